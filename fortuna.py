@@ -11,23 +11,33 @@ from various racing websites. It serves as a high-reliability fallback system.
 """
 import argparse
 import asyncio
+import bisect
+import difflib
 import functools
 from functools import lru_cache
+import gzip
+import hashlib
 import html
+import importlib
+import importlib.metadata
 import json
 import logging
 import os
 import random
 import re
+import shutil
 import time
+import weakref
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
 from io import StringIO
 from pathlib import Path
+from urllib.parse import urlparse
 from typing import (
     Any,
     Annotated,
@@ -35,6 +45,9 @@ from typing import (
     ClassVar,
     Dict,
     Final,
+    Hashable,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -44,6 +57,7 @@ from typing import (
 )
 
 import httpx
+import numpy as np
 import pandas as pd
 import sqlite3
 from zoneinfo import ZoneInfo
@@ -76,6 +90,11 @@ try:
 except Exception:
     curl_requests = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import tomli
     HAS_TOML = True
@@ -122,6 +141,16 @@ def get_base_path() -> Path:
         return Path(sys._MEIPASS)
     return Path(__file__).parent
 
+def get_writable_path(filename: str) -> Path:
+    """Returns a writable path for the given filename, using AppData in frozen mode."""
+    if is_frozen() and sys.platform == "win32":
+        appdata = os.getenv('APPDATA')
+        if appdata:
+            target = Path(appdata) / "Fortuna" / filename
+            target.parent.mkdir(parents=True, exist_ok=True)
+            return target
+    return Path(filename)
+
 def load_config() -> Dict[str, Any]:
     """Loads configuration from config.toml with intelligent fallback."""
     config = {
@@ -347,6 +376,20 @@ DEFAULT_ODDS_FALLBACK: Final[float] = 2.75
 COMMON_PLACEHOLDERS: Final[set] = {2.75}
 DEFAULT_CONCURRENT_REQUESTS: Final[int] = 5
 DEFAULT_REQUEST_TIMEOUT: Final[int] = 30
+DEFAULT_HOST_CONCURRENCY: Final[int] = 4
+SELECTOR_PLAN_FILE: Final[str] = "selector_plans.json"
+VENUE_ALIAS_FILE: Final[str] = "venue_aliases.json"
+PREDICTION_HISTORY_DIR: Final[str] = "prediction_history"
+# Local port of the continuous monitor's /ws/monitor event stream (0 disables it)
+MONITOR_WS_PORT: Final[int] = 8014
+
+# Live odds refresh for the favourite-to-place monitor: only these adapters are re-polled
+ODDS_REFRESH_ADAPTERS: Final[List[str]] = ["TwinSpires", "NYRABets"]
+# (minutes-to-post ceiling, seconds between refreshes); races further out keep their discovery odds
+ODDS_REFRESH_CADENCE: Final[Tuple[Tuple[int, int], ...]] = ((5, 30), (15, 60), (30, 120), (60, 300), (120, 600))
+ODDS_REFRESH_BUDGET_PER_MINUTE: Final[int] = 4
+# Change in second-favourite odds that counts as a move for BET NOW subscribers
+ODDS_MOVE_THRESHOLD: Final[float] = 0.5
 
 DEFAULT_BROWSER_HEADERS: Final[Dict[str, str]] = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
@@ -548,6 +591,102 @@ def clean_text(text: Any) -> str:
     return " ".join(str(text).strip().split())
 
 
+def fast_json_loads(data: Union[str, bytes]) -> Any:
+    """json.loads drop-in that uses orjson when installed (stdlib still handles NaN/surrogate edge cases)."""
+    if orjson is not None:
+        if isinstance(data, str) and type(data) is not str: data = str(data)
+        try: return orjson.loads(data)
+        except orjson.JSONDecodeError: pass
+    return json.loads(data)
+
+
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:]')
+
+
+def _json_key_path_at(text: str, pos: int) -> Optional[List[str]]:
+    """
+    Keys leading to the object whose member key starts at offset `pos`, or None when `pos`
+    is not a key of an object reachable through objects only (inside a string or a list).
+    """
+    stack: List[List[Any]] = []  # [bracket, raw key of the member being read]
+    last = ""
+    for m in _JSON_TOKEN.finditer(text):
+        if m.start() >= pos:
+            break
+        if m.end() > pos:
+            return None  # `pos` falls inside a string
+        tok = m.group()
+        if tok in "{[":
+            stack.append([tok, None])
+        elif tok in "}]":
+            if not stack: return None
+            stack.pop()
+        elif tok == ":":
+            if stack: stack[-1][1] = last
+        else:
+            last = tok
+    if not stack or any(bracket != "{" for bracket, _ in stack):
+        return None
+    return [json.loads(raw) if "\\" in raw else raw[1:-1] for _, raw in stack[:-1]]
+
+
+def _decode_at_anchor(text: str, path: List[str], anchor: str) -> Tuple[bool, Any]:
+    """(True, value of `anchor`) when it is a unique key sitting exactly at its place in `path`."""
+    token = f'"{anchor}":'
+    pos = text.find(token)
+    if pos == -1 or text.find(token, pos + 1) != -1:
+        return False, None
+    if _json_key_path_at(text, pos) != path[:path.index(anchor)]:
+        return False, None
+    start = pos + len(token)
+    while start < len(text) and text[start] in " \t\r\n": start += 1
+    try:
+        return True, json.JSONDecoder().raw_decode(text, start)[0]
+    except json.JSONDecodeError:
+        return False, None
+
+
+def decode_json_subtree(text: Union[str, bytes], path: List[str], anchor: Optional[str] = None) -> Any:
+    """
+    Returns the value at `path` (list of keys) inside a JSON document, or None.
+
+    The sub-tree shortcut only applies without orjson, which decodes a whole document
+    faster than the stdlib decodes part of it. There, an `anchor` key in `path` that occurs
+    exactly once, and is verified to sit at its place in `path`, lets raw_decode read just
+    that value; anything else falls back to a full decode.
+    """
+    found, node, rest = False, None, path
+    if orjson is None and anchor and anchor in path and isinstance(text, str):
+        found, node = _decode_at_anchor(text, path, anchor)
+        if found:
+            rest = path[path.index(anchor) + 1:]
+    if not found:
+        node, rest = fast_json_loads(text), path
+    for key in rest:
+        if not isinstance(node, dict): return None
+        node = node.get(key)
+    return node
+
+
+def fast_json_dumps(data: Any) -> bytes:
+    """Compact UTF-8 JSON; orjson when installed, otherwise the stdlib with tight separators."""
+    if orjson is not None:
+        try: return orjson.dumps(data)
+        except TypeError: pass
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def atomic_write_bytes(path: str, payload: bytes) -> None:
+    """Replaces ``path`` via a temp file and os.replace, so readers never see a torn file."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 def node_text(n: Any) -> str:
     """Consistently extracts text from Scrapling Selectors and Selectolax Nodes."""
     if n is None:
@@ -771,6 +910,160 @@ def normalize_venue_name(name: Optional[str]) -> str:
     return track_part.title()
 
 
+class VenueResolver:
+    """
+    Resolves noisy venue strings to canonical keys (as produced by get_canonical_venue)
+    so the same track spelled differently by two sources lands on one key.
+
+    Exact lookups cover VENUE_MAP, learned aliases and venues observed this run; anything
+    else goes through a trigram index and is accepted only when the best candidate's edit
+    similarity reaches ``min_similarity``. Confirmed aliases are persisted to ``path``;
+    aliases learned from fuzzy evidence stay in memory until ``ALIAS_CONFIRMATIONS``
+    distinct pieces of evidence (e.g. matched races) agree.
+    """
+    MIN_FUZZY_LENGTH: ClassVar[int] = 5
+    MAX_CANDIDATES: ClassVar[int] = 5
+    ALIAS_CONFIRMATIONS: ClassVar[int] = 3
+
+    def __init__(self, path: Optional[str] = VENUE_ALIAS_FILE, min_similarity: float = 0.85):
+        self.path = path
+        self.min_similarity = min_similarity
+        self.known: set = set()
+        self.aliases: Dict[str, str] = {}
+        self.provisional: Dict[str, str] = {}  # in-memory aliases awaiting confirmation
+        self._evidence: Dict[Tuple[str, str], set] = defaultdict(set)
+        self._grams: Dict[str, set] = defaultdict(set)
+        self._memo: Dict[str, str] = {}
+        self._dirty = False
+        self.generation = 0  # bumped whenever a resolve() answer may have changed
+        for venue in set(VENUE_MAP.values()):
+            self.add_venue(get_canonical_venue(venue))
+        self._load()
+
+    @staticmethod
+    def key_of(name: Optional[str]) -> str:
+        """get_canonical_venue, falling back to the raw (unicode) word characters for non-latin names."""
+        key = get_canonical_venue(name)
+        if key == "unknown" and name:
+            key = re.sub(r"[\W_]", "", str(name).lower()) or "unknown"
+        return key
+
+    @staticmethod
+    def _trigrams(key: str) -> set:
+        return {key[i:i + 3] for i in range(len(key) - 2)}
+
+    def _load(self) -> None:
+        if not self.path: return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                for alias, canonical in data.items():
+                    self.aliases[str(alias)] = str(canonical)
+                    self.add_venue(str(canonical))
+        except FileNotFoundError: pass
+        except Exception as e:
+            structlog.get_logger("VenueResolver").warning("venue_alias_load_failed", path=self.path, error=str(e))
+
+    def save(self) -> None:
+        """Writes learned aliases if any were added since the last save."""
+        if not self._dirty or not self.path: return
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.aliases, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except Exception as e:
+            structlog.get_logger("VenueResolver").warning("venue_alias_save_failed", path=self.path, error=str(e))
+
+    def add_venue(self, key: str) -> None:
+        if not key or key == "unknown" or key in self.known: return
+        self.known.add(key)
+        for gram in self._trigrams(key):
+            self._grams[gram].add(key)
+        # A new venue can change earlier fuzzy answers
+        self._memo.clear()
+        self.generation += 1
+
+    def resolve(self, name: Optional[str]) -> str:
+        """Canonical key for ``name``; unmatched names resolve to their own key."""
+        key = self.key_of(name)
+        if key in self.known or key == "unknown":
+            return key
+        alias = self.aliases.get(key) or self.provisional.get(key)
+        if alias is not None:
+            return alias
+        hit = self._memo.get(key)
+        if hit is None:
+            hit = self._memo[key] = self._fuzzy(key) or key
+        return hit
+
+    def observe(self, name: Optional[str]) -> str:
+        """Resolves ``name`` and registers it as a known venue when nothing matched."""
+        resolved = self.resolve(name)
+        self.add_venue(resolved)
+        return resolved
+
+    def learn(self, name: Optional[str], canonical: str, evidence: Optional[str] = None) -> None:
+        """
+        Records that ``name`` is the venue ``canonical``. Without ``evidence`` the alias is
+        taken as confirmed and persisted on save; with it (a fuzzy match, identified e.g. by
+        the matched race key) it is kept in memory until ALIAS_CONFIRMATIONS distinct
+        pieces of evidence agree.
+        """
+        key = self.key_of(name)
+        if key == "unknown" or key == canonical or self.aliases.get(key) == canonical: return
+        if evidence is not None:
+            seen = self._evidence[(key, canonical)]
+            seen.add(evidence)
+            if len(seen) < self.ALIAS_CONFIRMATIONS:
+                self.provisional[key] = canonical
+                self.add_venue(canonical)
+                self._memo.pop(key, None)
+                self.generation += 1
+                return
+            del self._evidence[(key, canonical)]
+        self.provisional.pop(key, None)
+        self.aliases[key] = canonical
+        self.add_venue(canonical)
+        self._memo.pop(key, None)
+        self.generation += 1
+        self._dirty = True
+
+    def _fuzzy(self, key: str) -> Optional[str]:
+        if len(key) < self.MIN_FUZZY_LENGTH:
+            return None
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in self._trigrams(key):
+            for candidate in self._grams.get(gram, ()):
+                shared[candidate] += 1
+        if not shared:
+            return None
+        best, best_ratio = None, self.min_similarity
+        for candidate in sorted(shared, key=lambda c: (-shared[c], c))[:self.MAX_CANDIDATES]:
+            ratio = difflib.SequenceMatcher(None, key, candidate).ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = candidate, ratio
+        return best
+
+
+_venue_resolver: Optional[VenueResolver] = None
+
+
+def get_venue_resolver() -> VenueResolver:
+    """Process-wide VenueResolver, built on first use."""
+    global _venue_resolver
+    if _venue_resolver is None:
+        _venue_resolver = VenueResolver(str(get_writable_path(VENUE_ALIAS_FILE)))
+    return _venue_resolver
+
+
+def resolve_venue(name: Optional[str]) -> str:
+    """Canonical venue key with fuzzy cross-source resolution; see VenueResolver."""
+    return get_venue_resolver().resolve(name)
+
+
 def parse_odds_to_decimal(odds_str: Any) -> Optional[float]:
     """
     Parses various odds formats (fractional, decimal) into a float decimal.
@@ -916,6 +1209,398 @@ def generate_race_id(prefix: str, venue: str, start_time: datetime, race_number:
     return f"{prefix}_{venue_slug}_{date_str}_{time_str}_R{race_number}{disc_suffix}"
 
 
+# --- COLUMNAR STORE ---
+_EPOCH: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NO_TIME: Final[int] = np.iinfo(np.int64).min
+_NO_NUMBER: Final[int] = np.iinfo(np.int32).min
+
+# Odds are kept as float64 plus a kind code; Decimals and non-numeric values also go to the
+# side table so they round-trip exactly
+_KIND_NONE, _KIND_FLOAT, _KIND_DECIMAL, _KIND_INT, _KIND_OTHER = range(5)
+
+
+class StringPool:
+    """Interns strings to dense int32 codes; code -1 stands for None."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        c = self._codes.get(value)
+        if c is None:
+            c = self._codes[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        return c
+
+    def value(self, code: int) -> Optional[str]:
+        return None if code < 0 else self.values[code]
+
+    def lookup(self, codes: np.ndarray, fn: Optional[Callable[[Optional[str]], Any]] = None) -> np.ndarray:
+        """Maps a code array to values, applying ``fn`` once per distinct string."""
+        mapped = [fn(v) for v in self.values] if fn else list(self.values)
+        table = np.empty(len(mapped) + 1, dtype=object)
+        table[:-1] = mapped
+        table[-1] = fn(None) if fn else None
+        return table[codes]  # code -1 picks the trailing None slot
+
+
+class RaceTable:
+    """
+    Columnar view of a run: parallel arrays for races, runners and per-source odds.
+
+    Strings are interned into a shared :class:`StringPool`; runners and odds are
+    stored in race/runner order with CSR-style offsets, so ``runner_offsets[i]:
+    runner_offsets[i+1]`` are the runners of race ``i``. Build it once after
+    deduplication with :meth:`from_races`; :meth:`to_races` rebuilds equal models.
+    Metadata dicts are shared with the source models rather than copied, so
+    analyzer annotations (``is_goldmine`` etc.) stay visible through the table.
+    """
+
+    def __init__(self) -> None:
+        self.strings = StringPool()
+        self._tzinfos: List[Any] = []
+        self._extras: Dict[Tuple[str, int], Any] = {}
+        self._derived: Dict[str, np.ndarray] = {}
+
+    # --- construction ---
+
+    def _tz_code(self, tz: Any) -> int:
+        if self._tzinfos and self._tzinfos[-1] is tz:
+            return len(self._tzinfos) - 1
+        for i, known in enumerate(self._tzinfos):
+            if known is tz:
+                return i
+        self._tzinfos.append(tz)
+        return len(self._tzinfos) - 1
+
+    def _time(self, column: str, index: int, value: Any) -> Tuple[int, int]:
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            d = value - _EPOCH
+            return (d.days * 86_400 + d.seconds) * 1_000_000 + d.microseconds, self._tz_code(value.tzinfo)
+        self._extras[(column, index)] = value
+        return _NO_TIME, -1
+
+    def _odds(self, column: str, index: int, value: Any) -> Tuple[float, int]:
+        if value is None:
+            return np.nan, _KIND_NONE
+        if isinstance(value, float):
+            return value, _KIND_FLOAT
+        if isinstance(value, Decimal):
+            self._extras[(column, index)] = value
+            return float(value), _KIND_DECIMAL
+        if isinstance(value, int) and not isinstance(value, bool):
+            return float(value), _KIND_INT
+        self._extras[(column, index)] = value
+        return np.nan, _KIND_OTHER
+
+    @classmethod
+    def from_races(cls, races: List[Race]) -> "RaceTable":
+        t = cls()
+        code = t.strings.code
+        r_cols: Dict[str, list] = defaultdict(list)
+        n_cols: Dict[str, list] = defaultdict(list)
+        o_cols: Dict[str, list] = defaultdict(list)
+        runner_offsets, odds_offsets = [0], [0]
+
+        for ri, race in enumerate(races):
+            r_cols["id"].append(code(race.id))
+            r_cols["venue"].append(code(race.venue))
+            r_cols["race_number"].append(race.race_number)
+            us, tz = t._time("start_time", ri, race.start_time)
+            r_cols["start_us"].append(us)
+            r_cols["start_tz"].append(tz)
+            r_cols["source"].append(code(race.source))
+            r_cols["discipline"].append(code(race.discipline))
+            r_cols["distance"].append(code(race.distance))
+            r_cols["field_size"].append(_NO_NUMBER if race.field_size is None else race.field_size)
+            r_cols["qualification_score"].append(np.nan if race.qualification_score is None else race.qualification_score)
+            r_cols["is_error_placeholder"].append(race.is_error_placeholder)
+            r_cols["top_five_numbers"].append(code(race.top_five_numbers))
+            r_cols["error_message"].append(code(race.error_message))
+            r_cols["available_bets"].append([code(b) for b in race.available_bets])
+            r_cols["metadata"].append(race.metadata)
+
+            for runner in race.runners:
+                ni = len(n_cols["race"])
+                n_cols["race"].append(ri)
+                n_cols["id"].append(code(runner.id))
+                n_cols["name"].append(code(runner.name))
+                n_cols["number"].append(_NO_NUMBER if runner.number is None else runner.number)
+                n_cols["scratched"].append(runner.scratched)
+                v, k = t._odds("win_odds", ni, runner.win_odds)
+                n_cols["win_odds"].append(v)
+                n_cols["win_odds_kind"].append(k)
+                n_cols["metadata"].append(runner.metadata)
+
+                for key, od in runner.odds.items():
+                    oi = len(o_cols["runner"])
+                    o_cols["runner"].append(ni)
+                    o_cols["key"].append(code(key))
+                    o_cols["source"].append(code(od.source))
+                    v, k = t._odds("win", oi, od.win)
+                    o_cols["win"].append(v)
+                    o_cols["win_kind"].append(k)
+                    v, k = t._odds("place", oi, od.place)
+                    o_cols["place"].append(v)
+                    o_cols["place_kind"].append(k)
+                    us, tz = t._time("last_updated", oi, od.last_updated)
+                    o_cols["updated_us"].append(us)
+                    o_cols["updated_tz"].append(tz)
+                odds_offsets.append(len(o_cols["runner"]))
+            runner_offsets.append(len(n_cols["race"]))
+
+        def arr(values: list, dtype) -> np.ndarray:
+            return np.array(values, dtype=dtype)
+
+        t.race_id = arr(r_cols["id"], np.int32)
+        t.venue = arr(r_cols["venue"], np.int32)
+        t.race_number = arr(r_cols["race_number"], np.int16)
+        t.start_us = arr(r_cols["start_us"], np.int64)
+        t.start_tz = arr(r_cols["start_tz"], np.int8)
+        t.race_source = arr(r_cols["source"], np.int32)
+        t.discipline = arr(r_cols["discipline"], np.int32)
+        t.distance = arr(r_cols["distance"], np.int32)
+        t.field_size = arr(r_cols["field_size"], np.int32)
+        t.qualification_score = arr(r_cols["qualification_score"], np.float64)
+        t.is_error_placeholder = arr(r_cols["is_error_placeholder"], bool)
+        t.top_five_numbers = arr(r_cols["top_five_numbers"], np.int32)
+        t.error_message = arr(r_cols["error_message"], np.int32)
+        t.available_bets = r_cols["available_bets"]
+        t.race_metadata = r_cols["metadata"]
+        t.runner_offsets = arr(runner_offsets, np.int32)
+
+        t.runner_race = arr(n_cols["race"], np.int32)
+        t.runner_id = arr(n_cols["id"], np.int32)
+        t.runner_name = arr(n_cols["name"], np.int32)
+        t.runner_number = arr(n_cols["number"], np.int32)
+        t.scratched = arr(n_cols["scratched"], bool)
+        t.win_odds = arr(n_cols["win_odds"], np.float64)
+        t.win_odds_kind = arr(n_cols["win_odds_kind"], np.uint8)
+        t.runner_metadata = n_cols["metadata"]
+        t.odds_offsets = arr(odds_offsets, np.int32)
+
+        t.odds_runner = arr(o_cols["runner"], np.int32)
+        t.odds_key = arr(o_cols["key"], np.int32)
+        t.odds_source = arr(o_cols["source"], np.int32)
+        t.odds_win = arr(o_cols["win"], np.float64)
+        t.odds_win_kind = arr(o_cols["win_kind"], np.uint8)
+        t.odds_place = arr(o_cols["place"], np.float64)
+        t.odds_place_kind = arr(o_cols["place_kind"], np.uint8)
+        t.odds_updated_us = arr(o_cols["updated_us"], np.int64)
+        t.odds_updated_tz = arr(o_cols["updated_tz"], np.int8)
+        return t
+
+    # --- conversion back to models ---
+
+    def _time_value(self, column: str, index: int, us: int, tz: int) -> Any:
+        if us == _NO_TIME:
+            return self._extras.get((column, index))
+        return (_EPOCH + timedelta(microseconds=int(us))).astimezone(self._tzinfos[tz])
+
+    def _odds_value(self, column: str, index: int, value: float, kind: int) -> Any:
+        if kind == _KIND_FLOAT:
+            return float(value)
+        if kind == _KIND_INT:
+            return int(value)
+        return self._extras.get((column, index)) if kind in (_KIND_DECIMAL, _KIND_OTHER) else None
+
+    def _number(self, value: int) -> Optional[int]:
+        return None if value == _NO_NUMBER else int(value)
+
+    def to_races(self) -> List[Race]:
+        """Rebuilds the models. Values were validated on the way in, so this skips validation."""
+        s = self.strings.value
+        races = []
+        for ri in range(len(self)):
+            runners = []
+            for ni in range(self.runner_offsets[ri], self.runner_offsets[ri + 1]):
+                odds = {}
+                for oi in range(self.odds_offsets[ni], self.odds_offsets[ni + 1]):
+                    odds[s(self.odds_key[oi])] = OddsData.model_construct(
+                        win=self._odds_value("win", oi, self.odds_win[oi], self.odds_win_kind[oi]),
+                        place=self._odds_value("place", oi, self.odds_place[oi], self.odds_place_kind[oi]),
+                        source=s(self.odds_source[oi]),
+                        last_updated=self._time_value("last_updated", oi, self.odds_updated_us[oi], self.odds_updated_tz[oi]),
+                    )
+                runners.append(Runner.model_construct(
+                    id=s(self.runner_id[ni]),
+                    name=s(self.runner_name[ni]),
+                    number=self._number(self.runner_number[ni]),
+                    scratched=bool(self.scratched[ni]),
+                    odds=odds,
+                    win_odds=self._odds_value("win_odds", ni, self.win_odds[ni], self.win_odds_kind[ni]),
+                    metadata=self.runner_metadata[ni],
+                ))
+            score = self.qualification_score[ri]
+            races.append(Race.model_construct(
+                id=s(self.race_id[ri]),
+                venue=s(self.venue[ri]),
+                race_number=int(self.race_number[ri]),
+                start_time=self._time_value("start_time", ri, self.start_us[ri], self.start_tz[ri]),
+                runners=runners,
+                source=s(self.race_source[ri]),
+                discipline=s(self.discipline[ri]),
+                distance=s(self.distance[ri]),
+                field_size=self._number(self.field_size[ri]),
+                available_bets=[s(c) for c in self.available_bets[ri]],
+                metadata=self.race_metadata[ri],
+                qualification_score=None if np.isnan(score) else float(score),
+                is_error_placeholder=bool(self.is_error_placeholder[ri]),
+                top_five_numbers=s(self.top_five_numbers[ri]),
+                error_message=s(self.error_message[ri]),
+            ))
+        return races
+
+    # --- vectorized accessors ---
+
+    def __len__(self) -> int:
+        return len(self.race_id)
+
+    def _cached(self, name: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+        if name not in self._derived:
+            self._derived[name] = build()
+        return self._derived[name]
+
+    def tracks(self) -> np.ndarray:
+        """normalize_venue_name per race, computed once per distinct venue string."""
+        return self._cached("tracks", lambda: self.strings.lookup(self.venue, normalize_venue_name))
+
+    def canonical_venues(self) -> np.ndarray:
+        return self._cached("canonical", lambda: self.strings.lookup(self.venue, get_canonical_venue))
+
+    def active_field_sizes(self) -> np.ndarray:
+        """Non-scratched runner count per race."""
+        return self._cached("active", lambda: np.bincount(self.runner_race[~self.scratched], minlength=len(self)))
+
+    def minutes_to_post(self, now: datetime) -> np.ndarray:
+        """Minutes from ``now`` to each start time; NaN where the start time is not a datetime."""
+        now_us = (now - _EPOCH) // timedelta(microseconds=1)
+        mtp = (self.start_us - now_us) / 60_000_000
+        mtp[self.start_us == _NO_TIME] = np.nan
+        return mtp
+
+    def best_win_odds(self) -> np.ndarray:
+        """Vectorized _best_win_odds_value: shortest valid price per runner, NaN if none."""
+        def build() -> np.ndarray:
+            def valid(values: np.ndarray) -> np.ndarray:
+                with np.errstate(invalid="ignore"):
+                    ok = (values >= MIN_VALID_ODDS) & (values < MAX_VALID_ODDS)
+                return ok & ~np.isin(np.round(values, 2), list(COMMON_PLACEHOLDERS))
+
+            best = np.full(len(self.runner_race), np.inf)
+            ok = valid(self.odds_win)
+            np.minimum.at(best, self.odds_runner[ok], self.odds_win[ok])
+            fallback = np.isinf(best) & valid(self.win_odds)
+            best[fallback] = self.win_odds[fallback]
+            best[np.isinf(best)] = np.nan
+            return best
+        return self._cached("best_win", build)
+
+    def nbytes(self) -> int:
+        """Approximate footprint: array buffers, interned strings and per-row list overhead."""
+        total = sum(v.nbytes for v in vars(self).values() if isinstance(v, np.ndarray))
+        total += sum(sys.getsizeof(v) for v in self.strings.values)
+        total += sys.getsizeof(self.available_bets) + sum(sys.getsizeof(b) for b in self.available_bets)
+        return total + sys.getsizeof(self.race_metadata) + sys.getsizeof(self.runner_metadata)
+
+
+
+# --- TIME INDEX ---
+
+def start_timestamp(item: Any) -> Optional[float]:
+    """POSIX timestamp of ``item.start_time`` (naive times are Eastern); None if it has no usable time."""
+    st = getattr(item, "start_time", None)
+    if isinstance(st, str):
+        try:
+            st = datetime.fromisoformat(st.replace('Z', '+00:00'))
+        except (ValueError, TypeError):
+            return None
+    if not isinstance(st, datetime):
+        return None
+    return ensure_eastern(st).timestamp()
+
+
+class RaceTimeIndex:
+    """
+    Races (or summaries) ordered by start time, answering "what starts between T1 and T2"
+    by bisection instead of a scan.
+
+    Entries are keyed so an updated race replaces its slot rather than being indexed twice;
+    ties keep insertion order. Items without a usable start_time are not indexed. The index
+    is safe to feed from RaceMergeStore subscribers and to share between callers that ask
+    the same windowed question every refresh.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), key_fn: Callable[[Any], Hashable] = id):
+        self.key_fn = key_fn
+        self._times: List[float] = []
+        self._keys: List[Hashable] = []
+        self._items: Dict[Hashable, Any] = {}
+        self._slot: Dict[Hashable, float] = {}
+        self._lock = threading.RLock()
+        for item in items:
+            self.upsert(item)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter([self._items[k] for k in self._keys])
+
+    def upsert(self, item: Any, key: Optional[Hashable] = None) -> bool:
+        """Adds or replaces ``item``; returns False (and drops any old slot) if it has no start time."""
+        key = self.key_fn(item) if key is None else key
+        ts = start_timestamp(item)
+        with self._lock:
+            old = self._slot.get(key)
+            if old is not None and old != ts:
+                self._drop(key, old)
+                old = None
+            if ts is None:
+                self._items.pop(key, None)
+                return False
+            self._items[key] = item
+            if old is None:
+                i = bisect.bisect_right(self._times, ts)
+                self._times.insert(i, ts)
+                self._keys.insert(i, key)
+                self._slot[key] = ts
+            return True
+
+    def remove(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            ts = self._slot.get(key)
+            if ts is None:
+                return None
+            self._drop(key, ts)
+            return self._items.pop(key, None)
+
+    def _drop(self, key: Hashable, ts: float) -> None:
+        i = bisect.bisect_left(self._times, ts)
+        while self._keys[i] != key:
+            i += 1
+        del self._times[i], self._keys[i]
+        del self._slot[key]
+
+    def between(self, after: datetime, until: datetime) -> List[Any]:
+        """Items with ``after < start_time <= until``, in start-time order."""
+        lo, hi = ensure_eastern(after).timestamp(), ensure_eastern(until).timestamp()
+        with self._lock:
+            i = bisect.bisect_right(self._times, lo)
+            j = bisect.bisect_right(self._times, hi)
+            return [self._items[k] for k in self._keys[i:j]]
+
+    def mtp_window(self, min_mtp: float, max_mtp: float, now: Optional[datetime] = None) -> List[Any]:
+        """Items with ``min_mtp < minutes-to-post <= max_mtp`` at ``now`` (default: current time)."""
+        now = now or now_eastern()
+        return self.between(now + timedelta(minutes=min_mtp), now + timedelta(minutes=max_mtp))
+
 # --- VALIDATORS ---
 class RaceValidator(BaseModel):
     venue: str = Field(..., min_length=1)
@@ -953,6 +1638,9 @@ class GlobalResourceManager:
     _locks: ClassVar[dict[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
     _lock_initialized: ClassVar[threading.Lock] = threading.Lock()
     _global_semaphore: Optional[asyncio.Semaphore] = None
+    # loop -> host -> (semaphore, limit). A contended semaphore references its loop, so the
+    # weak key alone cannot free it: cleanup() drops the running loop's entry.
+    _host_semaphores: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, tuple[asyncio.Semaphore, int]]]"] = weakref.WeakKeyDictionary()
 
     @classmethod
     async def _get_lock(cls) -> asyncio.Lock:
@@ -1002,11 +1690,31 @@ class GlobalResourceManager:
                 return cls._global_semaphore
         return cls._global_semaphore
 
+    @classmethod
+    def get_host_semaphore(cls, host: str, limit: int = DEFAULT_HOST_CONCURRENCY) -> asyncio.Semaphore:
+        """
+        Per-host concurrency cap shared by every caller in the running loop.
+
+        The first caller for a host fixes its limit; a later caller asking for a
+        different one gets the existing semaphore and a warning.
+        """
+        hosts = cls._host_semaphores.setdefault(asyncio.get_running_loop(), {})
+        host = host.lower()
+        limit = max(1, limit)
+        entry = hosts.get(host)
+        if entry is None:
+            entry = hosts[host] = (asyncio.Semaphore(limit), limit)
+        elif entry[1] != limit:
+            structlog.get_logger("GlobalResourceManager").warning(
+                "host_semaphore_limit_mismatch", host=host, limit=entry[1], requested=limit)
+        return entry[0]
+
     @classmethod
     async def cleanup(cls):
         if cls._httpx_client:
             await cls._httpx_client.aclose()
             cls._httpx_client = None
+        cls._host_semaphores.pop(asyncio.get_running_loop(), None)
 
 
 class BrowserEngine(Enum):
@@ -1027,7 +1735,7 @@ class UnifiedResponse:
     headers: Dict[str, str] = field(default_factory=dict)
 
     def json(self) -> Any:
-        return json.loads(self.text)
+        return fast_json_loads(self.text)
 
 
 class FetchStrategy(FortunaBaseModel):
@@ -1322,6 +2030,9 @@ class AdapterMetrics:
         self.total_latency_ms = 0.0
         self.consecutive_failures = 0
         self.last_failure_reason: Optional[str] = None
+        self.json_decodes = 0
+        self.json_decode_ms = 0.0
+        self.json_decode_bytes = 0
     @property
     def success_rate(self) -> float:
         return self.successful_requests / self.total_requests if self.total_requests > 0 else 1.0
@@ -1338,25 +2049,42 @@ class AdapterMetrics:
         self.failed_requests += 1
         self.consecutive_failures += 1
         self.last_failure_reason = error
+    def record_json_decode(self, elapsed_ms: float, size: int) -> None:
+        with self._lock:
+            self.json_decodes += 1
+            self.json_decode_ms += elapsed_ms
+            self.json_decode_bytes += size
     def snapshot(self) -> Dict[str, Any]:
         return {
             "total_requests": self.total_requests,
             "success_rate": self.success_rate,
             "failed_requests": self.failed_requests,
             "consecutive_failures": self.consecutive_failures,
-            "last_failure_reason": getattr(self, "last_failure_reason", None)
+            "last_failure_reason": getattr(self, "last_failure_reason", None),
+            "json_decodes": self.json_decodes,
+            "json_decode_ms": round(self.json_decode_ms, 2),
+            "json_decode_bytes": self.json_decode_bytes
         }
 
 
 # --- MIXINS ---
 class JSONParsingMixin:
     """Mixin for safe JSON extraction from HTML and scripts."""
-    def _parse_json_from_script(self, parser: HTMLParser, selector: str, context: str = "script") -> Optional[Any]:
+    def _decode_json(self, raw: Union[str, bytes], path: Optional[List[str]] = None, anchor: Optional[str] = None) -> Any:
+        """Decodes with the fast loader (optionally just the sub-tree at `path`) and records decode time."""
+        t0 = time.perf_counter()
+        try:
+            return decode_json_subtree(raw, path, anchor) if path else fast_json_loads(raw)
+        finally:
+            if metrics := getattr(self, "metrics", None):
+                metrics.record_json_decode((time.perf_counter() - t0) * 1000, len(raw))
+
+    def _parse_json_from_script(self, parser: HTMLParser, selector: str, context: str = "script", path: Optional[List[str]] = None, anchor: Optional[str] = None) -> Optional[Any]:
         script = parser.css_first(selector)
         if not script:
             return None
         try:
-            return json.loads(script.text())
+            return self._decode_json(script.text(), path, anchor)
         except json.JSONDecodeError as e:
             if hasattr(self, 'logger'):
                 self.logger.error("failed_parsing_json", context=context, selector=selector, error=str(e))
@@ -1370,7 +2098,7 @@ class JSONParsingMixin:
         if not raw:
             return None
         try:
-            return json.loads(html.unescape(raw))
+            return self._decode_json(html.unescape(raw))
         except json.JSONDecodeError as e:
             if hasattr(self, 'logger'):
                 self.logger.error("failed_parsing_json", context=context, selector=selector, attribute=attribute, error=str(e))
@@ -1380,7 +2108,7 @@ class JSONParsingMixin:
         results = []
         for script in parser.css(selector):
             try:
-                results.append(json.loads(script.text()))
+                results.append(self._decode_json(script.text()))
             except json.JSONDecodeError as e:
                 if hasattr(self, 'logger'):
                     self.logger.error("failed_parsing_json_in_list", context=context, selector=selector, error=str(e))
@@ -1448,6 +2176,123 @@ class RacePageFetcherMixin:
         return [r for r in results if not isinstance(r, Exception) and r is not None]
 
 
+class SelectorPlanMixin:
+    """
+    Learned selector plan for adapters with long CSS fallback lists.
+    Remembers which selector matched per page template and slot, tries that winner
+    first on later pages, and falls back to the full list when it misses.
+
+    A selector list is in priority order; a tuple entry holds alternatives of equal
+    priority (e.g. spellings of the same class hook). The winner only moves ahead
+    within its tuple, so a more specific earlier selector is never skipped.
+    """
+    SELECTOR_PLAN_PATH: ClassVar[str] = SELECTOR_PLAN_FILE
+    _selector_plans: ClassVar[Dict[str, str]] = {}
+    _selector_plans_loaded: ClassVar[bool] = False
+    _selector_plans_dirty: ClassVar[bool] = False
+
+    @classmethod
+    def _load_selector_plans(cls) -> None:
+        if SelectorPlanMixin._selector_plans_loaded: return
+        SelectorPlanMixin._selector_plans_loaded = True
+        try:
+            with open(cls.SELECTOR_PLAN_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                SelectorPlanMixin._selector_plans.update({str(k): str(v) for k, v in data.items()})
+        except FileNotFoundError: pass
+        except Exception as e:
+            structlog.get_logger("SelectorPlan").warning("selector_plan_load_failed", path=cls.SELECTOR_PLAN_PATH, error=str(e))
+
+    @classmethod
+    def _save_selector_plans(cls) -> None:
+        if not SelectorPlanMixin._selector_plans_dirty: return
+        tmp = f"{cls.SELECTOR_PLAN_PATH}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(SelectorPlanMixin._selector_plans, f, indent=2, sort_keys=True)
+            os.replace(tmp, cls.SELECTOR_PLAN_PATH)
+            SelectorPlanMixin._selector_plans_dirty = False
+        except Exception as e:
+            structlog.get_logger("SelectorPlan").warning("selector_plan_save_failed", path=cls.SELECTOR_PLAN_PATH, error=str(e))
+
+    def _page_template(self, url: Optional[str]) -> str:
+        """Host plus first path segment, e.g. 'www.twinspires.com/bet'."""
+        parsed = urlparse(url or "")
+        host = parsed.netloc or urlparse(getattr(self, "base_url", "") or "").netloc
+        segment = next((p for p in parsed.path.split("/") if p), "")
+        return f"{host}/{segment.lower()}"
+
+    def _plan_key(self, slot: str, template: Optional[str]) -> str:
+        return f"{getattr(self, 'source_name', type(self).__name__)}|{template or 'default'}|{slot}"
+
+    def _plan_selectors(self, slot: str, selectors: List[Union[str, Tuple[str, ...]]], template: Optional[str] = None) -> List[str]:
+        """Returns selectors flattened in plan order: the learned winner first within its equal-priority tuple."""
+        if not any(isinstance(tier, tuple) for tier in selectors):
+            return list(selectors)  # nothing to reorder, so no plan is loaded or kept
+        self._load_selector_plans()
+        winner = SelectorPlanMixin._selector_plans.get(self._plan_key(slot, template))
+        ordered = []
+        for tier in selectors:
+            if isinstance(tier, str):
+                ordered.append(tier)
+            elif winner in tier:
+                ordered.extend([winner] + [s for s in tier if s != winner])
+            else:
+                ordered.extend(tier)
+        return ordered
+
+    def _plan_record(self, slot: str, selector: str, template: Optional[str] = None,
+                     selectors: Optional[List[Union[str, Tuple[str, ...]]]] = None) -> None:
+        if selectors is not None and not any(isinstance(tier, tuple) and selector in tier for tier in selectors):
+            return  # only a winner inside an equal-priority tuple changes the plan
+        key = self._plan_key(slot, template)
+        previous = SelectorPlanMixin._selector_plans.get(key)
+        if previous == selector: return
+        SelectorPlanMixin._selector_plans[key] = selector
+        SelectorPlanMixin._selector_plans_dirty = True
+        if previous and hasattr(self, 'logger'):
+            self.logger.info("selector_plan_changed", slot=slot, template=template, previous=previous, winner=selector)
+
+    def _plan_css(self, root: Any, slot: str, selectors: List[Union[str, Tuple[str, ...]]], template: Optional[str] = None) -> List[Any]:
+        """First non-empty css() result following the plan."""
+        for s in self._plan_selectors(slot, selectors, template):
+            try:
+                nodes = root.css(s)
+                if nodes:
+                    self._plan_record(slot, s, template, selectors)
+                    return nodes
+            except Exception: continue
+        return []
+
+    def _plan_css_first(self, root: Any, slot: str, selectors: List[Union[str, Tuple[str, ...]]], template: Optional[str] = None) -> Any:
+        for s in self._plan_selectors(slot, selectors, template):
+            try:
+                node = root.css_first(s)
+                if node:
+                    self._plan_record(slot, s, template, selectors)
+                    return node
+            except Exception: continue
+        return None
+
+    def _plan_text(self, root: Any, slot: str, selectors: List[Union[str, Tuple[str, ...]]], template: Optional[str] = None) -> Optional[str]:
+        """First non-empty node text following the plan."""
+        for s in self._plan_selectors(slot, selectors, template):
+            try:
+                node = root.css_first(s)
+                if node:
+                    t = node_text(node)
+                    if t:
+                        self._plan_record(slot, s, template, selectors)
+                        return t
+            except Exception: continue
+        return None
+
+    async def close(self) -> None:
+        self._save_selector_plans()
+        await super().close()
+
+
 # --- BASE ADAPTER ---
 class BaseAdapterV3(ABC):
     ADAPTER_TYPE: ClassVar[str] = "discovery"
@@ -1515,8 +2360,8 @@ class BaseAdapterV3(ABC):
 
         for r in races:
             # Global heuristic for runner numbers (addressing "impossible" high numbers)
-            active_runners = [run for run in r.runners if not run.scratched]
-            field_size = len(active_runners)
+            feats = race_features(r)
+            field_size = feats.field_size
 
             # If any runner has a number > 20 and it's also > field_size + 10 (buffer)
             # or if it's extremely high (> 100), re-index everything as it's likely a parsing error (horse IDs).
@@ -1534,17 +2379,16 @@ class BaseAdapterV3(ABC):
                 for i, run in enumerate(r.runners):
                     run.number = i + 1
 
-            for runner in r.runners:
-                if not runner.scratched:
-                    # Explicitly enrich win_odds using all available sources (including fallbacks)
-                    best = _get_best_win_odds(runner)
-                    # Untrustworthy odds should be flagged (Memory Directive Fix)
-                    is_trustworthy = best is not None
-                    runner.metadata["odds_source_trustworthy"] = is_trustworthy
-                    if best:
-                        runner.win_odds = float(best)
-                        trustworthy_runners += 1
-                    total_runners += 1
+            for runner in feats.active:
+                # Explicitly enrich win_odds using all available sources (including fallbacks)
+                best = feats.best.get(id(runner))
+                # Untrustworthy odds should be flagged (Memory Directive Fix)
+                is_trustworthy = best is not None
+                runner.metadata["odds_source_trustworthy"] = is_trustworthy
+                if best:
+                    runner.win_odds = best
+                    trustworthy_runners += 1
+                total_runners += 1
 
         if total_runners > 0:
             self.trust_ratio = round(trustworthy_runners / total_runners, 2)
@@ -1860,7 +2704,7 @@ class SkyRacingWorldAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixi
 # ----------------------------------------
 # AtTheRacesAdapter
 # ----------------------------------------
-class AtTheRacesAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, BaseAdapterV3):
+class AtTheRacesAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, SelectorPlanMixin, BaseAdapterV3):
     SOURCE_NAME: ClassVar[str] = "AtTheRaces"
     BASE_URL: ClassVar[str] = "https://www.attheraces.com"
 
@@ -1871,13 +2715,14 @@ class AtTheRacesAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, B
         kwargs.setdefault("impersonate", "chrome120")
         return await super().make_request(method, url, **kwargs)
 
-    SELECTORS: ClassVar[Dict[str, List[str]]] = {
+    SELECTORS: ClassVar[Dict[str, List[Union[str, Tuple[str, ...]]]]] = {
         "race_links": ['a.race-navigation-link', 'a.sidebar-racecardsigation-link', 'a[href^="/racecard/"]', 'a[href*="/racecard/"]'],
         "details_container": [".race-header__details--primary", "atr-racecard-race-header .container", ".racecard-header .container"],
         "track_name": ["h2", "h1 a", "h1"],
-        "race_time": ["h2 b", "h1 span", ".race-time"],
+        "race_time": ["h2 b", ".race-time"],
         "distance": [".race-header__details--secondary .p--large", ".race-header__details--secondary div"],
-        "runners": [".card-cell--horse", ".odds-grid-horse", "atr-horse-in-racecard", ".horse-in-racecard"],
+        # The racecard component renders as a custom element or as a plain class hook
+        "runners": [".card-cell--horse", ".odds-grid-horse", ("atr-horse-in-racecard", ".horse-in-racecard")],
     }
 
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
@@ -1991,13 +2836,14 @@ class AtTheRacesAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, B
                 track_raw = re.split(r"\s+Race\s+\d+", track_raw, flags=re.I)[0]
                 track_raw = re.sub(r"^\d+\s+", "", track_raw).split(" - ")[0].split("|")[0].strip()
                 track_name = normalize_venue_name(track_raw)
+        tpl = self._page_template(url_path)
         if not track_name:
             details = parser.css_first(".race-header__details--primary")
             if details:
-                track_node = details.css_first("h2") or details.css_first("h1 a") or details.css_first("h1")
+                track_node = self._plan_css_first(details, "track_name", self.SELECTORS["track_name"], tpl)
                 if track_node: track_name = normalize_venue_name(clean_text(track_node.text()))
                 if not time_str:
-                    time_node = details.css_first("h2 b") or details.css_first(".race-time")
+                    time_node = self._plan_css_first(details, "race_time", self.SELECTORS["race_time"], tpl)
                     if time_node: time_str = clean_text(time_node.text()).replace(" ATR", "")
         if not track_name:
             parts = url_path.split("/")
@@ -2014,11 +2860,11 @@ class AtTheRacesAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, B
         distance = None
         dist_match = re.search(r"\|\s*(\d+[mfy].*)", header_text, re.I)
         if dist_match: distance = dist_match.group(1).strip()
-        runners = self._parse_runners(parser)
+        runners = self._parse_runners(parser, tpl)
         if not runners: return None
         return Race(discipline="Thoroughbred", id=generate_race_id("atr", track_name, start_time, race_number), venue=track_name, race_number=race_number, start_time=start_time, runners=runners, distance=distance, source=self.source_name, available_bets=scrape_available_bets(html_content))
 
-    def _parse_runners(self, parser: HTMLParser) -> List[Runner]:
+    def _parse_runners(self, parser: HTMLParser, tpl: Optional[str] = None) -> List[Runner]:
         odds_map: Dict[str, float] = {}
         for row in parser.css(".odds-grid__row--horse"):
             if m := re.search(r"row-(\d+)", row.attributes.get("id", "")):
@@ -2028,13 +2874,9 @@ class AtTheRacesAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, B
                         if is_valid_odds(p_val): odds_map[m.group(1)] = p_val
                     except Exception: pass
         runners: List[Runner] = []
-        for selector in self.SELECTORS["runners"]:
-            nodes = parser.css(selector)
-            if nodes:
-                for i, node in enumerate(nodes):
-                    runner = self._parse_runner(node, odds_map, i + 1)
-                    if runner: runners.append(runner)
-                break
+        for i, node in enumerate(self._plan_css(parser, "runners", self.SELECTORS["runners"], tpl)):
+            runner = self._parse_runner(node, odds_map, i + 1)
+            if runner: runners.append(runner)
         return runners
 
     def _parse_runner(self, row: Node, odds_map: Dict[str, float], fallback_number: int = 0) -> Optional[Runner]:
@@ -2132,7 +2974,7 @@ class AtTheRacesGreyhoundAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMix
         now_site = datetime.now(site_tz)
 
         try:
-            modules = json.loads(html.unescape(items_raw))
+            modules = self._decode_json(html.unescape(items_raw))
             for module in modules:
                 for meeting in module.get("data", {}).get("items", []):
                     # Broaden window to capture multiple races (Memory Directive Fix)
@@ -2176,7 +3018,7 @@ class AtTheRacesGreyhoundAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMix
         if not pc: return None
         items_raw = pc.attributes.get(":items") or pc.attributes.get(":modules")
         if not items_raw: return None
-        try: modules = json.loads(html.unescape(items_raw))
+        try: modules = self._decode_json(html.unescape(items_raw))
         except Exception: return None
         venue, race_time_str, distance, runners, odds_map = "", "", "", [], {}
 
@@ -2350,7 +3192,7 @@ class SportingLifeAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMixin, Rac
 
     def _extract_race_metadata(self, parser: HTMLParser, date_str: str) -> List[Dict[str, Any]]:
         meta: List[Dict[str, Any]] = []
-        data = self._parse_json_from_script(parser, "script#__NEXT_DATA__", context="SportingLife Index")
+        json_meetings = self._parse_json_from_script(parser, "script#__NEXT_DATA__", context="SportingLife Index", path=["props", "pageProps", "meetings"], anchor="pageProps")
 
         try:
             target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
@@ -2360,8 +3202,8 @@ class SportingLifeAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMixin, Rac
         site_tz = ZoneInfo("Europe/London")
         now_site = datetime.now(site_tz)
 
-        if data:
-            for meeting in data.get("props", {}).get("pageProps", {}).get("meetings", []):
+        if isinstance(json_meetings, list):
+            for meeting in json_meetings:
                 # Broaden window to capture multiple races (Memory Directive Fix)
                 races = meeting.get("races", [])
                 for i, race in enumerate(races):
@@ -2417,10 +3259,8 @@ class SportingLifeAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMixin, Rac
         return races
 
     def _parse_from_next_data(self, parser: HTMLParser, race_date: date, race_number_fallback: Optional[int], html_content: str) -> Optional[Race]:
-        data = self._parse_json_from_script(parser, "script#__NEXT_DATA__", context="SportingLife Race")
-        if not data: return None
-        race_info = data.get("props", {}).get("pageProps", {}).get("race")
-        if not race_info: return None
+        race_info = self._parse_json_from_script(parser, "script#__NEXT_DATA__", context="SportingLife Race", path=["props", "pageProps", "race"], anchor="pageProps")
+        if not isinstance(race_info, dict) or not race_info: return None
         summary = race_info.get("race_summary") or {}
         track_name = normalize_venue_name(race_info.get("meeting_name") or summary.get("course_name") or "Unknown")
         rt = race_info.get("time") or summary.get("time") or race_info.get("off_time") or race_info.get("start_time")
@@ -2814,7 +3654,7 @@ class StandardbredCanadaAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcher
 # ----------------------------------------
 # TabAdapter
 # ----------------------------------------
-class TabAdapter(BaseAdapterV3):
+class TabAdapter(JSONParsingMixin, BaseAdapterV3):
     SOURCE_NAME: ClassVar[str] = "TAB"
     # Note: api.tab.com.au often has DNS resolution issues in some environments.
     # api.beta.tab.com.au is more reliable.
@@ -2828,44 +3668,63 @@ class TabAdapter(BaseAdapterV3):
         # Switch to CURL_CFFI for TAB API to avoid DNS and TLS issues common in cloud environments
         return FetchStrategy(primary_engine=BrowserEngine.CURL_CFFI, enable_js=False, stealth_mode="fast", timeout=45)
 
-    async def _fetch_data(self, date: str) -> Optional[Dict[str, Any]]:
-        url = f"{self.base_url}/dates/{date}/meetings"
+    def _jurisdictions(self) -> List[str]:
+        j = self.config.get("jurisdictions") or self.config.get("jurisdiction") or ["VIC"]
+        if isinstance(j, str): j = j.split(",")
+        return list(dict.fromkeys(x.strip().upper() for x in j if x and x.strip()))
+
+    async def _get_json(self, url: str) -> Optional[Any]:
         resp = await self.make_request("GET", url, headers={"Accept": "application/json", "User-Agent": CHROME_USER_AGENT})
+        if not resp or get_resp_status(resp) != 200: return None
+        try:
+            text = getattr(resp, "text", None)
+            return self._decode_json(text) if text else resp.json()
+        except Exception: return None
 
-        if not resp or resp.status != 200:
-            self.logger.info("Falling back to STABLE TAB API")
-            url = f"{self.BASE_URL_STABLE}/dates/{date}/meetings"
-            resp = await self.make_request("GET", url, headers={"Accept": "application/json", "User-Agent": CHROME_USER_AGENT})
+    async def _fetch_meeting_list(self, date: str, jurisdiction: str) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        for base in (self.base_url, self.BASE_URL_STABLE):
+            if base != self.base_url: self.logger.info("Falling back to STABLE TAB API", jurisdiction=jurisdiction)
+            data = await self._get_json(f"{base}/dates/{date}/meetings?jurisdiction={jurisdiction}")
+            if data and "meetings" in data: return base, data["meetings"] or []
+        return None, []
 
-        if not resp: return None
-        try: data = resp.json() if hasattr(resp, "json") else json.loads(resp.text)
-        except Exception: return None
-        if not data or "meetings" not in data: return None
+    async def _fetch_data(self, date: str) -> Optional[Dict[str, Any]]:
+        jurisdictions = self._jurisdictions()
+        listings = await asyncio.gather(*(self._fetch_meeting_list(date, j) for j in jurisdictions))
+        if not any(base for base, _ in listings): return None
+
+        # One detail request per meeting; the first jurisdiction listing it is used
+        targets: Dict[Tuple[Any, Any], Tuple[Dict[str, Any], str, str]] = {}
+        for j, (base, meetings) in zip(jurisdictions, listings):
+            for m in meetings:
+                targets.setdefault((m.get("meetingType"), m.get("meetingName")), (m, base, j))
 
         # TAB meetings often only have race headers. We need to fetch each meeting's details
-        # to get runners and odds.
-        all_meetings = []
-        for m in data["meetings"]:
-            try:
-                vn = m.get("meetingName")
-                mt = m.get("meetingType")
-                if vn and mt:
-                    # Endpoint for meeting details (includes races and runners)
-                    m_url = f"{self.base_url}/dates/{date}/meetings/{mt}/{vn}?jurisdiction=VIC"
-                    m_resp = await self.make_request("GET", m_url, headers={"Accept": "application/json", "User-Agent": CHROME_USER_AGENT})
-                    if m_resp:
-                        try:
-                            m_data = m_resp.json() if hasattr(m_resp, "json") else json.loads(m_resp.text)
-                            if m_data:
-                                all_meetings.append(m_data)
-                                continue
-                        except Exception: pass
+        # to get runners and odds. Details are fetched concurrently under a per-host cap.
+        limit = int(self.config.get("host_concurrency", DEFAULT_HOST_CONCURRENCY))
+
+        async def fetch_detail(m: Dict[str, Any], base: str, jurisdiction: str) -> Optional[Dict[str, Any]]:
+            vn, mt = m.get("meetingName"), m.get("meetingType")
+            if not (vn and mt): return None
+            # Endpoint for meeting details (includes races and runners)
+            m_url = f"{base}/dates/{date}/meetings/{mt}/{vn}?jurisdiction={jurisdiction}"
+            async with GlobalResourceManager.get_host_semaphore(urlparse(m_url).netloc, limit):
+                return await self._get_json(m_url)
+
+        details = await asyncio.gather(*(fetch_detail(*t) for t in targets.values()), return_exceptions=True)
+
+        all_meetings, failed = [], 0
+        for (m, _, _), d in zip(targets.values(), details):
+            if d and not isinstance(d, BaseException):
+                all_meetings.append(d)
+            else:
                 # Fallback to the summary data if detail fetch fails
+                failed += 1
                 all_meetings.append(m)
-            except Exception:
-                all_meetings.append(m)
+        if failed:
+            self.logger.warning("tab_meeting_details_partial", failed=failed, total=len(targets))
 
-        return {"meetings": all_meetings, "date": date}
+        return {"meetings": all_meetings, "date": date, "jurisdictions": jurisdictions}
 
     def _parse_races(self, raw_data: Any) -> List[Race]:
         if not raw_data or "meetings" not in raw_data: return []
@@ -2938,40 +3797,67 @@ class BetfairDataScientistAdapter(JSONParsingMixin, BaseAdapterV3):
         resp = await self.make_request("GET", endpoint)
         return StringIO(resp.text) if resp and resp.text else None
 
+    CSV_COLUMNS: ClassVar[Dict[str, str]] = {"meetings.races.bfExchangeMarketId": "market_id", "meetings.name": "meeting_name", "meetings.races.raceNumber": "race_number", "meetings.races.runners.runnerName": "runner_name", "meetings.races.runners.clothNumber": "saddle_cloth", "meetings.races.runners.ratedPrice": "rated_price"}
+    START_TIME_COLUMNS: ClassVar[List[str]] = ["meetings.races.startTime", "startTime", "start_time", "time"]
+
     def _parse_races(self, raw_data: Optional[StringIO]) -> List[Race]:
         if not raw_data: return []
         try:
-            df = pd.read_csv(raw_data)
-            if df.empty: return []
-            df = df.rename(columns={"meetings.races.bfExchangeMarketId": "market_id", "meetings.name": "meeting_name", "meetings.races.raceNumber": "race_number", "meetings.races.runners.runnerName": "runner_name", "meetings.races.runners.clothNumber": "saddle_cloth", "meetings.races.runners.ratedPrice": "rated_price"})
-            races: List[Race] = []
-            for mid, group in df.groupby("market_id"):
-                ri = group.iloc[0]
-                runners = []
-                for _, row in group.iterrows():
-                    rp, od = row.get("rated_price"), {}
-                    if pd.notna(rp):
-                        if ov := create_odds_data(self.source_name, float(rp)): od[self.source_name] = ov
-                    runners.append(Runner(name=str(row.get("runner_name", "Unknown")), number=int(row.get("saddle_cloth", 0)), odds=od))
-
-                vn = normalize_venue_name(str(ri.get("meeting_name", "")))
-
-                # Try to find a start time in the CSV
-                start_time = datetime.now(EASTERN)
-                for col in ["meetings.races.startTime", "startTime", "start_time", "time"]:
-                    if col in ri and pd.notna(ri[col]):
-                        try:
-                            # Assume UTC and convert to Eastern if it looks like ISO
-                            st_val = str(ri[col])
-                            if "T" in st_val:
-                                start_time = to_eastern(datetime.fromisoformat(st_val.replace("Z", "+00:00")))
-                            break
-                        except Exception: pass
-
-                races.append(Race(id=str(mid), venue=vn, race_number=int(ri.get("race_number", 0)), start_time=start_time, runners=runners, source=self.source_name, discipline="Thoroughbred"))
-            return races
+            # Optional streamed reading for full-day files; markets are merged across chunks
+            chunksize = self.config.get("csv_chunksize")
+            frames = pd.read_csv(raw_data, chunksize=int(chunksize)) if chunksize else [pd.read_csv(raw_data)]
+            markets: Dict[Any, Dict[str, Any]] = {}
+            for df in frames:
+                if not df.empty: self._collect_markets(df.rename(columns=self.CSV_COLUMNS), markets)
+            venues: Dict[str, str] = {}
+            return [self._build_market_race(mid, markets[mid], venues) for mid in sorted(markets)]
         except Exception: return []
 
+    def _collect_markets(self, df: pd.DataFrame, markets: Dict[Any, Dict[str, Any]]) -> None:
+        """Groups runners by market id using column-level coercion instead of per-row iterrows."""
+        df = df[df["market_id"].notna()]
+        n = len(df)
+        names = df["runner_name"].astype(str).tolist() if "runner_name" in df else ["Unknown"] * n
+        numbers = df["saddle_cloth"].astype("int64").tolist() if "saddle_cloth" in df else [0] * n
+        prices: List[Optional[float]] = [None] * n
+        if "rated_price" in df:
+            rp = df["rated_price"].astype(float)
+            prices = rp.astype(object).where(rp.notna(), None).tolist()
+
+        groups = df.groupby("market_id", sort=False).indices
+        new = [mid for mid in groups if mid not in markets]
+        # Race-level fields come from each market's first row, materialised in one call
+        for mid, first in zip(new, df.iloc[[groups[mid][0] for mid in new]].to_dict("records")):
+            markets[mid] = {"first": first, "runners": []}
+
+        for mid, idx in groups.items():
+            runners = markets[mid]["runners"]
+            for i in idx:
+                od = {}
+                if prices[i] is not None:
+                    if ov := create_odds_data(self.source_name, prices[i]): od[self.source_name] = ov
+                runners.append(Runner(name=names[i], number=numbers[i], odds=od))
+
+    def _build_market_race(self, mid: Any, market: Dict[str, Any], venues: Dict[str, str]) -> Race:
+        ri = market["first"]
+        mn = str(ri.get("meeting_name", ""))
+        vn = venues.get(mn)
+        if vn is None: vn = venues[mn] = normalize_venue_name(mn)
+
+        # Try to find a start time in the CSV
+        start_time = datetime.now(EASTERN)
+        for col in self.START_TIME_COLUMNS:
+            if col in ri and pd.notna(ri[col]):
+                try:
+                    # Assume UTC and convert to Eastern if it looks like ISO
+                    st_val = str(ri[col])
+                    if "T" in st_val:
+                        start_time = to_eastern(datetime.fromisoformat(st_val.replace("Z", "+00:00")))
+                    break
+                except Exception: pass
+
+        return Race(id=str(mid), venue=vn, race_number=int(ri.get("race_number", 0)), start_time=start_time, runners=market["runners"], source=self.source_name, discipline="Thoroughbred")
+
 # ----------------------------------------
 # EquibaseAdapter
 # ----------------------------------------
@@ -3213,15 +4099,16 @@ class EquibaseAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, Bas
 # ----------------------------------------
 # TwinSpiresAdapter
 # ----------------------------------------
-class TwinSpiresAdapter(JSONParsingMixin, DebugMixin, BaseAdapterV3):
+class TwinSpiresAdapter(JSONParsingMixin, DebugMixin, SelectorPlanMixin, BaseAdapterV3):
     SOURCE_NAME: ClassVar[str] = "TwinSpires"
     BASE_URL: ClassVar[str] = "https://www.twinspires.com"
 
-    RACE_CONTAINER_SELECTORS: ClassVar[List[str]] = ['div[class*="RaceCard"]', 'div[class*="race-card"]', 'div[data-testid*="race"]', 'div[data-race-id]', 'section[class*="race"]', 'article[class*="race"]', ".race-container", "[data-race]", 'div[class*="card"][class*="race" i]', 'div[class*="event"]']
-    TRACK_NAME_SELECTORS: ClassVar[List[str]] = ['[class*="track-name"]', '[class*="trackName"]', '[data-track-name]', 'h2[class*="track"]', 'h3[class*="track"]', ".track-title", '[class*="venue"]']
-    RACE_NUMBER_SELECTORS: ClassVar[List[str]] = ['[class*="race-number"]', '[class*="raceNumber"]', '[class*="race-num"]', '[data-race-number]', 'span[class*="number"]']
-    POST_TIME_SELECTORS: ClassVar[List[str]] = ["time[datetime]", '[class*="post-time"]', '[class*="postTime"]', '[class*="mtp"]', "[data-post-time]", '[class*="race-time"]']
-    RUNNER_ROW_SELECTORS: ClassVar[List[str]] = ['tr[class*="runner"]', 'div[class*="runner"]', 'li[class*="runner"]', "[data-runner-id]", 'div[class*="horse-row"]', 'tr[class*="horse"]', 'div[class*="entry"]', ".runner-row", ".horse-entry"]
+    RACE_CONTAINER_SELECTORS: ClassVar[List[Union[str, Tuple[str, ...]]]] = [('div[class*="RaceCard"]', 'div[class*="race-card"]'), 'div[data-testid*="race"]', 'div[data-race-id]', 'section[class*="race"]', 'article[class*="race"]', ".race-container", "[data-race]", 'div[class*="card"][class*="race" i]', 'div[class*="event"]']
+    TRACK_NAME_SELECTORS: ClassVar[List[Union[str, Tuple[str, ...]]]] = [('[class*="track-name"]', '[class*="trackName"]'), '[data-track-name]', 'h2[class*="track"]', 'h3[class*="track"]', ".track-title", '[class*="venue"]']
+    RACE_NUMBER_SELECTORS: ClassVar[List[Union[str, Tuple[str, ...]]]] = [('[class*="race-number"]', '[class*="raceNumber"]'), '[class*="race-num"]', '[data-race-number]', 'span[class*="number"]']
+    POST_TIME_SELECTORS: ClassVar[List[Union[str, Tuple[str, ...]]]] = ["time[datetime]", ('[class*="post-time"]', '[class*="postTime"]'), '[class*="mtp"]', "[data-post-time]", '[class*="race-time"]']
+    DISTANCE_SELECTORS: ClassVar[List[Union[str, Tuple[str, ...]]]] = [('[class*="distance"]', '[class*="Distance"]'), '[data-distance]', ".race-distance"]
+    RUNNER_ROW_SELECTORS: ClassVar[List[Union[str, Tuple[str, ...]]]] = [('tr[class*="runner"]', 'div[class*="runner"]', 'li[class*="runner"]'), "[data-runner-id]", 'div[class*="horse-row"]', 'tr[class*="horse"]', 'div[class*="entry"]', ".runner-row", ".horse-entry"]
 
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(source_name=self.SOURCE_NAME, base_url=self.BASE_URL, config=config, enable_cache=True, cache_ttl=180.0, rate_limit=1.5)
@@ -3298,17 +4185,11 @@ class TwinSpiresAdapter(JSONParsingMixin, DebugMixin, BaseAdapterV3):
             page = HTMLParser(resp.text)
 
         rd = []
-        relems, used = [], None
-        for s in self.RACE_CONTAINER_SELECTORS:
-            try:
-                el = page.css(s)
-                if el:
-                    relems, used = el, s
-                    break
-            except Exception: continue
+        tpl = self._page_template(getattr(resp, "url", None))
+        relems = self._plan_css(page, "race_container", self.RACE_CONTAINER_SELECTORS, tpl)
 
         if not relems:
-            return [{"html": resp.text, "selector": page, "track": "Unknown", "race_number": 0, "date": date, "full_page": True}]
+            return [{"html": resp.text, "selector": page, "track": "Unknown", "race_number": 0, "date": date, "full_page": True, "template": tpl}]
 
         track_counters = defaultdict(int)
         last_track = "Unknown"
@@ -3326,7 +4207,7 @@ class TwinSpiresAdapter(JSONParsingMixin, DebugMixin, BaseAdapterV3):
 
                 # Try to find track name in the card, but fallback to the last seen track
                 # (addressing grouped race cards)
-                tn = self._find_with_selectors(relem, self.TRACK_NAME_SELECTORS)
+                tn = self._plan_text(relem, "track_name", self.TRACK_NAME_SELECTORS, tpl)
                 if tn:
                     last_track = tn.strip()
 
@@ -3335,7 +4216,7 @@ class TwinSpiresAdapter(JSONParsingMixin, DebugMixin, BaseAdapterV3):
                 track_counters[venue] += 1
                 rnum = track_counters[venue] # Track-specific index as default (Fixes Race 20 issue)
 
-                rn_txt = self._find_with_selectors(relem, self.RACE_NUMBER_SELECTORS)
+                rn_txt = self._plan_text(relem, "race_number", self.RACE_NUMBER_SELECTORS, tpl)
                 if rn_txt:
                     digits = "".join(filter(str.isdigit, rn_txt))
                     if digits: rnum = int(digits)
@@ -3345,25 +4226,16 @@ class TwinSpiresAdapter(JSONParsingMixin, DebugMixin, BaseAdapterV3):
                     "selector": relem,
                     "track": venue,
                     "race_number": rnum,
-                    "post_time_text": self._find_with_selectors(relem, self.POST_TIME_SELECTORS),
-                    "distance": self._find_with_selectors(relem, ['[class*="distance"]', '[class*="Distance"]', '[data-distance]', ".race-distance"]),
+                    "post_time_text": self._plan_text(relem, "post_time", self.POST_TIME_SELECTORS, tpl),
+                    "distance": self._plan_text(relem, "distance", self.DISTANCE_SELECTORS, tpl),
                     "date": date,
                     "full_page": False,
+                    "template": tpl,
                     "available_bets": scrape_available_bets(html_str)
                 })
             except Exception: continue
         return rd
 
-    def _find_with_selectors(self, el, selectors: List[str]) -> Optional[str]:
-        for s in selectors:
-            try:
-                f = el.css_first(s)
-                if f:
-                    t = node_text(f)
-                    if t: return t
-            except Exception: continue
-        return None
-
     def _parse_races(self, raw_data: Any) -> List[Race]:
         if not raw_data or "races" not in raw_data: return []
         rl, ds, parsed = raw_data["races"], raw_data.get("date", datetime.now(EASTERN).strftime("%Y-%m-%d")), []
@@ -3383,19 +4255,19 @@ class TwinSpiresAdapter(JSONParsingMixin, DebugMixin, BaseAdapterV3):
                 page = Selector(hc)
             else:
                 page = HTMLParser(hc)
-        tn, rnum = rd.get("track", "Unknown"), rd.get("race_number", 1)
-        st = self._parse_post_time(rd.get("post_time_text"), page, ds)
-        runners = self._parse_runners(page)
+        tn, rnum, tpl = rd.get("track", "Unknown"), rd.get("race_number", 1), rd.get("template")
+        st = self._parse_post_time(rd.get("post_time_text"), page, ds, tpl)
+        runners = self._parse_runners(page, tpl)
         disc = rd.get("assigned_discipline") or detect_discipline(hc)
         ab = scrape_available_bets(hc)
         return Race(discipline=disc, id=generate_race_id("ts", tn, st, rnum, disc), venue=tn, race_number=rnum, start_time=st, runners=runners, distance=rd.get("distance"), source=self.source_name, available_bets=ab)
 
-    def _parse_post_time(self, tt: Optional[str], page, ds: str) -> datetime:
+    def _parse_post_time(self, tt: Optional[str], page, ds: str, tpl: Optional[str] = None) -> datetime:
         bd = datetime.strptime(ds, "%Y-%m-%d").date()
         if tt:
             p = self._parse_time_string(tt, bd)
             if p: return p
-        for s in self.POST_TIME_SELECTORS:
+        for s in self._plan_selectors("post_time_node", self.POST_TIME_SELECTORS, tpl):
             try:
                 e = page.css_first(s)
                 if e:
@@ -3406,12 +4278,15 @@ class TwinSpiresAdapter(JSONParsingMixin, DebugMixin, BaseAdapterV3):
                             dt = datetime.fromisoformat(da.replace('Z', '+00:00'))
                             # Only trust the date from HTML if it's within 1 day of what we expected
                             if abs((dt.date() - bd).days) <= 1:
+                                self._plan_record("post_time_node", s, tpl)
                                 return dt
                             else:
                                 self.logger.debug("Suspicious date in HTML datetime attribute", html_dt=da, expected_date=bd)
                         except Exception: pass
                     p = self._parse_time_string(node_text(e), bd)
-                    if p: return p
+                    if p:
+                        self._plan_record("post_time_node", s, tpl)
+                        return p
             except Exception: continue
         return datetime.combine(bd, datetime.now(EASTERN).time()) + timedelta(hours=1)
 
@@ -3435,14 +4310,9 @@ class TwinSpiresAdapter(JSONParsingMixin, DebugMixin, BaseAdapterV3):
             except Exception: continue
         return None
 
-    def _parse_runners(self, page) -> List[Runner]:
+    def _parse_runners(self, page, tpl: Optional[str] = None) -> List[Runner]:
         runners = []
-        relems = []
-        for s in self.RUNNER_ROW_SELECTORS:
-            try:
-                el = page.css(s)
-                if el: relems = el; break
-            except Exception: continue
+        relems = self._plan_css(page, "runner_row", self.RUNNER_ROW_SELECTORS, tpl)
         for i, e in enumerate(relems):
             try:
                 r = self._parse_single_runner(e, i + 1)
@@ -3507,39 +4377,166 @@ class TwinSpiresAdapter(JSONParsingMixin, DebugMixin, BaseAdapterV3):
 log = structlog.get_logger(__name__)
 
 
-def _get_best_win_odds(runner: Runner) -> Optional[Decimal]:
-    """Gets the best win odds for a runner, filtering out invalid or placeholder values."""
+def odds_value(value: Any) -> float:
+    """
+    In-memory form of a (valid) price: the float nearest its decimal value.
+
+    For floats, ints, Decimals and numeric strings this equals
+    ``float(Decimal(str(value)))``, and it orders and compares exactly like the
+    Decimal did, so validation, merge and analysis can work on plain floats.
+    Convert to Decimal only at serialization boundaries.
+    """
+    return value if type(value) is float else float(value)
+
+
+def _odds_win(source_data: Any) -> Any:
+    if isinstance(source_data, dict):
+        return source_data.get('win')
+    return getattr(source_data, 'win', source_data)
+
+
+def _best_win_odds_value(runner: Runner) -> Optional[float]:
+    """Gets the best win odds for a runner as a float, filtering out invalid or placeholder values."""
     if not runner.odds:
         # Fallback to win_odds if available
         if runner.win_odds and is_valid_odds(runner.win_odds):
-            return Decimal(str(runner.win_odds))
+            return odds_value(runner.win_odds)
 
-    valid_odds = []
+    best = None
     for source_data in runner.odds.values():
         # Handle both dict and primitive formats
-        if isinstance(source_data, dict):
-            win = source_data.get('win')
-        elif hasattr(source_data, 'win'):
-            win = source_data.win
-        else:
-            win = source_data
-
+        win = _odds_win(source_data)
         if is_valid_odds(win):
-            valid_odds.append(Decimal(str(win)))
+            v = odds_value(win)
+            if best is None or v < best:
+                best = v
 
-    if valid_odds:
-        return min(valid_odds)
+    if best is not None:
+        return best
 
     # Final fallback to win_odds if present
     if runner.win_odds and is_valid_odds(runner.win_odds):
-        return Decimal(str(runner.win_odds))
+        return odds_value(runner.win_odds)
 
     return None
 
 
+def _get_best_win_odds(runner: Runner) -> Optional[Decimal]:
+    """Decimal form of _best_win_odds_value, for serialization and external callers."""
+    best = _best_win_odds_value(runner)
+    return None if best is None else Decimal(str(best))
+
+
+class RaceFeatures:
+    """
+    Derived per-race values shared by the validator, analyzers, reports and monitor.
+
+    Get them through ``race_features(race)``: for Race models the result is cached per
+    race object and recomputed automatically once its venue, discipline, start time,
+    runners (added, removed, scratched, renumbered) or odds change in place, so callers
+    never invalidate anything. Dict races (loaded from JSON) are computed on each call.
+    """
+
+    __slots__ = (
+        "track", "canonical_venue", "discipline_code", "start_time",
+        "active", "field_size", "best", "ranked", "fav_odds", "sec_fav_odds", "gap12",
+        "harness_by_id", "greyhound_by_id", "greyhound_by_source", "harness_by_source",
+    )
+
+    def __init__(self, race: Any) -> None:
+        venue = get_field(race, 'venue')
+        self.track = normalize_venue_name(venue)
+        self.canonical_venue = get_canonical_venue(venue)
+        discipline = get_field(race, 'discipline', '') or ""
+        d = discipline.lower()
+        self.discipline_code = "H" if "harness" in d or "standardbred" in d else "G" if "greyhound" in d or "dog" in d else "T"
+        st = get_field(race, 'start_time')
+        self.start_time = ensure_eastern(st) if isinstance(st, datetime) else None
+
+        self.active = [run for run in get_field(race, 'runners', []) or [] if not get_field(run, 'scratched', False)]
+        self.field_size = len(self.active)
+        self.best: Dict[int, float] = {}
+        ranked = []
+        for run in self.active:
+            odds = _best_win_odds_value(run) if isinstance(run, Runner) else None
+            if odds is not None:
+                self.best[id(run)] = odds
+                ranked.append((run, odds))
+        ranked.sort(key=lambda x: x[1])
+        self.ranked: List[Tuple[Any, float]] = ranked
+        self.fav_odds = ranked[0][1] if ranked else None
+        self.sec_fav_odds = ranked[1][1] if len(ranked) >= 2 else None
+        # Exact decimal difference of the two prices; float subtraction rounds differently at half-cents
+        self.gap12 = round(float(Decimal(str(self.sec_fav_odds)) - Decimal(str(self.fav_odds))), 2) if len(ranked) >= 2 else 0.0
+
+        # Track-category signals (see get_track_category)
+        source = get_field(race, 'source', '') or ""
+        race_id = (get_field(race, 'id', '') or "").lower()
+        source_lower = source.lower()
+        self.harness_by_id = discipline == "Harness" or '_h' in race_id
+        self.greyhound_by_id = discipline == "Greyhound" or '_g' in race_id
+        self.greyhound_by_source = "greyhound" in source_lower or source in ["GBGB", "Greyhound", "AtTheRacesGreyhound"]
+        self.harness_by_source = source in ["USTrotting", "StandardbredCanada", "Harness"] or any(kw in source_lower for kw in ['harness', 'standardbred', 'trot', 'pace'])
+
+    @property
+    def favorite(self) -> Optional[Any]:
+        return self.ranked[0][0] if self.ranked else None
+
+    @property
+    def second_favorite(self) -> Optional[Any]:
+        return self.ranked[1][0] if len(self.ranked) >= 2 else None
+
+    def top_numbers(self, n: int = 5) -> str:
+        return ", ".join(str(get_field(run, 'number') or '?') for run, _ in self.ranked[:n])
+
+    def mtp(self, now: Optional[datetime] = None) -> Optional[int]:
+        """Whole minutes to post (truncated toward zero), None without a start time."""
+        if self.start_time is None:
+            return None
+        return int((self.start_time - (now or now_eastern())).total_seconds() / 60)
+
+
+_race_features: Dict[int, Tuple[Any, tuple, RaceFeatures]] = {}
+
+
+def _feature_inputs(race: Race) -> tuple:
+    """Everything RaceFeatures reads from a race, runner identity included (no derived values)."""
+    return (
+        race.venue, race.discipline, race.source, race.id, race.start_time,
+        tuple((id(run), run.number, run.scratched, run.win_odds, tuple(map(_odds_win, run.odds.values())))
+              for run in race.runners),
+    )
+
+
+def race_features(race: Any) -> RaceFeatures:
+    """Cached RaceFeatures for ``race``; see RaceFeatures."""
+    if not isinstance(race, Race):
+        return RaceFeatures(race)
+    key = id(race)
+    inputs = _feature_inputs(race)
+    entry = _race_features.get(key)
+    if entry is not None and entry[0]() is race and entry[1] == inputs:
+        return entry[2]
+    features = RaceFeatures(race)
+    _race_features[key] = (weakref.ref(race, lambda _, k=key: _race_features.pop(k, None)), inputs, features)
+    return features
+
+
+def build_track_categories(races: List[Any]) -> Dict[str, str]:
+    """Track -> category (T/H/G) for every track in ``races``."""
+    races_by_track = defaultdict(list)
+    for r in races:
+        races_by_track[race_features(r).track].append(r)
+    return {track: get_track_category(tr_races) for track, tr_races in races_by_track.items()}
+
+
 class BaseAnalyzer(ABC):
     """The abstract interface for all future analyzer plugins."""
 
+    # RaceFeatures fields read by qualify_race(); AnalyzerEngine.qualify_all computes the
+    # features once per race and hands the same object to every analyzer that declares any
+    FEATURES: ClassVar[Tuple[str, ...]] = ()
+
     def __init__(self, config: Optional[Dict[str, Any]] = None, **kwargs):
         self.logger = structlog.get_logger(self.__class__.__name__)
         self.config = config or {}
@@ -3550,9 +4547,29 @@ class BaseAnalyzer(ABC):
         pass
 
 
-class TrifectaAnalyzer(BaseAnalyzer):
+class SinglePassAnalyzer(BaseAnalyzer):
+    """
+    An analyzer that decides race by race. AnalyzerEngine.qualify_all runs every
+    SinglePassAnalyzer in one shared pass over the races instead of letting each scan
+    them itself.
+    """
+
+    @abstractmethod
+    def qualify_race(self, race: Race, feats: Optional[RaceFeatures] = None) -> bool:
+        """Accepts or rejects one race, scoring (and annotating) it when accepted."""
+        pass
+
+    @abstractmethod
+    def summarize(self, qualified: List[Race], races: List[Race]) -> Dict[str, Any]:
+        """Builds the qualify_races result from the races qualify_race accepted."""
+        pass
+
+
+class TrifectaAnalyzer(SinglePassAnalyzer):
     """Analyzes races and assigns a qualification score based on the 'Trifecta of Factors'."""
 
+    FEATURES = ("active", "field_size", "ranked", "fav_odds", "sec_fav_odds")
+
     @property
     def name(self) -> str:
         return "trifecta_analyzer"
@@ -3567,11 +4584,11 @@ class TrifectaAnalyzer(BaseAnalyzer):
         super().__init__(**kwargs)
         # Use config value if provided and no explicit override (GPT5 Improvement)
         self.max_field_size = max_field_size or self.config.get("analysis", {}).get("max_field_size", 11)
-        self.min_favorite_odds = Decimal(str(min_favorite_odds))
-        self.min_second_favorite_odds = Decimal(str(min_second_favorite_odds))
+        self.min_favorite_odds = odds_value(min_favorite_odds)
+        self.min_second_favorite_odds = odds_value(min_second_favorite_odds)
         self.notifier = RaceNotifier()
 
-    def is_race_qualified(self, race: Race) -> bool:
+    def is_race_qualified(self, race: Race, feats: Optional[RaceFeatures] = None) -> bool:
         """A race is qualified for a trifecta if it has at least 3 non-scratched runners."""
         if not race or not race.runners:
             return False
@@ -3586,44 +4603,43 @@ class TrifectaAnalyzer(BaseAnalyzer):
         if st < past_cutoff or st > future_cutoff:
             return False
 
-        active_runners = sum(1 for r in race.runners if not r.scratched)
-        return active_runners >= 3
+        return (feats or race_features(race)).field_size >= 3
 
-    def qualify_races(self, races: List[Race]) -> Dict[str, Any]:
-        """Scores all races and returns a dictionary with criteria and a sorted list."""
-        qualified_races = []
-        TRUSTWORTHY_RATIO_MIN = self.config.get("analysis", {}).get("trustworthy_ratio_min", 0.7)
+    def qualify_race(self, race: Race, feats: Optional[RaceFeatures] = None) -> bool:
+        """Timing, trust, placeholder-odds and scoring checks for one race; True when it scores."""
+        if not self.is_race_qualified(race, feats):
+            return False
 
-        for race in races:
-            if not self.is_race_qualified(race):
-                continue
+        TRUSTWORTHY_RATIO_MIN = self.config.get("analysis", {}).get("trustworthy_ratio_min", 0.7)
+        feats = feats or race_features(race)
+        total_active = feats.field_size
 
-            active_runners = [r for r in race.runners if not r.scratched]
-            total_active = len(active_runners)
+        # Trustworthiness Airlock (Success Playbook Item)
+        if total_active > 0:
+            trustworthy_count = sum(1 for r in feats.active if r.metadata.get("odds_source_trustworthy"))
+            if trustworthy_count / total_active < TRUSTWORTHY_RATIO_MIN:
+                log.warning("Not enough trustworthy odds for Trifecta; skipping", venue=race.venue, race=race.race_number, ratio=round(trustworthy_count/total_active, 2))
+                return False
 
-            # Trustworthiness Airlock (Success Playbook Item)
-            if total_active > 0:
-                trustworthy_count = sum(1 for r in active_runners if r.metadata.get("odds_source_trustworthy"))
-                if trustworthy_count / total_active < TRUSTWORTHY_RATIO_MIN:
-                    log.warning("Not enough trustworthy odds for Trifecta; skipping", venue=race.venue, race=race.race_number, ratio=round(trustworthy_count/total_active, 2))
-                    continue
+        # Uniform Odds Check
+        all_odds = [odds for _, odds in feats.ranked if odds]
 
-            # Uniform Odds Check
-            all_odds = []
-            for runner in active_runners:
-                odds = _get_best_win_odds(runner)
-                if odds: all_odds.append(odds)
+        if len(all_odds) >= 3 and len(set(all_odds)) == 1:
+            log.warning("Race contains uniform odds; likely placeholder. Skipping Trifecta.", venue=race.venue, race=race.race_number)
+            return False
 
-            if len(all_odds) >= 3 and len(set(all_odds)) == 1:
-                log.warning("Race contains uniform odds; likely placeholder. Skipping Trifecta.", venue=race.venue, race=race.race_number)
-                continue
+        score = self._evaluate_race(race, feats)
+        if score > 0:
+            race.qualification_score = score
+            return True
+        return False
 
-            score = self._evaluate_race(race)
-            if score > 0:
-                race.qualification_score = score
-                qualified_races.append(race)
+    def qualify_races(self, races: List[Race]) -> Dict[str, Any]:
+        """Scores all races and returns a dictionary with criteria and a sorted list."""
+        return self.summarize([race for race in races if self.qualify_race(race)], races)
 
-        qualified_races.sort(key=lambda r: r.qualification_score, reverse=True)
+    def summarize(self, qualified: List[Race], races: List[Race]) -> Dict[str, Any]:
+        qualified_races = sorted(qualified, key=lambda r: r.qualification_score, reverse=True)
 
         criteria = {
             "max_field_size": self.max_field_size,
@@ -3643,7 +4659,7 @@ class TrifectaAnalyzer(BaseAnalyzer):
 
         return {"criteria": criteria, "races": qualified_races}
 
-    def _evaluate_race(self, race: Race) -> float:
+    def _evaluate_race(self, race: Race, feats: Optional[RaceFeatures] = None) -> float:
         """Evaluates a single race and returns a qualification score."""
         # --- Constants for Scoring Logic ---
         FAV_ODDS_NORMALIZATION = 10.0
@@ -3653,37 +4669,31 @@ class TrifectaAnalyzer(BaseAnalyzer):
         FIELD_SIZE_SCORE_WEIGHT = 0.3
         ODDS_SCORE_WEIGHT = 0.7
 
-        active_runners = [r for r in race.runners if not r.scratched]
-
-        runners_with_odds = []
-        for runner in active_runners:
-            best_odds = _get_best_win_odds(runner)
-            if best_odds is not None:
-                runners_with_odds.append((runner, best_odds))
+        feats = feats or race_features(race)
+        field_size = feats.field_size
 
-        if len(runners_with_odds) < 2:
-            if len(active_runners) >= 2:
+        if len(feats.ranked) < 2:
+            if field_size >= 2:
                 # If we have runners but no odds, use fallbacks
-                favorite_odds = Decimal(str(DEFAULT_ODDS_FALLBACK))
-                second_favorite_odds = Decimal(str(DEFAULT_ODDS_FALLBACK))
+                favorite_odds = odds_value(DEFAULT_ODDS_FALLBACK)
+                second_favorite_odds = odds_value(DEFAULT_ODDS_FALLBACK)
             else:
                 return 0.0
         else:
-            runners_with_odds.sort(key=lambda x: x[1])
-            favorite_odds = runners_with_odds[0][1]
-            second_favorite_odds = runners_with_odds[1][1]
+            favorite_odds = feats.fav_odds
+            second_favorite_odds = feats.sec_fav_odds
 
         # --- Calculate Qualification Score (as inspired by the TypeScript Genesis) ---
         # --- Apply hard filters before scoring ---
         if (
-            len(active_runners) > self.max_field_size
-            or favorite_odds < Decimal("2.0")
+            field_size > self.max_field_size
+            or favorite_odds < 2.0
             or favorite_odds < self.min_favorite_odds
             or second_favorite_odds < self.min_second_favorite_odds
         ):
             return 0.0
 
-        field_score = (self.max_field_size - len(active_runners)) / self.max_field_size
+        field_score = (self.max_field_size - field_size) / self.max_field_size
 
         # Normalize odds scores - cap influence of extremely high odds
         fav_odds_score = min(float(favorite_odds) / FAV_ODDS_NORMALIZATION, 1.0)
@@ -3712,105 +4722,111 @@ class TinyFieldTrifectaAnalyzer(TrifectaAnalyzer):
         return "tiny_field_trifecta_analyzer"
 
 
-class SimplySuccessAnalyzer(BaseAnalyzer):
+class SimplySuccessAnalyzer(SinglePassAnalyzer):
     """An analyzer that qualifies every race to show maximum successes (HTTP 200)."""
 
+    FEATURES = ("active", "field_size", "ranked", "sec_fav_odds", "gap12")
+
     @property
     def name(self) -> str:
         return "simply_success"
 
-    def qualify_races(self, races: List[Race]) -> Dict[str, Any]:
-        """Returns races with a perfect score, applying global timing and chalk filters."""
-        qualified = []
-        now = datetime.now(EASTERN)
+    def _trusted_ratio(self, feats: RaceFeatures) -> Optional[float]:
+        if feats.field_size == 0:
+            return None
+        return sum(1 for r in feats.active if r.metadata.get("odds_source_trustworthy")) / feats.field_size
 
+    def _rejection(self, feats: RaceFeatures) -> Optional[str]:
+        """Why qualify_race would reject a race with these features, or None."""
         # Success Playbook Hardening (Council of Superbrains)
-        TRUSTWORTHY_RATIO_MIN = self.config.get("analysis", {}).get("trustworthy_ratio_min", 0.7)
+        trustworthy_ratio_min = self.config.get("analysis", {}).get("trustworthy_ratio_min", 0.7)
+        # Trustworthiness Airlock (Success Playbook Item)
+        ratio = self._trusted_ratio(feats)
+        if ratio is not None and ratio < trustworthy_ratio_min:
+            return "untrusted"
+        # Uniform Odds Check: If all runners have identical odds, it's likely a placeholder card (Memory Directive Fix)
+        all_odds = [odds for _, odds in feats.ranked]
+        if len(all_odds) >= 3 and len(set(all_odds)) == 1:
+            return "uniform_odds"
+        # Stability Check: Ensure we have at least 2 active runners to compare
+        if len(feats.active) < 2:
+            return "small_field"
+        return None
 
-        for race in races:
-            # 1. Timing Filter: Relaxed for "News" mode (GPT5: Caller handles strict timing)
-            st = race.start_time
-            if st.tzinfo is None:
-                st = st.replace(tzinfo=EASTERN)
-
-            # Goldmine Detection: 2nd favorite >= 4.5 decimal
-            is_goldmine = False
-            is_best_bet = False
-            active_runners = [r for r in race.runners if not r.scratched]
-            total_active = len(active_runners)
+    def accepts(self, race: Race) -> bool:
+        """Whether qualify_race would qualify ``race``, without annotating or logging anything."""
+        return self._rejection(race_features(race)) is None
+
+    def qualify_race(self, race: Race, feats: Optional[RaceFeatures] = None) -> bool:
+        """Scores and annotates a single race; True when it qualifies (safe to call again as data arrives)."""
+        # Goldmine Detection: 2nd favorite >= 4.5 decimal
+        is_goldmine = False
+        is_best_bet = False
+        feats = feats or race_features(race)
+        active_runners = feats.active
+        rejection = self._rejection(feats)
+
+        if rejection == "untrusted":
+            self.logger.warning("Not enough trustworthy odds; skipping race", venue=race.venue, race=race.race_number, ratio=round(self._trusted_ratio(feats), 2))
+            return False
 
-            # Trustworthiness Airlock (Success Playbook Item)
-            if total_active > 0:
-                trustworthy_count = sum(1 for r in active_runners if r.metadata.get("odds_source_trustworthy"))
-                if trustworthy_count / total_active < TRUSTWORTHY_RATIO_MIN:
-                    self.logger.warning("Not enough trustworthy odds; skipping race", venue=race.venue, race=race.race_number, ratio=round(trustworthy_count/total_active, 2))
-                    continue
+        gap12 = 0.0
 
-            gap12 = 0.0
-            all_odds = []
+        # 1. Collect and Enrich Odds (ranked ascending by best odds)
+        for runner, odds in feats.ranked:
+            # Propagate fresh odds to runner object for reporting
+            runner.win_odds = odds
+        all_odds = [odds for _, odds in feats.ranked]
 
-            # 1. Collect and Enrich Odds
-            for runner in active_runners:
-                odds = _get_best_win_odds(runner)
-                if odds is not None:
-                    # Propagate fresh odds to runner object for reporting
-                    runner.win_odds = float(odds)
-                    all_odds.append(odds)
+        if rejection == "uniform_odds":
+            self.logger.warning("Race contains uniform odds; likely placeholder data. Skipping.", venue=race.venue, race=race.race_number, odds=float(all_odds[0]))
+            return False
 
-            # Sort odds ascending
-            all_odds.sort()
+        if rejection == "small_field":
+            log.debug("Excluding race with < 2 runners", venue=race.venue)
+            return False
 
-            # Uniform Odds Check: If all runners have identical odds, it's likely a placeholder card (Memory Directive Fix)
-            if len(all_odds) >= 3 and len(set(all_odds)) == 1:
-                self.logger.warning("Race contains uniform odds; likely placeholder data. Skipping.", venue=race.venue, race=race.race_number, odds=float(all_odds[0]))
-                continue
+        # 2. Derive Selection (2nd favorite) and Top 5
+        race.top_five_numbers = feats.top_numbers(5)
 
-            # Stability Check: Ensure we have at least 2 active runners to compare
-            if len(active_runners) < 2:
-                log.debug("Excluding race with < 2 runners", venue=race.venue)
-                continue
-
-            # 2. Derive Selection (2nd favorite) and Top 5
-            # Collect valid runners with their enriched odds
-            valid_r_with_odds = sorted(
-                [(r, Decimal(str(r.win_odds))) for r in active_runners if r.win_odds is not None],
-                key=lambda x: x[1]
-            )
-            race.top_five_numbers = ", ".join([str(r[0].number or '?') for r in valid_r_with_odds[:5]])
+        sec_fav = feats.second_favorite
+        if sec_fav is not None:
+            race.metadata['selection_number'] = sec_fav.number
+            race.metadata['selection_name'] = sec_fav.name
 
-            if len(valid_r_with_odds) >= 2:
-                sec_fav = valid_r_with_odds[1][0]
-                race.metadata['selection_number'] = sec_fav.number
-                race.metadata['selection_name'] = sec_fav.name
+        # 3. Apply Best Bet Logic
+        if len(all_odds) >= 2:
+            sec = feats.sec_fav_odds
+            gap12 = feats.gap12
 
-            # 3. Apply Best Bet Logic
-            if len(all_odds) >= 2:
-                fav, sec = all_odds[0], all_odds[1]
-                gap12 = round(float(sec - fav), 2)
+            # Enforce gap requirement
+            if gap12 <= 0.25:
+                log.debug("Insufficient gap detected (1Gap2 <= 0.25), ineligible for Best Bet treatment", venue=race.venue, race=race.race_number, gap=gap12)
+            else:
+                # Goldmine = 2nd Fav >= 4.5, Field <= 11, Gap > 0.25
+                if len(active_runners) <= 11 and sec >= 4.5:
+                    is_goldmine = True
 
-                # Enforce gap requirement
-                if gap12 <= 0.25:
-                    log.debug("Insufficient gap detected (1Gap2 <= 0.25), ineligible for Best Bet treatment", venue=race.venue, race=race.race_number, gap=gap12)
-                else:
-                    # Goldmine = 2nd Fav >= 4.5, Field <= 11, Gap > 0.25
-                    if len(active_runners) <= 11 and sec >= Decimal("4.5"):
-                        is_goldmine = True
+                # You Might Like = 2nd Fav >= 3.5, Field <= 11, Gap > 0.25
+                if len(active_runners) <= 11 and sec >= 3.5:
+                    is_best_bet = True
 
-                    # You Might Like = 2nd Fav >= 3.5, Field <= 11, Gap > 0.25
-                    if len(active_runners) <= 11 and sec >= Decimal("3.5"):
-                        is_best_bet = True
+            race.metadata['predicted_2nd_fav_odds'] = float(sec)
+        else:
+            # Fallback if insufficient odds data
+            race.metadata['predicted_2nd_fav_odds'] = None
 
-                race.metadata['predicted_2nd_fav_odds'] = float(sec)
-            else:
-                # Fallback if insufficient odds data
-                race.metadata['predicted_2nd_fav_odds'] = None
+        race.metadata['is_goldmine'] = is_goldmine
+        race.metadata['is_best_bet'] = is_best_bet
+        race.metadata['1Gap2'] = gap12
+        race.qualification_score = 100.0
+        return True
 
-            race.metadata['is_goldmine'] = is_goldmine
-            race.metadata['is_best_bet'] = is_best_bet
-            race.metadata['1Gap2'] = gap12
-            race.qualification_score = 100.0
-            qualified.append(race)
+    def qualify_races(self, races: List[Race]) -> Dict[str, Any]:
+        """Returns races with a perfect score, applying global timing and chalk filters."""
+        return self.summarize([race for race in races if self.qualify_race(race)], races)
 
+    def summarize(self, qualified: List[Race], races: List[Race]) -> Dict[str, Any]:
         if not qualified:
             log.warning("🔭 SimplySuccess analyzer pass returned 0 qualified races", input_count=len(races))
 
@@ -3825,27 +4841,156 @@ class SimplySuccessAnalyzer(BaseAnalyzer):
         }
 
 
+# Built-in analyzers as "module:attribute" targets. Further plugins come from the
+# "fortuna.analyzers" entry-point group and the [analyzers] table in config.toml.
+ANALYZER_MANIFEST: Final[Dict[str, str]] = {
+    "trifecta":            f"{__name__}:TrifectaAnalyzer",
+    "tiny_field_trifecta": f"{__name__}:TinyFieldTrifectaAnalyzer",
+    "simply_success":      f"{__name__}:SimplySuccessAnalyzer",
+}
+ANALYZER_ENTRY_POINT_GROUP: Final[str] = "fortuna.analyzers"
+
+
+@dataclass
+class AnalyzerPlugin:
+    """A registered analyzer; the class is imported the first time the plugin is selected."""
+    name: str
+    target: str
+    analyzer_class: Optional[Type[BaseAnalyzer]] = None
+    import_seconds: Optional[float] = None
+    first_evaluation_seconds: Optional[float] = None
+
+
+class AnalyzerRegistry(Mapping):
+    """
+    Analyzer name -> class, resolved lazily.
+
+    Listing names reads the manifest and entry points without importing anything; looking
+    a name up imports that plugin's module once and records how long it took; a target that
+    fails to import is logged and looked up as missing (KeyError). The first evaluation of
+    each plugin is timed as well (see AnalyzerEngine.qualify and qualify_all).
+
+    A registry built with ``parent`` shares the parent's plugin records (imports and timings
+    happen once per process) while names added to it stay local.
+    """
+
+    def __init__(
+        self,
+        manifest: Optional[Dict[str, str]] = None,
+        entry_points: bool = True,
+        parent: Optional["AnalyzerRegistry"] = None,
+    ):
+        self.plugins: Dict[str, AnalyzerPlugin] = dict(parent.plugins) if parent is not None else {}
+        self._parent = parent
+        self._lock = parent._lock if parent is not None else threading.Lock()
+        self._entry_points_pending = entry_points
+        for name, target in {**({} if parent is not None else ANALYZER_MANIFEST), **(manifest or {})}.items():
+            self.add(name, target)
+
+    def add(self, name: str, target: Union[str, Type[BaseAnalyzer]]) -> None:
+        """Registers a "module:attribute" target, or an already imported class."""
+        with self._lock:
+            if isinstance(target, str):
+                self.plugins[name] = AnalyzerPlugin(name, target)
+            else:
+                self.plugins[name] = AnalyzerPlugin(
+                    name, f"{target.__module__}:{target.__qualname__}", analyzer_class=target, import_seconds=0.0,
+                )
+
+    def _discover_entry_points(self) -> None:
+        if self._parent is not None:
+            self._parent._discover_entry_points()
+            for name, plugin in self._parent.plugins.items():
+                self.plugins.setdefault(name, plugin)
+            return
+        if not self._entry_points_pending:
+            return
+        self._entry_points_pending = False
+        try:
+            found = importlib.metadata.entry_points(group=ANALYZER_ENTRY_POINT_GROUP)
+        except Exception as e:
+            log.warning("Analyzer entry point discovery failed", error=str(e))
+            return
+        for ep in found:
+            if ep.name not in self.plugins:  # the manifest and config win over installed packages
+                self.add(ep.name, ep.value)
+        log.info("AnalyzerEngine discovered plugins", available_analyzers=list(self.plugins))
+
+    def __getitem__(self, name: str) -> Type[BaseAnalyzer]:
+        if name not in self.plugins:
+            self._discover_entry_points()
+        plugin = self.plugins[name]
+        if plugin.analyzer_class is None:
+            with self._lock:
+                if plugin.analyzer_class is None:
+                    module_name, _, attr = plugin.target.partition(":")
+                    started = time.perf_counter()
+                    try:
+                        analyzer_class = getattr(importlib.import_module(module_name), attr)
+                    except Exception as e:
+                        log.error("Analyzer plugin failed to load", analyzer=name, target=plugin.target, error=str(e))
+                        raise KeyError(name) from e
+                    plugin.import_seconds = time.perf_counter() - started
+                    plugin.analyzer_class = analyzer_class
+                    log.info("Analyzer plugin loaded", analyzer=name, target=plugin.target,
+                             import_ms=round(plugin.import_seconds * 1000, 2))
+        return plugin.analyzer_class
+
+    def __contains__(self, name: object) -> bool:
+        if name not in self.plugins:
+            self._discover_entry_points()
+        return name in self.plugins
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover_entry_points()
+        return iter(list(self.plugins))
+
+    def __len__(self) -> int:
+        self._discover_entry_points()
+        return len(self.plugins)
+
+    def loaded(self) -> List[str]:
+        return [name for name, plugin in self.plugins.items() if plugin.analyzer_class is not None]
+
+    def record_evaluation(self, name: str, seconds: float) -> None:
+        plugin = self.plugins.get(name)
+        if plugin is not None and plugin.first_evaluation_seconds is None:
+            plugin.first_evaluation_seconds = seconds
+            log.info("Analyzer first evaluation", analyzer=name, evaluation_ms=round(seconds * 1000, 2))
+
+    def timings(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Import and first-evaluation seconds of every plugin loaded so far."""
+        return {
+            name: {"import": p.import_seconds, "first_evaluation": p.first_evaluation_seconds}
+            for name, p in self.plugins.items() if p.analyzer_class is not None
+        }
+
+
+_analyzer_registry: Optional[AnalyzerRegistry] = None
+
+
+def get_analyzer_registry() -> AnalyzerRegistry:
+    """Process-wide AnalyzerRegistry, built on first use."""
+    global _analyzer_registry
+    if _analyzer_registry is None:
+        _analyzer_registry = AnalyzerRegistry()
+    return _analyzer_registry
+
+
 class AnalyzerEngine:
-    """Discovers and manages all available analyzer plugins."""
+    """Selects analyzer plugins from the AnalyzerRegistry, importing only the ones used."""
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
-        self.analyzers: Dict[str, Type[BaseAnalyzer]] = {}
+    def __init__(self, config: Optional[Dict[str, Any]] = None, registry: Optional[AnalyzerRegistry] = None):
         self.config = config or {}
-        self._discover_analyzers()
-
-    def _discover_analyzers(self):
-        # In a real plugin system, this would inspect a folder.
-        # For now, we register them manually.
-        self.register_analyzer("trifecta", TrifectaAnalyzer)
-        self.register_analyzer("tiny_field_trifecta", TinyFieldTrifectaAnalyzer)
-        self.register_analyzer("simply_success", SimplySuccessAnalyzer)
-        log.info(
-            "AnalyzerEngine discovered plugins",
-            available_analyzers=list(self.analyzers.keys()),
-        )
+        shared = registry if registry is not None else get_analyzer_registry()
+        # [analyzers] in config.toml names process-wide plugins; register_analyzer stays per engine
+        for name, target in (self.config.get("analyzers") or {}).items():
+            if name not in shared.plugins or shared.plugins[name].target != target:
+                shared.add(name, target)
+        self.analyzers = AnalyzerRegistry(parent=shared)
 
     def register_analyzer(self, name: str, analyzer_class: Type[BaseAnalyzer]):
-        self.analyzers[name] = analyzer_class
+        self.analyzers.add(name, analyzer_class)
 
     def get_analyzer(self, name: str, **kwargs) -> BaseAnalyzer:
         analyzer_class = self.analyzers.get(name)
@@ -3854,6 +4999,61 @@ class AnalyzerEngine:
             raise ValueError(f"Analyzer '{name}' not found.")
         return analyzer_class(config=self.config, **kwargs)
 
+    def qualify(self, name: str, races: List[Race], **kwargs) -> Dict[str, Any]:
+        """Runs analyzer ``name`` (built with ``kwargs``) over ``races``, timing the plugin's first evaluation."""
+        analyzer = self.get_analyzer(name, **kwargs)
+        started = time.perf_counter()
+        result = analyzer.qualify_races(races)
+        self.analyzers.record_evaluation(name, time.perf_counter() - started)
+        return result
+
+    def qualify_all(
+        self,
+        races: List[Race],
+        names: Optional[List[str]] = None,
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Runs several analyzers (default: all registered) over ``races`` in a single pass.
+
+        Each race's features are computed once and shared by every analyzer, so the cost
+        grows with the races rather than races x analyzers. Analyzers that are not
+        SinglePassAnalyzers run their own ``qualify_races`` afterwards. ``overrides``
+        maps an analyzer name to its constructor kwargs.
+        """
+        overrides = overrides or {}
+        analyzers = {name: self.get_analyzer(name, **overrides.get(name, {})) for name in (names or self.analyzers)}
+        shared = {name: a for name, a in analyzers.items() if isinstance(a, SinglePassAnalyzer)}
+        needs_features = any(a.FEATURES for a in shared.values())
+
+        accepted: Dict[str, List[Tuple[Race, Optional[float]]]] = {name: [] for name in shared}
+        # Per-analyzer time in the shared pass, kept only for plugins never evaluated before
+        spent = {name: 0.0 for name in shared if self.analyzers.plugins[name].first_evaluation_seconds is None}
+        for race in races:
+            feats = race_features(race) if needs_features else None
+            for name, analyzer in shared.items():
+                if spent:
+                    started = time.perf_counter()
+                if analyzer.qualify_race(race, feats):
+                    accepted[name].append((race, race.qualification_score))
+                if name in spent:
+                    spent[name] += time.perf_counter() - started
+
+        results = {}
+        for name, analyzer in analyzers.items():
+            if name not in shared:
+                results[name] = analyzer.qualify_races(races)
+                continue
+            # Races are shared objects: restore this analyzer's scores before it sorts and
+            # reports, which leaves them as if the analyzers had run one after another
+            started = time.perf_counter()
+            for race, score in accepted[name]:
+                race.qualification_score = score
+            results[name] = analyzer.summarize([race for race, _ in accepted[name]], races)
+            if name in spent:
+                self.analyzers.record_evaluation(name, spent[name] + time.perf_counter() - started)
+        return results
+
 
 class AudioAlertSystem:
     """Plays sound alerts for important events."""
@@ -3918,6 +5118,25 @@ class RaceNotifier:
         except Exception as e:
             log.error("Failed to send notification", error=str(e))
 
+    def notify_monitor_event(self, event):
+        """MonitorEventBus subscriber: alerts once per race as it enters the BET NOW list."""
+        if event.kind != "qualified" or event.key in self.notified_races:
+            return
+        r = event.summary
+        log.info("BET NOW opportunity", track=r.track, race=r.race_number, mtp=r.mtp, second_fav_odds=r.second_fav_odds)
+        if not self.notifications_enabled or self.notifier is None:
+            return
+        try:
+            self.notifier.send(
+                title="🎯 BET NOW",
+                message=f"{r.track} - Race {r.race_number}\n2nd Fav: {r.second_fav_odds:.2f}  MTP: {r.mtp}",
+                urgency="high" if r.superfecta_offered else "normal",
+            )
+            self.notified_races.add(event.key)
+            self.audio_system.play("high_value")
+        except Exception as e:
+            log.error("Failed to send notification", error=str(e))
+
 
 # ----------------------------------------
 def get_track_category(races_at_track: List[Any]) -> str:
@@ -3925,28 +5144,18 @@ def get_track_category(races_at_track: List[Any]) -> str:
     if not races_at_track:
         return 'T'
 
-    # Never allow any track with a field size above 7 to be G
-    has_large_field = False
-    for r in races_at_track:
-        runners = get_field(r, 'runners', [])
-        active_runners = len([run for run in runners if not get_field(run, 'scratched', False)])
-        if active_runners > 7:
-            has_large_field = True
-            break
+    features = [race_features(r) for r in races_at_track]
 
-    for race in races_at_track:
-        source = get_field(race, 'source', '') or ""
-        race_id = (get_field(race, 'id', '') or "").lower()
-        discipline = get_field(race, 'discipline', '') or ""
+    # Never allow any track with a field size above 7 to be G
+    has_large_field = any(f.field_size > 7 for f in features)
 
-        if discipline == "Harness" or '_h' in race_id: return 'H'
-        if (discipline == "Greyhound" or '_g' in race_id) and not has_large_field:
+    for f in features:
+        if f.harness_by_id: return 'H'
+        if f.greyhound_by_id and not has_large_field:
             return 'G'
-
-        source_lower = source.lower()
-        if ("greyhound" in source_lower or source in ["GBGB", "Greyhound", "AtTheRacesGreyhound"]) and not has_large_field:
+        if f.greyhound_by_source and not has_large_field:
             return 'G'
-        if source in ["USTrotting", "StandardbredCanada", "Harness"] or any(kw in source_lower for kw in ['harness', 'standardbred', 'trot', 'pace']):
+        if f.harness_by_source:
             return 'H'
 
     # Distance consistency check (Disabled - was mis-identifying Thoroughbred tracks)
@@ -3966,9 +5175,7 @@ def generate_fortuna_fives(races: List[Any], all_races: Optional[List[Any]] = No
     lines = ["", "", "FORTUNA FIVES", "-------------"]
     fives = []
     for race in (all_races or races):
-        runners = get_field(race, 'runners', [])
-        field_size = len([r for r in runners if not get_field(r, 'scratched', False)])
-        if field_size == 5:
+        if race_features(race).field_size == 5:
             fives.append(race)
 
     if not fives:
@@ -3979,11 +5186,11 @@ def generate_fortuna_fives(races: List[Any], all_races: Optional[List[Any]] = No
     track_odds_counts = defaultdict(int)
     stats_races = all_races if all_races is not None else races
     for race in stats_races:
-        v = get_field(race, 'venue')
-        track = normalize_venue_name(v)
-        for runner in get_field(race, 'runners', []):
+        feats = race_features(race)
+        track = feats.track
+        for runner in feats.active:
             win_odds = get_field(runner, 'win_odds')
-            if not get_field(runner, 'scratched') and win_odds:
+            if win_odds:
                 track_odds_sums[track] += float(win_odds)
                 track_odds_counts[track] += 1
 
@@ -3995,9 +5202,8 @@ def generate_fortuna_fives(races: List[Any], all_races: Optional[List[Any]] = No
 
     track_to_nums = defaultdict(list)
     for r in fives:
-        v = get_field(r, 'venue')
-        if v:
-            track_to_nums[normalize_venue_name(v)].append(get_field(r, 'race_number'))
+        if get_field(r, 'venue'):
+            track_to_nums[race_features(r).track].append(get_field(r, 'race_number'))
 
     for track in sorted(track_to_nums.keys()):
         nums = sorted(list(set(track_to_nums[track])))
@@ -4007,10 +5213,11 @@ def generate_fortuna_fives(races: List[Any], all_races: Optional[List[Any]] = No
     return "\n".join(lines)
 
 
-def generate_field_matrix(races: List[Any]) -> str:
+def generate_field_matrix(races: List[Any], table: Optional[RaceTable] = None) -> str:
     """
     Generates a Markdown table matrix of races by Track and Field Size.
     Cells contain alphabetic race codes (lowercase=normal, uppercase=goldmine).
+    Pass the run's RaceTable (built from ``races``) to scan columns instead of models.
     """
     if not races:
         return "No races available for field matrix."
@@ -4018,15 +5225,21 @@ def generate_field_matrix(races: List[Any]) -> str:
     # Group races by Track and Field Size
     matrix = defaultdict(lambda: defaultdict(list))
 
-    for r in races:
-        track = normalize_venue_name(get_field(r, 'venue'))
-        field_size = len([run for run in get_field(r, 'runners', []) if not get_field(run, 'scratched', False)])
+    if table is not None:
+        tracks, sizes = table.tracks(), table.active_field_sizes()
+        for i in np.flatnonzero((sizes >= 3) & (sizes <= 11)):
+            is_gold = table.race_metadata[i].get('is_goldmine', False)
+            matrix[tracks[i]][int(sizes[i])].append((int(table.race_number[i]), is_gold))
+    else:
+        for r in races:
+            feats = race_features(r)
+            track, field_size = feats.track, feats.field_size
 
-        # Only interested in field sizes 3-11 for this report
-        if 3 <= field_size <= 11:
-            is_gold = get_field(r, 'metadata', {}).get('is_goldmine', False)
-            race_num = get_field(r, 'race_number')
-            matrix[track][field_size].append((race_num, is_gold))
+            # Only interested in field sizes 3-11 for this report
+            if 3 <= field_size <= 11:
+                is_gold = get_field(r, 'metadata', {}).get('is_goldmine', False)
+                race_num = get_field(r, 'race_number')
+                matrix[track][field_size].append((race_num, is_gold))
 
     if not matrix:
         return "No qualifying races for field matrix (3-11 runners)."
@@ -4058,15 +5271,7 @@ def generate_goldmines(races: List[Any], all_races: Optional[List[Any]] = None)
     lines = ["", "", "GOLDMINE RACES", "--------------"]
 
     # Pre-calculate track categories
-    track_categories = {}
-    source_races_for_cat = all_races if all_races is not None else races
-    races_by_track = defaultdict(list)
-    for r in source_races_for_cat:
-        v = get_field(r, 'venue')
-        track = normalize_venue_name(v)
-        races_by_track[track].append(r)
-    for track, tr_races in races_by_track.items():
-        track_categories[track] = get_track_category(tr_races)
+    track_categories = build_track_categories(all_races if all_races is not None else races)
 
     def is_superfecta_effective(r):
         available_bets = get_field(r, 'available_bets', [])
@@ -4074,11 +5279,9 @@ def generate_goldmines(races: List[Any], all_races: Optional[List[Any]] = None)
         if 'Superfecta' in available_bets or 'Superfecta' in metadata_bets:
             return True
 
-        track = normalize_venue_name(get_field(r, 'venue'))
-        cat = track_categories.get(track, 'T')
-        runners = get_field(r, 'runners', [])
-        field_size = len([run for run in runners if not get_field(run, 'scratched', False)])
-        if cat == 'T' and field_size >= 6:
+        feats = race_features(r)
+        cat = track_categories.get(feats.track, 'T')
+        if cat == 'T' and feats.field_size >= 6:
             return True
         return False
 
@@ -4116,26 +5319,16 @@ def generate_goldmines(races: List[Any], all_races: Optional[List[Any]] = None)
 def generate_goldmine_report(races: List[Any], all_races: Optional[List[Any]] = None) -> str:
     """Generate a detailed report for Goldmine races."""
     # 1. Reuse category logic
-    track_categories = {}
-    source_races_for_cat = all_races if all_races is not None else races
-    races_by_track = defaultdict(list)
-    for r in source_races_for_cat:
-        v = get_field(r, 'venue')
-        track = normalize_venue_name(v)
-        races_by_track[track].append(r)
-    for track, tr_races in races_by_track.items():
-        track_categories[track] = get_track_category(tr_races)
+    track_categories = build_track_categories(all_races if all_races is not None else races)
 
     def is_superfecta_available(r):
         available_bets = get_field(r, 'available_bets', [])
         metadata_bets = get_field(r, 'metadata', {}).get('available_bets', [])
         if 'Superfecta' in available_bets or 'Superfecta' in metadata_bets:
             return True
-        track = normalize_venue_name(get_field(r, 'venue'))
-        cat = track_categories.get(track, 'T')
-        runners = get_field(r, 'runners', [])
-        field_size = len([run for run in runners if not get_field(run, 'scratched', False)])
-        return cat == 'T' and field_size >= 6
+        feats = race_features(r)
+        cat = track_categories.get(feats.track, 'T')
+        return cat == 'T' and feats.field_size >= 6
 
     # Include all goldmines (2nd fav >= 4.5)
     # Deduplicate to prevent double-reporting (e.g. from multiple sources)
@@ -4143,7 +5336,7 @@ def generate_goldmine_report(races: List[Any], all_races: Optional[List[Any]] =
     seen_gold = set()
     for r in races:
         if get_field(r, 'metadata', {}).get('is_goldmine'):
-            track = get_canonical_venue(get_field(r, 'venue'))
+            track = race_features(r).canonical_venue
             num = get_field(r, 'race_number')
             st = get_field(r, 'start_time')
             st_str = st.strftime('%Y%m%d') if isinstance(st, datetime) else str(st)
@@ -4159,7 +5352,7 @@ def generate_goldmine_report(races: List[Any], all_races: Optional[List[Any]] =
     # Sort goldmines: Cat descending, Track asc, Race num asc
     cat_map = {'T': 3, 'H': 2, 'G': 1}
     def goldmine_sort_key(r):
-        track = normalize_venue_name(get_field(r, 'venue'))
+        track = race_features(r).track
         cat = track_categories.get(track, 'T')
         return (-cat_map.get(cat, 0), track, get_field(r, 'race_number', 0))
 
@@ -4178,6 +5371,8 @@ def generate_goldmine_report(races: List[Any], all_races: Optional[List[Any]] =
             except ValueError:
                 remaining_gold.append(r)
                 continue
+        elif isinstance(start_time, datetime):
+            start_time = race_features(r).start_time
 
         if start_time:
             if start_time.tzinfo is None:
@@ -4204,7 +5399,8 @@ def generate_goldmine_report(races: List[Any], all_races: Optional[List[Any]] =
         report_lines.append("")
 
         for r in races_to_render:
-            track = normalize_venue_name(get_field(r, 'venue'))
+            feats = race_features(r)
+            track = feats.track
             cat = track_categories.get(track, 'T')
             race_num = get_field(r, 'race_number')
             start_time = get_field(r, 'start_time')
@@ -4217,14 +5413,7 @@ def generate_goldmine_report(races: List[Any], all_races: Optional[List[Any]] =
 
             # Identify Top 5
             runners = get_field(r, 'runners', [])
-            active_with_odds = []
-            for run in runners:
-                if get_field(run, 'scratched'): continue
-                wo = _get_best_win_odds(run)
-                if wo: active_with_odds.append((run, wo))
-
-            sorted_by_odds = sorted(active_with_odds, key=lambda x: x[1])
-            top_5_nums = ", ".join([str(get_field(run[0], 'number') or '?') for run in sorted_by_odds[:5]])
+            top_5_nums = feats.top_numbers(5)
             if hasattr(r, 'top_five_numbers'):
                 r.top_five_numbers = top_5_nums
 
@@ -4526,10 +5715,12 @@ async def _generate_audit_history_html() -> str:
     """
 
 
-def generate_summary_grid(races: List[Any], all_races: Optional[List[Any]] = None) -> str:
+def generate_summary_grid(races: List[Any], all_races: Optional[List[Any]] = None, table: Optional[RaceTable] = None) -> str:
     """
     Generates a Markdown table summary of upcoming races.
     Sorted by MTP, ceiling of 4 hours from now.
+    ``table`` is the optional RaceTable built from ``all_races`` (or ``races``); it lets
+    the start-time window and field sizes be taken from columns.
     """
     now = datetime.now(EASTERN)
     cutoff = now + timedelta(hours=18)
@@ -4538,17 +5729,25 @@ def generate_summary_grid(races: List[Any], all_races: Optional[List[Any]] = Non
     track_categories = {}
     source_races = all_races if all_races is not None else races
     races_by_track = defaultdict(list)
-    for r in source_races:
-        venue = get_field(r, 'venue')
-        track = normalize_venue_name(venue)
+    tracks = table.tracks() if table is not None else None
+    for i, r in enumerate(source_races):
+        track = tracks[i] if tracks is not None else normalize_venue_name(get_field(r, 'venue'))
         races_by_track[track].append(r)
 
     for track, tr_races in races_by_track.items():
         track_categories[track] = get_track_category(tr_races)
 
+    grid_races = list(enumerate(all_races or races))
+    if table is not None:
+        # Vectorized window pre-filter; rows without a datetime start fall through to the checks below
+        lo = (now - timedelta(minutes=10) - _EPOCH) // timedelta(microseconds=1)
+        hi = (cutoff - _EPOCH) // timedelta(microseconds=1)
+        window = (table.start_us == _NO_TIME) | ((table.start_us >= lo) & (table.start_us <= hi))
+        grid_races = [grid_races[i] for i in np.flatnonzero(window)]
+
     table_races = []
     seen = set()
-    for race in (all_races or races):
+    for i, race in grid_races:
         st = get_field(race, 'start_time')
         if isinstance(st, str):
             try: st = datetime.fromisoformat(st.replace('Z', '+00:00'))
@@ -4559,8 +5758,11 @@ def generate_summary_grid(races: List[Any], all_races: Optional[List[Any]] = Non
         if not st or st < now - timedelta(minutes=10) or st > cutoff:
             continue
 
-        track = normalize_venue_name(get_field(race, 'venue'))
-        canonical_track = get_canonical_venue(get_field(race, 'venue'))
+        if table is not None:
+            track, canonical_track = tracks[i], table.canonical_venues()[i]
+        else:
+            track = normalize_venue_name(get_field(race, 'venue'))
+            canonical_track = get_canonical_venue(get_field(race, 'venue'))
         num = get_field(race, 'race_number')
         # Deduplication key: Use canonical track/num/date
         key = (canonical_track, num, st.strftime('%Y%m%d'))
@@ -4568,8 +5770,11 @@ def generate_summary_grid(races: List[Any], all_races: Optional[List[Any]] = Non
         seen.add(key)
 
         mtp = int((st - now).total_seconds() / 60)
-        runners = get_field(race, 'runners', [])
-        field_size = len([run for run in runners if not get_field(run, 'scratched', False)])
+        if table is not None:
+            field_size = int(table.active_field_sizes()[i])
+        else:
+            runners = get_field(race, 'runners', [])
+            field_size = len([run for run in runners if not get_field(run, 'scratched', False)])
         top5 = getattr(race, 'top_five_numbers', 'N/A')
         gap12 = get_field(race, 'metadata', {}).get('1Gap2', 0.0)
         is_gold = get_field(race, 'metadata', {}).get('is_goldmine', False)
@@ -5483,9 +6688,9 @@ Usage:
     python favorite_to_place_monitor.py [--date YYYY-MM-DD] [--refresh-interval 30]
 """
 
-@dataclass
+@dataclass(slots=True)
 class RaceSummary:
-    """Summary of a single race for display."""
+    """Summary of a single race for display (slotted: monitors keep thousands of these alive)."""
     discipline: str  # T/H/G
     track: str
     race_number: int
@@ -5541,16 +6746,611 @@ def get_discovery_adapter_classes() -> List[Type[BaseAdapterV3]]:
     ]
 
 
+def _race_record_key(record: Dict[str, Any]) -> str:
+    return f"{record.get('track')}|{record.get('race_number')}|{record.get('start_time')}"
+
+
+class JsonChangeWriter:
+    """
+    Keeps a JSON output file current without rewriting it when nothing changed.
+
+    Documents are written compactly through atomic_write_bytes. A write is skipped when the
+    document, minus its ``volatile`` top-level keys (timestamps) and the ``record_volatile``
+    fields of the records in its top-level lists (mtp, which readers derive from start_time),
+    hashes the same as the last one written; the file may then hold mtp values a few ticks
+    old. With ``delta_path`` set, each write is paired with a small delta file listing the
+    records of the ``records_key`` list that changed or disappeared since the previous write.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        delta_path: Optional[str] = None,
+        volatile: Iterable[str] = ("generated_at",),
+        records_key: str = "all_races",
+        record_key: Callable[[Dict[str, Any]], str] = _race_record_key,
+        record_volatile: Iterable[str] = ("mtp",),
+    ):
+        self.path = path
+        self.delta_path = delta_path
+        self.volatile = frozenset(volatile)
+        self.records_key = records_key
+        self.record_key = record_key
+        self.record_volatile = frozenset(record_volatile)
+        self.digest: Optional[str] = None
+        self._records: Dict[str, str] = {}
+        self.writes = 0
+        self.skips = 0
+
+    def write(self, data: Dict[str, Any]) -> bool:
+        """Writes ``data`` if its content changed; returns whether the file was replaced."""
+        stable = {k: self._stable(v) for k, v in data.items() if k not in self.volatile}
+        digest = hashlib.sha1(fast_json_dumps(stable)).hexdigest()
+        if digest == self.digest:
+            self.skips += 1
+            return False
+        atomic_write_bytes(self.path, fast_json_dumps(data))
+        if self.delta_path:
+            atomic_write_bytes(self.delta_path, fast_json_dumps(self._delta(data, digest)))
+        self.digest = digest
+        self.writes += 1
+        return True
+
+    def _stable(self, value: Any) -> Any:
+        """``value`` with record_volatile fields dropped from the records of a list."""
+        if not isinstance(value, list):
+            return value
+        return [
+            {k: v for k, v in item.items() if k not in self.record_volatile} if isinstance(item, dict) else item
+            for item in value
+        ]
+
+    def _delta(self, data: Dict[str, Any], digest: str) -> Dict[str, Any]:
+        records: Dict[str, str] = {}
+        changed = []
+        for record, stable in zip(data.get(self.records_key) or [], self._stable(data.get(self.records_key) or [])):
+            key = self.record_key(record)
+            records[key] = hashlib.sha1(fast_json_dumps(stable)).hexdigest()
+            if self._records.get(key) != records[key]:
+                changed.append(record)
+        removed = [key for key in self._records if key not in records]
+        self._records = records
+        delta = {k: data[k] for k in self.volatile if k in data}
+        delta.update({"digest": digest, "changed": changed, "removed": removed})
+        return delta
+
+
+@dataclass
+class HistorySegment:
+    """Index entry for one prediction history segment file."""
+    name: str
+    day: str                      # logged date (YYYY-MM-DD) of every record in the segment
+    first: str = ""               # earliest / latest logged_at
+    last: str = ""
+    records: int = 0
+    bytes: int = 0
+    closed: bool = False
+    race_dates: set = field(default_factory=set)
+    race_ids: set = field(default_factory=set)
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = dict(self.__dict__)
+        d["race_dates"], d["race_ids"] = sorted(self.race_dates), sorted(self.race_ids)
+        return d
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "HistorySegment":
+        seg = cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
+        seg.race_dates, seg.race_ids = set(seg.race_dates), set(seg.race_ids)
+        return seg
+
+    def add(self, record: Dict[str, Any]) -> None:
+        logged = record.get("logged_at") or ""
+        self.first = min(self.first, logged) if self.first else logged
+        self.last = max(self.last, logged)
+        self.records += 1
+        if record.get("start_time"):
+            self.race_dates.add(str(record["start_time"])[:10])
+        if record.get("race_id"):
+            self.race_ids.add(record["race_id"])
+
+
+class PredictionHistoryStore:
+    """
+    Segmented replacement for the append-forever prediction_history.jsonl.
+
+    Records go to one open JSONL segment per logged day; a segment is closed (gzip-compressed)
+    when the day changes or it reaches ``max_segment_bytes``. The index keeps one entry file
+    per segment under index/ -- the logged_at range, the race dates and the race ids it
+    holds -- so records() opens only the segments a query can match and streams them in
+    logged order. An append rewrites only the entries of the segments it touched (normally
+    just the open one); segment files without an entry, and an open segment that grew past
+    its indexed size (a crash between the two writes), are rescanned on load.
+    """
+
+    INDEX_DIR: ClassVar[str] = "index"
+    LEGACY_INDEX_FILE: ClassVar[str] = "index.json"
+    IMPORT_CHUNK_RECORDS: ClassVar[int] = 5000
+
+    def __init__(self, root: str = PREDICTION_HISTORY_DIR, max_segment_bytes: int = 8 * 2**20,
+                 legacy_path: Optional[str] = None):
+        self.root = Path(root)
+        self.max_segment_bytes = max_segment_bytes
+        self.legacy_path = legacy_path
+        self.segments: List[HistorySegment] = []
+        self.logger = structlog.get_logger(self.__class__.__name__)
+        self._load_index()
+
+    def _entry_path(self, seg: HistorySegment) -> Path:
+        return self.root / self.INDEX_DIR / f"{seg.name.split('.')[0]}.json"
+
+    def _load_index(self) -> None:
+        index_dir, legacy = self.root / self.INDEX_DIR, self.root / self.LEGACY_INDEX_FILE
+        try:
+            if index_dir.is_dir():
+                entries = []
+                for p in index_dir.glob("*.json"):
+                    with open(p, "rb") as f:
+                        entries.append(HistorySegment.from_dict(fast_json_loads(f.read())))
+            elif legacy.exists():
+                with open(legacy, "rb") as f:
+                    entries = [HistorySegment.from_dict(d) for d in fast_json_loads(f.read()).get("segments", [])]
+            else:
+                entries = []
+        except Exception as e:
+            self.logger.warning("history_index_load_failed", error=str(e))
+            self.rebuild_index()
+            return
+
+        # Reconcile with the files on disk: a close or a new segment may have outlived its entry
+        on_disk = {p.name for p in self.root.glob("*.jsonl")} | {p.name for p in self.root.glob("*.jsonl.gz")}
+        stale: List[HistorySegment] = []
+        for i, seg in enumerate(entries):
+            if seg.name not in on_disk and f"{seg.name}.gz" in on_disk:
+                entries[i] = self._scan(f"{seg.name}.gz", seg.day)
+                stale.append(entries[i])
+        indexed = {seg.name for seg in entries}
+        for name in sorted(on_disk - indexed):
+            if name.endswith(".gz") and name[:-3] in indexed:
+                continue  # closed copy of a still-open segment (crash before the plain file was removed)
+            entries.append(self._scan(name, name[:10]))
+            stale.append(entries[-1])
+        entries = [seg for seg in entries if seg.name in on_disk]
+        # closed segments in name order (day, then sequence); the open one last
+        self.segments = sorted(entries, key=lambda s: (not s.closed, s.name))
+
+        active = self.active
+        if active is not None and (self.root / active.name).stat().st_size != active.bytes:
+            self.segments[-1] = self._scan(active.name, active.day)
+            stale.append(self.segments[-1])
+        if legacy.exists():
+            self._save_index()
+            legacy.unlink()
+        else:
+            for seg in stale:
+                self._save_entry(seg)
+
+    def _save_entry(self, seg: HistorySegment) -> None:
+        atomic_write_bytes(str(self._entry_path(seg)), fast_json_dumps(seg.to_dict()))
+
+    def _save_index(self) -> None:
+        for seg in self.segments:
+            self._save_entry(seg)
+
+    def _scan(self, name: str, day: str) -> HistorySegment:
+        seg = HistorySegment(name=name, day=day, closed=name.endswith(".gz"))
+        for record in self._read_segment(seg):
+            seg.add(record)
+        seg.bytes = (self.root / name).stat().st_size
+        return seg
+
+    def rebuild_index(self) -> None:
+        """Re-derives the index entries from the segment files on disk."""
+        names = sorted(p.name for p in self.root.glob("*.jsonl*") if not p.name.endswith(".tmp"))
+        self.segments = sorted((self._scan(name, name[:10]) for name in names), key=lambda s: (not s.closed, s.name))
+        shutil.rmtree(self.root / self.INDEX_DIR, ignore_errors=True)
+        self._save_index()
+
+    @property
+    def active(self) -> Optional[HistorySegment]:
+        return self.segments[-1] if self.segments and not self.segments[-1].closed else None
+
+    def _close(self, seg: HistorySegment) -> None:
+        plain = self.root / seg.name
+        packed = plain.with_name(f"{seg.name}.gz")
+        tmp = packed.with_name(f"{packed.name}.tmp")
+        with open(plain, "rb") as src, gzip.open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp, packed)
+        plain.unlink()
+        seg.name, seg.closed, seg.bytes = packed.name, True, packed.stat().st_size
+        self._save_entry(seg)  # final rewrite of this entry
+
+    def _segment_for(self, day: str) -> HistorySegment:
+        active = self.active
+        if active is not None and active.day == day and active.bytes < self.max_segment_bytes:
+            return active
+        if active is not None:
+            self._close(active)
+        seq = sum(1 for s in self.segments if s.day == day)
+        seg = HistorySegment(name=f"{day}-{seq:03d}.jsonl", day=day)
+        self.segments.append(seg)
+        return seg
+
+    def append(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Appends records (each with an ISO "logged_at"); returns how many were written."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        by_day: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for record in records:
+            by_day[str(record.get("logged_at") or now_eastern().isoformat())[:10]].append(record)
+        count = 0
+        touched: Dict[str, HistorySegment] = {}
+        for day in sorted(by_day):
+            batch, i = by_day[day], 0
+            while i < len(batch):
+                seg = self._segment_for(day)
+                touched[seg.name] = seg
+                with open(self.root / seg.name, "ab") as f:
+                    while i < len(batch) and seg.bytes < self.max_segment_bytes:
+                        record, i = batch[i], i + 1
+                        line = fast_json_dumps(record) + b"\n"
+                        f.write(line)
+                        seg.bytes += len(line)
+                        seg.add(record)
+                        count += 1
+        for seg in touched.values():
+            if not seg.closed:  # closed ones were written by _close
+                self._save_entry(seg)
+        return count
+
+    def _read_segment(self, seg: HistorySegment) -> Iterator[Dict[str, Any]]:
+        path = self.root / seg.name
+        opener = gzip.open if seg.name.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield fast_json_loads(line)
+
+    def segments_for(self, start: Optional[str] = None, end: Optional[str] = None,
+                     race_date: Optional[str] = None, race_id: Optional[str] = None) -> List[HistorySegment]:
+        """Segments that can hold matches for records(), from the index alone."""
+        return [
+            s for s in self.segments
+            if (start is None or s.last >= start) and (end is None or s.first < end)
+            and (race_date is None or race_date in s.race_dates)
+            and (race_id is None or race_id in s.race_ids)
+        ]
+
+    def records(self, start: Optional[Union[str, datetime]] = None, end: Optional[Union[str, datetime]] = None,
+                race_date: Optional[str] = None, race_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Streams records logged in [start, end) (ISO strings or aware datetimes, Eastern like
+        logged_at), optionally only those for one race date (YYYY-MM-DD) or race id.
+        """
+        start = start.isoformat() if isinstance(start, datetime) else start
+        end = end.isoformat() if isinstance(end, datetime) else end
+        for seg in self.segments_for(start, end, race_date, race_id):
+            for record in self._read_segment(seg):
+                logged = record.get("logged_at") or ""
+                if start is not None and logged < start: continue
+                if end is not None and logged >= end: continue
+                if race_date is not None and str(record.get("start_time") or "")[:10] != race_date: continue
+                if race_id is not None and record.get("race_id") != race_id: continue
+                yield record
+
+    def import_jsonl(self, path: str) -> int:
+        """
+        Moves a legacy prediction_history.jsonl into the store, IMPORT_CHUNK_RECORDS at a time.
+
+        The file is renamed to *.importing before the first record is read, and the byte offset
+        reached is saved next to it after each chunk's index write, so an interrupted import
+        resumes where it stopped (replaying at most one chunk) instead of starting over. It is
+        renamed *.imported when done. This blocks; import_legacy() runs it in a worker thread.
+        """
+        importing = f"{path}.importing"
+        offset_path = f"{importing}.offset"
+        if not os.path.exists(importing):
+            os.replace(path, importing)
+        try:
+            with open(offset_path, "rb") as f:
+                offset = int(f.read() or 0)
+        except (FileNotFoundError, ValueError):
+            offset = 0
+
+        count, chunk = 0, []
+        with open(importing, "rb") as f:
+            f.seek(offset)
+            while True:
+                line = f.readline()
+                if line.strip():
+                    try: chunk.append(fast_json_loads(line))
+                    except ValueError: pass
+                if chunk and (not line or len(chunk) >= self.IMPORT_CHUNK_RECORDS):
+                    count += self.append(chunk)
+                    atomic_write_bytes(offset_path, str(f.tell()).encode())
+                    chunk = []
+                if not line:
+                    break
+        os.replace(importing, f"{path}.imported")
+        if os.path.exists(offset_path):
+            os.unlink(offset_path)
+        self.logger.info("history_imported", path=path, records=count, resumed_at=offset)
+        return count
+
+    async def import_legacy(self) -> int:
+        """Imports ``legacy_path`` (or resumes an interrupted import) off the event loop."""
+        path = self.legacy_path
+        if not path or not (os.path.exists(path) or os.path.exists(f"{path}.importing")):
+            return 0
+        return await asyncio.to_thread(self.import_jsonl, path)
+
+
+@dataclass
+class RefreshBatch:
+    """One adapter card-page request and the monitored races it refreshes."""
+    adapter: str
+    date: str
+    keys: List[str] = field(default_factory=list)
+    mtp: int = 0  # nearest race on the page
+
+
+class OddsRefreshScheduler:
+    """
+    Decides which monitored races get fresh odds, and when.
+
+    A race is due again once the cadence for its current minutes-to-post has elapsed since
+    its last refresh (ODDS_REFRESH_CADENCE: every 30s inside 5 minutes, backing off to every
+    10 minutes at two hours out; beyond that it is not refreshed). Only the refresh adapters
+    that carried the race are asked for it, and due races on the same adapter card page
+    (adapter + date) share one request. At most ``budget_per_minute`` requests are issued in
+    any rolling minute; pages holding the nearest races go first, the rest wait a tick.
+    """
+
+    def __init__(
+        self,
+        cadence: Iterable[Tuple[int, int]] = ODDS_REFRESH_CADENCE,
+        budget_per_minute: int = ODDS_REFRESH_BUDGET_PER_MINUTE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.cadence = sorted(cadence)
+        self.budget_per_minute = budget_per_minute
+        self.clock = clock
+        self._carriers: Dict[str, Dict[str, None]] = {}  # race key -> refresh adapters, in first-seen order
+        self._refreshed: Dict[str, float] = {}
+        self._issued: deque = deque()
+        self.requests = 0
+
+    def interval(self, mtp: Optional[int]) -> Optional[float]:
+        """Seconds between refreshes at ``mtp`` minutes to post, or None when not refreshed."""
+        if mtp is None or mtp <= -10:  # off, or past the BET NOW window
+            return None
+        return next((float(seconds) for ceiling, seconds in self.cadence if mtp <= ceiling), None)
+
+    def track(self, key: str, adapter: str, now: Optional[float] = None) -> None:
+        """Records that ``adapter`` carries odds for race ``key`` (fetched just now)."""
+        self._carriers.setdefault(key, {})[adapter] = None
+        self._refreshed.setdefault(key, self.clock() if now is None else now)
+
+    def carriers(self, key: str) -> List[str]:
+        return list(self._carriers.get(key, ()))
+
+    def budget_left(self, now: Optional[float] = None) -> int:
+        now = self.clock() if now is None else now
+        while self._issued and now - self._issued[0] >= 60.0:
+            self._issued.popleft()
+        return max(0, self.budget_per_minute - len(self._issued))
+
+    def plan(self, races: Iterable[Tuple[str, RaceSummary]], now: Optional[float] = None) -> List[RefreshBatch]:
+        """
+        The requests to issue now for ``races`` ((key, summary) pairs with current mtp). Planned
+        batches count against the budget and their races are marked refreshed.
+        """
+        now = self.clock() if now is None else now
+        due = []
+        for key, summary in races:
+            wait = self.interval(summary.mtp)
+            if wait is not None and key in self._carriers and now - self._refreshed[key] >= wait:
+                due.append((summary.mtp, key, ensure_eastern(summary.start_time).strftime("%Y-%m-%d")))
+        due.sort(key=lambda d: d[0])
+
+        # Prefer the carrier whose page serves the most due races, so fewer pages cover them all
+        load: Dict[Tuple[str, str], int] = defaultdict(int)
+        for _, key, day in due:
+            for adapter in self._carriers[key]:
+                load[(adapter, day)] += 1
+
+        budget = self.budget_left(now)
+        batches: Dict[Tuple[str, str], RefreshBatch] = {}
+        for mtp, key, day in due:
+            pages = [(adapter, day) for adapter in self._carriers[key]]
+            page = next((p for p in pages if p in batches), None)
+            if page is None:
+                if len(batches) >= budget:
+                    continue
+                page = max(pages, key=lambda p: load[p])
+                batches[page] = RefreshBatch(adapter=page[0], date=day, mtp=mtp)
+            batches[page].keys.append(key)
+            self._refreshed[key] = now
+
+        for _ in batches:
+            self._issued.append(now)
+        self.requests += len(batches)
+        return list(batches.values())
+
+    def mark_refreshed(self, keys: Iterable[str], now: Optional[float] = None) -> None:
+        """Resets the cadence for races a request refreshed without having planned them."""
+        now = self.clock() if now is None else now
+        for key in keys:
+            if key in self._carriers:
+                self._refreshed[key] = now
+
+
+@dataclass
+class MonitorEvent:
+    """
+    A BET NOW change published by FavoriteToPlaceMonitor: "qualified" (entered the list),
+    "odds_moved" (second favourite moved by at least the threshold since last reported),
+    "off" (reached post time) or "dropped" (left the list before post).
+    """
+    kind: str
+    key: str
+    summary: RaceSummary
+    previous_odds: Optional[float] = None
+    seq: int = 0
+    at: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seq": self.seq, "kind": self.kind, "key": self.key, "at": self.at,
+            "previous_odds": self.previous_odds, "race": self.summary.to_dict(),
+        }
+
+
+class MonitorEventBus:
+    """
+    In-process pub/sub for MonitorEvents.
+
+    Callbacks run on the publishing thread, as with RaceMergeStore subscribers. queue() hands
+    an asyncio consumer (a WebSocket handler on another loop or thread) its own bounded queue,
+    fed thread-safely; when a slow consumer's queue is full the oldest event is dropped. The
+    last ``history`` events are kept so reconnecting clients can catch up with since(seq).
+    """
+
+    def __init__(self, history: int = 512):
+        self._subscribers: List[Tuple[Callable[[MonitorEvent], None], Optional[frozenset]]] = []
+        self._lock = threading.RLock()
+        self.recent: deque = deque(maxlen=history)
+        self.seq = 0
+
+    def subscribe(self, callback: Callable[[MonitorEvent], None], kinds: Optional[Iterable[str]] = None) -> Callable[[], None]:
+        """Registers ``callback`` (optionally for some kinds only); returns an unsubscribe function."""
+        entry = (callback, frozenset(kinds) if kinds is not None else None)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+
+    def queue(self, kinds: Optional[Iterable[str]] = None, maxsize: int = 1000) -> Tuple[asyncio.Queue, Callable[[], None]]:
+        """An asyncio.Queue of events for the running loop, and its unsubscribe function."""
+        loop = asyncio.get_running_loop()
+        q: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+        def put(event: MonitorEvent) -> None:
+            if q.full():
+                q.get_nowait()
+            q.put_nowait(event)
+        return q, self.subscribe(lambda event: loop.call_soon_threadsafe(put, event), kinds)
+
+    def since(self, seq: int) -> List[MonitorEvent]:
+        with self._lock:
+            return [e for e in self.recent if e.seq > seq]
+
+    def publish(self, events: Iterable[MonitorEvent]) -> List[MonitorEvent]:
+        """Numbers, timestamps and delivers ``events``; returns them."""
+        stamp = now_eastern().isoformat()
+        with self._lock:
+            events = list(events)
+            for event in events:
+                self.seq += 1
+                event.seq, event.at = self.seq, event.at or stamp
+                self.recent.append(event)
+            subscribers = list(self._subscribers)
+        for event in events:
+            for callback, kinds in subscribers:
+                if kinds is not None and event.kind not in kinds:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    structlog.get_logger("MonitorEventBus").error("monitor_subscriber_failed", key=event.key, error=str(e))
+        return events
+
+
+_monitor_event_bus: Optional[MonitorEventBus] = None
+
+
+def get_monitor_event_bus() -> MonitorEventBus:
+    """Process-wide MonitorEventBus, built on first use."""
+    global _monitor_event_bus
+    if _monitor_event_bus is None:
+        _monitor_event_bus = MonitorEventBus()
+    return _monitor_event_bus
+
+
+async def serve_monitor_events(websocket: Any, bus: Optional[MonitorEventBus] = None) -> None:
+    """
+    Streams monitor events to a WebSocket as JSON. A ``since`` query parameter replays the
+    events after that sequence number first, so a reconnecting client misses nothing.
+    Only mount it where a FavoriteToPlaceMonitor publishes to ``bus`` in the same process,
+    as build_monitor_event_app does for the continuous --monitor run.
+    """
+    bus = bus if bus is not None else get_monitor_event_bus()
+    await websocket.accept()
+    queue, unsubscribe = bus.queue()
+    try:
+        last = int(websocket.query_params.get("since") or 0)
+        for event in bus.since(last):
+            await websocket.send_json(event.to_dict())
+            last = event.seq
+        while True:
+            event = await queue.get()
+            if event.seq > last:
+                await websocket.send_json(event.to_dict())
+                last = event.seq
+    except Exception as e:  # disconnects surface as framework-specific exceptions
+        structlog.get_logger("MonitorEventBus").debug("monitor_stream_closed", error=str(e))
+    finally:
+        unsubscribe()
+
+
+def build_monitor_event_app(bus: Optional[MonitorEventBus] = None) -> Any:
+    """ASGI app serving ``bus`` on /ws/monitor (see serve_monitor_events)."""
+    from starlette.applications import Starlette
+    from starlette.routing import WebSocketRoute
+
+    async def monitor_events(websocket: Any) -> None:
+        await serve_monitor_events(websocket, bus)
+
+    return Starlette(routes=[WebSocketRoute("/ws/monitor", monitor_events)])
+
+
+def start_monitor_event_server(bus: MonitorEventBus, port: int = MONITOR_WS_PORT, host: str = "127.0.0.1") -> Optional[threading.Thread]:
+    """
+    Serves /ws/monitor from a daemon thread with its own event loop, so the monitor's loop
+    only publishes (the bus hands events across threads). Returns None without uvicorn.
+    """
+    try:
+        import uvicorn
+        app = build_monitor_event_app(bus)
+    except ImportError as e:
+        structlog.get_logger("MonitorEventBus").warning("monitor_ws_unavailable", error=str(e))
+        return None
+
+    thread = threading.Thread(
+        target=uvicorn.run, args=(app,), kwargs={"host": host, "port": port, "log_level": "error"},
+        name="monitor-ws", daemon=True,
+    )
+    thread.start()
+    structlog.get_logger("MonitorEventBus").info("monitor_ws_started", url=f"ws://{host}:{port}/ws/monitor")
+    return thread
+
+
 class FavoriteToPlaceMonitor:
     """Monitor for favorite-to-place betting opportunities."""
 
-    def __init__(self, target_dates: Optional[List[str]] = None, refresh_interval: int = 30, config: Optional[Dict] = None):
+    def __init__(self, target_dates: Optional[List[str]] = None, refresh_interval: int = 30, config: Optional[Dict] = None,
+                 events: Optional[MonitorEventBus] = None):
         """
         Initialize monitor.
 
         Args:
             target_dates: Dates to fetch races for (YYYY-MM-DD), defaults to today + tomorrow
             refresh_interval: Seconds between refreshes for BET NOW list
+            events: Bus for BET NOW change events, defaults to the process-wide one
         """
         if target_dates:
             self.target_dates = target_dates
@@ -5562,6 +7362,17 @@ class FavoriteToPlaceMonitor:
         self.refresh_interval = refresh_interval
         self.config = config or {}
         self.all_races: List[RaceSummary] = []
+        self.golden_zone_races: List[RaceSummary] = []
+        self.golden_zone_index = RaceTimeIndex()
+        self.race_map: Dict[str, RaceSummary] = {}
+        self.json_writers: Dict[str, JsonChangeWriter] = {}
+        self._history: Optional[PredictionHistoryStore] = None
+        self.events = events if events is not None else get_monitor_event_bus()
+        self._watched: Dict[str, Dict[str, Any]] = {}  # BET NOW key -> odds last reported, off flag
+        self._saved_seq = self.events.seq
+        self.refresh_scheduler = OddsRefreshScheduler(
+            budget_per_minute=int(self.config.get("odds_refresh_budget", ODDS_REFRESH_BUDGET_PER_MINUTE))
+        )
         self.adapters: List = []
         self.logger = structlog.get_logger(self.__class__.__name__)
         self.tracker = HotTipsTracker()
@@ -5615,6 +7426,62 @@ class FavoriteToPlaceMonitor:
         self.logger.info("Total races fetched", total=len(all_races_with_adapters))
         return all_races_with_adapters
 
+    def odds_refresh_adapters(self) -> Dict[str, Any]:
+        """Initialized adapters that are re-polled for live odds, by the name summaries carry."""
+        return {
+            a.__class__.__name__: a for a in self.adapters
+            if getattr(a, "SOURCE_NAME", a.__class__.__name__) in ODDS_REFRESH_ADAPTERS
+        }
+
+    async def refresh_due_odds(self) -> int:
+        """
+        Re-fetches the card pages OddsRefreshScheduler says are due and swaps in fresh
+        summaries for the monitored races on them. Returns the number of races updated.
+        """
+        adapters = self.odds_refresh_adapters()
+        batches = self.refresh_scheduler.plan(self.race_map.items())
+        if not batches:
+            return 0
+
+        async def fetch(batch: RefreshBatch):
+            try:
+                return batch, await adapters[batch.adapter].get_races(batch.date)
+            except Exception as e:
+                self.logger.error("Odds refresh failed", adapter=batch.adapter, date=batch.date, error=str(e))
+                return batch, []
+
+        updated = []
+        for batch, races in await asyncio.gather(*(fetch(b) for b in batches)):
+            for race in races:
+                try:
+                    summary = self._create_race_summary(race, batch.adapter)
+                    key = self._summary_key(summary)
+                except Exception:
+                    continue
+                existing = self.race_map.get(key)
+                if existing is None or (existing.second_fav_odds and not summary.second_fav_odds):
+                    continue
+                summary.mtp = self._calculate_mtp(summary.start_time)
+                self.race_map[key] = summary
+                self.golden_zone_index.upsert(summary, key=key)
+                updated.append(key)
+        # Races that came along on a planned page are as fresh as the ones it was fetched for
+        self.refresh_scheduler.mark_refreshed(updated)
+        if updated:
+            self._index_summaries()
+        self.logger.info(
+            "Odds refreshed", requests=len(batches), due=sum(len(b.keys) for b in batches), updated=len(updated),
+            budget_left=self.refresh_scheduler.budget_left(),
+        )
+        return len(updated)
+
+    @staticmethod
+    def _summary_key(summary: RaceSummary) -> str:
+        """Stable key: Canonical Venue + Race Number + Date."""
+        canonical_venue = get_venue_resolver().observe(summary.track)
+        date_str = summary.start_time.strftime('%Y%m%d') if summary.start_time else "Unknown"
+        return f"{canonical_venue}|{summary.race_number}|{date_str}"
+
     def _get_discipline_code(self, race: Race) -> str:
         """Get discipline code (T/H/G)."""
         if not race.discipline:
@@ -5627,7 +7494,7 @@ class FavoriteToPlaceMonitor:
 
     def _calculate_field_size(self, race: Race) -> int:
         """Calculate active field size."""
-        return len([r for r in race.runners if not r.scratched])
+        return race_features(race).field_size
 
     def _has_superfecta(self, race: Race) -> bool:
         """Check if race offers Superfecta."""
@@ -5639,25 +7506,12 @@ class FavoriteToPlaceMonitor:
 
     def _get_top_runners(self, race: Race, limit: int = 5) -> List[Runner]:
         """Get top runners by odds, sorted lowest first."""
-        # Get active runners with valid odds
-        r_with_odds = []
-        for r in race.runners:
-            if r.scratched:
-                continue
-            # Refresh odds to avoid stale metadata in continuous monitor mode
-            wo = _get_best_win_odds(r)
-            if wo is not None and wo > 1.0:
-                # Update runner object with fresh odds for downstream summaries
-                r.win_odds = float(wo)
-                # Store the Decimal odds directly for sorting to avoid conversion
-                r_with_odds.append((r, wo))
-
-        if not r_with_odds:
-            return []
-
-        # Sort by odds (lowest first)
-        sorted_r = sorted(r_with_odds, key=lambda x: x[1])
-        return [x[0] for x in sorted_r[:limit]]
+        # Refresh odds to avoid stale metadata in continuous monitor mode (valid odds are always > 1.0)
+        feats = race_features(race)
+        for r, wo in feats.ranked:
+            # Update runner object with fresh odds for downstream summaries
+            r.win_odds = wo
+        return [r for r, _ in feats.ranked[:limit]]
 
     def _calculate_mtp(self, start_time: Optional[datetime]) -> int:
         """Calculate minutes to post. Returns -9999 if start_time is None."""
@@ -5679,25 +7533,25 @@ class FavoriteToPlaceMonitor:
         favorite = top_runners[0] if len(top_runners) >= 1 else None
         second_fav = top_runners[1] if len(top_runners) >= 2 else None
 
-        gap12 = 0.0
-        if favorite and second_fav and favorite.win_odds and second_fav.win_odds:
-            gap12 = round(second_fav.win_odds - favorite.win_odds, 2)
+        # Same exact gap the analyzers report in metadata['1Gap2']
+        feats = race_features(race)
+        gap12 = feats.gap12
 
         return RaceSummary(
-            discipline=self._get_discipline_code(race),
-            track=normalize_venue_name(race.venue),
+            discipline=feats.discipline_code,
+            track=feats.track,
             race_number=race.race_number,
             field_size=self._calculate_field_size(race),
             superfecta_offered=self._has_superfecta(race),
             adapter=adapter_name,
             start_time=race.start_time,
-            mtp=self._calculate_mtp(race.start_time),
+            mtp=feats.mtp() if feats.start_time else -9999,
             second_fav_odds=second_fav.win_odds if second_fav else None,
             second_fav_name=second_fav.name if second_fav else None,
             selection_number=second_fav.number if second_fav else None,
             favorite_odds=favorite.win_odds if favorite else None,
             favorite_name=favorite.name if favorite else None,
-            top_five_numbers=self._get_top_n_runners(race, 5),
+            top_five_numbers=", ".join(str(r.number) if r.number is not None else "?" for r in top_runners),
             gap12=gap12,
             is_goldmine=race.metadata.get('is_goldmine', False),
             is_best_bet=race.metadata.get('is_best_bet', False)
@@ -5708,6 +7562,7 @@ class FavoriteToPlaceMonitor:
         race_map = {}
         now = datetime.now(EASTERN)
         cutoff = now + timedelta(hours=window_hours) if window_hours else None
+        refreshable = self.odds_refresh_adapters()
 
         for race, adapter_name in races_with_adapters:
             try:
@@ -5718,10 +7573,9 @@ class FavoriteToPlaceMonitor:
                 # Time window filtering removed to ensure all unique races are counted
 
                 summary = self._create_race_summary(race, adapter_name)
-                # Stable key: Canonical Venue + Race Number + Date
-                canonical_venue = get_canonical_venue(summary.track)
-                date_str = summary.start_time.strftime('%Y%m%d') if summary.start_time else "Unknown"
-                key = f"{canonical_venue}|{summary.race_number}|{date_str}"
+                key = self._summary_key(summary)
+                if adapter_name in refreshable:
+                    self.refresh_scheduler.track(key, adapter_name)
 
                 if key not in race_map:
                     race_map[key] = summary
@@ -5735,28 +7589,29 @@ class FavoriteToPlaceMonitor:
                         race_map[key] = summary
             except Exception: pass
 
-        unique_summaries = list(race_map.values())
-        self.all_races = sorted(unique_summaries, key=lambda x: x.start_time)
+        self._set_race_map(race_map)
 
-        # GPT5 Improvement: Keep all races within window for analysis, not just one per track.
-        # Window broadened to 18 hours (News Mode)
-        timing_window_summaries = []
-        now = datetime.now(EASTERN)
-        for summary in unique_summaries:
-            st = summary.start_time
-            if st.tzinfo is None: st = st.replace(tzinfo=EASTERN)
+    def _set_race_map(self, race_map: Dict[str, RaceSummary]) -> None:
+        """Replaces race_map, removing dropped keys from golden_zone_index and upserting the rest."""
+        for key in self.race_map.keys() - race_map.keys():
+            self.golden_zone_index.remove(key)
+        for key, summary in race_map.items():
+            self.golden_zone_index.upsert(summary, key=key)
+        self.race_map = race_map
+        self._index_summaries()
 
-            # Calculate Minutes to Post
-            diff = st - now
-            mtp = diff.total_seconds() / 60
+    def _index_summaries(self):
+        """Re-derives the sorted race list and golden-zone list from golden_zone_index."""
+        # golden_zone_index holds every race_map summary by key, in start-time order, and is kept
+        # current by _set_race_map and the odds refresh; BET NOW / You Might Like ask it their
+        # windows every refresh
+        self.all_races = list(self.golden_zone_index)
 
-            # Broaden window to 18 hours to ensure yield for "News"
-            if -45 < mtp <= 1080: # 18 hours
-                timing_window_summaries.append(summary)
-
-        self.golden_zone_races = timing_window_summaries
+        # GPT5 Improvement: Keep all races within window for analysis, not just one per track.
+        # Window broadened to 18 hours (News Mode)
+        self.golden_zone_races = self.golden_zone_index.mtp_window(-45, 1080)
         if not self.golden_zone_races:
-            self.logger.warning("🔭 Monitor found 0 races in the Broadened Window (-45m to 18h)", total_unique=len(unique_summaries))
+            self.logger.warning("🔭 Monitor found 0 races in the Broadened Window (-45m to 18h)", total_unique=len(self.race_map))
 
     def print_full_list(self):
         """Log all fetched races."""
@@ -5782,8 +7637,9 @@ class FavoriteToPlaceMonitor:
         # 2. 2nd Fav Odds >= 4.0
         # 3. Field size <= 11 (User Directive)
         # 4. Gap > 0.25 (User Directive)
+        # One minute of slack around the window: the stored mtp is truncated to whole minutes
         bet_now = [
-            r for r in self.golden_zone_races
+            r for r in self.golden_zone_index.mtp_window(-11, 121)
             if r.mtp is not None and -10 < r.mtp <= 120
             and r.second_fav_odds is not None and r.second_fav_odds >= 4.0
             and r.field_size <= 11
@@ -5799,7 +7655,7 @@ class FavoriteToPlaceMonitor:
         # and field size <= 11 and Gap > 0.25
         bet_now_keys = {(r.track, r.race_number) for r in self.get_bet_now_races()}
         yml = [
-            r for r in self.golden_zone_races
+            r for r in self.golden_zone_index.mtp_window(-11, 241)
             if r.mtp is not None and -10 < r.mtp <= 240
             and r.second_fav_odds is not None and r.second_fav_odds >= 3.0
             and r.field_size <= 11
@@ -5810,6 +7666,30 @@ class FavoriteToPlaceMonitor:
         yml.sort(key=lambda r: r.mtp)
         return yml[:5]  # Limit to top 5 recommendations
 
+    def publish_changes(self) -> List[MonitorEvent]:
+        """Diffs the BET NOW list against the last call and publishes the changes on self.events."""
+        threshold = float(self.config.get("odds_move_threshold", ODDS_MOVE_THRESHOLD))
+        current = {self._summary_key(r): r for r in self.get_bet_now_races()}
+        events = []
+        for key, r in current.items():
+            seen = self._watched.get(key)
+            if seen is None:
+                self._watched[key] = {"odds": r.second_fav_odds, "off": r.mtp <= 0}
+                events.append(MonitorEvent("qualified", key, r))
+            elif seen["off"]:
+                continue
+            elif r.mtp <= 0:
+                seen["off"] = True
+                events.append(MonitorEvent("off", key, r))
+            elif abs(r.second_fav_odds - seen["odds"]) >= threshold:
+                events.append(MonitorEvent("odds_moved", key, r, previous_odds=seen["odds"]))
+                seen["odds"] = r.second_fav_odds
+        for key in [k for k in self._watched if k not in current]:
+            seen, r = self._watched.pop(key), self.race_map.get(key)
+            if not seen["off"] and r is not None:
+                events.append(MonitorEvent("off" if r.mtp is not None and r.mtp <= 0 else "dropped", key, r))
+        return self.events.publish(events) if events else []
+
     async def print_bet_now_list(self):
         """Log filtered BET NOW list and recent audited goldmine results."""
         bet_now = self.get_bet_now_races()
@@ -5865,7 +7745,10 @@ class FavoriteToPlaceMonitor:
             self.logger.info(historical_report)
 
     def save_to_json(self, filename: str = "race_data.json"):
-        """Export to JSON."""
+        """
+        Export to JSON. Unchanged content is not rewritten; config "race_data_delta" (True, or a
+        path) adds a delta file with just the races that changed.
+        """
         bn = self.get_bet_now_races()
         yml = self.get_you_might_like_races()
 
@@ -5893,34 +7776,53 @@ class FavoriteToPlaceMonitor:
             "all_races": [r.to_dict() for r in self.all_races],
             "bet_now_races": [r.to_dict() for r in bn],
             "you_might_like_races": [r.to_dict() for r in yml],
+            # BET NOW changes published since the previous save
+            "events": [e.to_dict() for e in self.events.since(self._saved_seq)],
         }
+        self._saved_seq = self.events.seq
+        writer = self.json_writers.get(filename)
+        if writer is None:
+            delta = self.config.get("race_data_delta")
+            if delta is True:
+                delta = str(Path(filename).with_suffix(".delta.json"))
+            writer = self.json_writers[filename] = JsonChangeWriter(
+                filename, delta_path=delta or None, volatile=("generated_at", "events"),
+            )
         try:
-            # Ensure parent directory exists (GPT5 Improvement)
-            Path(filename).parent.mkdir(parents=True, exist_ok=True)
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            writer.write(data)
         except Exception as e:
             self.logger.error("failed_saving_race_data", path=filename, error=str(e))
 
         # Persistent history log
         self._append_to_history(bn + yml)
 
+    @property
+    def history(self) -> PredictionHistoryStore:
+        """Prediction history store (config "history_dir"); run_* import a legacy prediction_history.jsonl."""
+        if self._history is None:
+            self._history = PredictionHistoryStore(
+                self.config.get("history_dir", PREDICTION_HISTORY_DIR), legacy_path="prediction_history.jsonl",
+            )
+        return self._history
+
     def _append_to_history(self, races: List[RaceSummary]):
         """Append races to persistent history for future result matching."""
         if not races: return
-        history_file = "prediction_history.jsonl"
         timestamp = datetime.now(EASTERN).isoformat()
         try:
-            with open(history_file, 'a') as f:
-                for r in races:
-                    record = r.to_dict()
-                    record["logged_at"] = timestamp
-                    f.write(json.dumps(record) + "\n")
+            records = []
+            for r in races:
+                record = r.to_dict()
+                record["race_id"] = self._summary_key(r)
+                record["logged_at"] = timestamp
+                records.append(record)
+            self.history.append(records)
         except Exception as e:
             self.logger.error("History logging failed", error=str(e))
 
     async def run_once(self, loaded_races: Optional[List[Race]] = None, adapter_names: Optional[List[str]] = None):
         try:
+            await self.history.import_legacy()
             if loaded_races is not None:
                 self.logger.info("Using loaded races", count=len(loaded_races))
                 # Map to (Race, AdapterName) tuple expected by build_race_summaries
@@ -5931,6 +7833,7 @@ class FavoriteToPlaceMonitor:
 
             await self.build_race_summaries(raw, window_hours=12) # Use 12h window for monitor
             self.print_full_list()
+            self.publish_changes()
             await self.print_bet_now_list()
             self.save_to_json()
         finally:
@@ -5938,19 +7841,26 @@ class FavoriteToPlaceMonitor:
             await GlobalResourceManager.cleanup()
 
     async def run_continuous(self):
+        await self.history.import_legacy()
         await self.initialize_adapters()
         raw = await self.fetch_all_races()
         await self.build_race_summaries(raw, window_hours=12)
         self.print_full_list()
+        # Desktop alerts are pushed as races qualify instead of diffing lists each cycle
+        unsubscribe = self.events.subscribe(RaceNotifier().notify_monitor_event, kinds={"qualified"})
         try:
             for _ in range(1000): # Iteration limit to prevent potential hangs
                 for r in self.all_races: r.mtp = self._calculate_mtp(r.start_time)
+                # Fresh odds where post time is close, within the per-minute request budget
+                await self.refresh_due_odds()
+                self.publish_changes()
                 await self.print_bet_now_list()
                 self.save_to_json()
                 await asyncio.sleep(self.refresh_interval)
         except KeyboardInterrupt:
             self.logger.info("Stopped by user")
         finally:
+            unsubscribe()
             for a in self.adapters: await a.shutdown()
             await GlobalResourceManager.cleanup()
 
@@ -6852,6 +8762,136 @@ class RacingPostToteAdapter(BrowserHeadersMixin, DebugMixin, BaseAdapterV3):
 # MASTER ORCHESTRATOR
 # ----------------------------------------
 
+@dataclass
+class MergeEvent:
+    """Emitted by RaceMergeStore when a merged race is created ("added") or gains data ("updated")."""
+    kind: str
+    key: str
+    race: Race
+    source: Optional[str] = None
+
+
+def discovery_race_key(race: Race) -> str:
+    """Canonical Venue + Race Number + Date; discipline is left out so adapters merge better."""
+    canonical_venue = get_venue_resolver().observe(race.venue)
+    st = race.start_time
+    if isinstance(st, str):
+        try:
+            st = datetime.fromisoformat(st.replace('Z', '+00:00'))
+        except (ValueError, TypeError):
+            pass
+    date_str = st.strftime('%Y%m%d') if hasattr(st, 'strftime') else "Unknown"
+    return f"{canonical_venue}|{race.race_number}|{date_str}"
+
+
+class RaceMergeStore:
+    """
+    Thread-safe, incremental deduplication of races as each adapter delivers them.
+
+    The first race seen for a key becomes the merged race; later copies add runners,
+    odds and sources to it. Subscribers receive a MergeEvent per touched race right
+    after each ingest, so analysis can start before the slowest adapter finishes.
+
+    Ingests may carry a ``priority`` (lower wins, e.g. the adapter's rank). Whatever the
+    arrival order, a merged race equals merging its copies in priority order: a copy that
+    arrives after a lower-priority one rebuilds the race (in place) from the copies as
+    delivered, which the store keeps untouched for that purpose.
+    """
+
+    def __init__(self, key_fn: Callable[[Race], str] = discovery_race_key, merge_runner_metadata: bool = False):
+        self.key_fn = key_fn
+        self.merge_runner_metadata = merge_runner_metadata
+        self._races: Dict[str, Race] = {}
+        self._parts: Dict[str, List[Tuple[float, int, Race]]] = {}  # key -> (priority, arrival, copy)
+        self._arrivals = 0
+        self._lock = threading.RLock()
+        self._subscribers: List[Callable[[MergeEvent], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._races)
+
+    def subscribe(self, callback: Callable[[MergeEvent], None]) -> None:
+        self._subscribers.append(callback)
+
+    def races(self) -> List[Race]:
+        """Merged races in first-seen order."""
+        with self._lock:
+            return list(self._races.values())
+
+    def ingest(self, races: List[Race], source: Optional[str] = None, priority: Optional[int] = None) -> List[MergeEvent]:
+        """Merges ``races`` into the store and notifies subscribers; returns the events."""
+        rank = float("inf") if priority is None else priority
+        touched: Dict[str, str] = {}
+        with self._lock:
+            for race in races:
+                key = self.key_fn(race)
+                self._arrivals += 1
+                parts = self._parts.get(key)
+                if parts is None:
+                    self._parts[key] = [(rank, self._arrivals, race)]
+                    self._races[key] = race
+                    touched[key] = "added"
+                    continue
+                if len(parts) == 1:
+                    # The first copy is the merged race and is about to change; keep it as delivered
+                    first_rank, first_arrival, first = parts[0]
+                    parts[0] = (first_rank, first_arrival, self._own(first))
+                parts.append((rank, self._arrivals, race))
+                existing = self._races[key]
+                if rank >= parts[-2][0]:
+                    self._merge(existing, race)
+                else:
+                    parts.sort(key=lambda part: part[:2])
+                    self._rebuild(existing, parts)
+                touched.setdefault(key, "updated")
+            events = [MergeEvent(kind, key, self._races[key], source) for key, kind in touched.items()]
+
+        for event in events:
+            for callback in self._subscribers:
+                try:
+                    callback(event)
+                except Exception as e:
+                    structlog.get_logger("RaceMergeStore").error("merge_subscriber_failed", key=event.key, error=str(e))
+        return events
+
+    def _merge(self, existing: Race, race: Race) -> None:
+        for nr in race.runners:
+            # Match by number OR name (if numbers are missing)
+            er = next((r for r in existing.runners if (r.number != 0 and r.number == nr.number) or (r.name.lower() == nr.name.lower())), None)
+            if er:
+                er.odds.update(nr.odds)
+                if not er.win_odds and nr.win_odds:
+                    er.win_odds = nr.win_odds
+                if not er.number and nr.number:
+                    er.number = nr.number
+                if self.merge_runner_metadata:
+                    er.metadata.update(nr.metadata)
+            else:
+                existing.runners.append(self._own_runner(nr))
+
+        # Update source
+        sources = set((existing.source or "").split(", "))
+        sources.add(race.source or "Unknown")
+        existing.source = ", ".join(sorted(list(filter(None, sources))))
+
+    def _rebuild(self, existing: Race, parts: List[Tuple[float, int, Race]]) -> None:
+        """Re-merges ``parts`` (in priority order) into ``existing``, keeping its identity."""
+        rebuilt = self._own(parts[0][2])
+        for _, _, race in parts[1:]:
+            self._merge(rebuilt, race)
+        for name in type(existing).model_fields:
+            setattr(existing, name, getattr(rebuilt, name))
+
+    @classmethod
+    def _own(cls, race: Race) -> Race:
+        return race.model_copy(update={"runners": [cls._own_runner(r) for r in race.runners]})
+
+    @staticmethod
+    def _own_runner(runner: Runner) -> Runner:
+        """A copy the merge can update without touching the adapter's runner."""
+        return runner.model_copy(update={"odds": dict(runner.odds), "metadata": dict(runner.metadata)})
+
+
 async def run_discovery(
     target_dates: List[str],
     window_hours: Optional[int] = 8,
@@ -6866,6 +8906,7 @@ async def run_discovery(
 ):
     logger = structlog.get_logger("run_discovery")
     logger.info("Running Discovery", dates=target_dates, window_hours=window_hours)
+    run_started = time.perf_counter()
 
     try:
         now = datetime.now(EASTERN)
@@ -6874,6 +8915,29 @@ async def run_discovery(
         all_races_raw = []
         harvest_summary = {}
 
+        # Merge races as each adapter finishes and qualify them on arrival, so the first
+        # qualified race does not wait for the slowest adapter
+        store = RaceMergeStore()
+        timing = {"first_qualified": None}
+
+        # Start-time index kept current by the store, for the analysis window below
+        time_index = RaceTimeIndex()
+        store.subscribe(lambda event: time_index.upsert(event.race, key=event.key))
+        # Fetch-only runs never select an analyzer, so no plugin is imported or built for them
+        engine = None
+        if not fetch_only:
+            engine = AnalyzerEngine(config)
+            early_analyzer = engine.get_analyzer("simply_success")
+
+            def on_merge(event: MergeEvent) -> None:
+                # Read-only probe: the race is still half-merged, so it must not be annotated yet
+                if timing["first_qualified"] is None and early_analyzer.accepts(event.race):
+                    timing["first_qualified"] = time.perf_counter() - run_started
+                    logger.info("First qualified race", venue=event.race.venue, race=event.race.race_number,
+                                source=event.source, seconds=round(timing["first_qualified"], 2))
+
+            store.subscribe(on_merge)
+
         # Pre-populate harvest_summary based on region/filter for visibility
         target_region = region or DEFAULT_REGION
         target_set = USA_DISCOVERY_ADAPTERS if target_region == "USA" else INT_DISCOVERY_ADAPTERS
@@ -6890,6 +8954,7 @@ async def run_discovery(
         if loaded_races is not None:
             logger.info("Using loaded races", count=len(loaded_races))
             all_races_raw = loaded_races
+            store.ingest(all_races_raw, source="loaded")
             adapters = []
             # Ensure harvest files exist even for loaded runs (Memory Directive Fix)
             try:
@@ -6923,22 +8988,25 @@ async def run_discovery(
                     logger.error("Failed to initialize adapter", adapter=cls.__name__, error=str(e))
 
             try:
-                async def fetch_one(a, date_str):
+                async def fetch_one(i, a, date_str):
                     try:
                         races = await a.get_races(date_str)
-                        return a.source_name, races
+                        return i, a.source_name, races
                     except Exception as e:
                         logger.error("Error fetching from adapter", adapter=a.source_name, date=date_str, error=str(e))
-                        return a.source_name, []
+                        return i, a.source_name, []
 
                 fetch_tasks = []
                 for d in target_dates:
                     for a in adapters:
-                        fetch_tasks.append(fetch_one(a, d))
+                        fetch_tasks.append(fetch_one(len(fetch_tasks), a, d))
 
-                results = await asyncio.gather(*fetch_tasks)
-                for adapter_name, r_list in results:
+                # Results are merged as they arrive; the task index is the adapter's priority,
+                # so the merge base for each race never depends on who answered first
+                for next_result in asyncio.as_completed(fetch_tasks):
+                    i, adapter_name, r_list = await next_result
                     all_races_raw.extend(r_list)
+                    store.ingest(r_list, source=adapter_name, priority=i)
 
                     # Track count and MaxOdds (Proxy for successful odds fetching)
                     m_odds = 0.0
@@ -6994,72 +9062,21 @@ async def run_discovery(
                     logger.error("Failed to save empty race list", error=str(e))
             return
 
-        # Deduplicate
-        race_map = {}
-        for race in all_races_raw:
-            canonical_venue = get_canonical_venue(race.venue)
-            # Use Canonical Venue + Race Number + Date + Discipline as stable key
-            st = race.start_time
-            if isinstance(st, str):
-                try:
-                    st = datetime.fromisoformat(st.replace('Z', '+00:00'))
-                except (ValueError, TypeError):
-                    pass
-
-            date_str = st.strftime('%Y%m%d') if hasattr(st, 'strftime') else "Unknown"
-            # Removing discipline from key to allow better merging across adapters
-            key = f"{canonical_venue}|{race.race_number}|{date_str}"
-
-            if key not in race_map:
-                race_map[key] = race
-            else:
-                existing = race_map[key]
-                # Merge runners/odds
-                for nr in race.runners:
-                    # Match by number OR name (if numbers are missing)
-                    er = next((r for r in existing.runners if (r.number != 0 and r.number == nr.number) or (r.name.lower() == nr.name.lower())), None)
-                    if er:
-                        er.odds.update(nr.odds)
-                        if not er.win_odds and nr.win_odds:
-                            er.win_odds = nr.win_odds
-                        if not er.number and nr.number:
-                            er.number = nr.number
-                    else:
-                        existing.runners.append(nr)
-
-                # Update source
-                sources = set((existing.source or "").split(", "))
-                sources.add(race.source or "Unknown")
-                existing.source = ", ".join(sorted(list(filter(None, sources))))
-
-        unique_races = list(race_map.values())
+        # Deduplicated incrementally by the merge store as adapters finished
+        unique_races = store.races()
         logger.info("Unique races identified", count=len(unique_races))
 
         # GPT5 Improvement: Keep all races within window for analysis, not just one per track.
         # Window broadened to 18 hours to match grid cutoff (News Mode)
-        timing_window_races = []
         now = datetime.now(EASTERN)
-        for race in unique_races:
-            st = race.start_time
-            if isinstance(st, str):
-                try:
-                    st = datetime.fromisoformat(st.replace('Z', '+00:00'))
-                except (ValueError, TypeError):
-                    continue
-            if st.tzinfo is None:
-                st = st.replace(tzinfo=EASTERN)
-
-            # Calculate Minutes to Post
-            diff = st - now
-            mtp = diff.total_seconds() / 60
-
-            # Broaden window to 18 hours to ensure yield for "News"
-            if -45 < mtp <= 1080: # 18 hours = 1080 mins
-                timing_window_races.append(race)
-                if mtp <= 45:
-                    logger.info(f"  💰 Found Gold Candidate: {race.venue} R{race.race_number} ({mtp:.1f} MTP)")
-                else:
-                    logger.debug(f"  🔭 Found Upcoming Candidate: {race.venue} R{race.race_number} ({mtp:.1f} MTP)")
+        # Broaden window to 18 hours to ensure yield for "News"
+        timing_window_races = time_index.mtp_window(-45, 1080, now=now)  # 18 hours = 1080 mins
+        for race in timing_window_races:
+            mtp = (start_timestamp(race) - now.timestamp()) / 60
+            if mtp <= 45:
+                logger.info(f"  💰 Found Gold Candidate: {race.venue} R{race.race_number} ({mtp:.1f} MTP)")
+            else:
+                logger.debug(f"  🔭 Found Upcoming Candidate: {race.venue} R{race.race_number} ({mtp:.1f} MTP)")
 
         golden_zone_races = timing_window_races
         if not golden_zone_races:
@@ -7080,17 +9097,26 @@ async def run_discovery(
             logger.info("Fetch-only mode active. Skipping analysis and reporting.")
             return
 
+        race_table = RaceTable.from_races(unique_races)
+
         # Analyze ALL unique races to ensure Grid is populated with Top 5 info (News Mode)
-        analyzer = SimplySuccessAnalyzer(config=config)
-        result = analyzer.qualify_races(unique_races)
+        result = engine.qualify("simply_success", unique_races)
         qualified = result.get("races", [])
+        first_qualified = timing["first_qualified"]
+        logger.info(
+            "Discovery timing",
+            time_to_first_qualified=round(first_qualified, 2) if first_qualified is not None else None,
+            analysis_ready=round(time.perf_counter() - run_started, 2),
+            qualified=len(qualified),
+            analyzer_plugins=engine.analyzers.timings(),
+        )
 
         # Generate Grid & Goldmine (Grid uses unique_races for the broader context)
-        grid = generate_summary_grid(qualified, all_races=unique_races)
+        grid = generate_summary_grid(qualified, all_races=unique_races, table=race_table)
         logger.info("Summary Grid Generated")
 
         # Generate Field Matrix for all unique races
-        field_matrix = generate_field_matrix(unique_races)
+        field_matrix = generate_field_matrix(unique_races, table=race_table)
         logger.info("Field Matrix Generated")
 
         # Log Hot Tips & Fetch recent historical results for the report
@@ -7219,6 +9245,7 @@ async def run_discovery(
                 logger.error("Failed to write GHA summary", error=str(e))
 
     finally:
+        logger.info("Discovery finished", total_seconds=round(time.perf_counter() - run_started, 2))
         await GlobalResourceManager.cleanup()
 async def start_desktop_app():
     """Starts a FastAPI server and opens a webview window for the Fortuna Dashboard."""
@@ -7291,7 +9318,7 @@ async def start_desktop_app():
                             {tips_html or "<tr><td colspan='5'>No opportunities found yet. Run discovery to populate the database.</td></tr>"}
                         </tbody>
                     </table>
-                    <div class="footer">Fortuna Intelligence Monolith - Sci-Fi Future Edition - Auto-refreshing every 30s</div>
+                    <div class="footer">Fortuna Intelligence Monolith - Sci-Fi Future Edition - Live updates from the monitor</div>
                 </div>
             </body>
         </html>
@@ -7376,6 +9403,8 @@ async def main_all_in_one():
     parser.add_argument("--hours", type=int, default=8, help="Discovery time window in hours (default: 8)")
     parser.add_argument("--monitor", action="store_true", help="Run in monitor mode")
     parser.add_argument("--once", action="store_true", help="Run monitor once")
+    parser.add_argument("--monitor-port", type=int, default=MONITOR_WS_PORT,
+                        help=f"Port for the continuous monitor's /ws/monitor event stream, 0 to disable (default: {MONITOR_WS_PORT})")
     parser.add_argument("--region", type=str, choices=["USA", "INT", "GLOBAL"], help="Filter by region (USA, INT or GLOBAL)")
     parser.add_argument("--include", type=str, help="Comma-separated adapter names to include")
     parser.add_argument("--save", type=str, help="Save races to JSON file")
@@ -7507,6 +9536,8 @@ async def main_all_in_one():
             if config.get("ui", {}).get("auto_open_report", True) and not os.getenv("GITHUB_ACTIONS"):
                 open_report_in_browser()
         else:
+            if args.monitor_port:
+                start_monitor_event_server(monitor.events, port=args.monitor_port)
             await monitor.run_continuous() # Continuous mode doesn't support load/filter yet for simplicity
     else:
         await ensure_browsers()
@@ -18,7 +18,7 @@ from typing import Any, Dict, Final, List, Optional, Set, Tuple, Type
 from zoneinfo import ZoneInfo
 
 import structlog
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 from selectolax.parser import HTMLParser, Node
 
 import fortuna
@@ -164,18 +164,40 @@ class ResultRace(fortuna.Race):
     superfecta_payout: Optional[float] = None
     superfecta_combination: Optional[str] = None
 
+    # (venue, race_number, start_time, discipline, resolver, resolver generation, canonical,
+    # relaxed, timed); the keys are rebuilt only when one of the inputs changes or the venue
+    # resolver may answer differently
+    _keys: Optional[Tuple[Any, ...]] = PrivateAttr(default=None)
+
+    def _match_keys(self) -> Tuple[Any, ...]:
+        keys = self._keys
+        resolver = fortuna.get_venue_resolver()
+        if (keys is None or keys[:4] != (self.venue, self.race_number, self.start_time, self.discipline)
+                or keys[4] is not resolver or keys[5] != resolver.generation):
+            d = self.start_time.strftime("%Y%m%d")
+            disc = (self.discipline or "T")[:1].upper()
+            base = f"{resolver.resolve(self.venue)}|{self.race_number}|{d}"
+            timed = f"{base}|{self.start_time.strftime('%H%M')}"
+            keys = self._keys = (
+                self.venue, self.race_number, self.start_time, self.discipline, resolver, resolver.generation,
+                f"{timed}|{disc}", f"{base}|{disc}", timed,
+            )
+        return keys
+
     @property
     def canonical_key(self) -> str:
-        d = self.start_time.strftime("%Y%m%d")
-        t = self.start_time.strftime("%H%M")
-        disc = (self.discipline or "T")[:1].upper()
-        return f"{fortuna.get_canonical_venue(self.venue)}|{self.race_number}|{d}|{t}|{disc}"
+        """Venue|Race|Date|HHMM|Disc."""
+        return self._match_keys()[6]
 
     @property
     def relaxed_key(self) -> str:
-        d = self.start_time.strftime("%Y%m%d")
-        disc = (self.discipline or "T")[:1].upper()
-        return f"{fortuna.get_canonical_venue(self.venue)}|{self.race_number}|{d}|{disc}"
+        """Venue|Race|Date|Disc (no time)."""
+        return self._match_keys()[7]
+
+    @property
+    def timed_key(self) -> str:
+        """Venue|Race|Date|HHMM (no discipline)."""
+        return self._match_keys()[8]
 
     def get_top_finishers(self, n: int = 5) -> List[ResultRunner]:
         ranked = [r for r in self.runners if r.position_numeric is not None]
@@ -240,6 +262,7 @@ class AuditorEngine:
         audited: List[Dict[str, Any]] = []
         outcomes_to_batch: List[Tuple[str, Dict[str, Any]]] = []
 
+        resolver = fortuna.get_venue_resolver()
         for tip in unverified:
             try:
                 race_id = tip.get("race_id")
@@ -254,6 +277,10 @@ class AuditorEngine:
                 if not result:
                     continue
 
+                # A fuzzy venue match is remembered for this run and persisted once enough
+                # matched races confirm it (exact spellings are already known)
+                resolver.learn(tip.get("venue"), result.canonical_key.split("|", 1)[0], evidence=result.canonical_key)
+
                 outcome = self._evaluate_tip(tip, result)
                 outcomes_to_batch.append((race_id, outcome))
                 audited.append({**tip, **outcome, "audit_completed": True})
@@ -266,6 +293,8 @@ class AuditorEngine:
                     exc_info=True,
                 )
 
+        resolver.save()
+
         if outcomes_to_batch:
             self.logger.info("Updating audit results", count=len(outcomes_to_batch))
             if hasattr(self.db, "update_audit_results_batch"):
@@ -282,24 +311,30 @@ class AuditorEngine:
     ) -> Dict[str, ResultRace]:
         mapping: Dict[str, ResultRace] = {}
         log = structlog.get_logger("AuditorEngine")
+        resolver = fortuna.get_venue_resolver()
         for r in results:
+            # Register result venues first so noisy tip spellings can resolve to them
+            resolver.observe(r.venue)
+            # Keys are built once per result and shared with the map
+            canonical, relaxed = r.canonical_key, r.relaxed_key
             # Canonical key: full precision
-            mapping[r.canonical_key] = r
-
-            if r.relaxed_key != r.canonical_key:
-                # Relaxed key: Venue|Race|Date|Disc (no time)
-                if r.relaxed_key in mapping:
-                    existing = mapping[r.relaxed_key]
-                    if existing.canonical_key != r.canonical_key:
-                        log.debug(
-                            "Relaxed key collision",
-                            key=r.relaxed_key,
-                            existing=existing.canonical_key,
-                            new=r.canonical_key,
-                        )
-                        # Prefer existing canonical over new relaxed if collision
-                        continue
-                mapping[r.relaxed_key] = r
+            mapping[canonical] = r
+            # Timed key without discipline (Venue|Race|Date|HHMM) for the discipline fallback;
+            # the first result wins, as with the previous prefix scan
+            mapping.setdefault(r.timed_key, r)
+
+            # Relaxed key: Venue|Race|Date|Disc (no time)
+            existing = mapping.get(relaxed)
+            if existing is not None and existing.canonical_key != canonical:
+                log.debug(
+                    "Relaxed key collision",
+                    key=relaxed,
+                    existing=existing.canonical_key,
+                    new=canonical,
+                )
+                # Prefer existing canonical over new relaxed if collision
+                continue
+            mapping[relaxed] = r
         return mapping
 
 
@@ -328,19 +363,16 @@ class AuditorEngine:
                 )
                 return result
 
-        # Fallback 2: drop discipline (keep time)
+        # Fallback 2: drop discipline (keep time), indexed by _build_results_map
         if len(parts) >= 4:
-            prefix = "|".join(parts[:4])
-            matches = [obj for key, obj in results_map.items() if key.startswith(prefix)]
-            if matches:
-                if len(matches) > 1:
-                    self.logger.warning(
-                        "Multiple discipline fallback matches",
-                        race_id=race_id,
-                        count=len(matches),
-                    )
-                # Deterministic return: the one with exact time match if available
-                return matches[0]
+            result = results_map.get("|".join(parts[:4]))
+            if result:
+                self.logger.info(
+                    "Discipline-relaxed fallback match",
+                    race_id=race_id,
+                    match_key=result.canonical_key,
+                )
+                return result
 
         return None
 
@@ -360,7 +392,7 @@ class AuditorEngine:
                 str(start_raw).replace("Z", "+00:00"),
             )
             return (
-                f"{fortuna.get_canonical_venue(venue)}"
+                f"{fortuna.resolve_venue(venue)}"
                 f"|{race_number}"
                 f"|{st.strftime('%Y%m%d')}"
                 f"|{st.strftime('%H%M')}"
@@ -810,7 +842,7 @@ class PageFetchingResultsAdapter(
             return True
 
         # Try exact canonical match on text (e.g. track name in link)
-        canon_text = fortuna.get_canonical_venue(text)
+        canon_text = fortuna.resolve_venue(text)
         if canon_text != "unknown" and canon_text in self.target_venues:
             return True
 
@@ -1608,7 +1640,7 @@ class AtTheRacesResultsAdapter(PageFetchingResultsAdapter):
 # -- SPORTING LIFE RESULTS ADAPTER --------------------------------------------
 
 
-class SportingLifeResultsAdapter(PageFetchingResultsAdapter):
+class SportingLifeResultsAdapter(fortuna.JSONParsingMixin, PageFetchingResultsAdapter):
     """Sporting Life results (UK / IRE / International)."""
 
     SOURCE_NAME = "SportingLifeResults"
@@ -1671,15 +1703,14 @@ class SportingLifeResultsAdapter(PageFetchingResultsAdapter):
         self, script_text: str, date_str: str,
     ) -> Optional[ResultRace]:
         try:
-            data = json.loads(script_text)
+            race_data = self._decode_json(
+                script_text, ["props", "pageProps", "race"], anchor="pageProps",
+            )
         except json.JSONDecodeError as exc:
             self.logger.debug("Invalid __NEXT_DATA__", error=str(exc))
             return None
 
-        race_data = (
-            data.get("props", {}).get("pageProps", {}).get("race", {})
-        )
-        if not race_data:
+        if not race_data or not isinstance(race_data, dict):
             return None
 
         summary    = race_data.get("race_summary", {})
@@ -2444,7 +2475,7 @@ async def run_analytics(
         else:
             _analytics_logger.info("Tips to audit", count=len(unverified))
             target_venues = {
-                fortuna.get_canonical_venue(t.get("venue"))
+                fortuna.resolve_venue(t.get("venue"))
                 for t in unverified
             }
             # Remove only the sentinel value, not a real problem (Bug #6 Fix)
@@ -57,11 +57,15 @@ from various racing websites. It serves as a high-reliability fallback system.
 """
 import argparse
 import asyncio
+import bisect
 import functools
 from functools import lru_cache
+import hashlib
 import html
+import itertools
 import json
 import logging
+import math
 import os
 import random
 import weakref
@@ -78,10 +82,14 @@ from pathlib import Path
 from typing import (
     Any,
     Annotated,
+    Awaitable,
     Callable,
     ClassVar,
     Dict,
     Final,
+    Hashable,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -94,6 +102,7 @@ from typing import (
 )
 
 import httpx
+import numpy as np
 import pandas as pd
 import sqlite3
 from zoneinfo import ZoneInfo
@@ -123,6 +132,11 @@ from tenacity import (
 # --- OPTIONAL IMPORTS ---
 curl_requests = None  # Not used in interactive mode
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import tomli
     HAS_TOML = True
@@ -487,6 +501,22 @@ SCORING_MTP_MAX: Final[int] = 15
 ODDS_REFRESH_ADAPTERS: Final[List[str]] = ["TwinSpires", "NYRABets"]
 SNAPSHOT_DIR: Final[str] = "snapshots"
 
+# Learned per-adapter fetch timeouts (AdapterTimeBudgets)
+ADAPTER_TIMEOUT_FLOOR: Final[float] = 15.0
+ADAPTER_TIMEOUT_CEILING: Final[float] = 300.0
+ADAPTER_TIMEOUT_FACTOR: Final[float] = 2.0
+ADAPTER_TIMEOUT_MIN_SAMPLES: Final[int] = 5
+ADAPTER_LATENCY_WINDOW: Final[int] = 50
+ADAPTER_DRIFT_TOLERANCE: Final[float] = 1.5
+ADAPTER_TIMEOUT_BACKOFF: Final[float] = 1.5
+ADAPTER_TIMEOUT_MAX_BACKOFF_STEPS: Final[int] = 3
+
+# Phase-1 quarter fetch concurrency (gather_by_host)
+PHASE1_CONCURRENCY: Final[int] = 6
+PHASE1_PER_HOST_CONCURRENCY: Final[int] = 1
+# Cap on one adapter's own concurrent requests to a host (e.g. TAB meeting details)
+DEFAULT_HOST_CONCURRENCY: Final[int] = 4
+
 # DayPart regional mapping - Phase A2 fix (adding INT/GLOBAL to Q4)
 DAYPART_ACTIVE_REGIONS: Final[Dict[DayPart, frozenset]] = {
     DayPart.Q1: frozenset({'INT', 'GLOBAL'}), # AU/NZ focus
@@ -656,7 +686,7 @@ def create_odds_data(source: str, win_odds: Optional[float]) -> Optional[OddsDat
     if win_odds is None:
         return None
     try:
-        return OddsData(source=source, win=Decimal(str(win_odds)))
+        return OddsData(source=source, win=odds_value(win_odds))
     except Exception:
         return None
 
@@ -849,20 +879,116 @@ def generate_race_id(
     return f"{prefix}_{venue_slug}_{date_str}_{time_str}_R{race_number}{disc_suffix}"
 
 
+def start_timestamp(item: Any) -> Optional[float]:
+    """POSIX timestamp of ``item.start_time`` (naive times are Eastern); None if it has no usable time."""
+    st = getattr(item, "start_time", None)
+    if isinstance(st, str):
+        try:
+            st = datetime.fromisoformat(st.replace('Z', '+00:00'))
+        except (ValueError, TypeError):
+            return None
+    if not isinstance(st, datetime):
+        return None
+    return ensure_eastern(st).timestamp()
+
+
+class RaceTimeIndex:
+    """
+    Races ordered by start time, answering "what starts between T1 and T2" by bisection
+    instead of a scan.
+
+    Entries are keyed so an updated race replaces its slot rather than being indexed twice;
+    ties keep insertion order. Items without a usable start_time are not indexed.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), key_fn: Callable[[Any], Hashable] = id):
+        self.key_fn = key_fn
+        self._times: List[float] = []
+        self._keys: List[Hashable] = []
+        self._items: Dict[Hashable, Any] = {}
+        self._slot: Dict[Hashable, float] = {}
+        self._lock = threading.RLock()
+        for item in items:
+            self.upsert(item)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter([self._items[k] for k in self._keys])
+
+    def upsert(self, item: Any, key: Optional[Hashable] = None) -> bool:
+        """Adds or replaces ``item``; returns False (and drops any old slot) if it has no start time."""
+        key = self.key_fn(item) if key is None else key
+        ts = start_timestamp(item)
+        with self._lock:
+            old = self._slot.get(key)
+            if old is not None and old != ts:
+                self._drop(key, old)
+                old = None
+            if ts is None:
+                self._items.pop(key, None)
+                return False
+            self._items[key] = item
+            if old is None:
+                i = bisect.bisect_right(self._times, ts)
+                self._times.insert(i, ts)
+                self._keys.insert(i, key)
+                self._slot[key] = ts
+            return True
+
+    def remove(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            ts = self._slot.get(key)
+            if ts is None:
+                return None
+            self._drop(key, ts)
+            return self._items.pop(key, None)
+
+    def _drop(self, key: Hashable, ts: float) -> None:
+        i = bisect.bisect_left(self._times, ts)
+        while self._keys[i] != key:
+            i += 1
+        del self._times[i], self._keys[i]
+        del self._slot[key]
+
+    def between(self, after: datetime, until: datetime) -> List[Any]:
+        """Items with ``after < start_time <= until``, in start-time order."""
+        lo, hi = ensure_eastern(after).timestamp(), ensure_eastern(until).timestamp()
+        with self._lock:
+            i = bisect.bisect_right(self._times, lo)
+            j = bisect.bisect_right(self._times, hi)
+            return [self._items[k] for k in self._keys[i:j]]
+
+    def mtp_window(self, min_mtp: float, max_mtp: float, now: Optional[datetime] = None) -> List[Any]:
+        """Items with ``min_mtp < minutes-to-post <= max_mtp`` at ``now`` (default: current time)."""
+        now = now or now_eastern()
+        return self.between(now + timedelta(minutes=min_mtp), now + timedelta(minutes=max_mtp))
+
+
 def get_scorable_races(
     cached_races: List[Race],
     already_scored: Optional[Set[str]] = None,
+    time_index: Optional[RaceTimeIndex] = None,
 ) -> List[Race]:
-    """Filter to races within SCORING_MTP_MAX minutes of post that haven't been scored yet."""
-    now = now_eastern()
+    """
+    Filter to races within SCORING_MTP_MAX minutes of post that haven't been scored yet.
+
+    Pass a ``time_index`` over ``cached_races`` when asking repeatedly (e.g. every refresh)
+    so the window is found by bisection (races come back in start-time order); without
+    one the list is scanned once and keeps its order.
+    """
     already = already_scored or set()
+    # This is the ONLY timing gate in the scoring path.
+    if time_index is not None:
+        return [race for race in time_index.mtp_window(0, SCORING_MTP_MAX) if race.id not in already]
+    now = now_eastern()
     scorable = []
     for race in cached_races:
         if race.id in already:
             continue
-        mtp_seconds = (race.start_time - now).total_seconds()
-        mtp_minutes = mtp_seconds / 60
-        # This is the ONLY timing gate in the scoring path.
+        mtp_minutes = (race.start_time - now).total_seconds() / 60
         if 0 < mtp_minutes <= SCORING_MTP_MAX:
             scorable.append(race)
     return scorable
@@ -960,6 +1086,28 @@ def load_quarter_snapshot(
         return None
 
 
+def race_fingerprint(race: Race) -> str:
+    """Stable digest of what the analyzers read: card details, start time, runners, scratchings and odds."""
+    runners = []
+    for r in race.runners:
+        odds = sorted(
+            (src, get_field(od, "win"), get_field(od, "place")) for src, od in (r.odds or {}).items()
+        )
+        runners.append((r.number, r.name, r.scratched, r.win_odds, r.metadata.get("odds_source_trustworthy"), odds))
+    start = race.start_time.isoformat() if isinstance(race.start_time, datetime) else race.start_time
+    payload = (
+        race.venue, race.race_number, start, race.discipline, race.distance,
+        race.race_type, race.is_handicap, race.metadata.get("provides_odds"), runners,
+    )
+    # repr of plain scalars is stable across runs and much cheaper than a JSON round trip
+    return hashlib.sha1(repr(payload).encode()).hexdigest()
+
+
+def score_state_path(daypart_tag: str, output_dir: str = SNAPSHOT_DIR) -> str:
+    """Where run_score_now keeps analyzer fingerprints, next to the quarter snapshot."""
+    return os.path.join(output_dir, f"{daypart_tag}_scores.json")
+
+
 def _find_adapter_class(source_name: str) -> Optional[Type[BaseAdapterV3]]:
     """Find adapter class by SOURCE_NAME."""
     def get_all_subclasses(cls):
@@ -1041,7 +1189,7 @@ class UnifiedResponse:
     headers: Dict[str, str] = field(default_factory=dict)
 
     def json(self) -> Any:
-        return json.loads(self.text)
+        return fast_json_loads(self.text)
 
 
 class FetchStrategy(FortunaBaseModel):
@@ -1101,6 +1249,9 @@ class AdapterMetrics:
         self.last_failure_reason: Optional[str] = None
         self.parse_warnings = 0
         self.parse_errors = 0
+        self.json_decodes = 0
+        self.json_decode_ms = 0.0
+        self.json_decode_bytes = 0
 
     @property
     def success_rate(self) -> float:
@@ -1129,6 +1280,12 @@ class AdapterMetrics:
         with self._lock:
             self.parse_errors += 1
 
+    def record_json_decode(self, elapsed_ms: float, size: int) -> None:
+        with self._lock:
+            self.json_decodes += 1
+            self.json_decode_ms += elapsed_ms
+            self.json_decode_bytes += size
+
     def snapshot(self) -> Dict[str, Any]:
         return {
             "total_requests": self.total_requests,
@@ -1137,19 +1294,108 @@ class AdapterMetrics:
             "consecutive_failures": self.consecutive_failures,
             "last_failure_reason": getattr(self, "last_failure_reason", None),
             "parse_warnings": self.parse_warnings,
-            "parse_errors": self.parse_errors
+            "parse_errors": self.parse_errors,
+            "json_decodes": self.json_decodes,
+            "json_decode_ms": round(self.json_decode_ms, 2),
+            "json_decode_bytes": self.json_decode_bytes
         }
 
 
+def fast_json_loads(data: Union[str, bytes]) -> Any:
+    """json.loads drop-in that uses orjson when installed (stdlib still handles NaN/surrogate edge cases)."""
+    if orjson is not None:
+        if isinstance(data, str) and type(data) is not str: data = str(data)
+        try: return orjson.loads(data)
+        except orjson.JSONDecodeError: pass
+    return json.loads(data)
+
+
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:]')
+
+
+def _json_key_path_at(text: str, pos: int) -> Optional[List[str]]:
+    """
+    Keys leading to the object whose member key starts at offset `pos`, or None when `pos`
+    is not a key of an object reachable through objects only (inside a string or a list).
+    """
+    stack: List[List[Any]] = []  # [bracket, raw key of the member being read]
+    last = ""
+    for m in _JSON_TOKEN.finditer(text):
+        if m.start() >= pos:
+            break
+        if m.end() > pos:
+            return None  # `pos` falls inside a string
+        tok = m.group()
+        if tok in "{[":
+            stack.append([tok, None])
+        elif tok in "}]":
+            if not stack: return None
+            stack.pop()
+        elif tok == ":":
+            if stack: stack[-1][1] = last
+        else:
+            last = tok
+    if not stack or any(bracket != "{" for bracket, _ in stack):
+        return None
+    return [json.loads(raw) if "\\" in raw else raw[1:-1] for _, raw in stack[:-1]]
+
+
+def _decode_at_anchor(text: str, path: List[str], anchor: str) -> Tuple[bool, Any]:
+    """(True, value of `anchor`) when it is a unique key sitting exactly at its place in `path`."""
+    token = f'"{anchor}":'
+    pos = text.find(token)
+    if pos == -1 or text.find(token, pos + 1) != -1:
+        return False, None
+    if _json_key_path_at(text, pos) != path[:path.index(anchor)]:
+        return False, None
+    start = pos + len(token)
+    while start < len(text) and text[start] in " \t\r\n": start += 1
+    try:
+        return True, json.JSONDecoder().raw_decode(text, start)[0]
+    except json.JSONDecodeError:
+        return False, None
+
+
+def decode_json_subtree(text: Union[str, bytes], path: List[str], anchor: Optional[str] = None) -> Any:
+    """
+    Returns the value at `path` (list of keys) inside a JSON document, or None.
+
+    The sub-tree shortcut only applies without orjson, which decodes a whole document
+    faster than the stdlib decodes part of it. There, an `anchor` key in `path` that occurs
+    exactly once, and is verified to sit at its place in `path`, lets raw_decode read just
+    that value; anything else falls back to a full decode.
+    """
+    found, node, rest = False, None, path
+    if orjson is None and anchor and anchor in path and isinstance(text, str):
+        found, node = _decode_at_anchor(text, path, anchor)
+        if found:
+            rest = path[path.index(anchor) + 1:]
+    if not found:
+        node, rest = fast_json_loads(text), path
+    for key in rest:
+        if not isinstance(node, dict): return None
+        node = node.get(key)
+    return node
+
+
 # --- MIXINS ---
 class JSONParsingMixin:
     """Mixin for safe JSON extraction from HTML and scripts."""
-    def _parse_json_from_script(self, parser: HTMLParser, selector: str, context: str = "script") -> Optional[Any]:
+    def _decode_json(self, raw: Union[str, bytes], path: Optional[List[str]] = None, anchor: Optional[str] = None) -> Any:
+        """Decodes with the fast loader (optionally just the sub-tree at `path`) and records decode time."""
+        t0 = time.perf_counter()
+        try:
+            return decode_json_subtree(raw, path, anchor) if path else fast_json_loads(raw)
+        finally:
+            if metrics := getattr(self, "metrics", None):
+                metrics.record_json_decode((time.perf_counter() - t0) * 1000, len(raw))
+
+    def _parse_json_from_script(self, parser: HTMLParser, selector: str, context: str = "script", path: Optional[List[str]] = None, anchor: Optional[str] = None) -> Optional[Any]:
         script = parser.css_first(selector)
         if not script:
             return None
         try:
-            return json.loads(node_text(script))
+            return self._decode_json(node_text(script), path, anchor)
         except json.JSONDecodeError as e:
             if hasattr(self, 'logger'):
                 self.logger.error("failed_parsing_json", context=context, selector=selector, error=str(e))
@@ -1163,7 +1409,7 @@ class JSONParsingMixin:
         if not raw:
             return None
         try:
-            return json.loads(html.unescape(raw))
+            return self._decode_json(html.unescape(raw))
         except json.JSONDecodeError as e:
             if hasattr(self, 'logger'):
                 self.logger.error("failed_parsing_json", context=context, selector=selector, attribute=attribute, error=str(e))
@@ -1173,7 +1419,7 @@ class JSONParsingMixin:
         results = []
         for script in parser.css(selector):
             try:
-                results.append(json.loads(node_text(script)))
+                results.append(self._decode_json(node_text(script)))
             except json.JSONDecodeError as e:
                 if hasattr(self, 'logger'):
                     self.logger.error("failed_parsing_json_in_list", context=context, selector=selector, error=str(e))
@@ -1253,6 +1499,8 @@ class BaseAdapterV3(ABC):
         self.last_race_count = 0
         self.last_duration_s = 0.0
         self.last_response_status: Optional[Union[int, str]] = None
+        # manual_fetch/ files this adapter asked for and did not find (see present_manual_fetch_batch)
+        self.manual_fetch_misses: List[Dict[str, str]] = []
 
     @abstractmethod
     def _configure_fetch_strategy(self) -> FetchStrategy: pass
@@ -1363,12 +1611,12 @@ class BaseAdapterV3(ABC):
             for runner in r.runners:
                 if not runner.scratched:
                     # Explicitly enrich win_odds using all available sources (including fallbacks)
-                    best = _get_best_win_odds(runner)
+                    best = _best_win_odds_value(runner)
                     # Untrustworthy odds should be flagged
                     is_trustworthy = best is not None
                     runner.metadata["odds_source_trustworthy"] = is_trustworthy
                     if best:
-                        runner.win_odds = float(best)
+                        runner.win_odds = best
                         trustworthy_runners += 1
                     else:
                         # Clear invalid or missing odds to maintain hygiene
@@ -1421,6 +1669,7 @@ class BaseAdapterV3(ABC):
             return UnifiedResponse(text=content, status=200, status_code=200, url=full_url)
 
         self.logger.warning("manual_fetch_miss", file=str(filepath), url=full_url)
+        self.manual_fetch_misses.append({"url": full_url, "file": str(filepath)})
         self.last_response_status = 404
         return None
 
@@ -1957,7 +2206,7 @@ class JRAAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, BaseAdap
             discipline="Thoroughbred"
         )
 
-class RacingAndSportsAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, BaseAdapterV3):
+class RacingAndSportsAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, BaseAdapterV3):
     """
     Adapter for Racing & Sports (RAS).
     Note: Highly protected by Cloudflare; requires advanced impersonation.
@@ -1990,7 +2239,7 @@ class RacingAndSportsAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMix
             resp = await self.make_request("GET", url, headers=self._get_headers(), raise_for_status=False)
             if resp and resp.text:
                 try:
-                    data = json.loads(resp.text)
+                    data = self._decode_json(resp.text)
                     if isinstance(data, (dict, list)) and data:
                         self.logger.info("ras_json_fetch_success", meeting_count=len(data.get('meetings', [])) if isinstance(data, dict) else len(data))
                         return {"json_data": data, "date": date}
@@ -2887,7 +3136,7 @@ class AtTheRacesGreyhoundAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMix
         now_site = datetime.now(site_tz)
 
         try:
-            modules = json.loads(html.unescape(items_raw))
+            modules = self._decode_json(html.unescape(items_raw))
             for module in modules:
                 for meeting in module.get("data", {}).get("items", []):
                     # Broaden window to capture multiple races
@@ -2931,7 +3180,7 @@ class AtTheRacesGreyhoundAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMix
         if not pc: return None
         items_raw = pc.attributes.get(":items") or pc.attributes.get(":modules")
         if not items_raw: return None
-        try: modules = json.loads(html.unescape(items_raw))
+        try: modules = self._decode_json(html.unescape(items_raw))
         except Exception: return None
         venue, race_time_str, distance, runners, odds_map = "", "", "", [], {}
 
@@ -3046,7 +3295,7 @@ class SportingLifeAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMixin, Rac
 
     def _extract_race_metadata(self, parser: HTMLParser, date_str: str) -> List[Dict[str, Any]]:
         meta: List[Dict[str, Any]] = []
-        data = self._parse_json_from_script(parser, "script#__NEXT_DATA__", context="SportingLife Index")
+        json_meetings = self._parse_json_from_script(parser, "script#__NEXT_DATA__", context="SportingLife Index", path=["props", "pageProps", "meetings"], anchor="pageProps")
 
         try:
             target_date = parse_date_string(date_str).date()
@@ -3056,8 +3305,8 @@ class SportingLifeAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMixin, Rac
         site_tz = ZoneInfo("Europe/London")
         now_site = datetime.now(site_tz)
 
-        if data:
-            for meeting in data.get("props", {}).get("pageProps", {}).get("meetings", []):
+        if isinstance(json_meetings, list):
+            for meeting in json_meetings:
                 # Broaden window to capture multiple races
                 races = meeting.get("races", [])
                 for i, race in enumerate(races):
@@ -3114,10 +3363,8 @@ class SportingLifeAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMixin, Rac
         return races
 
     def _parse_from_next_data(self, parser: HTMLParser, race_date: date, race_number_fallback: Optional[int], html_content: str) -> Optional[Race]:
-        data = self._parse_json_from_script(parser, "script#__NEXT_DATA__", context="SportingLife Race")
-        if not data: return None
-        race_info = data.get("props", {}).get("pageProps", {}).get("race")
-        if not race_info: return None
+        race_info = self._parse_json_from_script(parser, "script#__NEXT_DATA__", context="SportingLife Race", path=["props", "pageProps", "race"], anchor="pageProps")
+        if not isinstance(race_info, dict) or not race_info: return None
         summary = race_info.get("race_summary") or {}
 
         # Skip completed races (Insight 4)
@@ -3646,7 +3893,7 @@ class StandardbredCanadaAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcher
 # ----------------------------------------
 # TabAdapter
 # ----------------------------------------
-class TabAdapter(BaseAdapterV3):
+class TabAdapter(JSONParsingMixin, BaseAdapterV3):
     SOURCE_NAME: ClassVar[str] = "TAB"
     PROVIDES_ODDS: ClassVar[bool] = True
     # Note: api.tab.com.au often has DNS resolution issues in some environments.
@@ -3660,48 +3907,71 @@ class TabAdapter(BaseAdapterV3):
     def _configure_fetch_strategy(self) -> FetchStrategy:
         return api_fetch_strategy(timeout=45)
 
-    async def _fetch_data(self, date: str) -> Optional[Dict[str, Any]]:
-        dt = parse_date_string(date)
-        date_iso = dt.strftime("%Y-%m-%d")
-        url = f"{self.base_url}/dates/{date_iso}/meetings"
+    def _jurisdictions(self) -> List[str]:
+        j = self.config.get("jurisdictions") or self.config.get("jurisdiction") or ["VIC"]
+        if isinstance(j, str): j = j.split(",")
+        return list(dict.fromkeys(x.strip().upper() for x in j if x and x.strip()))
+
+    async def _get_json(self, url: str) -> Optional[Any]:
         resp = await self.make_request("GET", url, headers={"Accept": "application/json", "User-Agent": CHROME_USER_AGENT})
+        if not resp or get_resp_status(resp) != 200: return None
+        try:
+            text = getattr(resp, "text", None)
+            return self._decode_json(text) if text else resp.json()
+        except Exception: return None
 
-        if not resp or resp.status != 200:
-            self.logger.info("Falling back to STABLE TAB API")
-            url = f"{self.BASE_URL_STABLE}/dates/{date_iso}/meetings"
-            resp = await self.make_request("GET", url, headers={"Accept": "application/json", "User-Agent": CHROME_USER_AGENT})
+    async def _fetch_meeting_list(self, date_iso: str, jurisdiction: str) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        for base in (self.base_url, self.BASE_URL_STABLE):
+            if base != self.base_url: self.logger.info("Falling back to STABLE TAB API", jurisdiction=jurisdiction)
+            data = await self._get_json(f"{base}/dates/{date_iso}/meetings?jurisdiction={jurisdiction}")
+            if data and "meetings" in data: return base, data["meetings"] or []
+        return None, []
 
-        if not resp: return None
-        try: data = resp.json() if hasattr(resp, "json") else json.loads(resp.text)
-        except Exception: return None
-        if not data or "meetings" not in data:
+    async def _fetch_data(self, date: str) -> Optional[Dict[str, Any]]:
+        from urllib.parse import urlparse
+        date_iso = parse_date_string(date).strftime("%Y-%m-%d")
+        jurisdictions = self._jurisdictions()
+        listings = await asyncio.gather(*(self._fetch_meeting_list(date_iso, j) for j in jurisdictions))
+        if not any(base for base, _ in listings):
             self.metrics.record_parse_warning()
             return None
 
+        # One detail request per meeting; the first jurisdiction listing it is used
+        targets: Dict[Tuple[Any, Any], Tuple[Dict[str, Any], str, str]] = {}
+        for j, (base, meetings) in zip(jurisdictions, listings):
+            for m in meetings:
+                targets.setdefault((m.get("meetingType"), m.get("meetingName")), (m, base, j))
+
         # TAB meetings often only have race headers. We need to fetch each meeting's details
-        # to get runners and odds.
-        all_meetings = []
-        for m in data["meetings"]:
-            try:
-                vn = m.get("meetingName")
-                mt = m.get("meetingType")
-                if vn and mt:
-                    # Endpoint for meeting details (includes races and runners)
-                    m_url = f"{self.base_url}/dates/{date}/meetings/{mt}/{vn}?jurisdiction=VIC"
-                    m_resp = await self.make_request("GET", m_url, headers={"Accept": "application/json", "User-Agent": CHROME_USER_AGENT})
-                    if m_resp:
-                        try:
-                            m_data = m_resp.json() if hasattr(m_resp, "json") else json.loads(m_resp.text)
-                            if m_data:
-                                all_meetings.append(m_data)
-                                continue
-                        except Exception: pass
+        # to get runners and odds. Details are fetched concurrently under a per-host cap.
+        limit = max(1, int(self.config.get("host_concurrency", DEFAULT_HOST_CONCURRENCY)))
+
+        def detail_url(target: Tuple[Dict[str, Any], str, str]) -> Optional[str]:
+            m, base, jurisdiction = target
+            vn, mt = m.get("meetingName"), m.get("meetingType")
+            # Endpoint for meeting details (includes races and runners)
+            return f"{base}/dates/{date_iso}/meetings/{mt}/{vn}?jurisdiction={jurisdiction}" if vn and mt else None
+
+        async def fetch_detail(target: Tuple[Dict[str, Any], str, str]) -> Optional[Dict[str, Any]]:
+            url = detail_url(target)
+            return await self._get_json(url) if url else None
+
+        details = await gather_by_host(
+            list(targets.values()), fetch_detail, lambda t: urlparse(t[1]).netloc, limit=limit, per_host=limit,
+        )
+
+        all_meetings, failed = [], 0
+        for (m, _, _), d in zip(targets.values(), details):
+            if d and not isinstance(d, BaseException):
+                all_meetings.append(d)
+            else:
                 # Fallback to the summary data if detail fetch fails
+                failed += 1
                 all_meetings.append(m)
-            except Exception:
-                all_meetings.append(m)
+        if failed:
+            self.logger.warning("tab_meeting_details_partial", failed=failed, total=len(targets))
 
-        return {"meetings": all_meetings, "date": date}
+        return {"meetings": all_meetings, "date": date, "jurisdictions": jurisdictions}
 
     def _parse_races(self, raw_data: Any) -> List[Race]:
         if not raw_data or "meetings" not in raw_data: return []
@@ -3784,44 +4054,71 @@ class BetfairDataScientistAdapter(JSONParsingMixin, BaseAdapterV3):
             return None
         return StringIO(resp.text)
 
+    CSV_COLUMNS: ClassVar[Dict[str, str]] = {"meetings.races.bfExchangeMarketId": "market_id", "meetings.name": "meeting_name", "meetings.races.raceNumber": "race_number", "meetings.races.runners.runnerName": "runner_name", "meetings.races.runners.clothNumber": "saddle_cloth", "meetings.races.runners.ratedPrice": "rated_price"}
+    START_TIME_COLUMNS: ClassVar[List[str]] = ["meetings.races.startTime", "startTime", "start_time", "time"]
+
     def _parse_races(self, raw_data: Optional[StringIO]) -> List[Race]:
         if not raw_data: return []
         try:
-            df = pd.read_csv(raw_data)
-            if df.empty: return []
-            df = df.rename(columns={"meetings.races.bfExchangeMarketId": "market_id", "meetings.name": "meeting_name", "meetings.races.raceNumber": "race_number", "meetings.races.runners.runnerName": "runner_name", "meetings.races.runners.clothNumber": "saddle_cloth", "meetings.races.runners.ratedPrice": "rated_price"})
-            races: List[Race] = []
-            for mid, group in df.groupby("market_id"):
-                ri = group.iloc[0]
-                runners = []
-                for _, row in group.iterrows():
-                    rp, od = row.get("rated_price"), {}
-                    if pd.notna(rp):
-                        if ov := create_odds_data(self.source_name, float(rp)): od[self.source_name] = ov
-                    runners.append(Runner(name=str(row.get("runner_name", "Unknown")), number=int(row.get("saddle_cloth", 0)), odds=od))
-
-                vn = normalize_venue_name(str(ri.get("meeting_name", "")))
-
-                # Try to find a start time in the CSV
-                start_time = datetime.now(EASTERN)
-                for col in ["meetings.races.startTime", "startTime", "start_time", "time"]:
-                    if col in ri and pd.notna(ri[col]):
-                        try:
-                            # Assume UTC and convert to Eastern if it looks like ISO
-                            st_val = str(ri[col])
-                            if "T" in st_val:
-                                start_time = to_eastern(from_storage_format(st_val.replace("Z", "+00:00")))
-                            break
-                        except Exception: pass
-
-                races.append(Race(id=str(mid), venue=vn, race_number=int(ri.get("race_number", 0)), start_time=start_time, runners=runners, source=self.source_name, discipline="Thoroughbred"))
-            return races
+            # Optional streamed reading for full-day files; markets are merged across chunks
+            chunksize = self.config.get("csv_chunksize")
+            frames = pd.read_csv(raw_data, chunksize=int(chunksize)) if chunksize else [pd.read_csv(raw_data)]
+            markets: Dict[Any, Dict[str, Any]] = {}
+            for df in frames:
+                if not df.empty: self._collect_markets(df.rename(columns=self.CSV_COLUMNS), markets)
+            venues: Dict[str, str] = {}
+            return [self._build_market_race(mid, markets[mid], venues) for mid in sorted(markets)]
         except Exception: return []
 
+    def _collect_markets(self, df: pd.DataFrame, markets: Dict[Any, Dict[str, Any]]) -> None:
+        """Groups runners by market id using column-level coercion instead of per-row iterrows."""
+        df = df[df["market_id"].notna()]
+        n = len(df)
+        names = df["runner_name"].astype(str).tolist() if "runner_name" in df else ["Unknown"] * n
+        numbers = df["saddle_cloth"].astype("int64").tolist() if "saddle_cloth" in df else [0] * n
+        prices: List[Optional[float]] = [None] * n
+        if "rated_price" in df:
+            rp = df["rated_price"].astype(float)
+            prices = rp.astype(object).where(rp.notna(), None).tolist()
+
+        groups = df.groupby("market_id", sort=False).indices
+        new = [mid for mid in groups if mid not in markets]
+        # Race-level fields come from each market's first row, materialised in one call
+        for mid, first in zip(new, df.iloc[[groups[mid][0] for mid in new]].to_dict("records")):
+            markets[mid] = {"first": first, "runners": []}
+
+        for mid, idx in groups.items():
+            runners = markets[mid]["runners"]
+            for i in idx:
+                od = {}
+                if prices[i] is not None:
+                    if ov := create_odds_data(self.source_name, prices[i]): od[self.source_name] = ov
+                runners.append(Runner(name=names[i], number=numbers[i], odds=od))
+
+    def _build_market_race(self, mid: Any, market: Dict[str, Any], venues: Dict[str, str]) -> Race:
+        ri = market["first"]
+        mn = str(ri.get("meeting_name", ""))
+        vn = venues.get(mn)
+        if vn is None: vn = venues[mn] = normalize_venue_name(mn)
+
+        # Try to find a start time in the CSV
+        start_time = datetime.now(EASTERN)
+        for col in self.START_TIME_COLUMNS:
+            if col in ri and pd.notna(ri[col]):
+                try:
+                    # Assume UTC and convert to Eastern if it looks like ISO
+                    st_val = str(ri[col])
+                    if "T" in st_val:
+                        start_time = to_eastern(from_storage_format(st_val.replace("Z", "+00:00")))
+                    break
+                except Exception: pass
+
+        return Race(id=str(mid), venue=vn, race_number=int(ri.get("race_number", 0)), start_time=start_time, runners=market["runners"], source=self.source_name, discipline="Thoroughbred")
+
 # ----------------------------------------
 # NYRABetsAdapter
 # ----------------------------------------
-class NYRABetsAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, BaseAdapterV3):
+class NYRABetsAdapter(JSONParsingMixin, BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, BaseAdapterV3):
     """
     Adapter for NYRABets.com - an aggregate ADW source.
     Uses the internal JSON API for fast discovery and detailed runner info.
@@ -3902,7 +4199,7 @@ class NYRABetsAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, Bas
                 timeout=40
             )
             if not resp or not resp.text: return None
-            cards_data = json.loads(resp.text)
+            cards_data = self._decode_json(resp.text)
             card_ids = [c["cardId"] for c in cards_data.get("cards", [])]
             if not card_ids: return None
 
@@ -3917,7 +4214,7 @@ class NYRABetsAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, Bas
                 headers=self._get_headers()
             )
             if not resp or not resp.text: return None
-            list_races_data = json.loads(resp.text)
+            list_races_data = self._decode_json(resp.text)
             all_races = list_races_data.get("races", [])
             # Filter US/AU/NZ races for discovery efficiency (Fix: Include AUS/NZ for coverage)
             target_countries = {"US", "AU", "NZ"}
@@ -3941,7 +4238,7 @@ class NYRABetsAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin, Bas
                     headers=self._get_headers()
                 )
                 if resp and resp.text:
-                    chunk_data = json.loads(resp.text)
+                    chunk_data = self._decode_json(resp.text)
                     for race_detail in chunk_data.get("races", []):
                         details[race_detail["raceId"]] = race_detail
             return {"races": all_races, "details": details}
@@ -4672,14 +4969,26 @@ class FanDuelRacingAdapter(BrowserHeadersMixin, DebugMixin, RacePageFetcherMixin
 log = structlog.get_logger(__name__)
 
 
-def _get_best_win_odds(runner: Runner) -> Optional[Decimal]:
-    """Gets the best win odds for a runner, filtering out invalid or placeholder values."""
+def odds_value(value: Any) -> float:
+    """
+    In-memory form of a (valid) price: the float nearest its decimal value.
+
+    For floats, ints, Decimals and numeric strings this equals
+    ``float(Decimal(str(value)))``, and it orders and compares exactly like the
+    Decimal did, so validation, merge and analysis can work on plain floats.
+    Convert to Decimal only at serialization boundaries.
+    """
+    return value if type(value) is float else float(value)
+
+
+def _best_win_odds_value(runner: Runner) -> Optional[float]:
+    """Gets the best win odds for a runner as a float, filtering out invalid or placeholder values."""
     if not runner.odds:
         # Fallback to win_odds if available
         if runner.win_odds and is_valid_odds(runner.win_odds):
-            return Decimal(str(runner.win_odds))
+            return odds_value(runner.win_odds)
 
-    valid_odds = []
+    best = None
     for source_data in runner.odds.values():
         # Handle both dict and primitive formats
         if isinstance(source_data, dict):
@@ -4690,30 +4999,116 @@ def _get_best_win_odds(runner: Runner) -> Optional[Decimal]:
             win = source_data
 
         if is_valid_odds(win):
-            valid_odds.append(Decimal(str(win)))
+            v = odds_value(win)
+            if best is None or v < best:
+                best = v
 
-    if valid_odds:
-        return min(valid_odds)
+    if best is not None:
+        return best
 
     # Final fallback to win_odds if present
     if runner.win_odds and is_valid_odds(runner.win_odds):
-        return Decimal(str(runner.win_odds))
+        return odds_value(runner.win_odds)
 
     return None
 
 
+def _get_best_win_odds(runner: Runner) -> Optional[Decimal]:
+    """Decimal form of _best_win_odds_value, for serialization and external callers."""
+    best = _best_win_odds_value(runner)
+    return None if best is None else Decimal(str(best))
+
+
 class BaseAnalyzer(ABC):
     """The abstract interface for all future analyzer plugins."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None, **kwargs):
         self.logger = structlog.get_logger(self.__class__.__name__)
         self.config = config or {}
+        # race_id -> {"fingerprint", "qualified", "score", "top_five_numbers", "metadata"}
+        self.evaluations: Dict[str, Dict[str, Any]] = {}
+        # Races the last qualify_races rejected only because of another race in the batch
+        self.batch_rejected: Set[str] = set()
 
     @abstractmethod
     def qualify_races(self, races: List[Race], now: Optional[datetime] = None) -> Dict[str, Any]:
         """The core method every analyzer must implement."""
         pass
 
+    def qualify_changed_races(self, races: List[Race], now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        qualify_races for only the races whose fingerprint changed since their last evaluation.
+
+        Unchanged races that were rejected get their recorded outcome back (score, top five and
+        the metadata the analyzer wrote) without being scored again. Races that qualified last
+        time are re-scored with the changed ones, so in-batch duplicate checks still see them,
+        and a race rejected as a duplicate of another (listed in ``batch_rejected``) is not
+        recorded, so it is scored again once that other race changes or goes away.
+        """
+        fresh, reused = [], []
+        fingerprints = {}
+        for race in races:
+            fingerprints[race.id] = fp = race_fingerprint(race)
+            prev = self.evaluations.get(race.id)
+            if prev is None or prev["fingerprint"] != fp or prev["qualified"]:
+                fresh.append(race)
+            else:
+                reused.append(race)
+
+        before = {race.id: dict(race.metadata) for race in fresh}
+        self.batch_rejected = set()  # analyzers without in-batch checks never fill it
+        result = self.qualify_races(fresh, now=now)
+        qualified_ids = {race.id for race in result.get("races", [])}
+
+        for race in fresh:
+            if race.id in self.batch_rejected:
+                self.evaluations.pop(race.id, None)
+                continue
+            meta = before[race.id]
+            self.evaluations[race.id] = {
+                "fingerprint": fingerprints[race.id],
+                "qualified": race.id in qualified_ids,
+                "score": race.qualification_score,
+                "top_five_numbers": race.top_five_numbers,
+                "metadata": {k: v for k, v in race.metadata.items() if k not in meta or meta[k] != v},
+            }
+        for race in reused:
+            prev = self.evaluations[race.id]
+            race.metadata.update(prev["metadata"])
+            race.qualification_score = prev["score"]
+            race.top_five_numbers = prev["top_five_numbers"]
+
+        self.logger.info("incremental_scoring", evaluated=len(fresh), unchanged=len(reused))
+        return result
+
+    def _config_fingerprint(self) -> str:
+        return hashlib.sha1(json.dumps([self.__class__.__name__, self.config], sort_keys=True, default=str).encode()).hexdigest()
+
+    def load_evaluations(self, path: str) -> int:
+        """Loads fingerprints saved by save_evaluations; ignored if the analyzer or its config differ."""
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning("score_state_load_failed", path=path, error=str(e))
+            return 0
+        if state.get("analyzer") != self._config_fingerprint():
+            self.logger.info("score_state_stale", path=path)
+            return 0
+        self.evaluations.update(state.get("races", {}))
+        return len(state.get("races", {}))
+
+    def save_evaluations(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"analyzer": self._config_fingerprint(), "races": self.evaluations}, f, cls=FortunaJSONEncoder)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
 
 class TrifectaAnalyzer(BaseAnalyzer):
     """Analyzes races and assigns a qualification score based on the 'Trifecta of Factors'."""
@@ -4732,8 +5127,8 @@ class TrifectaAnalyzer(BaseAnalyzer):
         super().__init__(**kwargs)
         # Use config value if provided and no explicit override (Capability Improvement)
         self.max_field_size = max_field_size or self.config.get("analysis", {}).get("max_field_size", 11)
-        self.min_favorite_odds = Decimal(str(min_favorite_odds))
-        self.min_second_favorite_odds = Decimal(str(min_second_favorite_odds))
+        self.min_favorite_odds = odds_value(min_favorite_odds)
+        self.min_second_favorite_odds = odds_value(min_second_favorite_odds)
         self.notifier = RaceNotifier()
 
     def is_race_qualified(self, race: Race, now: Optional[datetime] = None) -> bool:
@@ -4794,7 +5189,7 @@ class TrifectaAnalyzer(BaseAnalyzer):
             # Uniform Odds Check
             all_odds = []
             for runner in active_runners:
-                odds = _get_best_win_odds(runner)
+                odds = _best_win_odds_value(runner)
                 if odds: all_odds.append(odds)
 
             if len(all_odds) >= 3 and len(set(all_odds)) == 1:
@@ -4840,15 +5235,15 @@ class TrifectaAnalyzer(BaseAnalyzer):
 
         runners_with_odds = []
         for runner in active_runners:
-            best_odds = _get_best_win_odds(runner)
+            best_odds = _best_win_odds_value(runner)
             if best_odds is not None:
                 runners_with_odds.append((runner, best_odds))
 
         if len(runners_with_odds) < 2:
             if len(active_runners) >= 2:
                 # If we have runners but no odds, use fallbacks
-                favorite_odds = Decimal(str(DEFAULT_ODDS_FALLBACK))
-                second_favorite_odds = Decimal(str(DEFAULT_ODDS_FALLBACK))
+                favorite_odds = odds_value(DEFAULT_ODDS_FALLBACK)
+                second_favorite_odds = odds_value(DEFAULT_ODDS_FALLBACK)
             else:
                 return 0.0
         else:
@@ -4860,7 +5255,7 @@ class TrifectaAnalyzer(BaseAnalyzer):
         # --- Apply hard filters before scoring ---
         if (
             len(active_runners) > self.max_field_size
-            or favorite_odds < Decimal("2.0")
+            or favorite_odds < 2.0
             or favorite_odds < self.min_favorite_odds
             or second_favorite_odds < self.min_second_favorite_odds
         ):
@@ -4931,18 +5326,96 @@ BLOCKED_VENUES: Final[Set[str]] = {
 }
 
 
-def get_discipline_threshold(discipline: str, key: str) -> float:
-    """Helper to retrieve threshold based on normalized discipline name."""
+def _threshold_discipline(discipline: Optional[str]) -> str:
+    """Maps a free-form discipline onto a DISCIPLINE_THRESHOLDS key."""
     d = (discipline or "Thoroughbred").title()
     if "Grey" in d or "Hound" in d:
-        norm_d = "Greyhound"
-    elif "Harness" in d:
-        norm_d = "Harness"
-    else:
-        norm_d = "Thoroughbred"
+        return "Greyhound"
+    if "Harness" in d:
+        return "Harness"
+    return "Thoroughbred"
+
+
+def get_discipline_threshold(discipline: str, key: str) -> float:
+    """Helper to retrieve threshold based on normalized discipline name."""
+    norm_d = _threshold_discipline(discipline)
     return DISCIPLINE_THRESHOLDS.get(norm_d, DISCIPLINE_THRESHOLDS["Thoroughbred"]).get(key, 0.0)
 
 
+# Distance formats: "6f", "6 furlongs", "6.0f", "0.75m", "1m". Any "<number> m" reads as miles,
+# so metre distances ("1200m") never reach the metres pattern; kept as the classifier always did.
+_FURLONGS_RE: Final = re.compile(r"(\d+(?:\.\d+)?)\s*f(?:url)?")
+_MILES_RE: Final = re.compile(r"(\d+(?:\.\d+)?)\s*m(?:i|le)?")
+_MILES_VALUE_RE: Final = re.compile(r"(\d+(?:\.\d+)?)\s*m")
+_METRES_RE: Final = re.compile(r"(\d+)\s*m\b")
+
+_PROFILE_FLAG_KEYS: Final[Tuple[str, ...]] = (
+    "is_sprint", "is_six_fur", "fg_high", "fg_mid", "fg_low", "in_goldmine_field", "in_small_field",
+    "in_mid_field", "r9_six_fur", "r10_six_fur", "r8_route", "sup55_zone",
+)
+
+
+@lru_cache(maxsize=4096)
+def _distance_furlongs(distance: Optional[str]) -> Optional[float]:
+    """Furlongs for a card distance string, or None when it cannot be read."""
+    dist_str = (distance or "").lower().strip()
+    m = _FURLONGS_RE.search(dist_str)
+    if m:
+        return float(m.group(1))
+    if _MILES_RE.search(dist_str):
+        # Extract miles value specifically from the pattern (Hardening Fix)
+        mile_match = _MILES_VALUE_RE.search(dist_str)
+        return float(mile_match.group(1)) * 8.0 if mile_match else None
+    metre_match = _METRES_RE.search(dist_str)
+    return float(metre_match.group(1)) / 201.168 if metre_match else None
+
+
+def _race_profile_flags(total_active: Any, sec_fav_odds: Any, furlongs: Any) -> Dict[str, Any]:
+    """
+    The dimensional flags behind RACE_PROFILE_RULES. Uses only comparisons, & and |, so the
+    same code takes one race (plain numbers) or a batch (numpy arrays); unknown furlongs are NaN.
+    """
+    is_sprint  = furlongs < 7.0                                  # Under 7 furlongs
+    is_route   = (furlongs >= 7.0) | (furlongs != furlongs)      # not a sprint, including unknown
+    is_six_fur = (furlongs >= 5.5) & (furlongs <= 6.5)           # 6f ±0.5f tolerance
+    sec_floor  = sec_fav_odds >= 4.5
+    in_small_field = (total_active >= 5) & (total_active <= 6)   # 55-family sweet spot
+    return {
+        "is_sprint":         is_sprint,
+        "is_six_fur":        is_six_fur,
+        # ── Fav2Group tier ──
+        "fg_high":           sec_fav_odds >= 6.0,                            # dominant positive zone
+        "fg_mid":            (sec_fav_odds >= 5.0) & (sec_fav_odds < 6.0),  # selective positives
+        "fg_low":            sec_fav_odds < 5.0,                             # mostly negative
+        # ── Field-size groups ──
+        "in_goldmine_field": (total_active >= 7) & (total_active <= 11),     # validated Goldmine range
+        "in_small_field":    in_small_field,
+        "in_mid_field":      (total_active >= 8) & (total_active <= 10),     # r8/r9/r10 focused slices
+        # ── Validated sweet-spot combos ──
+        #   r9 × 6f × sec_fav >= 4.5  (FvP hit 74 %, FAV_PS hit 76 %)
+        "r9_six_fur":        (total_active == 9) & is_six_fur & sec_floor,
+        #   r10 × 6f × sec_fav >= 4.5  (FvP +4 %, TopTwoW +11 %)
+        "r10_six_fur":       (total_active == 10) & is_six_fur & sec_floor,
+        #   r8 × route × sec_fav >= 4.5  (FvW +5.4 %, hit 60 %)
+        "r8_route":          (total_active == 8) & is_route & sec_floor,
+        #   55-family / Sup1x55 fires hard: small field + sec_fav >= 6.0
+        "sup55_zone":        in_small_field & (sec_fav_odds >= 6.0),
+        "sec_floor":         sec_floor,
+    }
+
+
+# Profile tags in priority order: the first rule that holds wins, otherwise "standard"
+RACE_PROFILE_RULES: Final[Tuple[Tuple[str, Callable[[Dict[str, Any]], Any]], ...]] = (
+    ("sup55_prime",         lambda f: f["fg_high"] & f["in_small_field"]),     # best 55-family superfecta zone
+    ("r9_6f_sweet_spot",    lambda f: f["r9_six_fur"]),                        # highest validated hit rate
+    ("r10_6f_sweet_spot",   lambda f: f["r10_six_fur"]),
+    ("r8_route_sweet_spot", lambda f: f["r8_route"]),
+    ("goldmine_high_fav2",  lambda f: f["fg_high"] & f["in_goldmine_field"]),  # Fav2Group 6+ standard Goldmine
+    ("high_fav2",           lambda f: f["fg_high"]),
+    ("goldmine_standard",   lambda f: f["in_goldmine_field"] & f["sec_floor"]),
+)
+
+
 def _classify_race_profile(
     total_active: int,
     sec_fav_odds: float,
@@ -4965,91 +5438,37 @@ def _classify_race_profile(
     │ r10 × sprint × mid-purse            │   91  │  +2.3 %  │  59.3 % │
     │ Fav2Group 6.0–6.5  (all runners)    │  695  │  varies  │  varies │
     └─────────────────────────────────────┴───────┴──────────┴─────────┘
-    """
-    # ── Distance parsing ──────────────────────────────────────────────
-    dist_str   = (distance or "").lower().strip()
-    is_sprint  = False   # Under 7 furlongs
-    is_six_fur = False   # Exactly ~6f (0.70–0.80 miles)
-
-    # Accept common formats: "6f", "6 furlongs", "1200m", "6.0f", "0.75m"
-    fur_match = None
-    import re
-    m = re.search(r"(\d+(?:\.\d+)?)\s*f(?:url)?", dist_str)
-    if m:
-        fur_match = float(m.group(1))
-    elif re.search(r"(\d+(?:\.\d+)?)\s*m(?:i|le)?", dist_str):
-        # Extract miles value specifically from the pattern (Hardening Fix)
-        mile_match = re.search(r"(\d+(?:\.\d+)?)\s*m", dist_str)
-        if mile_match:
-            miles = float(mile_match.group(1))
-            fur_match = miles * 8.0
-    elif re.search(r"(\d+)\s*m\b", dist_str):          # metres
-        metre_match = re.search(r"(\d+)\s*m\b", dist_str)
-        if metre_match:
-            metres = float(metre_match.group(1))
-            fur_match = metres / 201.168
-
-    if fur_match is not None:
-        is_sprint  = fur_match < 7.0
-        is_six_fur = 5.5 <= fur_match <= 6.5   # 6f ±0.5f tolerance
-
-    # ── Fav2Group tier ────────────────────────────────────────────────
-    fg_high    = sec_fav_odds >= 6.0            # dominant positive zone
-    fg_mid     = 5.0 <= sec_fav_odds < 6.0     # selective positives
-    fg_low     = sec_fav_odds < 5.0            # mostly negative
-
-    # ── Field-size groups ─────────────────────────────────────────────
-    in_goldmine_field = 7 <= total_active <= 11   # validated Goldmine range
-    in_small_field    = 5 <= total_active <= 6    # 55-family sweet spot
-    in_mid_field      = 8 <= total_active <= 10   # r8/r9/r10 focused slices
-
-    # ── Validated sweet-spot combos ───────────────────────────────────
-    #   r9 × 6f × sec_fav >= 4.5  (FvP hit 74 %, FAV_PS hit 76 %)
-    r9_six_fur = (total_active == 9 and is_six_fur and sec_fav_odds >= 4.5)
-
-    #   r10 × 6f × sec_fav >= 4.5  (FvP +4 %, TopTwoW +11 %)
-    r10_six_fur = (total_active == 10 and is_six_fur and sec_fav_odds >= 4.5)
-
-    #   r8 × route × sec_fav >= 4.5  (FvW +5.4 %, hit 60 %)
-    r8_route = (total_active == 8 and not is_sprint and sec_fav_odds >= 4.5)
-
-    #   55-family / Sup1x55 fires hard: small field + sec_fav >= 6.0
-    sup55_zone = (in_small_field and sec_fav_odds >= 6.0)
-
-    # ── Profile tag ───────────────────────────────────────────────────
-    if sec_fav_odds >= 6.0 and in_small_field:
-        profile = "sup55_prime"          # best 55-family superfecta zone
-    elif r9_six_fur:
-        profile = "r9_6f_sweet_spot"     # highest validated hit rate
-    elif r10_six_fur:
-        profile = "r10_6f_sweet_spot"
-    elif r8_route:
-        profile = "r8_route_sweet_spot"
-    elif sec_fav_odds >= 6.0 and in_goldmine_field:
-        profile = "goldmine_high_fav2"   # Fav2Group 6+ standard Goldmine
-    elif sec_fav_odds >= 6.0:
-        profile = "high_fav2"
-    elif in_goldmine_field and sec_fav_odds >= 4.5:
-        profile = "goldmine_standard"
-    else:
-        profile = "standard"
 
-    return {
-        "is_sprint":         is_sprint,
-        "is_six_fur":        is_six_fur,
-        "furlongs":          round(fur_match, 1) if fur_match is not None else None,
-        "fg_high":           fg_high,
-        "fg_mid":            fg_mid,
-        "fg_low":            fg_low,
-        "in_goldmine_field": in_goldmine_field,
-        "in_small_field":    in_small_field,
-        "in_mid_field":      in_mid_field,
-        "r9_six_fur":        r9_six_fur,
-        "r10_six_fur":       r10_six_fur,
-        "r8_route":          r8_route,
-        "sup55_zone":        sup55_zone,
-        "profile":           profile,
-    }
+    See classify_race_profiles for whole lists of races or tips.
+    """
+    fur = _distance_furlongs(distance)
+    flags = _race_profile_flags(total_active, sec_fav_odds, fur if fur is not None else math.nan)
+    profile = next((tag for tag, holds in RACE_PROFILE_RULES if holds(flags)), "standard")
+    result = {k: flags[k] for k in _PROFILE_FLAG_KEYS}
+    result["furlongs"] = round(fur, 1) if fur is not None else None
+    result["profile"] = profile
+    return result
+
+
+def classify_race_profiles(
+    total_active: Iterable[int],
+    sec_fav_odds: Iterable[float],
+    distances: Iterable[Optional[str]],
+) -> Dict[str, np.ndarray]:
+    """
+    _classify_race_profile for many races or tips at once: the same flags and "profile" as
+    columns (one entry per race), with "furlongs" as NaN where the distance is unknown.
+    """
+    furlongs = np.array([_distance_furlongs(d) for d in distances], dtype=float)
+    flags = _race_profile_flags(
+        np.asarray(list(total_active), dtype=float), np.asarray(list(sec_fav_odds), dtype=float), furlongs,
+    )
+    columns = {k: np.asarray(flags[k], dtype=bool) for k in _PROFILE_FLAG_KEYS}
+    columns["furlongs"] = np.round(furlongs, 1)
+    columns["profile"] = np.select(
+        [holds(flags) for _, holds in RACE_PROFILE_RULES], [tag for tag, _ in RACE_PROFILE_RULES], "standard",
+    ).astype(object)
+    return columns
 
 
 class SimplySuccessAnalyzer(BaseAnalyzer):
@@ -5099,6 +5518,7 @@ class SimplySuccessAnalyzer(BaseAnalyzer):
         SEC_FAV_BONUS_LOW  = analysis_cfg.get("sec_fav_bonus_low", 1.0)
 
         fingerprints = {}
+        self.batch_rejected = set()
 
         for race in races:
             canonical_venue = get_canonical_venue(race.venue)
@@ -5136,7 +5556,7 @@ class SimplySuccessAnalyzer(BaseAnalyzer):
 
             all_valid_with_odds = sorted(
                 [(r, odds) for r in active_runners
-                 if (odds := _get_best_win_odds(r)) is not None],
+                 if (odds := _best_win_odds_value(r)) is not None],
                 key=lambda x: x[1],
             )
 
@@ -5189,6 +5609,7 @@ class SimplySuccessAnalyzer(BaseAnalyzer):
             active_content = [(r.name, str(r.win_odds)) for r in race.runners if not r.scratched]
             content_fp     = (canonical_venue, frozenset(active_content))
             if content_fp in fingerprints:
+                self.batch_rejected.add(race.id)
                 continue
             fingerprints[content_fp] = 1
 
@@ -5433,6 +5854,279 @@ class AnalyzerEngine:
         return analyzer_class(config=self.config, **kwargs)
 
 
+# ----------------------------------------
+# BACKTEST
+# ----------------------------------------
+BACKTEST_STAKE: Final[float] = 2.00
+BACKTEST_VERDICTS: Final[Tuple[str, ...]] = ("CASHED", "CASHED_ESTIMATED", "BURNED")
+_BACKTEST_DISCIPLINES: Final[Tuple[str, ...]] = ("Thoroughbred", "Harness", "Greyhound")
+_BACKTEST_DISCIPLINE_KEYS: Final[Tuple[str, ...]] = ("min_gap12", "min_field_size", "max_field_size")
+_BACKTEST_CELLS: Final[int] = 4_000_000  # combinations x tips evaluated per block
+
+# SimplySuccessAnalyzer thresholds a backtest can vary, at their analyzer defaults. Per-discipline
+# thresholds are addressed as "<Discipline>.<key>", e.g. "Harness.min_gap12".
+BACKTEST_DEFAULTS: Final[Dict[str, float]] = {
+    "scoring_mtp_max":      SCORING_MTP_MAX,
+    "non_chalk_min":        0.90,
+    "second_fav_floor":     4.50,
+    "gap_abs_min":          0.75,
+    "goldmine_fav_min":     1.10,
+    "goldmine_sec_fav_min": 4.50,
+    "goldmine_gap_min":     2.00,
+    "goldmine_field_min":   5,
+    "goldmine_field_max":   11,
+    "tip_score_min":        45.0,
+    "best_bet_score_min":   52.0,
+    "sec_fav_bonus_high":   6.0,
+    "sec_fav_bonus_mid":    3.0,
+    "sec_fav_bonus_low":    1.0,
+    "r9_six_fur_bonus":     4.0,
+    "r10_six_fur_bonus":    2.5,
+    "r8_route_bonus":       2.0,
+    **{
+        f"{d}.{k}": DISCIPLINE_THRESHOLDS[d][k]
+        for d in _BACKTEST_DISCIPLINES for k in _BACKTEST_DISCIPLINE_KEYS
+    },
+}
+
+
+@dataclass
+class BacktestResult:
+    """Per-combination metrics (summary) and the same metrics split by race profile (by_profile)."""
+    summary: pd.DataFrame
+    by_profile: pd.DataFrame
+
+
+def _snapshot_distances(snapshot_dir: str) -> Dict[str, Optional[str]]:
+    """race_id -> distance from every quarter snapshot in snapshot_dir."""
+    distances: Dict[str, Optional[str]] = {}
+    if not os.path.isdir(snapshot_dir):
+        return distances
+    for path in sorted(Path(snapshot_dir).glob("*_races.json")):
+        try:
+            with open(path) as f:
+                race_dicts = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for rd in race_dicts:
+            if isinstance(rd, dict) and rd.get("id"):
+                distances[rd["id"]] = rd.get("distance")
+    return distances
+
+
+def load_backtest_frame(db_path: Optional[str] = None, snapshot_dir: str = SNAPSHOT_DIR) -> pd.DataFrame:
+    """
+    Loads audited tips into one row per tip with every column the backtest needs.
+
+    Everything that does not depend on a swept threshold (MTP when the tip was logged, the
+    _classify_race_profile bucket, the fixed composite terms) is computed here, once.
+    Distances come from the quarter snapshots, since the tips table does not store them.
+    """
+    conn = sqlite3.connect(db_path or get_db_path())
+    try:
+        df = pd.read_sql_query(
+            "SELECT race_id, discipline, start_time, report_date, field_size, predicted_fav_odds, "
+            "predicted_2nd_fav_odds, gap_abs, verdict, net_profit, top1_place_payout, "
+            "goldmine_sources FROM tips WHERE audit_completed = 1 AND verdict IN (?, ?, ?) "
+            "AND predicted_fav_odds IS NOT NULL AND predicted_2nd_fav_odds IS NOT NULL",
+            conn, params=BACKTEST_VERDICTS,
+        )
+    finally:
+        conn.close()
+
+    def minutes_before_post(start: Any, logged: Any) -> float:
+        try:
+            return (from_storage_format(start) - from_storage_format(logged)).total_seconds() / 60
+        except Exception:
+            return np.nan
+
+    distances = _snapshot_distances(snapshot_dir)
+    fav = df["predicted_fav_odds"].astype(float)
+    sec = df["predicted_2nd_fav_odds"].astype(float)
+    gap = pd.to_numeric(df["gap_abs"], errors="coerce").fillna(sec - fav)
+    field = pd.to_numeric(df["field_size"], errors="coerce").fillna(0).astype(int)
+    profiles = classify_race_profiles(field, sec, [distances.get(rid) for rid in df["race_id"]])
+    cashed = df["verdict"].isin(("CASHED", "CASHED_ESTIMATED"))
+
+    # Composite terms the analyzer adds regardless of configuration (field-size and favourite tiers)
+    fixed = np.select([field < 5, field <= 8, field <= 11], [-10.0, 8.0, 4.0], 0.0)
+    fixed += np.select(
+        [(fav >= 2.0) & (fav <= 4.0), ((fav >= 1.5) & (fav < 2.0)) | ((fav > 4.0) & (fav <= 6.0)), fav < 1.5],
+        [5.0, 2.0, -3.0], 0.0,
+    )
+
+    return pd.DataFrame({
+        "race_id":         df["race_id"],
+        "discipline":      [_threshold_discipline(d) for d in df["discipline"]],
+        "mtp":             [minutes_before_post(s, r) for s, r in zip(df["start_time"], df["report_date"])],
+        "field_size":      field,
+        "fav_odds":        fav,
+        "sec_fav_odds":    sec,
+        "gap_abs":         gap.astype(float),
+        "multi_source":    pd.to_numeric(df["goldmine_sources"], errors="coerce").fillna(0) >= 2,
+        "profile":         profiles["profile"],
+        "r9_six_fur":      profiles["r9_six_fur"],
+        "r10_six_fur":     profiles["r10_six_fur"],
+        "r8_route":        profiles["r8_route"],
+        "fixed_score":     fixed,
+        "cashed":          cashed,
+        "net_profit":      df["net_profit"].astype(float).fillna(0.0).where(cashed, -BACKTEST_STAKE),
+        "place_payout":    df["top1_place_payout"].astype(float).fillna(0.0).where(cashed, 0.0),
+    })
+
+
+def _by_code(values: List[Any], codes: np.ndarray) -> np.ndarray:
+    """Picks values[codes[i]] per tip: (tips,) when every value is a scalar, (combinations, tips) otherwise."""
+    if all(np.ndim(v) == 0 for v in values):
+        return np.asarray(values, dtype=float)[codes]
+    rows = max(np.shape(v)[0] for v in values if np.ndim(v))
+    return np.hstack([np.broadcast_to(np.reshape(v, (-1, 1)), (rows, 1)) for v in values])[:, codes]
+
+
+def _backtest_columns(frame: pd.DataFrame) -> Dict[str, Any]:
+    """Plain arrays (and tier codes) for _backtest_masks, derived once per frame sorted by discipline."""
+    fav, sec, gap = (frame[c].to_numpy(dtype=float) for c in ("fav_odds", "sec_fav_odds", "gap_abs"))
+    codes = frame["discipline"].map({d: i for i, d in enumerate(_BACKTEST_DISCIPLINES)}).fillna(0).to_numpy(dtype=int)
+    if (np.diff(codes) < 0).any():
+        raise ValueError("backtest frame must be sorted by discipline")
+    bounds = np.searchsorted(codes, np.arange(len(_BACKTEST_DISCIPLINES) + 1))
+    gap_weight = np.minimum(gap, 8.0)
+    return {
+        "fav": fav, "sec": sec, "gap": gap, "field": frame["field_size"].to_numpy(dtype=float),
+        "mtp": np.nan_to_num(frame["mtp"].to_numpy(dtype=float), nan=-np.inf),
+        "discipline": codes,
+        "discipline_slices": [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])],
+        "sec_tier": np.select([sec >= 6.0, sec >= 5.0, sec >= 4.5], [3, 2, 1], 0),
+        "profile_tier": np.select(
+            [frame["r9_six_fur"].to_numpy(bool), frame["r10_six_fur"].to_numpy(bool), frame["r8_route"].to_numpy(bool)],
+            [3, 2, 1], 0,
+        ),
+        # 45 + fixed tiers + the 2.5x gap term every race gets; high-confidence goldmines add 0.5x on top
+        "base_score": 45.0 + frame["fixed_score"].to_numpy(dtype=float) + 2.5 * gap_weight,
+        "goldmine_bonus": np.where(frame["multi_source"].to_numpy(bool), 0.5 * gap_weight, 0.0),
+    }
+
+
+def _backtest_masks(cols: Dict[str, Any], p: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(tipped, best bet, goldmine) masks of shape (combinations, tips), mirroring SimplySuccessAnalyzer."""
+    fav, sec, gap, field = cols["fav"], cols["sec"], cols["gap"], cols["field"]
+    combos = max([np.shape(v)[0] for v in p.values() if np.ndim(v)] or [1])
+
+    def per_discipline(key: str, values: np.ndarray, compare: Callable[[Any, Any], np.ndarray]) -> np.ndarray:
+        thresholds = [p[f"{d}.{key}"] for d in _BACKTEST_DISCIPLINES]
+        if all(np.ndim(t) == 0 for t in thresholds):
+            return compare(values, np.asarray(thresholds, dtype=float)[cols["discipline"]])
+        # rows are grouped by discipline, so each threshold column only touches its own slice
+        return np.concatenate([
+            np.broadcast_to(compare(values[s], t), (combos, s.stop - s.start))
+            for s, t in zip(cols["discipline_slices"], thresholds)
+        ], axis=1)
+
+    tipped = (
+        (cols["mtp"] <= p["scoring_mtp_max"])
+        & per_discipline("min_field_size", field, np.greater_equal)
+        & per_discipline("max_field_size", field, lambda v, t: (t <= 0) | (v <= t))
+        & (fav >= 0.10) & (fav >= p["non_chalk_min"]) & (sec >= p["second_fav_floor"]) & (gap > p["gap_abs_min"])
+    )
+    goldmine = (
+        (fav >= p["goldmine_fav_min"]) & (sec >= p["goldmine_sec_fav_min"]) & (gap >= p["goldmine_gap_min"])
+        & (field >= p["goldmine_field_min"]) & (field <= p["goldmine_field_max"])
+    )
+    below_gap = per_discipline("min_gap12", gap, np.less)
+
+    # composite = score + goldmine bonus - 20 below the discipline gap floor; compared per case
+    # instead of materialising it, since the two flags are the only (combinations x tips) terms
+    score = (
+        cols["base_score"]
+        + _by_code([0.0, p["sec_fav_bonus_low"], p["sec_fav_bonus_mid"], p["sec_fav_bonus_high"]], cols["sec_tier"])
+        + _by_code([0.0, p["r8_route_bonus"], p["r10_six_fur_bonus"], p["r9_six_fur_bonus"]], cols["profile_tier"])
+    )
+    with_bonus = score + cols["goldmine_bonus"]
+
+    def reaches(threshold: Any) -> np.ndarray:
+        # the goldmine bonus is never negative, so it can only lift a race over the threshold
+        above = (score >= threshold) | (goldmine & (with_bonus >= threshold))
+        penalised = (score - 20.0 >= threshold) | (goldmine & (with_bonus - 20.0 >= threshold))
+        return above & (~below_gap | penalised)
+
+    tipped = tipped & reaches(p["tip_score_min"])
+    return tipped, tipped & reaches(p["best_bet_score_min"]), tipped & goldmine & ~below_gap
+
+
+def run_backtest(
+    frame: pd.DataFrame,
+    grid: Dict[str, List[Any]],
+    config: Optional[Dict[str, Any]] = None,
+) -> BacktestResult:
+    """
+    Evaluates every combination of the threshold values in grid against the audited tips in
+    frame (see load_backtest_frame). Thresholds not in grid keep the analyzer's configured value.
+
+    Combinations are scored in blocks as (combinations x tips) boolean masks, so a sweep costs a
+    handful of array operations per block rather than one analyzer pass per combination.
+    Only tips that were actually logged can be replayed: loosening a threshold past the value
+    that produced the history cannot surface races that were never tipped.
+    """
+    unknown = set(grid) - set(BACKTEST_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown backtest parameters: {sorted(unknown)}")
+    base = dict(BACKTEST_DEFAULTS)
+    analysis_cfg = (config or {}).get("analysis", {})
+    base.update({k: v for k, v in analysis_cfg.items() if k in base and k not in grid})
+
+    keys = list(grid)
+    combo_frame = pd.DataFrame(list(itertools.product(*(grid[k] for k in keys))), columns=keys) if keys \
+        else pd.DataFrame(index=range(1))
+    frame = frame.sort_values("discipline", key=lambda d: d.map(_BACKTEST_DISCIPLINES.index), kind="stable")
+    cols = _backtest_columns(frame)
+
+    # One matmul per mask yields every outcome total per profile: weights[tip, bucket * 4 + k]
+    buckets = sorted(frame["profile"].unique())
+    onehot = frame["profile"].to_numpy()[:, None] == np.array(buckets, dtype=object)[None, :]
+    outcomes = np.column_stack([
+        np.ones(len(frame)), frame["cashed"].to_numpy(dtype=float),
+        frame["net_profit"].to_numpy(dtype=float), frame["place_payout"].to_numpy(dtype=float),
+    ])
+    weights = (onehot[:, :, None] * outcomes[:, None, :]).reshape(len(frame), -1)
+
+    totals = {name: np.zeros((len(combo_frame), 4)) for name in ("all", "best_bet", "goldmine")}
+    profile_totals = np.zeros((len(combo_frame), len(buckets), 4))
+    step = max(1, _BACKTEST_CELLS // max(1, len(frame)))
+    for lo in range(0, len(combo_frame), step):
+        block = combo_frame.iloc[lo:lo + step]
+        params = {k: block[k].to_numpy(dtype=float)[:, None] if k in grid else float(v) for k, v in base.items()}
+        tipped, best, gold = (np.broadcast_to(m, (len(block), len(frame))).astype(np.float64)
+                              for m in _backtest_masks(cols, params))
+        by_profile = (tipped @ weights).reshape(len(block), len(buckets), 4)
+        profile_totals[lo:lo + step] = by_profile
+        totals["all"][lo:lo + step] = by_profile.sum(axis=1)
+        totals["best_bet"][lo:lo + step] = best @ outcomes
+        totals["goldmine"][lo:lo + step] = gold @ outcomes
+
+    def metrics(t: np.ndarray, prefix: str = "") -> Dict[str, np.ndarray]:
+        n = t[..., 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                f"{prefix}tips":        n.round().astype(int),
+                f"{prefix}hits":        t[..., 1].round().astype(int),
+                f"{prefix}hit_rate":    np.where(n > 0, t[..., 1] / n, np.nan),
+                f"{prefix}profit":      t[..., 2].round(2),
+                f"{prefix}roi":         np.where(n > 0, t[..., 2] / (n * BACKTEST_STAKE), np.nan),
+                f"{prefix}places_paid": t[..., 3].round(2),
+            }
+
+    summary = combo_frame.reset_index(drop=True).copy()
+    for name, prefix in (("all", ""), ("best_bet", "best_bet_"), ("goldmine", "goldmine_")):
+        for col, values in metrics(totals[name], prefix).items():
+            summary[col] = values
+
+    by_profile = pd.concat(
+        [combo_frame.reset_index(drop=True).assign(profile=b, **metrics(profile_totals[:, i])) for i, b in enumerate(buckets)],
+        ignore_index=True,
+    ) if buckets else pd.DataFrame(columns=keys + ["profile"])
+    return BacktestResult(summary=summary, by_profile=by_profile)
+
+
 class AudioAlertSystem:
     """Stub — audio alerts not available in interactive mode."""
     def __init__(self): pass
@@ -5744,7 +6438,7 @@ def generate_goldmine_report(races: List[Any], all_races: Optional[List[Any]] =
             active_with_odds = []
             for run in runners:
                 if get_field(run, 'scratched'): continue
-                wo = _get_best_win_odds(run)
+                wo = _best_win_odds_value(run)
                 if wo: active_with_odds.append((run, wo))
 
             sorted_by_odds = sorted(active_with_odds, key=lambda x: x[1])
@@ -5925,6 +6619,13 @@ def generate_adapter_health_report(harvest_summary: Dict[str, Dict]) -> str:
         for name, err in failed:
             lines.append(f'  {name:<30} {err[:40]}')
 
+    drifted = [(name, stats) for name, stats in sorted(harvest_summary.items()) if stats.get('drift')]
+    if drifted:
+        lines.append(f'\n  \u23F1 LATENCY DRIFT ({len(drifted)} adapters)')
+        for name, stats in drifted:
+            lines.append(f'  {name:<30} {stats["drift"]:<8} {stats.get("seconds", 0):>8.1f}s '
+                         f'(budget {stats.get("budget", 0):.0f}s)')
+
     total = len(harvest_summary)
     lines.append(f'\n  \U0001F4CA {len(succeeded)}/{total} adapters producing data '
                  f'({len(blocked)} blocked, {len(failed)} failed)')
@@ -5945,12 +6646,11 @@ async def generate_friendly_html_report(races: List[Any], stats: Dict[str, Any])
         active = [run for run in runners if not getattr(run, 'scratched', False)]
         if len(active) < 2: continue
 
-        # IMP-CR-02: Sort runners using _get_best_win_odds to handle multi-source data
-        # Mapping back to float for sorting and metadata access
+        # IMP-CR-02: Sort runners using _best_win_odds_value to handle multi-source data
         with_best_odds = []
         for run in active:
-            best = _get_best_win_odds(run)
-            with_best_odds.append((run, float(best) if best else 999.0))
+            best = _best_win_odds_value(run)
+            with_best_odds.append((run, best if best else 999.0))
 
         with_best_odds.sort(key=lambda x: x[1])
         sel = with_best_odds[0][0] # Favourite is index 0 (Target for Place betting)
@@ -5990,7 +6690,7 @@ async def generate_friendly_html_report(races: List[Any], stats: Dict[str, Any])
                 <td>{getattr(r, 'venue', 'Unknown')}</td>
                 <td>R{getattr(r, 'race_number', '?')}</td>
                 <td>#{getattr(sel, 'number', '?')} {getattr(sel, 'name', 'Unknown')}</td>
-                <td>{ float(_get_best_win_odds(sel) or 0.0):.2f}</td>
+                <td>{ (_best_win_odds_value(sel) or 0.0):.2f}</td>
                 <td>{gold_badge}{key_badge}</td>
             </tr>
         """)
@@ -6019,8 +6719,8 @@ async def generate_friendly_html_report(races: List[Any], stats: Dict[str, Any])
         # IMP-CR-02: Sort active runners using best win odds
         with_best_odds = []
         for run in active:
-            best = _get_best_win_odds(run)
-            with_best_odds.append((run, float(best) if best else 999.0))
+            best = _best_win_odds_value(run)
+            with_best_odds.append((run, best if best else 999.0))
         with_best_odds.sort(key=lambda x: x[1])
 
         sel_name = with_best_odds[0][0].name if with_best_odds else "Unknown"
@@ -6849,6 +7549,13 @@ class FortunaDB:
                     if col not in existing_cols:
                         conn.execute(f"ALTER TABLE tips ADD COLUMN {col} {dtype}")
 
+                # Per-run adapter durations feed the learned fetch timeouts (AdapterTimeBudgets)
+                harvest_cols = {row[1] for row in conn.execute("PRAGMA table_info(harvest_logs)").fetchall()}
+                for col, dtype in {"duration_s": "REAL", "status": "TEXT"}.items():
+                    if col not in harvest_cols:
+                        conn.execute(f"ALTER TABLE harvest_logs ADD COLUMN {col} {dtype}")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_harvest_adapter ON harvest_logs (adapter_name, id)")
+
                 # Composite index for audit performance (BUG-CR-10: Added idx_daypart)
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_time ON tips (audit_completed, start_time)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_start_time ON tips (start_time)")
@@ -7160,20 +7867,23 @@ class FortunaDB:
             now = to_storage_format(datetime.now(EASTERN))
             to_insert = []
             for adapter, data in harvest_summary.items():
+                duration = status = None
                 if isinstance(data, dict):
                     count = data.get("count", 0)
                     max_odds = data.get("max_odds", 0.0)
+                    duration = data.get("seconds")
+                    status = None if data.get("status") is None else str(data["status"])
                 else:
                     count = data
                     max_odds = 0.0
 
-                to_insert.append((now, region, adapter, count, max_odds))
+                to_insert.append((now, region, adapter, count, max_odds, duration, status))
 
             if to_insert:
                 with conn:
                     conn.executemany("""
-                        INSERT INTO harvest_logs (timestamp, region, adapter_name, race_count, max_odds)
-                        VALUES (?, ?, ?, ?, ?)
+                        INSERT INTO harvest_logs (timestamp, region, adapter_name, race_count, max_odds, duration_s, status)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
                     """, to_insert)
 
         await self._run_in_executor(_log)
@@ -7203,6 +7913,57 @@ class FortunaDB:
 
         return await self._run_in_executor(_get)
 
+    async def get_adapter_latencies(self, days: int = 30, limit: int = ADAPTER_LATENCY_WINDOW) -> Dict[str, List[float]]:
+        """Most recent fetch durations (seconds, newest first) per adapter, excluding failed and timed-out runs."""
+        if not self._initialized: await self.initialize()
+
+        def _get():
+            conn = self._get_conn()
+            cutoff = to_storage_format(datetime.now(EASTERN) - timedelta(days=days))
+            cursor = conn.execute("""
+                SELECT adapter_name, duration_s
+                FROM harvest_logs
+                WHERE timestamp > ? AND duration_s IS NOT NULL
+                  AND COALESCE(status, '') NOT IN ('error', 'blocked', 'timeout')
+                ORDER BY id DESC
+            """, (cutoff,))
+            latencies: Dict[str, List[float]] = {}
+            for row in cursor:
+                samples = latencies.setdefault(row["adapter_name"], [])
+                if len(samples) < limit:
+                    samples.append(row["duration_s"])
+            return latencies
+
+        return await self._run_in_executor(_get)
+
+    async def get_adapter_timeout_streaks(self, days: int = 30) -> Dict[str, int]:
+        """Consecutive timed-out runs per adapter, counted back from its latest run (errors are skipped)."""
+        if not self._initialized: await self.initialize()
+
+        def _get():
+            conn = self._get_conn()
+            cutoff = to_storage_format(datetime.now(EASTERN) - timedelta(days=days))
+            cursor = conn.execute("""
+                SELECT adapter_name, status
+                FROM harvest_logs
+                WHERE timestamp > ? AND duration_s IS NOT NULL
+                  AND COALESCE(status, '') NOT IN ('error', 'blocked')
+                ORDER BY id DESC
+            """, (cutoff,))
+            streaks: Dict[str, int] = {}
+            settled: Set[str] = set()
+            for row in cursor:
+                name = row["adapter_name"]
+                if name in settled:
+                    continue
+                if row["status"] == "timeout":
+                    streaks[name] = streaks.get(name, 0) + 1
+                else:
+                    settled.add(name)
+            return streaks
+
+        return await self._run_in_executor(_get)
+
     async def log_tips(self, tips: List[Dict[str, Any]], dedup_window_hours: int = 12):
         """Logs new tips to the database with batch deduplication and scoring updates."""
         if not self._initialized: await self.initialize()
@@ -9205,6 +9966,231 @@ class RacingPostToteAdapter(BrowserHeadersMixin, DebugMixin, BaseAdapterV3):
 # MASTER ORCHESTRATOR
 # ----------------------------------------
 
+@dataclass
+class MergeEvent:
+    """Emitted by RaceMergeStore when a merged race is created ("added") or gains data ("updated")."""
+    kind: str
+    key: str
+    race: Race
+    source: Optional[str] = None
+
+
+def quarter_race_key(race: Race) -> str:
+    """Canonical Venue + Race Number + Date + Discipline (IMP-CR-04: no start time, to absorb small time variations)."""
+    canonical_venue = get_canonical_venue(race.venue)
+    st = race.start_time
+    if isinstance(st, str):
+        try: st = from_storage_format(st.replace('Z', '+00:00'))
+        except Exception: pass
+    d_str = st.strftime('%y%m%d') if hasattr(st, 'strftime') else "Unknown"
+    return f"{canonical_venue}|{race.race_number}|{d_str}|{race.discipline}"
+
+
+class RaceMergeStore:
+    """
+    Thread-safe, incremental deduplication of races as each adapter delivers them.
+
+    The first race seen for a key becomes the merged race; later copies add runners,
+    odds, runner metadata and sources to it. Subscribers receive a MergeEvent per
+    touched race right after each ingest.
+    """
+
+    def __init__(self, key_fn: Callable[[Race], str] = quarter_race_key):
+        self.key_fn = key_fn
+        self._races: Dict[str, Race] = {}
+        self._lock = threading.RLock()
+        self._subscribers: List[Callable[[MergeEvent], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._races)
+
+    def subscribe(self, callback: Callable[[MergeEvent], None]) -> None:
+        self._subscribers.append(callback)
+
+    def races(self) -> List[Race]:
+        """Merged races in first-seen order."""
+        with self._lock:
+            return list(self._races.values())
+
+    def ingest(self, races: List[Race], source: Optional[str] = None) -> List[MergeEvent]:
+        """Merges ``races`` into the store and notifies subscribers; returns the events."""
+        touched: Dict[str, str] = {}
+        with self._lock:
+            for race in races:
+                key = self.key_fn(race)
+                existing = self._races.get(key)
+                if existing is None:
+                    self._races[key] = race
+                    touched[key] = "added"
+                    continue
+                self._merge(existing, race)
+                touched.setdefault(key, "updated")
+            events = [MergeEvent(kind, key, self._races[key], source) for key, kind in touched.items()]
+
+        for event in events:
+            for callback in self._subscribers:
+                try:
+                    callback(event)
+                except Exception as e:
+                    structlog.get_logger("RaceMergeStore").error("merge_subscriber_failed", key=event.key, error=str(e))
+        return events
+
+    @staticmethod
+    def _merge(existing: Race, race: Race) -> None:
+        # Merge runners with shadow-runner / double-header detection
+        for nr in race.runners:
+            # Find matching runner in existing race by number or name
+            er = next((r for r in existing.runners if (r.number != 0 and r.number == nr.number) or (r.name.lower() == nr.name.lower())), None)
+            if er:
+                # Update odds and metadata
+                er.odds.update(nr.odds)
+                if not er.win_odds and nr.win_odds: er.win_odds = nr.win_odds
+                if not er.number and nr.number: er.number = nr.number
+                er.metadata.update(nr.metadata)
+            else:
+                # New runner discovered for this race (e.g. from a different aggregator)
+                existing.runners.append(nr)
+        sources = set((existing.source or "").split(", "))
+        sources.add(race.source or "Unknown")
+        existing.source = ", ".join(sorted(list(filter(None, sources))))
+
+
+class AdapterTimeBudgets:
+    """
+    Per-adapter fetch timeouts learned from recent run durations (harvest_logs.duration_s).
+
+    An adapter's budget is the p95 of its last ADAPTER_LATENCY_WINDOW completed runs
+    times the factor, clamped to [floor, ceiling]; until it has min_samples runs it gets
+    the ceiling. Timed-out runs never enter the percentile (a hang would otherwise raise
+    its own budget); instead each consecutive timeout widens the budget by
+    ADAPTER_TIMEOUT_BACKOFF, for at most ADAPTER_TIMEOUT_MAX_BACKOFF_STEPS steps, and the
+    next completed run resets it. A run outside the adapter's own p5-p95 band by more
+    than ADAPTER_DRIFT_TOLERANCE is reported as drift.
+    """
+
+    def __init__(
+        self,
+        latencies: Optional[Dict[str, List[float]]] = None,
+        timeouts: Optional[Dict[str, int]] = None,
+        factor: float = ADAPTER_TIMEOUT_FACTOR,
+        floor: float = ADAPTER_TIMEOUT_FLOOR,
+        ceiling: float = ADAPTER_TIMEOUT_CEILING,
+        min_samples: int = ADAPTER_TIMEOUT_MIN_SAMPLES,
+    ):
+        self.latencies = {name: list(samples) for name, samples in (latencies or {}).items()}
+        self.timeouts = dict(timeouts or {})
+        self.factor = factor
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+
+    @classmethod
+    async def load(cls, db: FortunaDB, **kwargs) -> "AdapterTimeBudgets":
+        return cls(await db.get_adapter_latencies(), await db.get_adapter_timeout_streaks(), **kwargs)
+
+    def band(self, name: str) -> Optional[Tuple[float, float]]:
+        """(p5, p95) of the adapter's recent durations, or None without enough history."""
+        samples = self.latencies.get(name, [])
+        if len(samples) < self.min_samples:
+            return None
+        lo, hi = np.percentile(samples, [5, 95])
+        return float(lo), float(hi)
+
+    def timeout(self, name: str) -> float:
+        band = self.band(name)
+        if band is None:
+            return self.ceiling
+        steps = min(self.timeouts.get(name, 0), ADAPTER_TIMEOUT_MAX_BACKOFF_STEPS)
+        budget = max(self.floor, band[1] * self.factor) * ADAPTER_TIMEOUT_BACKOFF ** steps
+        return min(self.ceiling, budget)
+
+    def drift(self, name: str, seconds: float) -> Optional[str]:
+        band = self.band(name)
+        if band is None:
+            return None
+        if seconds > band[1] * ADAPTER_DRIFT_TOLERANCE:
+            return "slower"
+        if seconds < band[0] / ADAPTER_DRIFT_TOLERANCE:
+            return "faster"
+        return None
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Adds a completed run (newest first) so later lookups in this process see it."""
+        samples = self.latencies.setdefault(name, [])
+        samples.insert(0, seconds)
+        del samples[ADAPTER_LATENCY_WINDOW:]
+        self.timeouts.pop(name, None)
+
+    def observe_timeout(self, name: str) -> None:
+        self.timeouts[name] = self.timeouts.get(name, 0) + 1
+
+
+async def gather_by_host(
+    items: List[T],
+    fetch: Callable[[T], Awaitable[Any]],
+    host_of: Callable[[T], str],
+    limit: int = PHASE1_CONCURRENCY,
+    per_host: int = PHASE1_PER_HOST_CONCURRENCY,
+    on_result: Optional[Callable[[int, Any], None]] = None,
+) -> List[Any]:
+    """
+    Runs ``fetch`` over ``items`` concurrently: at most ``limit`` at once and ``per_host``
+    per host. ``on_result(i, result)`` is called as each one finishes; an item that raises
+    has its exception returned in its slot instead of cancelling the rest.
+    """
+    overall = asyncio.Semaphore(limit)
+    hosts: Dict[str, asyncio.Semaphore] = {}
+
+    async def run(i: int, item: T) -> Any:
+        host = hosts.setdefault(host_of(item), asyncio.Semaphore(per_host))
+        async with host, overall:
+            try:
+                result = await fetch(item)
+            except Exception as e:
+                result = e
+        if on_result is not None:
+            on_result(i, result)
+        return result
+
+    return await asyncio.gather(*(run(i, item) for i, item in enumerate(items)))
+
+
+def _adapter_host(cls: Type[BaseAdapterV3]) -> str:
+    from urllib.parse import urlparse
+    base_url = getattr(cls, "BASE_URL", "") or ""
+    return urlparse(base_url).netloc.lower() or getattr(cls, "SOURCE_NAME", cls.__name__)
+
+
+async def present_manual_fetch_batch(misses: Dict[str, List[Dict[str, str]]], prompt: bool = False) -> bool:
+    """
+    Lists every manual_fetch/ file the run was missing, once, grouped by adapter, and
+    writes them to manual_missing.txt in the --list-links format. With ``prompt`` it asks
+    a single question; True means the files were saved and those adapters should re-run.
+    """
+    if not misses:
+        return False
+    total = sum(len(v) for v in misses.values())
+    lines = [f"\n=== MANUAL FETCH: {total} page(s) missing for {len(misses)} adapter(s) ==="]
+    for adapter, entries in sorted(misses.items()):
+        lines.append(f"\n  {adapter}")
+        lines.extend(f"    {e['url']}\n      -> {e['file']}" for e in entries)
+    print("\n".join(lines))
+    try:
+        with open(get_writable_path("manual_missing.txt"), "w") as f:
+            for adapter, entries in sorted(misses.items()):
+                for e in entries:
+                    f.write(f"URL: {e['url']}\nFILE: {e['file']}\n\n")
+    except OSError as e:
+        structlog.get_logger("manual_fetch").warning("manual_missing_write_failed", error=str(e))
+    if not prompt:
+        return False
+    try:
+        answer = await asyncio.to_thread(input, "\nSave these pages, then press Enter to re-run those adapters (s to skip): ")
+    except EOFError:
+        return False
+    return answer.strip().lower() not in ("s", "skip", "n", "no")
+
+
 async def run_quarter_fetch(
     config: Dict,
     daypart_tag: str,
@@ -9213,13 +10199,27 @@ async def run_quarter_fetch(
     save_path: Optional[str] = None,
     force_fetch: bool = False,
     include_health_checks: bool = False,
+    db: Optional[FortunaDB] = None,
+    adapters: Optional[Dict[str, BaseAdapterV3]] = None,
+    prompt_missing: Optional[bool] = None,
 ) -> List[Race]:
     """
     Performs the structural discovery sweep and saves a snapshot.
     Does NOT score or persist tips.
+
+    Phase-1 adapters run concurrently (see gather_by_host) and are merged in tier order.
+    Missing manual_fetch/ pages are presented once at the end of the phase; with
+    ``prompt_missing`` (default: an interactive terminal outside CI) the user can save
+    them and re-run just those adapters.
+
+    ``db`` and ``adapters`` let a resident caller (DayPartDaemon) reuse an open database
+    and adapter instances across runs: adapters are taken from and returned to the pool
+    (keyed by name and region) instead of being closed, and one that fails is dropped.
     """
     logger = structlog.get_logger("run_quarter_fetch")
-    db = FortunaDB()
+    run_started = time.perf_counter()
+    if db is None:
+        db = FortunaDB()
     await db.initialize()
 
     if await db.is_quarter_fetched(daypart_tag) and not force_fetch:
@@ -9296,31 +10296,59 @@ async def run_quarter_fetch(
                 tier2_count=len(tier2_discovery),
                 tier3_count=len(tier3_health))
 
+    try:
+        budgets = await AdapterTimeBudgets.load(db)
+    except Exception:
+        budgets = AdapterTimeBudgets()
+
     adapter_configs = config.get("adapters", {}) if config else {}
     harvest_summary = {}
+    manual_misses: Dict[str, List[Dict[str, str]]] = {}
 
     date_str = daypart_tag.split("_")[1] # 260225
 
+    def record_duration(name: str, seconds: float, fetch_timeout: float, learn: bool = True) -> None:
+        stats = harvest_summary.setdefault(name, {"count": 0, "max_odds": 0.0, "trust_ratio": 0.0})
+        stats["seconds"] = round(seconds, 3)
+        stats["budget"] = round(fetch_timeout, 1)
+        drift = budgets.drift(name, seconds)
+        if drift:
+            stats["drift"] = drift
+            lo, hi = budgets.band(name)
+            logger.warning("adapter_latency_drift", adapter=name, direction=drift,
+                           seconds=round(seconds, 2), band=[round(lo, 2), round(hi, 2)])
+        if learn:
+            budgets.observe(name, seconds)
+
     async def fetch_one(cls):
         name = getattr(cls, "SOURCE_NAME", cls.__name__)
         specific_config = adapter_configs.get(name, {}).copy()
         specific_config.update({"region": region})
+        pool_key = f"{name}:{region}"
 
         adapter = None
+        pooled = False
+        # Learned from this adapter's own history; the ceiling until there is enough of it
+        fetch_timeout = budgets.timeout(name)
+        started = time.perf_counter()
         try:
-            adapter = cls(config=specific_config)
+            adapter = adapters.pop(pool_key, None) if adapters is not None else None
+            if adapter is None:
+                adapter = cls(config=specific_config)
+            adapter.manual_fetch_misses = []
             # Determine if this adapter uses Playwright
             strategy = getattr(adapter, 'strategy', None)
             use_playwright_sem = False
             if strategy and strategy.primary_engine in (BrowserEngine.PLAYWRIGHT, BrowserEngine.PLAYWRIGHT_LEGACY, BrowserEngine.CAMOUFOX):
                 use_playwright_sem = True
 
-            # GEMINI_3: Increase per-adapter timeout in run_quarter_fetch to 180s
-            # Increased to 300s to match hardened adapter timeouts (Hardening Fix)
-            fetch_timeout = 300.0
             # FIX: Deadlock guard — do not acquire playwright_semaphore here!
             # SmartFetcher already handles the semaphore internally during session creation.
             races = await asyncio.wait_for(adapter.get_races(date_str), timeout=fetch_timeout)
+            record_duration(name, time.perf_counter() - started, fetch_timeout)
+            if adapters is not None:
+                adapters[pool_key] = adapter
+                pooled = True
 
             # Record last status for Phase 1 logging (Hardening Fix)
             status = getattr(adapter, 'last_response_status', None)
@@ -9343,14 +10371,14 @@ async def run_quarter_fetch(
             return races
         except asyncio.TimeoutError:
             logger.warning("adapter_timeout", adapter=name, timeout=fetch_timeout)
-            if name not in harvest_summary:
-                harvest_summary[name] = {"count": 0, "max_odds": 0.0, "trust_ratio": 0.0}
+            # Logged with status "timeout", which keeps it out of the percentile
+            record_duration(name, fetch_timeout, fetch_timeout, learn=False)
+            budgets.observe_timeout(name)
             harvest_summary[name]["status"] = "timeout"
             return []
         except Exception as e:
             logger.error("Error fetching from adapter", adapter=name, date=date_str, error=str(e))
-            if name not in harvest_summary:
-                harvest_summary[name] = {"count": 0, "max_odds": 0.0, "trust_ratio": 0.0}
+            record_duration(name, time.perf_counter() - started, fetch_timeout, learn=False)
 
             error_str = str(e).lower()
             bot_keywords = ['captcha','cloudflare','bot','403','challenge','blocked','perimeterx','datadome']
@@ -9358,11 +10386,26 @@ async def run_quarter_fetch(
             harvest_summary[name]["error"] = str(e)
             return []
         finally:
-            if adapter:
+            if adapter is not None and getattr(adapter, "manual_fetch_misses", None):
+                manual_misses[name] = list(adapter.manual_fetch_misses)
+            else:
+                manual_misses.pop(name, None)
+            if adapter and not pooled:
                 try: await adapter.close()
                 except Exception: pass
 
-    all_races_raw = []
+    # Races are merged as each adapter returns, so a snapshot-ready race set exists
+    # long before the slowest adapter finishes
+    store = RaceMergeStore()
+    timing = {"first_race": None}
+
+    def on_merge(event: MergeEvent) -> None:
+        if timing["first_race"] is None:
+            timing["first_race"] = time.perf_counter() - run_started
+            logger.info("first_merged_race", venue=event.race.venue, race=event.race.race_number,
+                        source=event.source, seconds=round(timing["first_race"], 2))
+
+    store.subscribe(on_merge)
 
     # Phase 1: Odds-providing + discovery adapters (main time budget)
     phase1_adapters = tier1_odds + tier2_discovery
@@ -9370,14 +10413,42 @@ async def run_quarter_fetch(
     phase1_timeout = 600
 
     if phase1_adapters:
-        # INTERACTIVE MODE: Sequential processing to avoid overlapping prompts
-        for cls in phase1_adapters:
-            try:
-                r = await fetch_one(cls)
-                if isinstance(r, list):
-                    all_races_raw.extend(r)
-            except Exception as e:
-                logger.error("task_error", adapter=getattr(cls, "SOURCE_NAME", cls.__name__), error=str(e))
+        # Adapters run concurrently, a few at a time and one per host, but results are
+        # merged strictly in tier order so the snapshot is the same as a sequential run.
+        # Merging pauses at the first adapter that missed manual_fetch/ pages until the
+        # batch prompt has had a chance to re-run it.
+        def source_name(i: int) -> str:
+            return getattr(phase1_adapters[i], "SOURCE_NAME", phase1_adapters[i].__name__)
+
+        results: Dict[int, Any] = {}
+        merged_upto = 0
+
+        def merge_result(i: int) -> None:
+            r = results.pop(i)
+            if isinstance(r, BaseException):
+                logger.error("task_error", adapter=source_name(i), error=str(r))
+            else:
+                store.ingest(r, source=source_name(i))
+
+        def merge_in_order(i: int, result: Any) -> None:
+            nonlocal merged_upto
+            results[i] = result
+            while merged_upto in results and source_name(merged_upto) not in manual_misses:
+                merge_result(merged_upto)
+                merged_upto += 1
+
+        await gather_by_host(phase1_adapters, fetch_one, _adapter_host, on_result=merge_in_order)
+
+        held = [i for i in range(merged_upto, len(phase1_adapters)) if source_name(i) in manual_misses]
+        if held:
+            if prompt_missing is None:
+                prompt_missing = sys.stdin.isatty() and not os.getenv("GITHUB_ACTIONS")
+            missing = {source_name(i): manual_misses[source_name(i)] for i in held}
+            if await present_manual_fetch_batch(missing, prompt=prompt_missing):
+                retried = await gather_by_host([phase1_adapters[i] for i in held], fetch_one, _adapter_host)
+                results.update(zip(held, retried))
+        for i in range(merged_upto, len(phase1_adapters)):
+            merge_result(i)
 
     # Phase 2: Health checks only if time permits and explicitly included
     if tier3_health:
@@ -9400,42 +10471,14 @@ async def run_quarter_fetch(
         else:
             logger.info("adapter_fetch_complete", adapter=adapter_name, count=count, status=status)
 
-    # Deduplicate
-    race_map = {}
-    for race in all_races_raw:
-        canonical_venue = get_canonical_venue(race.venue)
-        st = race.start_time
-        if isinstance(st, str):
-            try: st = from_storage_format(st.replace('Z', '+00:00'))
-            except Exception: pass
-
-        d_str = st.strftime('%y%m%d') if hasattr(st, 'strftime') else "Unknown"
-        # IMP-CR-04: Drop time from dedup key to handle slight start time variations
-        key = f"{canonical_venue}|{race.race_number}|{d_str}|{race.discipline}"
-
-        if key not in race_map:
-            race_map[key] = race
-        else:
-            existing = race_map[key]
-            # Merge runners with shadow-runner / double-header detection
-            for nr in race.runners:
-                # Find matching runner in existing race by number or name
-                er = next((r for r in existing.runners if (r.number != 0 and r.number == nr.number) or (r.name.lower() == nr.name.lower())), None)
-                if er:
-                    # Update odds and metadata
-                    er.odds.update(nr.odds)
-                    if not er.win_odds and nr.win_odds: er.win_odds = nr.win_odds
-                    if not er.number and nr.number: er.number = nr.number
-                    er.metadata.update(nr.metadata)
-                else:
-                    # New runner discovered for this race (e.g. from a different aggregator)
-                    existing.runners.append(nr)
-            sources = set((existing.source or "").split(", "))
-            sources.add(race.source or "Unknown")
-            existing.source = ", ".join(sorted(list(filter(None, sources))))
-
-    unique_races = list(race_map.values())
+    # Deduplicated incrementally by the merge store as adapters finished
+    unique_races = store.races()
     logger.info("Unique races identified", count=len(unique_races))
+    logger.info(
+        "quarter_fetch_timing",
+        time_to_first_race=round(timing["first_race"], 2) if timing["first_race"] is not None else None,
+        total_seconds=round(time.perf_counter() - run_started, 2),
+    )
 
     # Save snapshot
     snapshot_path = save_quarter_snapshot(daypart_tag, unique_races)
@@ -9470,12 +10513,20 @@ async def run_score_now(
     config: Dict,
     daypart_tag: str,
     loaded_races: Optional[List[Race]] = None,
+    db: Optional[FortunaDB] = None,
+    analyzer: Optional[SimplySuccessAnalyzer] = None,
+    time_index: Optional[RaceTimeIndex] = None,
 ) -> List[Race]:
     """
     Loads a snapshot, refreshes odds for approaching races, scores, and persists tips.
+
+    A resident caller can pass its open ``db``, an ``analyzer`` whose evaluations are
+    already loaded for this day part (they are still saved after each run), and a
+    ``time_index`` over ``loaded_races`` so nothing is rebuilt between runs.
     """
     logger = structlog.get_logger("run_score_now")
-    db = FortunaDB()
+    if db is None:
+        db = FortunaDB()
     await db.initialize()
 
     # 2. Load races
@@ -9497,7 +10548,7 @@ async def run_score_now(
     already_scored = await db.get_scored_race_ids(daypart_tag)
 
     # 5. Filter scorable
-    scorable = get_scorable_races(cached_races, already_scored)
+    scorable = get_scorable_races(cached_races, already_scored, time_index=time_index)
 
     if not scorable:
         logger.info("No races within scoring window", mtp_max=SCORING_MTP_MAX)
@@ -9508,10 +10559,17 @@ async def run_score_now(
     # 8. Refresh odds
     await refresh_odds_for_races(scorable, config)
 
-    # 9. Score
-    analyzer = SimplySuccessAnalyzer(config)
-    analysis_result = analyzer.qualify_races(scorable)
+    # 9. Score (only races whose odds, runners or timing changed since the last run)
+    state_path = score_state_path(daypart_tag)
+    if analyzer is None:
+        analyzer = SimplySuccessAnalyzer(config)
+        analyzer.load_evaluations(state_path)
+    analysis_result = analyzer.qualify_changed_races(scorable)
     qualified = analysis_result.get("races", [])
+    try:
+        analyzer.save_evaluations(state_path)
+    except OSError as e:
+        logger.warning("score_state_save_failed", path=state_path, error=str(e))
 
     # 11. Persist
     if qualified:
@@ -9560,6 +10618,185 @@ async def run_score_now(
     return qualified
 
 
+# --- DAY-PART DAEMON ---
+DAEMON_TICK_SECONDS: Final[int] = 30
+DAEMON_SCORE_INTERVAL: Final[int] = 300
+DAEMON_FETCH_RETRY: Final[int] = 600
+DAEMON_JOB_TIMEOUT: Final[int] = 1800
+
+
+@dataclass
+class DaemonJobStats:
+    """Run counters for one daemon job kind (fetch, score or audit)."""
+    runs: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+    last_error: Optional[str] = None
+
+
+class DayPartDaemon:
+    """
+    Runs the day-part schedule (quarter fetch, score, audit) inside one resident process.
+
+    The separate --quarter-fetch / --score-now launches each re-import the module, reopen
+    the database, rebuild adapters, re-read the snapshot and reload the analyzer state.
+    The daemon keeps all of that warm: one FortunaDB connection, a pool of adapter
+    instances, the current day part's races with their RaceTimeIndex, and its analyzer.
+
+    On every tick the current day part is fetched once (retried after fetch_retry seconds
+    if that fails), scored every score_interval seconds, and the day part that just ended
+    is audited. Each job runs under its own timeout and exception guard, so one failing
+    job is logged and counted in ``stats`` without stopping the others or the process.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        adapter_filter: Optional[List[str]] = None,
+        quality: Optional[str] = None,
+        include_health_checks: bool = False,
+        tick: float = DAEMON_TICK_SECONDS,
+        score_interval: float = DAEMON_SCORE_INTERVAL,
+        fetch_retry: float = DAEMON_FETCH_RETRY,
+        job_timeout: float = DAEMON_JOB_TIMEOUT,
+        audit_region: Optional[str] = None,
+        db: Optional[FortunaDB] = None,
+    ):
+        self.config = config
+        self.adapter_filter = adapter_filter
+        self.quality = quality
+        self.include_health_checks = include_health_checks
+        self.tick_seconds = tick
+        self.score_interval = score_interval
+        self.fetch_retry = fetch_retry
+        self.job_timeout = job_timeout
+        self.audit_region = audit_region
+        self.db = db or FortunaDB()
+        self.adapters: Dict[str, BaseAdapterV3] = {}
+        self.races: Dict[str, List[Race]] = {}
+        self.time_indexes: Dict[str, RaceTimeIndex] = {}
+        self.analyzers: Dict[str, SimplySuccessAnalyzer] = {}
+        self.stats: Dict[str, DaemonJobStats] = {name: DaemonJobStats() for name in ("fetch", "score", "audit")}
+        self.current_tag: Optional[str] = None
+        self._fetched: Set[str] = set()
+        self._last_fetch: Dict[str, float] = {}
+        self._last_score: Dict[str, float] = {}
+        self._stop = asyncio.Event()
+        self.logger = structlog.get_logger(self.__class__.__name__)
+
+    @staticmethod
+    def daypart_tag(now: datetime) -> str:
+        """Q3_260225-style tag for the day part containing ``now``."""
+        return f"{resolve_daypart_from_dt(now).value}_{now.strftime(DATE_FORMAT)}"
+
+    async def _run_job(self, name: str, job: Callable[[], Awaitable[Any]]) -> bool:
+        stats = self.stats[name]
+        started = time.perf_counter()
+        stats.runs += 1
+        try:
+            await asyncio.wait_for(job(), timeout=self.job_timeout)
+            return True
+        except Exception as e:
+            # Crash isolation: the failure is recorded and the schedule carries on
+            stats.failures += 1
+            stats.last_error = f"{type(e).__name__}: {e}"
+            self.logger.error("daemon_job_failed", job=name, error=stats.last_error)
+            return False
+        finally:
+            stats.seconds += time.perf_counter() - started
+
+    async def fetch(self, tag: str) -> None:
+        races = await run_quarter_fetch(
+            self.config, tag, adapter_filter=self.adapter_filter, quality=self.quality,
+            include_health_checks=self.include_health_checks, db=self.db, adapters=self.adapters,
+            prompt_missing=False,
+        )
+        if not races:
+            # Already fetched by an earlier process today: pick up its snapshot once
+            races = load_quarter_snapshot(tag) or []
+        self.races[tag] = races
+        self.time_indexes[tag] = RaceTimeIndex(races)
+        self._fetched.add(tag)
+
+    async def score(self, tag: str) -> None:
+        races = self.races.get(tag)
+        if not races:
+            return
+        analyzer = self.analyzers.get(tag)
+        if analyzer is None:
+            analyzer = self.analyzers[tag] = SimplySuccessAnalyzer(self.config)
+            analyzer.load_evaluations(score_state_path(tag))
+        await run_score_now(
+            self.config, tag, loaded_races=races, db=self.db, analyzer=analyzer,
+            time_index=self.time_indexes.get(tag),
+        )
+
+    async def audit(self, tag: str) -> None:
+        import fortuna_analytics
+        day = datetime.strptime(tag.split("_")[1], DATE_FORMAT)
+        dates = [(day - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(2)]
+        await fortuna_analytics.run_analytics(dates, region=self.audit_region)
+
+    def _forget(self, tag: str) -> None:
+        """Drops a finished day part's races, index and analyzer."""
+        self.races.pop(tag, None)
+        self.time_indexes.pop(tag, None)
+        self.analyzers.pop(tag, None)
+        self._last_score.pop(tag, None)
+
+    async def tick(self, now: Optional[datetime] = None) -> List[str]:
+        """Runs whatever jobs are due at ``now``; returns their names in order."""
+        now = now or now_eastern()
+        clock = now.timestamp()
+        tag = self.daypart_tag(now)
+        ran: List[str] = []
+
+        finished = self.current_tag if self.current_tag not in (None, tag) else None
+        self.current_tag = tag
+        if finished:
+            self._forget(finished)
+
+        if tag not in self._fetched and clock - self._last_fetch.get(tag, float("-inf")) >= self.fetch_retry:
+            self._last_fetch[tag] = clock
+            await self._run_job("fetch", lambda: self.fetch(tag))
+            ran.append("fetch")
+
+        if tag in self._fetched and clock - self._last_score.get(tag, float("-inf")) >= self.score_interval:
+            self._last_score[tag] = clock
+            await self._run_job("score", lambda: self.score(tag))
+            ran.append("score")
+
+        # The new day part is fetched and scored first; auditing the last one can wait
+        if finished:
+            await self._run_job("audit", lambda: self.audit(finished))
+            ran.append("audit")
+        return ran
+
+    async def run(self) -> None:
+        """Ticks until stop() is called, then releases the warm resources."""
+        self.logger.info("daemon_started", tick=self.tick_seconds, score_interval=self.score_interval)
+        try:
+            while not self._stop.is_set():
+                await self.tick()
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.tick_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.close()
+            self.logger.info("daemon_stopped", **{k: vars(v) for k, v in self.stats.items()})
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def close(self) -> None:
+        for adapter in self.adapters.values():
+            try: await adapter.close()
+            except Exception: pass
+        self.adapters.clear()
+        await self.db.close()
+
+
 async def run_discovery(
     target_dates: List[str],
     window_hours: Optional[int] = 8,
@@ -9645,6 +10882,28 @@ async def ensure_browsers(force_install: bool = False) -> bool:
     """No-op in interactive mode — no browser automation required."""
     return True
 
+def run_backtest_cli(grid_arg: str, config: Dict[str, Any], db_path: Optional[str] = None, top: int = 20) -> BacktestResult:
+    """Loads the audited history, sweeps the grid and prints the best combinations by ROI."""
+    grid_text = Path(grid_arg).read_text() if os.path.isfile(grid_arg) else grid_arg
+    grid = {k: v if isinstance(v, list) else [v] for k, v in json.loads(grid_text).items()}
+    frame = load_backtest_frame(db_path)
+    t0 = time.perf_counter()
+    result = run_backtest(frame, grid, config)
+    elapsed = time.perf_counter() - t0
+
+    ranked = result.summary.sort_values(["roi", "tips"], ascending=[False, False])
+    print(f"\n=== BACKTEST: {len(result.summary)} combinations x {len(frame)} audited tips in {elapsed:.2f}s ===\n")
+    print(ranked.head(top).to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+    if len(ranked):
+        best = ranked.iloc[0]
+        mask = np.ones(len(result.by_profile), dtype=bool)
+        for k in grid:
+            mask &= result.by_profile[k].to_numpy() == best[k]
+        print("\n--- By race profile (best combination) ---\n")
+        print(result.by_profile[mask].drop(columns=list(grid)).to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+    return result
+
+
 async def handle_early_exit_args(args: argparse.Namespace, config: Dict[str, Any]) -> bool:
     """Handles CLI arguments that should trigger an immediate exit (Capability Improvement)."""
     if args.quick_help:
@@ -9659,6 +10918,9 @@ async def handle_early_exit_args(args: argparse.Namespace, config: Dict[str, Any
     if args.open_dashboard:
         open_report_in_browser()
         return True
+    if args.backtest:
+        run_backtest_cli(args.backtest, config, db_path=args.db_path)
+        return True
     return False
 
 async def main_all_in_one():
@@ -9676,6 +10938,7 @@ async def main_all_in_one():
     parser.add_argument("--daypart", type=str, choices=["auto", "Q1", "Q2", "Q3", "Q4"], default="auto", help="Specify daypart for fetching/scoring")
     parser.add_argument("--quarter-fetch", action="store_true", help="Structural discovery sweep for current daypart. Saves snapshot for later scoring. Does NOT score races.")
     parser.add_argument("--score-now", action="store_true", help="Load quarter snapshot, refresh odds for races within 15min of post, score and persist tips.")
+    parser.add_argument("--daemon", action="store_true", help="Stay resident and run the day-part schedule (quarter fetch, score every few minutes, audit) in one process, keeping the DB connection, adapters and snapshot warm.")
     parser.add_argument("--force-fetch", action="store_true", help="Force structural re-fetch even if quarter already cached. Use with --quarter-fetch.")
     parser.add_argument("--region", type=str, choices=["USA", "INT", "GLOBAL"], help="Filter by region (USA, INT or GLOBAL)")
     parser.add_argument("--quality", choices=["solid", "lousy"], help="Filter by adapter quality (Solid Top 3 vs others)")
@@ -9689,6 +10952,7 @@ async def main_all_in_one():
     parser.add_argument("--show-log", action="store_true", help="Print recent fetch/audit highlights")
     parser.add_argument("--quick-help", action="store_true", help="Show friendly onboarding guide")
     parser.add_argument("--open-dashboard", action="store_true", help="Open the HTML intelligence report in browser")
+    parser.add_argument("--backtest", type=str, metavar="GRID", help='Replay audited tips over a threshold grid (JSON or path to a JSON file, e.g. \'{"second_fav_floor": [4.5, 5, 6]}\') and exit')
     parser.add_argument("--include-health-checks", action="store_true", help="Include Official_* track health-check adapters in discovery. These confirm track websites are reachable but produce no race data. Off by default. Also affects --test-all-adapters.")
     parser.add_argument("--list-links", action="store_true", help="INTERACTIVE: Only list racecard URLs needed, skip fetching and processing.")
     args = parser.parse_args()
@@ -9846,6 +11110,22 @@ async def main_all_in_one():
                 print(f"Error loading {path}: {e}")
                 logger.error("Failed to load race data", path=path, error=str(e), exc_info=True)
 
+    if args.daemon:
+        if args.quarter_fetch or args.score_now:
+            parser.error("--daemon runs fetch and scoring itself; drop --quarter-fetch/--score-now")
+        daemon_cfg = config.get("daemon", {})
+        daemon = DayPartDaemon(
+            config,
+            adapter_filter=adapter_filter,
+            quality=args.quality,
+            include_health_checks=args.include_health_checks,
+            tick=daemon_cfg.get("tick_seconds", DAEMON_TICK_SECONDS),
+            score_interval=daemon_cfg.get("score_interval_seconds", DAEMON_SCORE_INTERVAL),
+            audit_region=args.region,
+        )
+        await daemon.run()
+        return
+
     # Phase B8: CLI Execution Logic
     if args.quarter_fetch:
         if args.score_now:
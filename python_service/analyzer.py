@@ -1,11 +1,14 @@
 from abc import ABC
 from abc import abstractmethod
 from decimal import Decimal
+from functools import cached_property
 from pathlib import Path
 from typing import Any
+from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 
 import structlog
@@ -48,9 +51,31 @@ def _get_best_win_odds(runner: Runner) -> Optional[Decimal]:
     return min(valid_odds) if valid_odds else None
 
 
+class RaceFeatures:
+    """Per-race values shared by the analyzers, each computed on first use."""
+
+    def __init__(self, race: Race):
+        self.race = race
+
+    @cached_property
+    def active(self) -> List[Runner]:
+        return [r for r in self.race.runners if not r.scratched]
+
+    @cached_property
+    def ranked(self) -> List[Tuple[Runner, Decimal]]:
+        """Active runners with valid win odds, shortest price first."""
+        ranked = [(r, odds) for r in self.active if (odds := _get_best_win_odds(r)) is not None]
+        ranked.sort(key=lambda x: x[1])
+        return ranked
+
+
 class BaseAnalyzer(ABC):
     """The abstract interface for all future analyzer plugins."""
 
+    # RaceFeatures fields read by qualify_race(); AnalyzerEngine.qualify_all builds one
+    # RaceFeatures per race and hands it to every analyzer that declares any
+    FEATURES: ClassVar[Tuple[str, ...]] = ()
+
     def __init__(self, **kwargs):
         pass
 
@@ -60,9 +85,29 @@ class BaseAnalyzer(ABC):
         pass
 
 
-class TrifectaAnalyzer(BaseAnalyzer):
+class SinglePassAnalyzer(BaseAnalyzer):
+    """
+    An analyzer that decides race by race. AnalyzerEngine.qualify_all runs every
+    SinglePassAnalyzer in one shared pass over the races instead of letting each scan
+    them itself.
+    """
+
+    @abstractmethod
+    def qualify_race(self, race: Race, feats: Optional[RaceFeatures] = None) -> bool:
+        """Accepts or rejects one race, scoring (and annotating) it when accepted."""
+        pass
+
+    @abstractmethod
+    def summarize(self, qualified: List[Race], races: List[Race]) -> Dict[str, Any]:
+        """Builds the qualify_races result from the races qualify_race accepted."""
+        pass
+
+
+class TrifectaAnalyzer(SinglePassAnalyzer):
     """Analyzes races and assigns a qualification score based on the 'Trifecta of Factors'."""
 
+    FEATURES = ("active", "ranked")
+
     @property
     def name(self) -> str:
         return "trifecta_analyzer"
@@ -78,26 +123,29 @@ class TrifectaAnalyzer(BaseAnalyzer):
         self.min_second_favorite_odds = Decimal(str(min_second_favorite_odds))
         self.notifier = RaceNotifier()
 
-    def is_race_qualified(self, race: Race) -> bool:
+    def is_race_qualified(self, race: Race, feats: Optional[RaceFeatures] = None) -> bool:
         """A race is qualified for a trifecta if it has at least 3 non-scratched runners."""
         if not race or not race.runners:
             return False
 
-        active_runners = sum(1 for r in race.runners if not r.scratched)
-        return active_runners >= 3
+        return len((feats or RaceFeatures(race)).active) >= 3
+
+    def qualify_race(self, race: Race, feats: Optional[RaceFeatures] = None) -> bool:
+        feats = feats or RaceFeatures(race)
+        if not self.is_race_qualified(race, feats):
+            return False
+        score = self._evaluate_race(race, feats)
+        if score > 0:
+            race.qualification_score = score
+            return True
+        return False
 
     def qualify_races(self, races: List[Race]) -> Dict[str, Any]:
         """Scores all races and returns a dictionary with criteria and a sorted list."""
-        qualified_races = []
-        for race in races:
-            if not self.is_race_qualified(race):
-                continue
-            score = self._evaluate_race(race)
-            if score > 0:
-                race.qualification_score = score
-                qualified_races.append(race)
+        return self.summarize([race for race in races if self.qualify_race(race)], races)
 
-        qualified_races.sort(key=lambda r: r.qualification_score, reverse=True)
+    def summarize(self, qualified: List[Race], races: List[Race]) -> Dict[str, Any]:
+        qualified_races = sorted(qualified, key=lambda r: r.qualification_score, reverse=True)
 
         criteria = {
             "max_field_size": self.max_field_size,
@@ -117,7 +165,7 @@ class TrifectaAnalyzer(BaseAnalyzer):
 
         return {"criteria": criteria, "races": qualified_races}
 
-    def _evaluate_race(self, race: Race) -> float:
+    def _evaluate_race(self, race: Race, feats: Optional[RaceFeatures] = None) -> float:
         """Evaluates a single race and returns a qualification score."""
         # --- Constants for Scoring Logic ---
         FAV_ODDS_NORMALIZATION = 10.0
@@ -127,18 +175,13 @@ class TrifectaAnalyzer(BaseAnalyzer):
         FIELD_SIZE_SCORE_WEIGHT = 0.3
         ODDS_SCORE_WEIGHT = 0.7
 
-        active_runners = [r for r in race.runners if not r.scratched]
-
-        runners_with_odds = []
-        for runner in active_runners:
-            best_odds = _get_best_win_odds(runner)
-            if best_odds is not None:
-                runners_with_odds.append((runner, best_odds))
+        feats = feats or RaceFeatures(race)
+        active_runners = feats.active
+        runners_with_odds = feats.ranked
 
         if len(runners_with_odds) < 2:
             return 0.0
 
-        runners_with_odds.sort(key=lambda x: x[1])
         favorite_odds = runners_with_odds[0][1]
         second_favorite_odds = runners_with_odds[1][1]
 
@@ -179,21 +222,25 @@ class TinyFieldTrifectaAnalyzer(TrifectaAnalyzer):
         return "tiny_field_trifecta_analyzer"
 
 
-class SimplySuccessAnalyzer(BaseAnalyzer):
+class SimplySuccessAnalyzer(SinglePassAnalyzer):
     """An analyzer that qualifies every race to show maximum successes (HTTP 200)."""
 
     @property
     def name(self) -> str:
         return "simply_success"
 
+    def qualify_race(self, race: Race, feats: Optional[RaceFeatures] = None) -> bool:
+        race.qualification_score = 100.0
+        return True
+
     def qualify_races(self, races: List[Race]) -> Dict[str, Any]:
         """Returns all races with a perfect score to celebrate success."""
-        for race in races:
-            race.qualification_score = 100.0
+        return self.summarize([race for race in races if self.qualify_race(race)], races)
 
+    def summarize(self, qualified: List[Race], races: List[Race]) -> Dict[str, Any]:
         return {
             "criteria": {"mode": "simply_success", "filtering": "disabled"},
-            "races": races
+            "races": qualified
         }
 
 
@@ -225,6 +272,44 @@ class AnalyzerEngine:
             raise ValueError(f"Analyzer '{name}' not found.")
         return analyzer_class(**kwargs)
 
+    def qualify_all(
+        self,
+        races: List[Race],
+        names: Optional[List[str]] = None,
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Runs several analyzers (default: all registered) over ``races`` in a single pass.
+
+        Each race gets one RaceFeatures shared by every analyzer, so the cost grows with
+        the races rather than races x analyzers. Analyzers that are not
+        SinglePassAnalyzers run their own ``qualify_races`` afterwards. ``overrides``
+        maps an analyzer name to its constructor kwargs.
+        """
+        overrides = overrides or {}
+        analyzers = {name: self.get_analyzer(name, **overrides.get(name, {})) for name in (names or self.analyzers)}
+        shared = {name: a for name, a in analyzers.items() if isinstance(a, SinglePassAnalyzer)}
+        needs_features = any(a.FEATURES for a in shared.values())
+
+        accepted: Dict[str, List[Tuple[Race, Optional[float]]]] = {name: [] for name in shared}
+        for race in races:
+            feats = RaceFeatures(race) if needs_features else None
+            for name, analyzer in shared.items():
+                if analyzer.qualify_race(race, feats):
+                    accepted[name].append((race, race.qualification_score))
+
+        results = {}
+        for name, analyzer in analyzers.items():
+            if name not in shared:
+                results[name] = analyzer.qualify_races(races)
+                continue
+            # Races are shared objects: restore this analyzer's scores before it sorts and
+            # reports, which leaves them as if the analyzers had run one after another
+            for race, score in accepted[name]:
+                race.qualification_score = score
+            results[name] = analyzer.summarize([race for race, _ in accepted[name]], races)
+        return results
+
 
 class AudioAlertSystem:
     """Plays sound alerts for important events."""
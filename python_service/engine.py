@@ -2,7 +2,6 @@
 
 import asyncio
 import json
-from copy import deepcopy
 from datetime import datetime
 from typing import Any
 from typing import Dict
@@ -360,27 +359,40 @@ class OddsEngine:
         return f"{race.venue.lower().strip()}|{race.race_number}|{race.start_time.strftime('%H:%M')}"
 
     def _dedupe_races(self, races: List[Race]) -> List[Race]:
-        """Deduplicates races and reconciles odds from different sources."""
-        races_copy = deepcopy(races)
+        """
+        Deduplicates races and reconciles odds from different sources.
+
+        Adapter output is never mutated and never returned: every race in the result is a
+        shallow copy with its own runner list, whether or not it was merged. Runners are
+        shared with the adapter until a merge changes their odds, at which point that
+        runner is copied.
+        """
         race_map: Dict[str, Race] = {}
-        for race in races_copy:
+        owned: set = set()  # ids of runners copied here, safe to modify in place
+        for race in races:
             key = self._race_key(race)
             if key not in race_map:
-                race_map[key] = race
-            else:
-                existing_race = race_map[key]
-                runner_map = {r.number: r for r in existing_race.runners}
-                for new_runner in race.runners:
-                    if new_runner.number in runner_map:
-                        existing_runner = runner_map[new_runner.number]
-                        existing_runner.odds.update(new_runner.odds)
-                    else:
-                        existing_race.runners.append(new_runner)
-
-                # Maintain source as string
-                sources = set(existing_race.source.split(", "))
-                sources.add(race.source)
-                existing_race.source = ", ".join(sorted(list(sources)))
+                race_map[key] = race.model_copy(update={"runners": list(race.runners)})
+                continue
+
+            existing_race = race_map[key]
+            runner_map = {r.number: i for i, r in enumerate(existing_race.runners)}
+            for new_runner in race.runners:
+                if new_runner.number in runner_map:
+                    idx = runner_map[new_runner.number]
+                    existing_runner = existing_race.runners[idx]
+                    if id(existing_runner) not in owned:
+                        existing_runner = existing_runner.model_copy(update={"odds": dict(existing_runner.odds)})
+                        existing_race.runners[idx] = existing_runner
+                        owned.add(id(existing_runner))
+                    existing_runner.odds.update(new_runner.odds)
+                else:
+                    existing_race.runners.append(new_runner)
+
+            # Maintain source as string
+            sources = set(existing_race.source.split(", "))
+            sources.add(race.source)
+            existing_race.source = ", ".join(sorted(list(sources)))
 
         return list(race_map.values())
 
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Simulation benchmark for the learned per-adapter fetch timeouts.
+
+Replays a run history (120 day-part runs by default) of phase-1 adapters with their own
+latency profiles -- fast JSON feeds, typical HTML scrapes, slow browser-backed sites --
+where any adapter occasionally hangs (hangs widen the budget in capped steps but
+never enter its latency history). Each run is scored by the adapter time it holds,
+the sum of min(latency, timeout). The flat 300 s timeout is compared with
+AdapterTimeBudgets, which is updated after every run exactly as run_quarter_fetch does.
+No run may take longer with learned budgets than with the flat timeout; successful
+fetches that a learned budget cut short are counted and reported.
+
+Usage: python scripts/benchmark_adapter_budgets.py [--runs 120] [--hang-rate 0.03]
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import fortuna_interactive as fi  # noqa: E402
+
+# name: (median seconds, spread as a lognormal sigma)
+PROFILES = {
+    "FeedA": (2.0, 0.3), "FeedB": (4.0, 0.4), "ScrapeA": (25.0, 0.35), "ScrapeB": (40.0, 0.5),
+    "ScrapeC": (15.0, 0.6), "BrowserA": (90.0, 0.3), "BrowserB": (140.0, 0.25),
+}
+FLAT_TIMEOUT = 300.0
+
+
+def latency(rng, name, hang_rate):
+    if rng.random() < hang_rate:
+        return float("inf")
+    median, sigma = PROFILES[name]
+    return median * rng.lognormvariate(0.0, sigma)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=120)
+    ap.add_argument("--hang-rate", type=float, default=0.03)
+    args = ap.parse_args()
+
+    rng = random.Random(17)
+    budgets = fi.AdapterTimeBudgets()
+    flat_total = learned_total = 0.0
+    hangs = cut_short = fetched = 0
+    hung_flat = hung_learned = 0.0
+    for _ in range(args.runs):
+        flat_run = learned_run = 0.0
+        for name in PROFILES:
+            took = latency(rng, name, args.hang_rate)
+            timeout = budgets.timeout(name)
+            flat_run += min(took, FLAT_TIMEOUT)
+            learned_run += min(took, timeout)
+            if took == float("inf"):
+                hangs += 1
+                hung_flat += FLAT_TIMEOUT
+                hung_learned += timeout
+            if took <= timeout:
+                fetched += 1
+                budgets.observe(name, took)
+            else:
+                cut_short += took < FLAT_TIMEOUT
+                budgets.observe_timeout(name)
+        assert learned_run <= flat_run + 1e-9, "a learned budget exceeded the flat timeout"
+        flat_total += flat_run
+        learned_total += learned_run
+
+    print(f"runs={args.runs} adapters={len(PROFILES)} hangs={hangs} fetched={fetched} "
+          f"cut short by learned budget={cut_short}")
+    for name in PROFILES:
+        lo, hi = budgets.band(name)
+        print(f"  {name:<9} band {lo:7.1f}-{hi:7.1f}s  budget {budgets.timeout(name):6.1f}s")
+    print(f"flat {FLAT_TIMEOUT:.0f}s timeout : {flat_total / args.runs:8.1f}s per phase")
+    print(f"learned budgets    : {learned_total / args.runs:8.1f}s per phase  "
+          f"({flat_total / learned_total:4.2f}x)")
+    print(f"waiting on hangs   : {hung_flat / args.runs:8.1f}s -> {hung_learned / args.runs:6.1f}s per phase")
+
+
+if __name__ == "__main__":
+    main()
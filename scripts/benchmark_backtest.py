@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the vectorized backtest in fortuna_interactive.
+
+Writes a synthetic year of audited tips (80 a day by default) to a scratch SQLite
+database, loads it once with load_backtest_frame and sweeps a threshold grid with
+run_backtest. A sample of combinations is also evaluated one at a time, and the
+sweep is checked against it before timings are reported.
+
+Usage: python scripts/benchmark_backtest.py [--days 365] [--per-day 80] [--sample 50]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import fortuna_interactive as fi  # noqa: E402
+
+GRID = {
+    "scoring_mtp_max":      [5, 10, 15],
+    "non_chalk_min":        [0.9, 1.5, 2.0],
+    "second_fav_floor":     [4.5, 5.0, 5.5, 6.0],
+    "gap_abs_min":          [0.75, 1.0, 1.5, 2.0],
+    "goldmine_sec_fav_min": [4.5, 5.0, 6.0],
+    "goldmine_gap_min":     [2.0, 2.5, 3.0],
+    "best_bet_score_min":   [52.0, 56.0, 60.0],
+    "Harness.min_gap12":    [0.75, 1.25],
+}
+
+
+def write_tips(path: str, days: int, per_day: int, seed: int = 3) -> int:
+    rng = random.Random(seed)
+    start = fi.now_eastern() - timedelta(days=days)
+    rows = []
+    for i in range(days * per_day):
+        st = start + timedelta(minutes=i * 1440 // per_day)
+        fav = round(rng.uniform(1.1, 5.0), 2)
+        sec = round(fav + rng.uniform(0.8, 8.0), 2)
+        cashed = rng.random() < 0.55
+        rows.append((
+            f"race_{i}", f"Track {i % 50}", i % 12 + 1, rng.choice(["Thoroughbred", "Harness", "Greyhound"]),
+            fi.to_storage_format(st), fi.to_storage_format(st - timedelta(minutes=rng.randint(1, 15))),
+            rng.randint(5, 12), fav, sec, str(round(sec - fav, 4)), rng.choice([None, "Maiden", "Handicap"]),
+            "CASHED" if cashed else "BURNED", round(rng.uniform(0.2, 4.0), 2) if cashed else -2.0,
+            round(rng.uniform(2.2, 6.0), 2) if cashed else None, rng.randint(0, 3),
+        ))
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE tips (race_id TEXT, venue TEXT, race_number INTEGER, discipline TEXT, start_time TEXT, "
+            "report_date TEXT, field_size INTEGER, predicted_fav_odds REAL, predicted_2nd_fav_odds REAL, gap_abs TEXT, "
+            "race_type TEXT, verdict TEXT, net_profit REAL, top1_place_payout REAL, goldmine_sources INTEGER, "
+            "audit_completed INTEGER DEFAULT 1)"
+        )
+        conn.executemany(f"INSERT INTO tips VALUES ({', '.join('?' * 15)}, 1)", rows)
+    return len(rows)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--days", type=int, default=365)
+    ap.add_argument("--per-day", type=int, default=80)
+    ap.add_argument("--sample", type=int, default=50)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "tips.db")
+        count = write_tips(db_path, args.days, args.per_day)
+        t0 = time.perf_counter()
+        frame = fi.load_backtest_frame(db_path, snapshot_dir=tmp)
+        t_load = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    result = fi.run_backtest(frame, GRID)
+    t_sweep = time.perf_counter() - t0
+
+    rng = random.Random(1)
+    picks = rng.sample(range(len(result.summary)), min(args.sample, len(result.summary)))
+    t0 = time.perf_counter()
+    singles = [fi.run_backtest(frame, {k: [result.summary.at[i, k]] for k in GRID}).summary.iloc[0] for i in picks]
+    t_single = (time.perf_counter() - t0) / len(picks)
+
+    metrics = ["tips", "hits", "profit", "places_paid", "best_bet_tips", "goldmine_tips", "goldmine_profit"]
+    for i, single in zip(picks, singles):
+        assert np.allclose(result.summary.loc[i, metrics].to_numpy(float), single[metrics].to_numpy(float)), f"combo {i} differs"
+
+    combos = len(result.summary)
+    print(f"tips={count} combinations={combos} profiles={result.by_profile['profile'].nunique()} "
+          f"(sweep matches {len(picks)} single-combination runs)")
+    print(f"load + derive once      : {t_load:8.3f}s")
+    print(f"one combination at a time: {t_single * combos:8.3f}s  (extrapolated from {len(picks)})")
+    print(f"vectorized sweep        : {t_sweep:8.3f}s  ({t_single * combos / t_sweep:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
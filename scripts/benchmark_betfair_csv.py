@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark for BetfairDataScientistAdapter CSV ingestion.
+
+Builds a synthetic ratings CSV (100k rows by default), parses it with the
+legacy iterrows loop and with the adapter's grouped ingestion, and checks
+that both produce the same races before reporting timings.
+
+Usage: python scripts/benchmark_betfair_csv.py [--rows 100000] [--chunksize 20000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from io import StringIO
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fortuna import (  # noqa: E402
+    EASTERN, BetfairDataScientistAdapter, Race, Runner,
+    create_odds_data, normalize_venue_name, to_eastern,
+)
+
+VENUES = ["Flemington", "Randwick", "Eagle Farm", "Morphettville", "Caulfield", "Rosehill Gardens"]
+
+
+def build_csv(rows: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    lines = ["meetings.races.bfExchangeMarketId,meetings.name,meetings.races.raceNumber,meetings.races.startTime,meetings.races.runners.runnerName,meetings.races.runners.clothNumber,meetings.races.runners.ratedPrice"]
+    market, written = 0, 0
+    while written < rows:
+        market += 1
+        venue = rng.choice(VENUES)
+        race_no = market % 10 + 1
+        start = f"2026-10-18T{(market % 12) + 1:02d}:{market % 60:02d}:00.000Z"
+        for cloth in range(1, rng.randint(6, 16) + 1):
+            if written >= rows: break
+            price = "" if rng.random() < 0.05 else f"{rng.uniform(1.2, 80.0):.2f}"
+            lines.append(f"1.{200000000 + market},{venue},{race_no},{start},Runner {market}-{cloth} (AUS),{cloth},{price}")
+            written += 1
+    return "\n".join(lines) + "\n"
+
+
+def legacy_parse(source_name: str, raw_data: StringIO):
+    """The previous iterrows-based implementation, kept here as the reference."""
+    df = pd.read_csv(raw_data)
+    if df.empty: return []
+    df = df.rename(columns=BetfairDataScientistAdapter.CSV_COLUMNS)
+    races = []
+    for mid, group in df.groupby("market_id"):
+        ri = group.iloc[0]
+        runners = []
+        for _, row in group.iterrows():
+            rp, od = row.get("rated_price"), {}
+            if pd.notna(rp):
+                if ov := create_odds_data(source_name, float(rp)): od[source_name] = ov
+            runners.append(Runner(name=str(row.get("runner_name", "Unknown")), number=int(row.get("saddle_cloth", 0)), odds=od))
+        vn = normalize_venue_name(str(ri.get("meeting_name", "")))
+        start_time = datetime.now(EASTERN)
+        for col in BetfairDataScientistAdapter.START_TIME_COLUMNS:
+            if col in ri and pd.notna(ri[col]):
+                try:
+                    st_val = str(ri[col])
+                    if "T" in st_val:
+                        start_time = to_eastern(datetime.fromisoformat(st_val.replace("Z", "+00:00")))
+                    break
+                except Exception: pass
+        races.append(Race(id=str(mid), venue=vn, race_number=int(ri.get("race_number", 0)), start_time=start_time, runners=runners, source=source_name, discipline="Thoroughbred"))
+    return races
+
+
+def fingerprint(races):
+    """Race dumps without the per-object last_updated timestamps."""
+    out = []
+    for r in races:
+        d = r.model_dump(mode="json")
+        for run in d["runners"]:
+            for od in run["odds"].values(): od.pop("last_updated", None)
+        out.append(d)
+    return out
+
+
+def timed(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--chunksize", type=int, default=20_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    csv_text = build_csv(args.rows)
+    adapter = BetfairDataScientistAdapter()
+    chunked = BetfairDataScientistAdapter(config={"csv_chunksize": args.chunksize})
+
+    t_legacy, legacy = timed(lambda: legacy_parse(adapter.source_name, StringIO(csv_text)), args.repeat)
+    t_grouped, grouped = timed(lambda: adapter._parse_races(StringIO(csv_text)), args.repeat)
+    t_chunked, streamed = timed(lambda: chunked._parse_races(StringIO(csv_text)), args.repeat)
+
+    reference = fingerprint(legacy)
+    assert fingerprint(grouped) == reference, "grouped ingestion differs from legacy output"
+    assert fingerprint(streamed) == reference, "chunked ingestion differs from legacy output"
+
+    runners = sum(len(r.runners) for r in legacy)
+    print(f"rows={args.rows} races={len(legacy)} runners={runners} (outputs identical)")
+    print(f"legacy iterrows : {t_legacy:8.3f}s")
+    print(f"grouped         : {t_grouped:8.3f}s  ({t_legacy / t_grouped:5.1f}x)")
+    print(f"chunked ({args.chunksize:>6}): {t_chunked:8.3f}s  ({t_legacy / t_chunked:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the resident day-part daemon in fortuna_interactive.
+
+Saves a synthetic quarter snapshot (400 races by default, posts spread over the next
+hours) and replays a day of scoring runs two ways:
+  * cold: what a separate --score-now launch pays each time -- interpreter start and
+    module import (timed in a subprocess), a fresh database connection, the snapshot
+    re-read from disk and the analyzer state reloaded;
+  * warm: DayPartDaemon.score with the connection, races, time index and analyzer kept.
+
+Each run advances the clock so a new slice of races comes into the scoring window.
+Both variants must qualify the same races before wall and CPU times are reported.
+
+Usage: python scripts/benchmark_daemon.py [--races 400] [--runs 96] [--imports 3]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+import structlog
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+import fortuna_interactive as fi  # noqa: E402
+
+TAG = "Q3_261018"
+
+
+def build_races(count: int, start, seed: int = 5):
+    rng = random.Random(seed)
+    races = []
+    for i in range(count):
+        prices = sorted(round(rng.uniform(1.2, 25.0), 2) for _ in range(rng.randint(5, 12)))
+        races.append(fi.Race(
+            id=f"race_{i}", venue=f"Track {i % 30}", race_number=i % 12 + 1, source="S", discipline="Thoroughbred",
+            start_time=start + timedelta(minutes=5 + i * 2), distance=rng.choice(["6f", "1m", None]),
+            runners=[
+                fi.Runner(name=f"Horse {i}-{n}", number=n, metadata={"odds_source_trustworthy": True},
+                          odds={"S": fi.OddsData(win=p, source="S")})
+                for n, p in enumerate(prices, start=1)
+            ],
+        ))
+    return races
+
+
+def import_cost(repeat: int):
+    """Best (wall, cpu) seconds for a fresh interpreter to import the module."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    best = (float("inf"), float("inf"))
+    for _ in range(repeat):
+        before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import fortuna_interactive"], env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        wall = time.perf_counter() - t0
+        after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+        best = min(best, (wall, cpu))
+    return best
+
+
+@contextmanager
+def frozen_clock(start):
+    """Lets each run move now_eastern forward without waiting for real time."""
+    original = fi.now_eastern
+    clock = {"now": start}
+    fi.now_eastern = lambda: clock["now"]
+    try:
+        yield clock
+    finally:
+        fi.now_eastern = original
+
+
+async def replay(races, runs: int, start, workdir: str, warm: bool):
+    os.chdir(workdir)
+    os.environ["FORTUNA_DB_PATH"] = os.path.join(workdir, "tips.db")
+    fi.save_quarter_snapshot(TAG, races)
+    daemon = fi.DayPartDaemon({}) if warm else None
+    wall, cpu = 0.0, 0.0
+    with frozen_clock(start) as clock:
+        if warm:
+            await daemon.fetch(TAG)  # one-off: the daemon's fetch job leaves the races in memory
+        for i in range(runs):
+            clock["now"] = start + timedelta(minutes=5 * i)
+            w0, c0 = time.perf_counter(), time.process_time()
+            if warm:
+                await daemon.score(TAG)
+            else:
+                await fi.run_score_now({}, TAG)
+            wall += time.perf_counter() - w0
+            cpu += time.process_time() - c0
+    db = daemon.db if warm else fi.FortunaDB()
+    await db.initialize()
+    qualified = sorted(await db.get_scored_race_ids(TAG))
+    if warm:
+        await daemon.close()
+    return qualified, wall, cpu
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--races", type=int, default=400)
+    ap.add_argument("--runs", type=int, default=96)
+    ap.add_argument("--imports", type=int, default=3)
+    args = ap.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+
+    start = fi.now_eastern()
+    races = build_races(args.races, start)
+    import_wall, import_cpu = import_cost(args.imports)
+
+    async def fetch_from_snapshot(config, tag, **kwargs):
+        return []  # already fetched: the daemon loads the snapshot once
+
+    fi.run_quarter_fetch = fetch_from_snapshot
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as cold_dir, tempfile.TemporaryDirectory() as warm_dir:
+        try:
+            cold_ids, cold_wall, cold_cpu = asyncio.run(replay(races, args.runs, start, cold_dir, warm=False))
+            warm_ids, warm_wall, warm_cpu = asyncio.run(replay(races, args.runs, start, warm_dir, warm=True))
+        finally:
+            os.chdir(cwd)
+    assert cold_ids == warm_ids, "cold and warm runs scored different races"
+
+    cold_total = (cold_wall + args.runs * import_wall, cold_cpu + args.runs * import_cpu)
+    warm_total = (warm_wall + import_wall, warm_cpu + import_cpu)
+    print(f"races={args.races} runs={args.runs} scored={len(warm_ids)} (same races both ways)")
+    print(f"process start + import : {import_wall:7.3f}s wall {import_cpu:7.3f}s cpu  (per launch)")
+    print(f"cold launches          : {cold_total[0]:7.2f}s wall {cold_total[1]:7.2f}s cpu  "
+          f"(scoring alone {cold_wall:.2f}s / {cold_cpu:.2f}s)")
+    print(f"resident daemon        : {warm_total[0]:7.2f}s wall {warm_total[1]:7.2f}s cpu  "
+          f"({cold_total[0] / warm_total[0]:4.1f}x wall, {cold_total[1] / warm_total[1]:4.1f}x cpu)")
+
+
+if __name__ == "__main__":
+    main()
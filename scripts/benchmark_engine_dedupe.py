@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark for OddsEngine._dedupe_races.
+
+Builds a synthetic multi-source race day (600 races by default, each reported
+by 3 adapters with 8-14 runners and one odds record per runner) and compares
+the previous deepcopy-then-merge implementation with the copy-on-write merge:
+call latency and peak allocated memory (tracemalloc). The serialized output
+of both must be identical and the adapter input must be left untouched.
+
+Usage: python scripts/benchmark_engine_dedupe.py [--races 600] [--sources 3] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from python_service.engine import OddsEngine  # noqa: E402
+from python_service.models import OddsData, Race, Runner  # noqa: E402
+
+VENUES = ["Ascot", "Flemington", "Gulfstream Park", "Santa Anita", "Meadowlands", "Woodbine", "Kempton", "Randwick"]
+
+
+def build_day(n_races: int, n_sources: int, seed: int = 5) -> List[Race]:
+    rng = random.Random(seed)
+    base = datetime(2026, 10, 18, 12, 0)
+    races = []
+    for i in range(n_races):
+        venue, number = VENUES[i % len(VENUES)], i // len(VENUES) + 1
+        start = base + timedelta(minutes=7 * i)
+        field = rng.randint(8, 14)
+        for s in range(n_sources):
+            source = f"Source{s}"
+            runners = [
+                Runner(name=f"Runner {i}-{n}", number=n, odds={source: OddsData(
+                    win=Decimal(f"{rng.uniform(1.5, 40):.2f}"), source=source, last_updated=start)})
+                for n in range(1, field + 1 + (s == 1))
+            ]
+            races.append(Race(id=f"{source}_{i}", venue=venue, race_number=number, start_time=start,
+                              runners=runners, source=source, metadata={"url": f"https://example.com/{i}"}))
+    rng.shuffle(races)
+    return races
+
+
+def legacy_dedupe(engine: OddsEngine, races: List[Race]) -> List[Race]:
+    """The previous deepcopy-based implementation, kept here as the reference."""
+    races_copy = deepcopy(races)
+    race_map: Dict[str, Race] = {}
+    for race in races_copy:
+        key = engine._race_key(race)
+        if key not in race_map:
+            race_map[key] = race
+        else:
+            existing_race = race_map[key]
+            runner_map = {r.number: r for r in existing_race.runners}
+            for new_runner in race.runners:
+                if new_runner.number in runner_map:
+                    runner_map[new_runner.number].odds.update(new_runner.odds)
+                else:
+                    existing_race.runners.append(new_runner)
+            sources = set(existing_race.source.split(", "))
+            sources.add(race.source)
+            existing_race.source = ", ".join(sorted(list(sources)))
+    return list(race_map.values())
+
+
+def measure(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--races", type=int, default=600)
+    ap.add_argument("--sources", type=int, default=3)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    races = build_day(args.races, args.sources)
+    before = [r.model_dump(mode="json") for r in races]
+    # Only _race_key is needed; skip the network/cache setup done by __init__
+    engine = OddsEngine.__new__(OddsEngine)
+
+    t_legacy, m_legacy, legacy = measure(lambda: legacy_dedupe(engine, races), args.repeat)
+    t_cow, m_cow, cow = measure(lambda: engine._dedupe_races(races), args.repeat)
+
+    assert [r.model_dump(by_alias=True) for r in cow] == [r.model_dump(by_alias=True) for r in legacy], "merged output differs"
+    assert [r.model_dump(mode="json") for r in races] == before, "adapter input was modified"
+
+    runners = sum(len(r.runners) for r in races)
+    print(f"input races={len(races)} runners={runners} merged races={len(cow)} (outputs identical, input untouched)")
+    print(f"deepcopy merge     : {t_legacy * 1000:8.1f} ms  peak {m_legacy / 2**20:7.2f} MiB")
+    print(f"copy-on-write merge: {t_cow * 1000:8.1f} ms  peak {m_cow / 2**20:7.2f} MiB  ({t_legacy / t_cow:5.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark for PredictionHistoryStore.
+
+Writes a synthetic monitor history (21 days of 10,000 records a day by default) twice:
+once as the previous append-forever prediction_history.jsonl and once into the segmented
+store. It then runs the lookbacks a reporter makes, a one-day logged range and a single
+race id, as a full scan of the flat file and as a store query. Both must return the
+same records before disk size and query times are reported.
+
+Usage: python scripts/benchmark_history_store.py [--days 21] [--per-day 10000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fortuna import EASTERN, PredictionHistoryStore  # noqa: E402
+
+
+def build_records(days: int, per_day: int, seed: int = 5):
+    rng = random.Random(seed)
+    start = datetime(2026, 9, 1, 8, 0, tzinfo=EASTERN)
+    for d in range(days):
+        for i in range(per_day):
+            logged = start + timedelta(days=d, seconds=i * 50_000 // per_day)
+            venue, number = rng.randint(0, 40), rng.randint(1, 12)
+            yield {
+                "discipline": "T", "track": f"Track {venue}", "race_number": number, "field_size": rng.randint(5, 12),
+                "superfecta_offered": True, "adapter": "Synthetic", "start_time": (logged + timedelta(minutes=30)).isoformat(),
+                "mtp": 30, "second_fav_odds": round(rng.uniform(3, 9), 2), "second_fav_name": f"Runner {i}",
+                "selection_number": 2, "favorite_odds": round(rng.uniform(1.5, 3), 2), "favorite_name": f"Fav {i}",
+                "top_five_numbers": "1, 2, 3, 4, 5", "gap12": round(rng.uniform(0, 3), 2), "is_goldmine": False,
+                "is_best_bet": False, "race_id": f"track{venue}|{number}|{logged:%Y%m%d}", "logged_at": logged.isoformat(),
+            }
+
+
+def scan(path, keep):
+    with open(path, encoding="utf-8") as f:
+        return [r for r in map(json.loads, f) if keep(r)]
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--days", type=int, default=21)
+    ap.add_argument("--per-day", type=int, default=10_000)
+    args = ap.parse_args()
+
+    records = list(build_records(args.days, args.per_day))
+    with tempfile.TemporaryDirectory() as tmp:
+        flat = os.path.join(tmp, "prediction_history.jsonl")
+        with open(flat, "w", encoding="utf-8") as f:
+            for r in records:
+                f.write(json.dumps(r) + "\n")
+        store = PredictionHistoryStore(os.path.join(tmp, "store"))
+        cycle = 10  # records the monitor appends per cycle
+        t_append, _ = timed(lambda: [store.append(records[n:n + cycle]) for n in range(0, len(records), cycle)])
+
+        day = records[len(records) // 2]["logged_at"][:10]
+        start, end = f"{day}T00:00", f"{day}T99"
+        race_id = records[len(records) // 3]["race_id"]
+        t_old_day, old_day = timed(lambda: scan(flat, lambda r: start <= r["logged_at"] < end))
+        t_new_day, new_day = timed(lambda: list(store.records(start, end)))
+        t_old_id, old_id = timed(lambda: scan(flat, lambda r: r["race_id"] == race_id))
+        t_new_id, new_id = timed(lambda: list(store.records(race_id=race_id)))
+        assert old_day == new_day and old_id == new_id, "store queries differ from the full scan"
+
+        flat_size = os.path.getsize(flat)
+        store_size = sum(os.path.getsize(os.path.join(d, n)) for d, _, names in os.walk(store.root) for n in names)
+
+    print(f"records={len(records)} segments={len(store.segments)} (query results identical)")
+    print(f"disk            : {flat_size / 2**20:8.1f} MiB -> {store_size / 2**20:8.1f} MiB ({store_size / flat_size:5.1%})")
+    print(f"one-day range   : {t_old_day:8.3f}s     -> {t_new_day:8.3f}s     ({t_old_day / t_new_day:5.1f}x, {len(new_day)} records)")
+    print(f"one race id     : {t_old_id:8.3f}s     -> {t_new_id:8.3f}s     ({t_old_id / t_new_id:5.1f}x, {len(new_id)} records)")
+    print(f"store appends   : {t_append / (len(records) / cycle) * 1e3:8.2f}ms per {cycle}-record cycle")
+
+
+if __name__ == "__main__":
+    main()
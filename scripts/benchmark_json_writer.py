@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the monitor's race_data.json writer.
+
+Replays a monitor session (1,500 races, 720 cycles = six hours at the 30s tick by
+default). Minutes-to-post move every other cycle and a few races get new odds every
+tenth cycle. Each cycle's document is saved two ways: the previous indented json.dump
+on every cycle, and JsonChangeWriter with a delta file. The final files are checked to
+decode to the same document (apart from generated_at and mtp) before disk bytes, writer
+time and reader parse time are reported.
+
+Usage: python scripts/benchmark_json_writer.py [--races 1500] [--cycles 720]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fortuna import JsonChangeWriter, RaceSummary, now_eastern  # noqa: E402
+
+
+def build_summaries(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    start = now_eastern()
+    return [
+        RaceSummary(discipline=rng.choice("THG"), track=f"Track {i % 60}", race_number=i // 60 + 1,
+                    field_size=rng.randint(5, 14), superfecta_offered=rng.random() < 0.5, adapter="Synthetic",
+                    start_time=start + timedelta(minutes=rng.randint(0, 720)), second_fav_odds=round(rng.uniform(2, 9), 2),
+                    second_fav_name=f"Runner {i}", selection_number=2, favorite_odds=round(rng.uniform(1.5, 4), 2),
+                    favorite_name=f"Fav {i}", top_five_numbers="1, 2, 3, 4, 5", gap12=round(rng.uniform(0, 3), 2))
+        for i in range(count)
+    ]
+
+
+def documents(summaries, cycles: int, seed: int = 3):
+    rng = random.Random(seed)
+    now = now_eastern()
+    for c in range(cycles):
+        minute = c // 2
+        for s in summaries:
+            s.mtp = int((s.start_time - now).total_seconds() // 60) - minute
+        if c % 10 == 0:
+            for s in rng.sample(summaries, 5):
+                s.second_fav_odds = round(rng.uniform(2, 9), 2)
+        yield {
+            "generated_at": (now + timedelta(seconds=30 * c)).isoformat(),
+            "total_races": len(summaries),
+            "all_races": [s.to_dict() for s in summaries],
+        }
+
+
+def legacy_write(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--races", type=int, default=1_500)
+    ap.add_argument("--cycles", type=int, default=720)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old_path, new_path = os.path.join(tmp, "old.json"), os.path.join(tmp, "race_data.json")
+        writer = JsonChangeWriter(new_path, delta_path=os.path.join(tmp, "race_data.delta.json"))
+        t_old = t_new = 0.0
+        old_bytes = new_bytes = 0
+        for data in documents(build_summaries(args.races), args.cycles):
+            t0 = time.perf_counter()
+            legacy_write(old_path, data)
+            t_old += time.perf_counter() - t0
+            old_bytes += os.path.getsize(old_path)
+            t0 = time.perf_counter()
+            if writer.write(data):
+                new_bytes += os.path.getsize(new_path) + os.path.getsize(writer.delta_path)
+            t_new += time.perf_counter() - t0
+
+        with open(old_path, encoding="utf-8") as f:
+            old_doc = json.load(f)
+        with open(new_path, encoding="utf-8") as f:
+            new_doc = json.load(f)
+        # a skipped write keeps the earlier stamp and mtp values
+        old_doc.pop("generated_at"), new_doc.pop("generated_at")
+        assert writer._stable(old_doc["all_races"]) == writer._stable(new_doc["all_races"]), "final documents differ"
+        assert old_doc.keys() == new_doc.keys() and old_doc["total_races"] == new_doc["total_races"]
+
+        def parse(path, repeat=5):
+            best = float("inf")
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                with open(path, encoding="utf-8") as f:
+                    json.load(f)
+                best = min(best, time.perf_counter() - t0)
+            return best
+
+        t_read_old, t_read_new, t_read_delta = parse(old_path), parse(new_path), parse(writer.delta_path)
+        size_old, size_new = os.path.getsize(old_path), os.path.getsize(new_path)
+
+    print(f"races={args.races} cycles={args.cycles} writes={writer.writes} skipped={writer.skips} (final documents identical apart from mtp)")
+    print(f"bytes written  : {old_bytes / 2**20:8.1f} MiB -> {new_bytes / 2**20:8.1f} MiB ({new_bytes / old_bytes:5.1%})")
+    print(f"writer time    : {t_old:8.3f}s     -> {t_new:8.3f}s     ({t_old / t_new:4.1f}x)")
+    print(f"file size      : {size_old / 1024:8.0f} KiB -> {size_new / 1024:8.0f} KiB")
+    print(f"reader parse   : {t_read_old * 1e3:8.2f}ms    -> {t_read_new * 1e3:8.2f}ms    (delta {t_read_delta * 1e3:.2f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark for push-based BET NOW notifications.
+
+Replays monitor cycles over synthetic races (1,500 races and 240 cycles by default):
+post times approach, a few odds move each cycle and races drift in and out of BET NOW.
+Each cycle the monitor saves race_data.json and publishes its changes on a
+MonitorEventBus. A consumer on another thread's event loop (as a WebSocket handler
+runs) receives them.
+
+Compared with the previous pattern, where a consumer re-reads race_data.json on a timer
+and diffs the BET NOW list, it reports per-cycle consumer cost and delivery latency.
+The pushed "qualified" events are checked against what the poller finds.
+
+Usage: python scripts/benchmark_monitor_events.py [--races 1500] [--cycles 240] [--interval 30]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fortuna import FavoriteToPlaceMonitor, MonitorEventBus, RaceSummary, now_eastern  # noqa: E402
+
+
+def build_summaries(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    now = now_eastern()
+    return [
+        RaceSummary(discipline="T", track=f"Track {i % 60}", race_number=i // 60 + 1, field_size=rng.randint(5, 11),
+                    superfecta_offered=rng.random() < 0.5, adapter="Synthetic",
+                    start_time=now + timedelta(minutes=rng.randint(0, 360)), second_fav_odds=round(rng.uniform(3, 8), 2),
+                    favorite_odds=2.0, gap12=round(rng.uniform(0.3, 3), 2))
+        for i in range(count)
+    ]
+
+
+def poll_bet_now(path, previous):
+    """The previous consumer pattern: re-read the file, diff the BET NOW list."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    current = {f"{r['track']}|{r['race_number']}": r for r in data["bet_now_races"]}
+    return current, [k for k in current if k not in previous]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--races", type=int, default=1_500)
+    ap.add_argument("--cycles", type=int, default=240)
+    ap.add_argument("--interval", type=int, default=30, help="monitor refresh / consumer poll interval, seconds")
+    args = ap.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+
+    bus = MonitorEventBus(history=100_000)
+    received, published_at, ready = [], {}, threading.Event()
+    loop_holder = {}
+
+    async def consume():
+        queue, _ = bus.queue(maxsize=100_000)
+        loop_holder["loop"], loop_holder["queue"] = asyncio.get_running_loop(), queue
+        ready.set()
+        while True:
+            event = await queue.get()
+            if event is None:
+                return
+            received.append((event, time.perf_counter()))
+
+    consumer = threading.Thread(target=lambda: asyncio.run(consume()))
+    consumer.start()
+    ready.wait()
+
+    rng = random.Random(3)
+    summaries = build_summaries(args.races)
+    t_poll, t_push, polled, previous = 0.0, 0.0, [], {}
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            monitor = FavoriteToPlaceMonitor(events=bus)
+            monitor._set_race_map({monitor._summary_key(s): s for s in summaries})
+            for c in range(args.cycles):
+                for s in summaries:
+                    s.mtp = int((s.start_time - now_eastern()).total_seconds() // 60) - c * args.interval // 60
+                for s in rng.sample(summaries, 20):
+                    s.second_fav_odds = round(max(1.5, s.second_fav_odds + rng.uniform(-1.0, 1.0)), 2)
+                t0 = time.perf_counter()
+                for event in monitor.publish_changes():
+                    published_at[event.seq] = t0
+                t_push += time.perf_counter() - t0
+                monitor.save_to_json("race_data.json")
+                t0 = time.perf_counter()
+                previous, new = poll_bet_now("race_data.json", previous)
+                t_poll += time.perf_counter() - t0
+                polled.extend(new)
+        finally:
+            os.chdir(cwd)
+
+    loop_holder["loop"].call_soon_threadsafe(loop_holder["queue"].put_nowait, None)
+    consumer.join()
+
+    pushed = [f"{e.summary.track}|{e.summary.race_number}" for e, _ in received if e.kind == "qualified"]
+    assert len(received) == bus.seq, "events lost"
+    assert sorted(pushed) == sorted(polled), "pushed qualifications differ from the polled diff"
+    latency = [(at - published_at[e.seq]) * 1e3 for e, at in received]
+    kinds = {k: sum(1 for e, _ in received if e.kind == k) for k in ("qualified", "odds_moved", "off", "dropped")}
+
+    print(f"races={args.races} cycles={args.cycles} events={bus.seq} {kinds} (pushed qualifications match the polled diff)")
+    print(f"consumer cost / cycle : poll+diff {t_poll / args.cycles * 1e3:7.2f}ms -> push {t_push / args.cycles * 1e3:6.2f}ms "
+          f"(diff and publish, on the monitor)")
+    print(f"delivery latency      : poll up to {args.interval}s after the write (avg {args.interval / 2:.0f}s) -> "
+          f"push median {statistics.median(latency):.2f}ms, max {max(latency):.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the monitor's MTP-prioritized odds refresh.
+
+Simulates a race day (12 hours of races across 40 venues by default) watched by a
+monitor ticking every 30 seconds, with eight discovery adapters of which the
+ODDS_REFRESH_ADAPTERS carry odds for half of the races. Three policies are compared:
+
+  * startup only   - the previous behaviour: odds are never refetched;
+  * full refetch   - every adapter is fetched every tick;
+  * scheduled      - OddsRefreshScheduler with its default cadence and budget.
+
+For each policy it reports requests made and the age of the odds shown for races
+inside 5 and 120 minutes to post. The scheduler is checked to stay within its budget
+in every rolling minute and to keep near-post odds within one cadence step and tick.
+
+Usage: python scripts/benchmark_odds_refresh.py [--hours 12] [--venues 40] [--tick 30]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+from datetime import timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fortuna import ODDS_REFRESH_ADAPTERS, OddsRefreshScheduler, RaceSummary, now_eastern  # noqa: E402
+
+OTHER_ADAPTERS = ["Equibase", "AtTheRaces", "RacingPost", "SportingLife", "Timeform", "SkySports"]
+
+
+def build_card(hours: int, venues: int, seed: int = 5):
+    rng = random.Random(seed)
+    start = now_eastern().replace(second=0, microsecond=0)
+    card = {}
+    for v in range(venues):
+        first = rng.randint(0, 60 * hours // 3)
+        for n in range(1, 13):
+            minutes = first + (n - 1) * rng.randint(20, 35)
+            if minutes > 60 * hours:
+                break
+            key = f"venue{v}|{n}"
+            carriers = [ODDS_REFRESH_ADAPTERS[v % len(ODDS_REFRESH_ADAPTERS)]] if v % 2 == 0 else []
+            card[key] = (RaceSummary(discipline="T", track=f"Venue {v}", race_number=n, field_size=8,
+                                     superfecta_offered=True, adapter="Synthetic",
+                                     start_time=start + timedelta(minutes=minutes)), minutes, carriers)
+    return card
+
+
+def simulate(card, hours: int, tick: int, policy: str):
+    adapters = len(ODDS_REFRESH_ADAPTERS) + len(OTHER_ADAPTERS)
+    sched = OddsRefreshScheduler(clock=lambda: 0.0)
+    refreshed = {}
+    for key, (_, _, carriers) in card.items():
+        for adapter in carriers:
+            sched.track(key, adapter, now=0.0)
+        refreshed[key] = 0.0
+    requests, issued, near, window = adapters, [], [], []  # discovery fetch counts for everyone
+    for t in range(tick, hours * 3600 + 1, tick):
+        for summary, minutes, _ in card.values():
+            summary.mtp = int((minutes * 60 - t) // 60)
+        if policy == "full":
+            requests += adapters
+            refreshed.update((key, t) for key, (_, _, carriers) in card.items() if carriers)
+        elif policy == "scheduled":
+            batches = sched.plan(((k, s) for k, (s, _, _) in card.items()), now=float(t))
+            requests += len(batches)
+            issued.extend([t] * len(batches))
+            refreshed.update((key, t) for b in batches for key in b.keys)
+        for key, (summary, _, carriers) in card.items():
+            if carriers and -10 < summary.mtp <= 120:
+                window.append(t - refreshed[key])
+                if summary.mtp <= 5:
+                    near.append(t - refreshed[key])
+    return requests, issued, near, window
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--hours", type=int, default=12)
+    ap.add_argument("--venues", type=int, default=40)
+    ap.add_argument("--tick", type=int, default=30)
+    args = ap.parse_args()
+
+    card = build_card(args.hours, args.venues)
+    results = {policy: simulate(card, args.hours, args.tick, policy) for policy in ("startup", "full", "scheduled")}
+
+    _, issued, near, _ = results["scheduled"]
+    budget = OddsRefreshScheduler().budget_per_minute
+    assert all(sum(1 for s in issued if t - 60 < s <= t) <= budget for t in issued), "budget exceeded"
+    assert max(near) <= 30 + args.tick, "near-post odds went stale"
+
+    full = results["full"][0]
+    print(f"races={len(card)} refreshable={sum(1 for *_, c in card.values() if c)} ticks={args.hours * 3600 // args.tick} "
+          f"(scheduler within budget of {budget}/min)")
+    print(f"{'policy':<14} {'requests':>9} {'vs full':>8} {'age<=5m med/max':>17} {'age<=120m med/max':>19}")
+    for policy, (requests, _, near, window) in results.items():
+        print(f"{policy:<14} {requests:>9} {requests / full:>8.1%} "
+              f"{statistics.median(near):>8.0f}s/{max(near):>6.0f}s {statistics.median(window):>9.0f}s/{max(window):>7.0f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the concurrent phase 1 of fortuna_interactive.run_quarter_fetch.
+
+Registers synthetic discovery adapters (10 by default, a few sharing a host) whose
+get_races waits a per-adapter latency (0.1-1.0 s, scaled by --scale) and returns
+overlapping race cards, then runs a quarter fetch twice: one adapter at a time (the
+previous behaviour) and with gather_by_host's default limits. Both snapshots must
+contain the same races, runners and sources before wall times are reported.
+
+Usage: python scripts/benchmark_phase1.py [--adapters 10] [--scale 1.0]
+"""
+import argparse
+import asyncio
+import functools
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import fortuna_interactive as fi  # noqa: E402
+
+
+def build_adapters(count: int, scale: float, seed: int = 3):
+    rng = random.Random(seed)
+    start = fi.now_eastern() + timedelta(hours=1)
+    classes = []
+    for k in range(count):
+        delay = rng.uniform(0.1, 1.0) * scale
+        venues = rng.sample([f"Track {v}" for v in range(12)], 6)
+
+        async def get_races(self, date_str, delay=delay, venues=venues, name=f"Adapter{k}"):
+            await asyncio.sleep(delay)
+            return [fi.Race(id=f"{name}_{v}_{n}", venue=v, race_number=n, source=name,
+                            start_time=start + timedelta(minutes=30 * n),
+                            runners=[fi.Runner(name=f"{v} H{n}-{i}", number=i) for i in range(1, 9)])
+                    for v in venues for n in range(1, 9)]
+
+        async def close(self):
+            pass
+
+        classes.append(type(f"Adapter{k}", (), {
+            "SOURCE_NAME": f"Adapter{k}", "BASE_URL": f"https://host{k % max(1, count - 2)}.example",
+            "PROVIDES_ODDS": k % 2 == 0, "__init__": lambda self, config=None: None,
+            "get_races": get_races, "close": close,
+        }))
+    return classes
+
+
+def snapshot(races):
+    return sorted((r.venue, r.race_number, r.source, tuple(sorted(run.name for run in r.runners))) for r in races)
+
+
+def timed_fetch(classes, sequential: bool):
+    gather = fi.gather_by_host
+    if sequential:
+        fi.gather_by_host = functools.partial(gather, limit=1)
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            db = fi.FortunaDB(os.path.join(tmp, "tips.db"))
+            asyncio.run(db.initialize())
+            t0 = time.perf_counter()
+            races = asyncio.run(fi.run_quarter_fetch({}, "Q3_261018", adapter_filter=[c.SOURCE_NAME for c in classes],
+                                                     force_fetch=True, db=db, prompt_missing=False))
+            return time.perf_counter() - t0, races
+    finally:
+        fi.gather_by_host = gather
+        os.chdir(cwd)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--adapters", type=int, default=10)
+    ap.add_argument("--scale", type=float, default=1.0)
+    args = ap.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+
+    classes = build_adapters(args.adapters, args.scale)
+    fi.get_discovery_adapter_classes = lambda: classes
+    t_seq, seq = timed_fetch(classes, sequential=True)
+    t_par, par = timed_fetch(classes, sequential=False)
+    assert snapshot(seq) == snapshot(par), "snapshots differ"
+
+    print(f"adapters={args.adapters} races={len(par)} (snapshots identical)")
+    print(f"one adapter at a time : {t_seq:7.2f}s")
+    print(f"host-aware concurrent : {t_par:7.2f}s  ({t_seq / t_par:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the race profile classifier in fortuna_interactive.
+
+Builds synthetic tips (50,000 by default) with a realistic mix of distance strings and
+classifies them three ways: the previous per-call classifier, the precompiled
+_classify_race_profile, and classify_race_profiles over the whole list. All three are
+checked to agree before per-call costs are reported.
+
+Usage: python scripts/benchmark_race_profile.py [--tips 50000] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import fortuna_interactive as fi  # noqa: E402
+
+DISTANCES = ["6f", "5f", "5.5f", "7f", "1m", "1 1/16m", "1m 1f", "6 furlongs", "0.75m", "1200m", "2m 4f", "", None, "Sprint"]
+
+
+def legacy_classify_race_profile(
+    total_active: int,
+    sec_fav_odds: float,
+    fav_odds: float,
+    distance: Optional[str],
+    race_type: Optional[str],
+) -> dict:
+    """The previous per-call classifier, kept here as the reference."""
+    # ── Distance parsing ──────────────────────────────────────────────
+    dist_str   = (distance or "").lower().strip()
+    is_sprint  = False   # Under 7 furlongs
+    is_six_fur = False   # Exactly ~6f (0.70–0.80 miles)
+
+    # Accept common formats: "6f", "6 furlongs", "1200m", "6.0f", "0.75m"
+    fur_match = None
+    import re
+    m = re.search(r"(\d+(?:\.\d+)?)\s*f(?:url)?", dist_str)
+    if m:
+        fur_match = float(m.group(1))
+    elif re.search(r"(\d+(?:\.\d+)?)\s*m(?:i|le)?", dist_str):
+        # Extract miles value specifically from the pattern (Hardening Fix)
+        mile_match = re.search(r"(\d+(?:\.\d+)?)\s*m", dist_str)
+        if mile_match:
+            miles = float(mile_match.group(1))
+            fur_match = miles * 8.0
+    elif re.search(r"(\d+)\s*m\b", dist_str):          # metres
+        metre_match = re.search(r"(\d+)\s*m\b", dist_str)
+        if metre_match:
+            metres = float(metre_match.group(1))
+            fur_match = metres / 201.168
+
+    if fur_match is not None:
+        is_sprint  = fur_match < 7.0
+        is_six_fur = 5.5 <= fur_match <= 6.5   # 6f ±0.5f tolerance
+
+    # ── Fav2Group tier ────────────────────────────────────────────────
+    fg_high    = sec_fav_odds >= 6.0            # dominant positive zone
+    fg_mid     = 5.0 <= sec_fav_odds < 6.0     # selective positives
+    fg_low     = sec_fav_odds < 5.0            # mostly negative
+
+    # ── Field-size groups ─────────────────────────────────────────────
+    in_goldmine_field = 7 <= total_active <= 11   # validated Goldmine range
+    in_small_field    = 5 <= total_active <= 6    # 55-family sweet spot
+    in_mid_field      = 8 <= total_active <= 10   # r8/r9/r10 focused slices
+
+    # ── Validated sweet-spot combos ───────────────────────────────────
+    #   r9 × 6f × sec_fav >= 4.5  (FvP hit 74 %, FAV_PS hit 76 %)
+    r9_six_fur = (total_active == 9 and is_six_fur and sec_fav_odds >= 4.5)
+
+    #   r10 × 6f × sec_fav >= 4.5  (FvP +4 %, TopTwoW +11 %)
+    r10_six_fur = (total_active == 10 and is_six_fur and sec_fav_odds >= 4.5)
+
+    #   r8 × route × sec_fav >= 4.5  (FvW +5.4 %, hit 60 %)
+    r8_route = (total_active == 8 and not is_sprint and sec_fav_odds >= 4.5)
+
+    #   55-family / Sup1x55 fires hard: small field + sec_fav >= 6.0
+    sup55_zone = (in_small_field and sec_fav_odds >= 6.0)
+
+    # ── Profile tag ───────────────────────────────────────────────────
+    if sec_fav_odds >= 6.0 and in_small_field:
+        profile = "sup55_prime"          # best 55-family superfecta zone
+    elif r9_six_fur:
+        profile = "r9_6f_sweet_spot"     # highest validated hit rate
+    elif r10_six_fur:
+        profile = "r10_6f_sweet_spot"
+    elif r8_route:
+        profile = "r8_route_sweet_spot"
+    elif sec_fav_odds >= 6.0 and in_goldmine_field:
+        profile = "goldmine_high_fav2"   # Fav2Group 6+ standard Goldmine
+    elif sec_fav_odds >= 6.0:
+        profile = "high_fav2"
+    elif in_goldmine_field and sec_fav_odds >= 4.5:
+        profile = "goldmine_standard"
+    else:
+        profile = "standard"
+
+    return {
+        "is_sprint":         is_sprint,
+        "is_six_fur":        is_six_fur,
+        "furlongs":          round(fur_match, 1) if fur_match is not None else None,
+        "fg_high":           fg_high,
+        "fg_mid":            fg_mid,
+        "fg_low":            fg_low,
+        "in_goldmine_field": in_goldmine_field,
+        "in_small_field":    in_small_field,
+        "in_mid_field":      in_mid_field,
+        "r9_six_fur":        r9_six_fur,
+        "r10_six_fur":       r10_six_fur,
+        "r8_route":          r8_route,
+        "sup55_zone":        sup55_zone,
+        "profile":           profile,
+    }
+
+
+def build_tips(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        (rng.randint(3, 14), round(rng.uniform(1.5, 12.0), 2), round(rng.uniform(1.1, 4.0), 2), rng.choice(DISTANCES), None)
+        for _ in range(count)
+    ]
+
+
+def timed(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        fi._distance_furlongs.cache_clear()  # no warm distance cache between runs
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--tips", type=int, default=50_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    tips = build_tips(args.tips)
+    t_old, old = timed(lambda: [legacy_classify_race_profile(*t) for t in tips], args.repeat)
+    t_new, new = timed(lambda: [fi._classify_race_profile(*t) for t in tips], args.repeat)
+    t_batch, batch = timed(lambda: fi.classify_race_profiles([t[0] for t in tips], [t[1] for t in tips], [t[3] for t in tips]), args.repeat)
+
+    assert new == old, "per-call classifications differ"
+    assert list(batch["profile"]) == [p["profile"] for p in old], "batch profiles differ"
+    for key in fi._PROFILE_FLAG_KEYS:
+        assert batch[key].tolist() == [p[key] for p in old], f"batch {key} differs"
+
+    per_call = lambda t: t / args.tips * 1e6  # noqa: E731
+    print(f"tips={args.tips} profiles={len(set(batch['profile']))} (outputs identical)")
+    print(f"previous classifier : {t_old:7.3f}s  {per_call(t_old):6.2f} us/call")
+    print(f"precompiled rules   : {t_new:7.3f}s  {per_call(t_new):6.2f} us/call  ({t_old / t_new:4.1f}x)")
+    print(f"batch (whole list)  : {t_batch:7.3f}s  {per_call(t_batch):6.2f} us/tip   ({t_old / t_batch:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the columnar RaceTable.
+
+Builds a synthetic global race day (1,500 races by default, 6-16 runners each,
+1-4 odds sources per runner) as pydantic models, then compares:
+  * memory held by the model list vs. the table (tracemalloc),
+  * per-race/per-runner scans (active field size, best win odds) on models vs. columns,
+  * generate_field_matrix / generate_summary_grid with and without the table.
+Every comparison asserts identical results, and the table is checked to
+round-trip back to equal models.
+
+Usage: python scripts/benchmark_race_table.py [--races 1500] [--repeat 5]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fortuna import (  # noqa: E402
+    OddsData, Race, RaceTable, Runner, _best_win_odds_value,
+    generate_field_matrix, generate_summary_grid, now_eastern,
+)
+
+VENUES = ["Ascot", "Flemington", "Gulfstream Park", "Santa Anita", "Romford", "Meadowlands",
+          "Sha Tin", "Tokyo", "Woodbine", "Kempton", "Randwick", "Towcester", "Yonkers", "Mohawk"]
+SOURCES = ["AtTheRaces", "SportingLife", "TwinSpires", "SkySports", "TAB", "Equibase"]
+
+
+def build_day(n_races: int, seed: int = 11):
+    rng = random.Random(seed)
+    base = now_eastern().replace(second=0, microsecond=0)
+    races = []
+    for i in range(n_races):
+        venue = VENUES[i % len(VENUES)] + ("" if i % 3 else " (GB)")
+        runners = []
+        for n in range(1, rng.randint(6, 16) + 1):
+            odds = {}
+            for src in rng.sample(SOURCES, rng.randint(1, 4)):
+                odds[src] = OddsData(win=round(rng.uniform(1.2, 60.0), 2), source=src)
+            runners.append(Runner(name=f"Runner {i}-{n}", number=n, scratched=rng.random() < 0.06,
+                                  odds=odds, metadata={"odds_source_trustworthy": True}))
+        races.append(Race(
+            id=f"x_{i}", venue=venue, race_number=i % 12 + 1, source=rng.choice(SOURCES),
+            start_time=base + timedelta(minutes=rng.randint(-60, 20 * 60)), runners=runners,
+            discipline="Thoroughbred", available_bets=["Exacta", "Trifecta"][: rng.randint(0, 2)],
+            metadata={"is_goldmine": rng.random() < 0.1, "1Gap2": round(rng.random(), 2)},
+        ))
+    return races
+
+
+def timed(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def model_scan(races):
+    sizes = [sum(1 for r in race.runners if not r.scratched) for race in races]
+    return sizes, [_best_win_odds_value(r) for race in races for r in race.runners]
+
+
+def column_scan(table):
+    table._derived.clear()
+    best = table.best_win_odds()
+    return table.active_field_sizes().tolist(), [None if np.isnan(b) else float(b) for b in best]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--races", type=int, default=1500)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    races = build_day(args.races)
+    model_bytes = tracemalloc.get_traced_memory()[0] - base
+    table = RaceTable.from_races(races)
+    assert table.to_races() == races, "table does not round-trip to the source models"
+
+    # Footprint of the table alone: drop the models, keep what the table still references
+    keep = table
+    del races
+    gc.collect()
+    table_bytes = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    races = keep.to_races()
+    t_build, table = timed(lambda: RaceTable.from_races(races), args.repeat)
+
+    runners = len(table.runner_race)
+    print(f"races={len(table)} runners={runners} odds={len(table.odds_runner)} (round-trip identical)")
+    print(f"memory  models: {model_bytes / 1e6:7.2f} MB   table: {table_bytes / 1e6:7.2f} MB"
+          f"  ({model_bytes / table_bytes:4.1f}x smaller; array buffers {table.nbytes() / 1e6:.2f} MB)")
+    print(f"build   RaceTable.from_races: {t_build * 1000:8.1f} ms")
+
+    t_models, ref = timed(lambda: model_scan(races), args.repeat)
+    t_cols, got = timed(lambda: column_scan(table), args.repeat)
+    assert got == ref, "column scan differs from model scan"
+    print(f"scan    models: {t_models * 1000:8.1f} ms   columns: {t_cols * 1000:8.1f} ms  ({t_models / t_cols:5.1f}x)")
+
+    for name, plain, columnar in [
+        ("field matrix", lambda: generate_field_matrix(races), lambda: generate_field_matrix(races, table=table)),
+        ("summary grid", lambda: generate_summary_grid(races, all_races=races),
+         lambda: generate_summary_grid(races, all_races=races, table=table)),
+    ]:
+        t_plain, out_plain = timed(plain, args.repeat)
+        t_table, out_table = timed(columnar, args.repeat)
+        assert out_plain == out_table, f"{name} output differs with table"
+        print(f"report  {name}: models {t_plain * 1000:8.1f} ms   table {t_table * 1000:8.1f} ms  ({t_plain / t_table:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
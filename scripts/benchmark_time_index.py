@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark for RaceTimeIndex MTP-window queries.
+
+Builds a synthetic day of races (5,000 by default) and answers the monitor's
+BET NOW window (-10 to 120 MTP) at successive refresh times, once with the
+previous linear scan and once by bisection on the shared index, checking that
+both return the same races before reporting timings.
+
+Usage: python scripts/benchmark_time_index.py [--races 5000] [--queries 1000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fortuna import Race, RaceTimeIndex, now_eastern  # noqa: E402
+
+
+def build_races(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    now = now_eastern()
+    return now, [
+        Race(id=f"r{i}", venue=f"Track {i % 60}", race_number=i % 12 + 1, source="Synthetic", runners=[],
+             start_time=now + timedelta(minutes=rng.uniform(-60, 1440)))
+        for i in range(count)
+    ]
+
+
+def linear_window(races, now, lo, hi):
+    """The previous per-call scan, kept here as the reference."""
+    out = []
+    for race in races:
+        mtp = (race.start_time - now).total_seconds() / 60
+        if lo < mtp <= hi:
+            out.append(race)
+    return out
+
+
+def timed(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--races", type=int, default=5_000)
+    ap.add_argument("--queries", type=int, default=1_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    now, races = build_races(args.races)
+    refreshes = [now + timedelta(seconds=30 * q) for q in range(args.queries)]
+
+    t_build, index = timed(lambda: RaceTimeIndex(races), args.repeat)
+    t_scan, scanned = timed(lambda: [linear_window(races, t, -10, 120) for t in refreshes], args.repeat)
+    t_index, indexed = timed(lambda: [index.mtp_window(-10, 120, now=t) for t in refreshes], args.repeat)
+
+    assert [sorted(map(id, w)) for w in indexed] == [sorted(map(id, w)) for w in scanned], "index windows differ from scan"
+
+    hits = sum(len(w) for w in scanned) / len(scanned)
+    print(f"races={args.races} queries={args.queries} avg_window={hits:.0f} (outputs identical)")
+    print(f"index build : {t_build:8.4f}s")
+    print(f"linear scan : {t_scan:8.4f}s")
+    print(f"bisection   : {t_index:8.4f}s  ({t_scan / t_index:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
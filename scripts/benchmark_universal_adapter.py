@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the declarative UniversalAdapter engine.
+
+Tiles the recorded TwinSpires race card (tests/fixtures/twinspires_racecard.html)
+into a multi-race page, parses it with the hand-written fortuna.TwinSpiresAdapter
+(on its selectolax path, so both sides use the same HTML parser) and with
+UniversalAdapter running definitions/twinspires.json, checks that both produce the
+same races and runners, and reports timings. The engine is timed cold (plan cache
+cleared before every run) and warm (plan compiled once and reused across pages).
+
+Usage: python scripts/benchmark_universal_adapter.py [--races 200] [--pages 5] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import fortuna  # noqa: E402
+from web_service.backend.adapters import universal_adapter  # noqa: E402
+from web_service.backend.adapters.universal_adapter import UniversalAdapter, load_definition  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "twinspires_racecard.html")
+DATE = "2026-02-01"
+
+
+class _Response:
+    url = "https://www.twinspires.com/bet/todays-races/time"
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+def build_page(card: str, races: int) -> str:
+    cards = [
+        card.replace("Race 5", f"Race {i % 12 + 1}").replace("Churchill Downs", f"Track {i // 12}")
+        for i in range(races)
+    ]
+    return "<html><body>" + "\n".join(cards) + "</body></html>"
+
+
+def fingerprint(races):
+    return [
+        (r.venue, r.race_number, [(run.number, run.name, run.scratched, run.win_odds) for run in r.runners])
+        for r in races
+    ]
+
+
+def timed(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--races", type=int, default=200, help="race cards per page")
+    ap.add_argument("--pages", type=int, default=5)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        pages = [build_page(f.read(), args.races)] * args.pages
+
+    fortuna.Selector = None
+    hand = fortuna.TwinSpiresAdapter()
+    definition = load_definition("twinspires.json")
+
+    def run_hand():
+        races = []
+        for html in pages:
+            extracted = hand._extract_races_from_page(_Response(html), DATE)
+            races.extend(hand._parse_races({"races": extracted, "date": DATE}))
+        return races
+
+    def run_engine(cold: bool):
+        if cold:
+            universal_adapter._PLAN_CACHE.clear()
+        adapter = UniversalAdapter(definition=definition)
+        return adapter._parse_races({"pages": [{"url": "fixture", "html": html} for html in pages], "date": DATE})
+
+    t_hand, hand_races = timed(run_hand, args.repeat)
+    t_cold, cold_races = timed(lambda: run_engine(True), args.repeat)
+    t_warm, warm_races = timed(lambda: run_engine(False), args.repeat)
+
+    reference = fingerprint(hand_races)
+    assert fingerprint(cold_races) == reference, "engine output differs from hand-written adapter"
+    assert fingerprint(warm_races) == reference, "warm engine output differs from hand-written adapter"
+
+    runners = sum(len(r.runners) for r in hand_races)
+    print(f"pages={args.pages} races={len(hand_races)} runners={runners} (outputs identical)")
+    print(f"hand-written TwinSpires : {t_hand:8.3f}s")
+    print(f"engine (cold plan)      : {t_cold:8.3f}s  ({t_hand / t_cold:5.1f}x)")
+    print(f"engine (cached plan)    : {t_warm:8.3f}s  ({t_hand / t_warm:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
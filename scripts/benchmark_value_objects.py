@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the monitor and auditor value objects.
+
+Measures:
+  * resident size (tracemalloc) of N RaceSummary objects, slotted vs the previous
+    dict-backed dataclass;
+  * time and retained memory for building the auditor results map and re-reading the
+    match keys (as tip matching and logging do), cached keys vs the previous
+    per-access properties.
+
+Both variants are checked to produce the same summaries / results map first.
+
+Usage: python scripts/benchmark_value_objects.py [--summaries 20000] [--results 5000] [--lookups 3]
+"""
+import argparse
+import dataclasses
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import fortuna  # noqa: E402
+from fortuna import EASTERN, RaceSummary, VenueResolver  # noqa: E402
+from fortuna_analytics import AuditorEngine, ResultRace, ResultRunner  # noqa: E402
+
+VENUES = ["Ascot", "Ayr", "Belmont Park", "Churchill Downs", "Flemington", "Gulfstream Park", "Kempton Park", "Sha Tin"]
+
+
+@dataclasses.dataclass
+class LegacyRaceSummary:
+    """The previous, dict-backed RaceSummary."""
+    discipline: str
+    track: str
+    race_number: int
+    field_size: int
+    superfecta_offered: bool
+    adapter: str
+    start_time: datetime
+    mtp: Optional[int] = None
+    second_fav_odds: Optional[float] = None
+    second_fav_name: Optional[str] = None
+    selection_number: Optional[int] = None
+    favorite_odds: Optional[float] = None
+    favorite_name: Optional[str] = None
+    top_five_numbers: Optional[str] = None
+    gap12: float = 0.0
+    is_goldmine: bool = False
+    is_best_bet: bool = False
+
+
+class LegacyResultRace(ResultRace):
+    """ResultRace with the previous per-access key properties."""
+
+    @property
+    def canonical_key(self) -> str:
+        d = self.start_time.strftime("%Y%m%d")
+        t = self.start_time.strftime("%H%M")
+        disc = (self.discipline or "T")[:1].upper()
+        return f"{fortuna.resolve_venue(self.venue)}|{self.race_number}|{d}|{t}|{disc}"
+
+    @property
+    def relaxed_key(self) -> str:
+        d = self.start_time.strftime("%Y%m%d")
+        disc = (self.discipline or "T")[:1].upper()
+        return f"{fortuna.resolve_venue(self.venue)}|{self.race_number}|{d}|{disc}"
+
+
+def legacy_results_map(results):
+    """The previous _build_results_map, kept here as the reference."""
+    mapping = {}
+    resolver = fortuna.get_venue_resolver()
+    for r in results:
+        resolver.observe(r.venue)
+        mapping[r.canonical_key] = r
+        mapping.setdefault(r.canonical_key.rsplit("|", 1)[0], r)
+        if r.relaxed_key != r.canonical_key:
+            if r.relaxed_key in mapping:
+                existing = mapping[r.relaxed_key]
+                if existing.canonical_key != r.canonical_key:
+                    continue
+            mapping[r.relaxed_key] = r
+    return mapping
+
+
+def summary_kwargs(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    now = datetime(2026, 10, 18, 12, 0, tzinfo=EASTERN)
+    for i in range(count):
+        yield dict(
+            discipline=rng.choice("THG"), track=rng.choice(VENUES), race_number=i % 12 + 1,
+            field_size=rng.randint(5, 14), superfecta_offered=rng.random() < 0.5, adapter="Synthetic",
+            start_time=now + timedelta(minutes=i % 1440), mtp=i % 1440, second_fav_odds=rng.uniform(2, 9),
+            second_fav_name=f"Runner {i}", selection_number=2, favorite_odds=rng.uniform(1.5, 4),
+            favorite_name=f"Fav {i}", top_five_numbers="1, 2, 3, 4, 5", gap12=rng.uniform(0, 3),
+        )
+
+
+def build_results(cls, count: int, seed: int = 11):
+    rng = random.Random(seed)
+    day = datetime(2026, 10, 18, 12, 0, tzinfo=EASTERN)
+    return [
+        cls(id=f"res_{i}", venue=VENUES[i % 8], race_number=(i % 96) // 8 + 1, source="Synthetic",
+            start_time=day + timedelta(days=i // 96, minutes=(i % 96) * 7), discipline=rng.choice(["Thoroughbred", "Harness"]),
+            runners=[ResultRunner(name=f"R{i}-{n}", number=n, position=str(n)) for n in range(1, 9)])
+        for i in range(count)
+    ]
+
+
+def measure(fn):
+    """(result, retained bytes, peak bytes) for fn()."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current - base, peak - base
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def audit_pass(results, build_map, lookups: int):
+    mapping = build_map(results)
+    for _ in range(lookups):  # tip matching and match logging re-read the keys
+        for r in results:
+            assert mapping.get(r.canonical_key) is r or r.relaxed_key
+    return mapping
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--summaries", type=int, default=20_000)
+    ap.add_argument("--results", type=int, default=5_000)
+    ap.add_argument("--lookups", type=int, default=3)
+    args = ap.parse_args()
+    fortuna._venue_resolver = VenueResolver(path=None)
+
+    kwargs = list(summary_kwargs(args.summaries))
+    legacy, legacy_bytes, _ = measure(lambda: [LegacyRaceSummary(**k) for k in kwargs])
+    slotted, slotted_bytes, _ = measure(lambda: [RaceSummary(**k) for k in kwargs])
+    assert [s.to_dict() for s in slotted] == [RaceSummary(**dataclasses.asdict(s)).to_dict() for s in legacy]
+
+    old_results = build_results(LegacyResultRace, args.results)
+    new_results = build_results(ResultRace, args.results)
+    old_map, old_kept, old_peak = measure(lambda: audit_pass(old_results, legacy_results_map, args.lookups))
+    new_map, new_kept, new_peak = measure(lambda: audit_pass(new_results, AuditorEngine._build_results_map, args.lookups))
+    assert {k: v.id for k, v in old_map.items()} == {k: v.id for k, v in new_map.items()}, "results maps differ"
+    cold = build_results(ResultRace, args.results)  # keys not yet cached
+    t_old = timed(lambda: audit_pass(old_results, legacy_results_map, args.lookups))
+    t_new = timed(lambda: audit_pass(cold, AuditorEngine._build_results_map, args.lookups))
+
+    print(f"summaries={args.summaries} results={args.results} lookups={args.lookups} (outputs identical)")
+    print(f"RaceSummary retained : {legacy_bytes / 2**20:7.2f} MiB -> {slotted_bytes / 2**20:7.2f} MiB "
+          f"({slotted_bytes / legacy_bytes:5.0%})")
+    print(f"audit pass retained  : {old_kept / 2**20:7.2f} MiB -> {new_kept / 2**20:7.2f} MiB")
+    print(f"audit pass peak      : {old_peak / 2**20:7.2f} MiB -> {new_peak / 2**20:7.2f} MiB")
+    print(f"audit pass time      : {t_old:7.3f}s     -> {t_new:7.3f}s     ({t_old / t_new:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -108,3 +108,33 @@ def test_handles_empty_runner_list(analyzer, create_race):
 
 def test_handles_none_race_object(analyzer):
     assert analyzer.is_race_qualified(None) is False
+
+
+def test_engine_single_pass_matches_individual_analyzers():
+    from decimal import Decimal
+
+    from python_service.analyzer import AnalyzerEngine
+    from python_service.models import OddsData
+
+    def build():
+        races = []
+        for i, prices in enumerate([("3.0", "4.0", "5.0"), ("2.0", "9.0", "12.0", "15.0"), ("4.0", "6.0")], start=1):
+            runners = [
+                Runner(number=n, name=f"R{n}", odds={"T": OddsData(win=Decimal(p), source="T", last_updated=datetime.now())})
+                for n, p in enumerate(prices, start=1)
+            ]
+            races.append(Race(id=f"race-{i}", venue="TEST", race_number=i, start_time=datetime.now(), runners=runners, source="test"))
+        return races
+
+    engine = AnalyzerEngine()
+    expected = {}
+    for name in engine.analyzers:
+        result = engine.get_analyzer(name).qualify_races(build())
+        expected[name] = [(r.id, r.qualification_score) for r in result["races"]]
+
+    combined = engine.qualify_all(build())
+
+    assert list(combined) == list(engine.analyzers)
+    for name, result in combined.items():
+        assert [r.id for r in result["races"]] == [rid for rid, _ in expected[name]]
+    assert combined["simply_success"]["races"][0].qualification_score == 100.0
@@ -147,4 +147,26 @@ async def test_race_aggregation_and_deduplication(mock_fetch, clear_cache):
     # If it merges into a dict, this passes. If it overwrites, adjust accordingly.
     odds_keys = runner["odds"].keys()
     assert "SourceA" in odds_keys
-    assert "SourceB" in odds_keys
\ No newline at end of file
+    assert "SourceB" in odds_keys
+
+def test_dedupe_races_leaves_adapter_output_untouched():
+    """Every returned race is a copy; the races it was given keep their own odds, runners and sources."""
+    engine = OddsEngine.__new__(OddsEngine)  # _dedupe_races needs no settings or connections
+    now = datetime.now()
+    race_a = Race(**create_mock_race("SourceA", "Ascot", 1, now, [{"number": 1, "name": "Horse X", "odds": "2.0"}, {"number": 2, "name": "Horse Y", "odds": "5.0"}]))
+    race_b = Race(**create_mock_race("SourceB", "Ascot", 1, now, [{"number": 1, "name": "Horse X", "odds": "2.2"}, {"number": 3, "name": "Horse Z", "odds": "9.0"}]))
+    race_c = Race(**create_mock_race("SourceC", "Ayr", 2, now, [{"number": 1, "name": "Horse Q", "odds": "3.0"}]))
+
+    merged = engine._dedupe_races([race_a, race_b, race_c])
+
+    assert [r.venue for r in merged] == ["Ascot", "Ayr"]
+    ascot = merged[0]
+    assert ascot.source == "SourceA, SourceB"
+    assert [r.number for r in ascot.runners] == [1, 2, 3]
+    assert set(ascot.runners[0].odds) == {"SourceA", "SourceB"}
+    # Inputs are unchanged; races are always copied, untouched runners are shared
+    assert race_a.source == "SourceA" and set(race_a.runners[0].odds) == {"SourceA"} and len(race_a.runners) == 2
+    assert ascot.runners[1] is race_a.runners[1]
+    assert merged[1] is not race_c and merged[1].runners is not race_c.runners and merged[1].runners == race_c.runners
+    merged[1].runners.append(race_a.runners[1])
+    assert len(race_c.runners) == 1
@@ -0,0 +1,108 @@
+# tests/test_fortuna_adapter_budgets.py
+import asyncio
+from datetime import datetime
+
+import pytest
+
+fi = pytest.importorskip("fortuna_interactive")
+
+START = datetime(2026, 10, 18, 14, 0, tzinfo=fi.EASTERN)
+
+
+def test_budget_follows_p95_within_floor_and_ceiling():
+    budgets = fi.AdapterTimeBudgets({
+        "Fast": [2.0, 3.0, 2.5, 3.5, 2.0, 3.0],
+        "Typical": [40.0, 42.0, 38.0, 45.0, 41.0],
+        "Slow": [200.0, 210.0, 190.0, 220.0, 205.0],
+        "New": [10.0, 12.0],
+    })
+
+    assert budgets.timeout("Fast") == fi.ADAPTER_TIMEOUT_FLOOR
+    assert budgets.timeout("Typical") == pytest.approx(2 * budgets.band("Typical")[1])
+    assert 80 < budgets.timeout("Typical") < 90
+    assert budgets.timeout("Slow") == fi.ADAPTER_TIMEOUT_CEILING
+    assert budgets.timeout("New") == budgets.timeout("Unknown") == fi.ADAPTER_TIMEOUT_CEILING
+
+
+def test_drift_is_relative_to_the_adapters_own_band():
+    budgets = fi.AdapterTimeBudgets({"Typical": [40.0, 42.0, 38.0, 45.0, 41.0]})
+
+    assert budgets.drift("Typical", 50.0) is None
+    assert budgets.drift("Typical", 80.0) == "slower"
+    assert budgets.drift("Typical", 5.0) == "faster"
+    assert budgets.drift("Unknown", 500.0) is None
+
+    for _ in range(fi.ADAPTER_LATENCY_WINDOW):
+        budgets.observe("Typical", 80.0)
+    assert budgets.drift("Typical", 80.0) is None and len(budgets.latencies["Typical"]) == fi.ADAPTER_LATENCY_WINDOW
+
+
+def test_harvest_durations_round_trip_without_failed_runs(tmp_path):
+    db = fi.FortunaDB(str(tmp_path / "tips.db"))
+
+    async def run():
+        for seconds in (1.0, 2.0, 3.0):
+            await db.log_harvest({"A": {"count": 5, "seconds": seconds, "status": 200}, "B": {"count": 0, "seconds": 0.1, "status": "error"}})
+        await db.log_harvest({"A": 7, "C": {"count": 0, "seconds": 30.0, "status": "timeout"}})
+        await db.log_harvest({"C": {"count": 0, "seconds": 30.0, "status": "timeout"}})
+        return await db.get_adapter_latencies(limit=2), await db.get_adapter_timeout_streaks()
+
+    assert asyncio.run(run()) == ({"A": [3.0, 2.0]}, {"C": 2})
+
+
+def test_timeouts_widen_the_budget_in_capped_steps_without_entering_the_band():
+    budgets = fi.AdapterTimeBudgets({"Typical": [40.0, 42.0, 38.0, 45.0, 41.0]})
+    base = budgets.timeout("Typical")
+
+    widened = []
+    for _ in range(5):
+        budgets.observe_timeout("Typical")
+        widened.append(budgets.timeout("Typical"))
+
+    assert widened[:3] == pytest.approx([base * 1.5, base * 2.25, base * 3.375])
+    assert widened[3:] == [widened[2]] * 2
+    assert budgets.latencies["Typical"] == [40.0, 42.0, 38.0, 45.0, 41.0]
+    budgets.observe("Typical", 41.0)
+    assert "Typical" not in budgets.timeouts and budgets.timeout("Typical") < widened[0]
+
+
+class SleepyAdapter:
+    SOURCE_NAME = "Sleepy"
+
+    def __init__(self, config=None):
+        pass
+
+    async def get_races(self, date_str):
+        await asyncio.sleep(0.5)
+        return [fi.Race(id="r1", venue="Aqueduct", race_number=1, source="Sleepy", start_time=START,
+                        runners=[fi.Runner(name=f"H{n}", number=n) for n in (1, 2)])]
+
+    async def close(self):
+        pass
+
+
+def test_quarter_fetch_uses_and_updates_learned_budget(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(fi, "get_discovery_adapter_classes", lambda: [SleepyAdapter])
+    db = fi.FortunaDB(str(tmp_path / "tips.db"))
+
+    async def fetch():
+        races = await fi.run_quarter_fetch({}, "Q3_261018", adapter_filter=["Sleepy"], force_fetch=True, db=db)
+        return races, (await db.get_adapter_latencies())["Sleepy"]
+
+    # History says Sleepy answers in 0.1s, so a 0.2s budget cuts this 0.5s run short
+    for _ in range(5):
+        asyncio.run(db.log_harvest({"Sleepy": {"count": 1, "seconds": 0.1, "status": 200}}))
+    load = fi.AdapterTimeBudgets.load.__func__
+    monkeypatch.setattr(fi.AdapterTimeBudgets, "load", classmethod(lambda cls, db: load(cls, db, floor=0.01)))
+
+    # Each consecutive timeout widens the budget by one step (0.2 -> 0.3 -> 0.45 -> 0.675)
+    # while the hung runs stay out of the latency history
+    for streak in (1, 2, 3):
+        races, latencies = asyncio.run(fetch())
+        assert races == [] and latencies == [0.1] * 5
+        assert asyncio.run(db.get_adapter_timeout_streaks()) == {"Sleepy": streak}
+
+    races, latencies = asyncio.run(fetch())
+    assert len(races) == 1 and 0.5 <= latencies[0] < 0.6
+    assert asyncio.run(db.get_adapter_timeout_streaks()) == {}
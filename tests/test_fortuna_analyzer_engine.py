@@ -0,0 +1,151 @@
+# tests/test_fortuna_analyzer_engine.py
+import sys
+from datetime import timedelta
+
+import pytest
+
+import fortuna
+from fortuna import AnalyzerEngine, BaseAnalyzer, OddsData, Race, Runner, now_eastern
+
+
+def _race(number, prices, trusted=True):
+    return Race(
+        id=f"race_{number}", venue="Ascot", race_number=number, source="S",
+        start_time=now_eastern() + timedelta(minutes=30),
+        runners=[Runner(name=f"R{n}", number=n, metadata={"odds_source_trustworthy": trusted},
+                        odds={"S": OddsData(win=p, source="S")}) for n, p in enumerate(prices, start=1)],
+    )
+
+
+def _races():
+    return [
+        _race(1, [2.5, 4.0, 6.0, 9.0]),
+        _race(2, [3.0, 5.5, 7.0]),
+        _race(3, [2.2, 3.0, 12.0, 15.0, 20.0, 25.0, 30.0]),
+        _race(4, [4.0, 4.0, 4.0]),
+        _race(5, [2.5, 4.0, 6.0], trusted=False),
+    ]
+
+
+def test_single_pass_matches_running_each_analyzer():
+    engine = AnalyzerEngine()
+    expected = {}
+    for name in engine.analyzers:
+        result = engine.get_analyzer(name).qualify_races(_races())
+        expected[name] = (result["criteria"], [(r.id, r.qualification_score) for r in result["races"]])
+
+    combined = engine.qualify_all(_races())
+
+    assert list(combined) == ["trifecta", "tiny_field_trifecta", "simply_success"]
+    for name, result in combined.items():
+        # Same races in the same (score) order; the race objects are shared, so their
+        # qualification_score now holds the last analyzer's value
+        assert (result["criteria"], [r.id for r in result["races"]]) == (expected[name][0], [rid for rid, _ in expected[name][1]])
+    assert [r.qualification_score for r in combined["simply_success"]["races"]] == [s for _, s in expected["simply_success"][1]]
+
+
+def test_features_are_computed_once_per_race(monkeypatch):
+    calls = []
+    real = fortuna.race_features
+    monkeypatch.setattr(fortuna, "race_features", lambda race: calls.append(race.id) or real(race))
+
+    AnalyzerEngine().qualify_all(_races())
+
+    assert sorted(calls) == sorted(r.id for r in _races())
+
+
+def test_analyzers_without_a_per_race_step_run_on_their_own():
+    class Everything(BaseAnalyzer):
+        def qualify_races(self, races):
+            return {"criteria": {}, "races": list(races)}
+
+    engine = AnalyzerEngine()
+    engine.register_analyzer("everything", Everything)
+
+    results = engine.qualify_all(_races(), names=["everything", "tiny_field_trifecta"], overrides={"tiny_field_trifecta": {}})
+
+    assert len(results["everything"]["races"]) == 5
+    assert [r.id for r in results["tiny_field_trifecta"]["races"]] == [r.id for r in AnalyzerEngine().get_analyzer("tiny_field_trifecta").qualify_races(_races())["races"]]
+
+
+
+def test_single_pass_is_an_explicit_capability():
+    class HalfDone(fortuna.SinglePassAnalyzer):
+        def qualify_races(self, races):
+            return {"criteria": {}, "races": []}
+
+        def qualify_race(self, race, feats=None):
+            return True
+
+    with pytest.raises(TypeError):
+        HalfDone()
+    assert isinstance(AnalyzerEngine().get_analyzer("trifecta"), fortuna.SinglePassAnalyzer)
+
+
+PLUGIN_SOURCE = '''
+from fortuna import BaseAnalyzer
+
+class EveryRace(BaseAnalyzer):
+    def qualify_races(self, races):
+        return {"criteria": {"plugin": True}, "races": list(races)}
+'''
+
+
+def test_plugins_are_imported_only_when_selected(tmp_path, monkeypatch):
+    (tmp_path / "lazy_fortuna_plugin.py").write_text(PLUGIN_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_fortuna_plugin", raising=False)
+    registry = fortuna.AnalyzerRegistry(entry_points=False)
+
+    engine = AnalyzerEngine({"analyzers": {"every_race": "lazy_fortuna_plugin:EveryRace"}}, registry=registry)
+
+    assert "every_race" in engine.analyzers and list(engine.analyzers)[-1] == "every_race"
+    assert registry.loaded() == [] and "lazy_fortuna_plugin" not in sys.modules
+
+    result = engine.qualify("every_race", _races())
+
+    assert len(result["races"]) == 5
+    assert registry.loaded() == ["every_race"]
+    timing = registry.timings()["every_race"]
+    assert timing["import"] > 0 and timing["first_evaluation"] > 0
+
+
+def test_entry_points_are_read_lazily_and_registrations_stay_local(monkeypatch):
+    calls = []
+
+    class EntryPoint:
+        name, value = "from_package", "fortuna:SimplySuccessAnalyzer"
+
+    monkeypatch.setattr(fortuna.importlib.metadata, "entry_points", lambda group: calls.append(group) or [EntryPoint()])
+    registry = fortuna.AnalyzerRegistry()
+    engine = AnalyzerEngine(registry=registry)
+    engine.register_analyzer("local_only", fortuna.TrifectaAnalyzer)
+    engine.get_analyzer("simply_success")
+    assert calls == []
+
+    assert "from_package" in list(engine.analyzers) and calls == [fortuna.ANALYZER_ENTRY_POINT_GROUP]
+    assert "local_only" not in registry and "local_only" not in AnalyzerEngine(registry=registry).analyzers
+    with pytest.raises(ValueError):
+        engine.get_analyzer("missing")
+
+
+def test_shared_pass_records_first_evaluation():
+    registry = fortuna.AnalyzerRegistry(entry_points=False)
+
+    AnalyzerEngine(registry=registry).qualify_all(_races(), names=["simply_success", "trifecta"])
+
+    assert set(registry.loaded()) == {"simply_success", "trifecta"}
+    assert all(t["first_evaluation"] is not None for t in registry.timings().values())
+
+
+def test_broken_plugin_target_is_reported_as_missing():
+    registry = fortuna.AnalyzerRegistry({"broken": "no_such_fortuna_plugin:Nope", "typo": "fortuna:NoSuchAnalyzer"},
+                                        entry_points=False)
+    engine = AnalyzerEngine(registry=registry)
+
+    for name in ("broken", "typo"):
+        with pytest.raises(KeyError):
+            registry[name]
+        with pytest.raises(ValueError, match=f"Analyzer '{name}' not found."):
+            engine.get_analyzer(name)
+    assert registry.loaded() == []
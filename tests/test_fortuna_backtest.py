@@ -0,0 +1,101 @@
+# tests/test_fortuna_backtest.py
+import asyncio
+import json
+import random
+import sqlite3
+from datetime import timedelta
+
+import pytest
+
+fi = pytest.importorskip("fortuna_interactive")
+
+START = fi.now_eastern() + timedelta(hours=2)
+
+
+def _card(count=150, seed=5):
+    rng = random.Random(seed)
+    races = []
+    for i in range(count):
+        prices = sorted(round(rng.uniform(1.2, 25.0), 2) for _ in range(rng.randint(5, 12)))
+        races.append(fi.Race(
+            id=f"race_{i}", venue="Aqueduct", race_number=i % 12 + 1, source="S", discipline="Thoroughbred",
+            start_time=START + timedelta(minutes=i), distance=rng.choice(["6f", "1m", "5.5f", None]),
+            runners=[
+                fi.Runner(name=f"Horse {i}-{n}", number=n, metadata={"odds_source_trustworthy": True},
+                          odds={src: fi.OddsData(win=p, source=src) for src in ("S", "T")[:rng.randint(1, 2)]})
+                for n, p in enumerate(prices, start=1)
+            ],
+        ))
+    return races
+
+
+def _qualified(analysis=None):
+    result = fi.SimplySuccessAnalyzer({"analysis": analysis or {}}).qualify_races(_card())
+    return [r for r in result["races"] if r.metadata.get("predicted_fav_odds") is not None]
+
+
+@pytest.fixture
+def frame(tmp_path):
+    db_path = str(tmp_path / "tips.db")
+    db = fi.FortunaDB(db_path)
+    asyncio.run(db.initialize())
+    rng = random.Random(9)
+    rows = []
+    for n, race in enumerate(_qualified()):
+        cashed = rng.random() < 0.6
+        rows.append((
+            race.id, race.venue, race.race_number, race.discipline, fi.to_storage_format(race.start_time),
+            fi.to_storage_format(race.start_time - timedelta(minutes=2 + n % 12)), int(race.metadata["is_goldmine"]),
+            race.metadata["gap_abs"], race.metadata["predicted_fav_odds"], race.metadata["predicted_2nd_fav_odds"],
+            len([r for r in race.runners if not r.scratched]), len(race.metadata.get("goldmine_sources", [])),
+            "CASHED" if cashed else "BURNED", 1.1 if cashed else -2.0, 3.1 if cashed else None,
+        ))
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO tips (race_id, venue, race_number, discipline, start_time, report_date, is_goldmine, gap_abs, "
+            "predicted_fav_odds, predicted_2nd_fav_odds, field_size, goldmine_sources, verdict, net_profit, "
+            "top1_place_payout, audit_completed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)", rows,
+        )
+    snapshots = tmp_path / "snapshots"
+    snapshots.mkdir()
+    (snapshots / "Q3_races.json").write_text(json.dumps([{"id": r.id, "distance": r.distance} for r in _card()]))
+    return fi.load_backtest_frame(db_path, snapshot_dir=str(snapshots))
+
+
+def test_default_thresholds_replay_the_logged_tips(frame):
+    logged = _qualified()
+    row = fi.run_backtest(frame, {}).summary.iloc[0]
+
+    assert len(frame) == len(logged) > 20
+    assert row["tips"] == len(logged)
+    assert row["best_bet_tips"] == sum(r.metadata["is_best_bet"] for r in logged)
+    assert row["goldmine_tips"] == sum(r.metadata["is_goldmine"] for r in logged)
+    assert row["profit"] == pytest.approx(frame["net_profit"].sum())
+    assert sorted(frame["profile"]) == sorted(r.metadata["race_profile"] for r in logged)
+
+
+def test_grid_matches_rerunning_the_analyzer(frame, monkeypatch):
+    grid = {"second_fav_floor": [4.5, 6.0], "goldmine_gap_min": [2.0, 3.5], "Thoroughbred.min_gap12": [0.75, 2.5]}
+    summary = fi.run_backtest(frame, grid).summary
+
+    assert len(summary) == 8 and summary["tips"].nunique() > 1 and summary["goldmine_tips"].nunique() > 1
+    for _, row in summary.iterrows():
+        monkeypatch.setitem(fi.DISCIPLINE_THRESHOLDS["Thoroughbred"], "min_gap12", row["Thoroughbred.min_gap12"])
+        rerun = _qualified({"second_fav_floor": row["second_fav_floor"], "goldmine_gap_min": row["goldmine_gap_min"]})
+        assert row["tips"] == len(rerun)
+        assert row["best_bet_tips"] == sum(r.metadata["is_best_bet"] for r in rerun)
+        assert row["goldmine_tips"] == sum(r.metadata["is_goldmine"] for r in rerun)
+
+
+def test_mtp_window_and_profile_split(frame):
+    result = fi.run_backtest(frame, {"scoring_mtp_max": [5, 15]})
+
+    assert result.summary["tips"].tolist() == [(frame["mtp"] <= 5).sum(), len(frame)]
+    per_combo = result.by_profile.groupby("scoring_mtp_max")[["tips", "hits", "profit"]].sum()
+    assert per_combo["tips"].tolist() == result.summary["tips"].tolist()
+    assert per_combo["profit"].to_numpy() == pytest.approx(result.summary["profit"].to_numpy())
+
+
+def test_unknown_parameter_is_rejected(frame):
+    with pytest.raises(ValueError):
+        fi.run_backtest(frame, {"second_fav_flor": [5.0]})
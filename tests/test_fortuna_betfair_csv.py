@@ -0,0 +1,36 @@
+# tests/test_fortuna_betfair_csv.py
+from io import StringIO
+
+from fortuna import BetfairDataScientistAdapter
+
+CSV = """meetings.races.bfExchangeMarketId,meetings.name,meetings.races.raceNumber,meetings.races.startTime,meetings.races.runners.runnerName,meetings.races.runners.clothNumber,meetings.races.runners.ratedPrice
+1.300000002,Randwick,2,2026-10-18T04:10:00.000Z,Beta (AUS),1,4.5
+1.300000001,Flemington,1,2026-10-18T03:00:00.000Z,Alpha,1,3.2
+1.300000001,Flemington,1,2026-10-18T03:00:00.000Z,Bravo,2,
+1.300000002,Randwick,2,2026-10-18T04:10:00.000Z,Gamma,2,12.0
+,Nowhere,9,,Orphan,1,5.0
+"""
+
+
+def _summary(races):
+    return [(r.id, r.venue, r.race_number, r.start_time.isoformat(), [(run.number, run.name, next(iter(run.odds.values())).win if run.odds else None) for run in r.runners]) for r in races]
+
+
+def test_grouped_ingestion_builds_sorted_markets():
+    races = BetfairDataScientistAdapter()._parse_races(StringIO(CSV))
+
+    assert _summary(races) == [
+        ("1.300000001", "Flemington", 1, "2026-10-17T23:00:00-04:00", [(1, "Alpha", 3.2), (2, "Bravo", None)]),
+        ("1.300000002", "Randwick", 2, "2026-10-18T00:10:00-04:00", [(1, "Beta", 4.5), (2, "Gamma", 12.0)]),
+    ]
+
+
+def test_chunked_ingestion_matches_single_read():
+    whole = BetfairDataScientistAdapter()._parse_races(StringIO(CSV))
+    chunked = BetfairDataScientistAdapter(config={"csv_chunksize": 1})._parse_races(StringIO(CSV))
+    assert _summary(chunked) == _summary(whole)
+
+
+def test_bad_cloth_number_still_rejects_file():
+    bad = CSV.replace("Gamma,2,12.0", "Gamma,,12.0")
+    assert BetfairDataScientistAdapter()._parse_races(StringIO(bad)) == []
@@ -0,0 +1,118 @@
+# tests/test_fortuna_daemon.py
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+fi = pytest.importorskip("fortuna_interactive")
+
+MORNING = datetime(2026, 10, 18, 9, 0, tzinfo=fi.EASTERN)
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(fi, "resolve_daypart_from_dt", lambda dt: fi.DayPart.Q1 if dt.hour < 12 else fi.DayPart.Q3)
+    calls = []
+
+    async def fake_fetch(config, tag, **kwargs):
+        calls.append(("fetch", tag, kwargs["db"], kwargs["adapters"]))
+        return [fi.Race(id=f"{tag}_r1", venue="Aqueduct", race_number=1, source="S", start_time=MORNING, runners=[])]
+
+    async def fake_score(config, tag, loaded_races=None, **kwargs):
+        calls.append(("score", tag, kwargs["db"], kwargs["analyzer"], loaded_races))
+        return []
+
+    monkeypatch.setattr(fi, "run_quarter_fetch", fake_fetch)
+    monkeypatch.setattr(fi, "run_score_now", fake_score)
+    d = fi.DayPartDaemon({}, score_interval=300, fetch_retry=600, db=fi.FortunaDB(str(tmp_path / "tips.db")))
+    audits = []
+
+    async def fake_audit(tag):
+        audits.append(tag)
+
+    d.audit = fake_audit
+    d.calls, d.audits = calls, audits
+    return d
+
+
+def test_schedule_reuses_warm_resources(daemon):
+    async def day():
+        return [
+            await daemon.tick(MORNING),
+            await daemon.tick(MORNING + timedelta(minutes=1)),
+            await daemon.tick(MORNING + timedelta(minutes=5)),
+            await daemon.tick(MORNING.replace(hour=13)),
+        ]
+
+    ran = asyncio.run(day())
+
+    assert ran == [["fetch", "score"], [], ["score"], ["fetch", "score", "audit"]]
+    assert daemon.audits == ["Q1_261018"]
+    fetches = [c for c in daemon.calls if c[0] == "fetch"]
+    scores = [c for c in daemon.calls if c[0] == "score"]
+    assert [c[1] for c in fetches] == ["Q1_261018", "Q3_261018"]
+    assert all(c[2] is daemon.db and c[3] is daemon.adapters for c in fetches)
+    assert scores[0][3] is scores[1][3] and scores[0][4] is scores[1][4]
+    assert scores[2][3] is not scores[0][3] and list(daemon.races) == ["Q3_261018"]
+
+
+def test_failing_job_is_isolated_and_retried(daemon, monkeypatch):
+    attempts = []
+
+    async def broken_fetch(config, tag, **kwargs):
+        attempts.append(tag)
+        if len(attempts) == 1:
+            raise RuntimeError("site down")
+        return []
+
+    monkeypatch.setattr(fi, "run_quarter_fetch", broken_fetch)
+    monkeypatch.setattr(fi, "load_quarter_snapshot", lambda tag: None)
+
+    async def day():
+        return [await daemon.tick(MORNING + timedelta(minutes=m)) for m in (0, 5, 10)]
+
+    assert asyncio.run(day()) == [["fetch"], [], ["fetch", "score"]]
+    assert daemon.stats["fetch"].runs == 2 and daemon.stats["fetch"].failures == 1
+    assert daemon.stats["fetch"].last_error == "RuntimeError: site down"
+    assert daemon.races["Q1_261018"] == []
+
+
+class PooledAdapter:
+    SOURCE_NAME = "PoolTest"
+    created, closed = [], []
+
+    def __init__(self, config=None):
+        self.fail = False
+        PooledAdapter.created.append(self)
+
+    async def get_races(self, date_str):
+        if self.fail:
+            raise RuntimeError("session expired")
+        return [fi.Race(id="pool_r1", venue="Aqueduct", race_number=1, source="PoolTest", start_time=MORNING,
+                        runners=[fi.Runner(name=f"H{n}", number=n) for n in (1, 2)])]
+
+    async def close(self):
+        PooledAdapter.closed.append(self)
+
+
+def test_quarter_fetch_keeps_pooled_adapters_open(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(fi, "get_discovery_adapter_classes", lambda: [PooledAdapter])
+    PooledAdapter.created.clear()
+    PooledAdapter.closed.clear()
+    db = fi.FortunaDB(str(tmp_path / "tips.db"))
+    pool = {}
+
+    async def fetch():
+        return await fi.run_quarter_fetch({}, "Q3_261018", adapter_filter=["PoolTest"], force_fetch=True, db=db, adapters=pool)
+
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+
+    assert len(first) == len(second) == 1
+    assert PooledAdapter.created == list(pool.values()) and not PooledAdapter.closed
+
+    pool["PoolTest:GLOBAL"].fail = True
+    asyncio.run(fetch())
+    assert not pool and PooledAdapter.closed == PooledAdapter.created
@@ -0,0 +1,131 @@
+# tests/test_fortuna_history_store.py
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import fortuna
+from fortuna import EASTERN, PredictionHistoryStore, VenueResolver
+
+DAY = datetime(2026, 10, 10, 12, 0, tzinfo=EASTERN)
+
+
+@pytest.fixture(autouse=True)
+def resolver(monkeypatch):
+    monkeypatch.setattr(fortuna, "_venue_resolver", VenueResolver(path=None))
+
+
+def _records(days=4, per_day=50):
+    out = []
+    for d in range(days):
+        for i in range(per_day):
+            logged = DAY + timedelta(days=d, minutes=i)
+            out.append({"race_id": f"track{i % 5}|{i // 5 + 1}|{logged:%Y%m%d}", "track": f"Track {i % 5}",
+                        "start_time": (logged + timedelta(minutes=30)).isoformat(), "logged_at": logged.isoformat()})
+    return out
+
+
+def test_rotates_by_day_and_size_and_compresses_closed_segments(tmp_path):
+    store = PredictionHistoryStore(str(tmp_path), max_segment_bytes=4096)
+    records = _records()
+    for n in range(0, len(records), 25):
+        store.append(records[n:n + 25])
+
+    names = [s.name for s in store.segments]
+    assert len({s.day for s in store.segments}) == 4 and len(names) > 4
+    assert all(n.endswith(".jsonl.gz") for n in names[:-1]) and names[-1].endswith(".jsonl")
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(names + ["index"])
+    assert sorted(p.name for p in (tmp_path / "index").iterdir()) == sorted(f"{n.split('.')[0]}.json" for n in names)
+    assert list(store.records()) == records
+    assert list(PredictionHistoryStore(str(tmp_path)).records()) == records   # index survives a reopen
+
+
+def test_range_queries_only_open_matching_segments(tmp_path, monkeypatch):
+    store = PredictionHistoryStore(str(tmp_path), max_segment_bytes=4096)
+    records = _records()
+    store.append(records)
+    opened = []
+    read = store._read_segment
+    monkeypatch.setattr(store, "_read_segment", lambda seg: opened.append(seg.name) or read(seg))
+
+    start, end = DAY + timedelta(days=1, minutes=10), DAY + timedelta(days=2)
+    got = list(store.records(start, end))
+    assert got == [r for r in records if start.isoformat() <= r["logged_at"] < end.isoformat()]
+    assert {n[:10] for n in opened} == {"2026-10-11"}
+
+    opened.clear()
+    race_id = records[-1]["race_id"]
+    assert [r["race_id"] for r in store.records(race_id=race_id)] == [race_id]
+    assert len(opened) == 1
+    assert len(list(store.records(race_date="2026-10-12"))) == 50
+
+
+def test_legacy_file_is_imported_and_torn_index_recovered(tmp_path):
+    legacy = tmp_path / "prediction_history.jsonl"
+    records = _records(days=1, per_day=10)
+    legacy.write_text("".join(json.dumps(r) + "\n" for r in records) + "{torn\n")
+    root = tmp_path / "history"
+
+    store = PredictionHistoryStore(str(root), legacy_path=str(legacy))
+    assert asyncio.run(store.import_legacy()) == 10
+    assert list(store.records()) == records and not legacy.exists()
+
+    # a crash after the segment write but before the index write
+    with open(root / store.active.name, "a") as f:
+        f.write(json.dumps(dict(records[0], logged_at=records[-1]["logged_at"])) + "\n")
+    assert len(list(PredictionHistoryStore(str(root)).records())) == 11
+
+
+def test_append_rewrites_only_the_touched_index_entries(tmp_path, monkeypatch):
+    store = PredictionHistoryStore(str(tmp_path), max_segment_bytes=4096)
+    records = _records(days=2)
+    store.append(records[:80])
+    written = []
+    write = fortuna.atomic_write_bytes
+    monkeypatch.setattr(fortuna, "atomic_write_bytes", lambda path, payload: written.append(path) or write(path, payload))
+
+    store.append(records[80:81])
+    assert written == [str(tmp_path / "index" / f"{store.active.name.split('.')[0]}.json")]
+
+
+def test_interrupted_import_resumes_after_the_last_saved_chunk(tmp_path, monkeypatch):
+    legacy = tmp_path / "prediction_history.jsonl"
+    records = _records(days=2, per_day=25)
+    legacy.write_text("".join(json.dumps(r) + "\n" for r in records))
+    root = tmp_path / "history"
+    monkeypatch.setattr(PredictionHistoryStore, "IMPORT_CHUNK_RECORDS", 10)
+
+    store = PredictionHistoryStore(str(root), legacy_path=str(legacy))
+    append, calls = store.append, []
+
+    def crash_on_third_chunk(chunk):
+        calls.append(len(chunk))
+        if len(calls) == 3:
+            raise OSError("disk full")
+        return append(chunk)
+
+    monkeypatch.setattr(store, "append", crash_on_third_chunk)
+    with pytest.raises(OSError):
+        asyncio.run(store.import_legacy())
+    assert not legacy.exists() and (tmp_path / "prediction_history.jsonl.importing").exists()
+
+    store = PredictionHistoryStore(str(root), legacy_path=str(legacy))
+    assert len(list(store.records())) == 20
+    assert asyncio.run(store.import_legacy()) == 30
+    assert list(store.records()) == records and (tmp_path / "prediction_history.jsonl.imported").exists()
+    assert not (tmp_path / "prediction_history.jsonl.importing.offset").exists()
+
+
+def test_single_file_index_is_migrated_to_entries(tmp_path):
+    store = PredictionHistoryStore(str(tmp_path), max_segment_bytes=4096)
+    records = _records(days=2)
+    store.append(records)
+    (tmp_path / "index.json").write_bytes(fortuna.fast_json_dumps({"segments": [s.to_dict() for s in store.segments]}))
+    for entry in (tmp_path / "index").iterdir():
+        entry.unlink()
+    (tmp_path / "index").rmdir()
+
+    reopened = PredictionHistoryStore(str(tmp_path))
+    assert list(reopened.records()) == records and not (tmp_path / "index.json").exists()
+    assert len(list((tmp_path / "index").iterdir())) == len(store.segments)
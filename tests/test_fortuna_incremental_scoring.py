@@ -0,0 +1,88 @@
+# tests/test_fortuna_incremental_scoring.py
+from datetime import timedelta
+
+import pytest
+
+fi = pytest.importorskip("fortuna_interactive")
+
+START = fi.now_eastern() + timedelta(minutes=10)
+
+
+def _race(race_id, prices, number=1):
+    return fi.Race(
+        id=race_id, venue="Aqueduct", race_number=number, source="S", discipline="Thoroughbred",
+        start_time=START,
+        runners=[fi.Runner(name=f"Horse {n}", number=n, metadata={"odds_source_trustworthy": True},
+                           odds={"S": fi.OddsData(win=p, source="S")}) for n, p in enumerate(prices, start=1)],
+    )
+
+
+def _card():
+    return [
+        _race("qualifies", [2.0, 7.0, 9.0, 12.0, 15.0, 20.0], number=1),
+        _race("chalky", [1.2, 1.4, 9.0, 12.0, 15.0, 20.0], number=2),
+    ]
+
+
+def _card_scored():
+    card = _card()
+    fi.SimplySuccessAnalyzer({}).qualify_races(card)
+    return card
+
+
+def test_fingerprint_tracks_odds_scratchings_and_time():
+    base = fi.race_fingerprint(_race("r", [2.0, 7.0, 9.0]))
+    assert fi.race_fingerprint(_race("r", [2.0, 7.0, 9.0])) == base
+
+    race = _race("r", [2.0, 7.0, 9.0])
+    race.runners[1].odds["S"] = fi.OddsData(win=6.5, source="S")
+    assert fi.race_fingerprint(race) != base
+    race = _race("r", [2.0, 7.0, 9.0])
+    race.runners[2].scratched = True
+    assert fi.race_fingerprint(race) != base
+    race = _race("r", [2.0, 7.0, 9.0])
+    race.start_time += timedelta(minutes=5)
+    assert fi.race_fingerprint(race) != base
+
+
+def test_only_changed_races_are_rescored(tmp_path, monkeypatch):
+    path = str(tmp_path / "Q1_scores.json")
+    first = fi.SimplySuccessAnalyzer({})
+    full = first.qualify_changed_races(_card())
+    first.save_evaluations(path)
+
+    seen = []
+    second = fi.SimplySuccessAnalyzer({})
+    real = second.qualify_races
+    monkeypatch.setattr(second, "qualify_races", lambda races, now=None: seen.append([r.id for r in races]) or real(races, now=now))
+    assert second.load_evaluations(path) == 2
+
+    card = _card()
+    again = second.qualify_changed_races(card)
+
+    # The rejected race is unchanged and restored; the qualified one is re-checked
+    assert seen == [["qualifies"]]
+    assert [r.id for r in again["races"]] == [r.id for r in full["races"]] == ["qualifies"]
+    assert card[1].top_five_numbers == _card_scored()[1].top_five_numbers
+
+
+def test_in_batch_duplicates_are_not_cached_as_rejected():
+    analyzer = fi.SimplySuccessAnalyzer({})
+    prices = [2.0, 7.0, 9.0, 12.0, 15.0, 20.0]
+    first = analyzer.qualify_changed_races([_race("original", prices), _race("copy", prices, number=2)])
+
+    assert [r.id for r in first["races"]] == ["original"] and analyzer.batch_rejected == {"copy"}
+    assert "copy" not in analyzer.evaluations
+
+    # The original leaves the card, so the unchanged copy is no longer a duplicate and qualifies
+    again = analyzer.qualify_changed_races([_race("copy", prices, number=2)])
+    assert [r.id for r in again["races"]] == ["copy"]
+
+
+def test_config_change_discards_saved_fingerprints(tmp_path):
+    path = str(tmp_path / "Q1_scores.json")
+    analyzer = fi.SimplySuccessAnalyzer({})
+    analyzer.qualify_changed_races(_card())
+    analyzer.save_evaluations(path)
+
+    assert fi.SimplySuccessAnalyzer({"analysis": {"gap_abs_min": 2.0}}).load_evaluations(path) == 0
@@ -0,0 +1,68 @@
+# tests/test_fortuna_interactive_tab_adapter.py
+import asyncio
+import json
+
+import pytest
+
+fi = pytest.importorskip("fortuna_interactive")
+
+
+def _meeting(name, mtype="R", runners=True):
+    race = {"raceNumber": 1, "raceStartTime": "2026-10-18T03:00:00.000Z"}
+    if runners:
+        race["runners"] = [{"runnerName": "Alpha", "runnerNumber": 1, "fixedOdds": {"returnWin": 3.4}}]
+    return {"meetingName": name, "meetingType": mtype, "races": [race]}
+
+
+class FakeTab:
+    def __init__(self, listings, fail=()):
+        self.listings, self.fail = listings, set(fail)
+        self.in_flight = self.peak = 0
+        self.urls = []
+
+    async def __call__(self, method, url, **kwargs):
+        self.urls.append(url)
+        if "/meetings?" in url:
+            j = url.rsplit("=", 1)[1]
+            return fi.UnifiedResponse(text=json.dumps({"meetings": self.listings.get(j, [])}), status=200, status_code=200, url=url)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        name = url.split("/")[-1].split("?")[0]
+        if name in self.fail:
+            return fi.UnifiedResponse(text="", status=500, status_code=500, url=url)
+        return fi.UnifiedResponse(text=json.dumps(_meeting(name)), status=200, status_code=200, url=url)
+
+
+def test_meeting_details_fetched_concurrently_under_host_cap():
+    names = [f"Track{i}" for i in range(10)]
+    fake = FakeTab({"VIC": [_meeting(n, runners=False) for n in names]})
+    adapter = fi.TabAdapter(config={"host_concurrency": 3})
+    adapter.make_request = fake
+
+    data = asyncio.run(adapter._fetch_data("261018"))
+
+    assert [m["meetingName"] for m in data["meetings"]] == names
+    assert all(m["races"][0].get("runners") for m in data["meetings"])
+    assert 1 < fake.peak <= 3
+    assert all("/dates/2026-10-18/" in u for u in fake.urls)
+
+
+def test_partial_results_and_multiple_jurisdictions():
+    fake = FakeTab(
+        {"VIC": [_meeting("Flemington", runners=False)], "NSW": [_meeting("Flemington", runners=False), _meeting("Randwick", runners=False)]},
+        fail={"Randwick"},
+    )
+    adapter = fi.TabAdapter(config={"jurisdictions": "VIC,NSW"})
+    adapter.make_request = fake
+
+    data = asyncio.run(adapter._fetch_data("261018"))
+
+    # Flemington is fetched once (via VIC); Randwick falls back to its summary
+    assert [m["meetingName"] for m in data["meetings"]] == ["Flemington", "Randwick"]
+    assert data["meetings"][0]["races"][0]["runners"]
+    assert "runners" not in data["meetings"][1]["races"][0]
+    assert sum("Flemington?" in u for u in fake.urls) == 1
+    assert any(u.endswith("Randwick?jurisdiction=NSW") for u in fake.urls)
+    assert len(adapter._parse_races(data)) == 2
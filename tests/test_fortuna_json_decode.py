@@ -0,0 +1,59 @@
+# tests/test_fortuna_json_decode.py
+import json
+
+import pytest
+from selectolax.parser import HTMLParser
+
+import fortuna
+from fortuna import SportingLifeAdapter, decode_json_subtree, fast_json_loads
+
+NEXT_DATA = json.dumps({
+    "props": {"pageProps": {"race": {"race_summary": {"course_name": "Ascot"}}, "meetings": [{"races": []}]}},
+    "buildId": "abc",
+})
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_subtree_matches_full_decode(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(fortuna, "orjson", None)
+    full = json.loads(NEXT_DATA)
+    assert decode_json_subtree(NEXT_DATA, ["props", "pageProps", "race"], anchor="pageProps") == full["props"]["pageProps"]["race"]
+    assert decode_json_subtree(NEXT_DATA, ["props", "pageProps", "meetings"], anchor="pageProps") == [{"races": []}]
+    assert decode_json_subtree(NEXT_DATA, ["props", "missing", "race"]) is None
+    # An anchor that is not unique falls back to a full decode
+    assert decode_json_subtree(NEXT_DATA, ["props", "pageProps", "race", "race_summary"], anchor="race") == {"course_name": "Ascot"}
+
+
+def test_anchor_is_only_trusted_at_its_place_in_the_path(monkeypatch):
+    monkeypatch.setattr(fortuna, "orjson", None)
+    nested = json.dumps({"props": {"cache": {"pageProps": {"race": "stale"}}, "list": [{"x": 1}]}, "buildId": "abc"})
+    in_list = json.dumps({"props": [{"pageProps": {"race": "stale"}}]})
+
+    # A unique anchor at the wrong depth, or under a list, falls back to a full decode
+    assert decode_json_subtree(nested, ["props", "pageProps", "race"], anchor="pageProps") is None
+    assert decode_json_subtree(in_list, ["props", "pageProps", "race"], anchor="pageProps") is None
+    assert fortuna._json_key_path_at(nested, nested.index('"pageProps"')) == ["props", "cache"]
+    assert fortuna._json_key_path_at(nested, nested.index('pageProps')) is None
+
+    # A verified anchor is decoded on its own, without the whole document
+    monkeypatch.setattr(fortuna, "fast_json_loads", lambda text: pytest.fail("full decode"))
+    escaped = json.dumps({"note": 'say "hi" {[', "props": {"pageProps": {"race": "live"}}})
+    assert decode_json_subtree(escaped, ["props", "pageProps", "race"], anchor="pageProps") == "live"
+
+
+def test_fast_loads_keeps_stdlib_semantics():
+    assert fast_json_loads('{"a": NaN}')["a"] != fast_json_loads('{"a": NaN}')["a"]
+    with pytest.raises(json.JSONDecodeError):
+        fast_json_loads("{not json")
+
+
+def test_script_decode_is_recorded_in_metrics():
+    adapter = SportingLifeAdapter()
+    parser = HTMLParser(f'<html><script id="__NEXT_DATA__" type="application/json">{NEXT_DATA}</script></html>')
+
+    race = adapter._parse_json_from_script(parser, "script#__NEXT_DATA__", path=["props", "pageProps", "race"], anchor="pageProps")
+
+    assert race["race_summary"]["course_name"] == "Ascot"
+    snap = adapter.metrics.snapshot()
+    assert snap["json_decodes"] == 1 and snap["json_decode_bytes"] == len(NEXT_DATA)
@@ -0,0 +1,70 @@
+# tests/test_fortuna_json_writer.py
+import json
+import os
+from datetime import timedelta
+
+import pytest
+
+import fortuna
+from fortuna import FavoriteToPlaceMonitor, JsonChangeWriter, RaceSummary, VenueResolver, now_eastern
+
+
+@pytest.fixture(autouse=True)
+def resolver(monkeypatch):
+    monkeypatch.setattr(fortuna, "_venue_resolver", VenueResolver(path=None))
+
+
+def _doc(races, stamp="t0"):
+    return {"generated_at": stamp, "total_races": len(races), "all_races": races}
+
+
+def _race(track, number, odds=5.0, mtp=30):
+    return {"track": track, "race_number": number, "start_time": "2026-10-18T14:30:00-04:00", "mtp": mtp,
+            "second_fav_odds": odds}
+
+
+def test_unchanged_content_is_not_rewritten(tmp_path):
+    path = tmp_path / "out" / "race_data.json"
+    writer = JsonChangeWriter(str(path))
+
+    assert writer.write(_doc([_race("Ascot", 1)]))
+    stat = path.stat()
+    assert not writer.write(_doc([_race("Ascot", 1)], stamp="t1"))   # only the timestamp moved
+    assert not writer.write(_doc([_race("Ascot", 1, mtp=29)], stamp="t2"))   # mtp is derived from start_time
+    assert path.stat().st_mtime_ns == stat.st_mtime_ns
+    assert writer.write(_doc([_race("Ascot", 1, odds=4.5, mtp=28)], stamp="t3"))
+
+    raw = path.read_text(encoding="utf-8")
+    assert "\n" not in raw and json.loads(raw)["generated_at"] == "t3" and json.loads(raw)["all_races"][0]["mtp"] == 28
+    assert (writer.writes, writer.skips) == (2, 2)
+    assert os.listdir(path.parent) == ["race_data.json"]
+
+
+def test_delta_lists_changed_and_removed_races(tmp_path):
+    delta_path = tmp_path / "race_data.delta.json"
+    writer = JsonChangeWriter(str(tmp_path / "race_data.json"), delta_path=str(delta_path))
+
+    writer.write(_doc([_race("Ascot", 1), _race("Ayr", 2)]))
+    assert len(json.loads(delta_path.read_text())["changed"]) == 2
+
+    writer.write(_doc([_race("Ascot", 1, mtp=20), _race("Bath", 3, odds=6.0)], stamp="t1"))
+    delta = json.loads(delta_path.read_text())
+    assert [r["track"] for r in delta["changed"]] == ["Bath"]         # mtp ticks are not changes
+    assert delta["removed"] == ["Ayr|2|2026-10-18T14:30:00-04:00"]
+    assert delta["generated_at"] == "t1" and delta["digest"] == writer.digest
+
+
+def test_monitor_save_skips_repeat_writes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    now = now_eastern()
+    monitor = FavoriteToPlaceMonitor(config={"race_data_delta": True})
+    monitor._set_race_map({"k": RaceSummary(discipline="T", track="Ascot", race_number=1, field_size=8, superfecta_offered=True,
+                                          adapter="A", start_time=now + timedelta(minutes=30), mtp=30)})
+
+    monitor.save_to_json()
+    monitor.save_to_json()
+
+    writer = monitor.json_writers["race_data.json"]
+    assert (writer.writes, writer.skips) == (1, 1)
+    assert json.loads((tmp_path / "race_data.json").read_text())["all_races"][0]["track"] == "Ascot"
+    assert (tmp_path / "race_data.delta.json").exists()
@@ -0,0 +1,101 @@
+# tests/test_fortuna_merge_store.py
+import threading
+from datetime import timedelta
+
+import pytest
+
+import fortuna
+from fortuna import (
+    OddsData, Race, RaceMergeStore, Runner, SimplySuccessAnalyzer, VenueResolver, now_eastern,
+)
+
+
+@pytest.fixture(autouse=True)
+def resolver(monkeypatch):
+    monkeypatch.setattr(fortuna, "_venue_resolver", VenueResolver(path=None))
+
+
+def _race(source, venue="Ascot", number=1, runners=((1, "Alpha", 3.0), (2, "Bravo", 6.0))):
+    return Race(
+        id=f"{source}_{venue}_{number}", venue=venue, race_number=number, source=source,
+        start_time=now_eastern() + timedelta(minutes=20),
+        runners=[Runner(name=n, number=no, metadata={"odds_source_trustworthy": True},
+                        odds={source: OddsData(win=w, source=source)}) for no, n, w in runners],
+    )
+
+
+def test_ingest_merges_runners_odds_and_sources():
+    store = RaceMergeStore()
+    events = store.ingest([_race("A")], source="A")
+    events += store.ingest([_race("B", runners=((2, "Bravo", 5.5), (3, "Charlie", 9.0))), _race("B", venue="Ayr")], source="B")
+
+    assert [(e.kind, e.key.split("|")[0], e.source) for e in events] == [("added", "ascot", "A"), ("updated", "ascot", "B"), ("added", "ayr", "B")]
+    ascot = store.races()[0]
+    assert ascot.source == "A, B"
+    assert [r.number for r in ascot.runners] == [1, 2, 3]
+    assert set(ascot.runners[1].odds) == {"A", "B"}
+
+
+def test_subscribers_can_qualify_on_arrival():
+    store, analyzer, qualified = RaceMergeStore(), SimplySuccessAnalyzer(), []
+    store.subscribe(lambda e: qualified.append(e.key) if analyzer.qualify_race(e.race) else None)
+
+    store.ingest([_race("A")], source="A")
+
+    assert len(qualified) == 1
+    assert store.races()[0].metadata["selection_number"] == 2
+
+
+def test_concurrent_ingest_keeps_one_race_per_key():
+    store = RaceMergeStore()
+    threads = [threading.Thread(target=store.ingest, args=([_race(f"S{i}", number=n) for n in range(1, 6)],)) for i in range(8)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+
+    assert len(store) == 5
+    assert all(len(r.source.split(", ")) == 8 for r in store.races())
+
+
+def test_read_only_probe_leaves_the_merged_race_untouched():
+    store, analyzer, qualified = RaceMergeStore(), SimplySuccessAnalyzer(), []
+    store.subscribe(lambda e: qualified.append(e.key) if analyzer.accepts(e.race) else None)
+    late = _race("B", runners=((1, "Alpha", 2.5), (2, "Bravo", 7.0)))
+    for runner in late.runners:
+        runner.win_odds = runner.odds["B"].win
+
+    store.ingest([_race("A")], source="A")
+    store.ingest([late], source="B")
+
+    merged = store.races()[0]
+    assert qualified and "selection_number" not in merged.metadata and merged.qualification_score is None
+    assert [r.win_odds for r in merged.runners] == [2.5, 7.0]
+    assert analyzer.qualify_race(merged) and merged.metadata["selection_number"] == 2
+
+
+def test_merge_follows_priority_whatever_the_arrival_order():
+    first = _race("A", runners=((1, "Alpha", 3.0),))
+    first.distance = "1m"
+    second = _race("B", runners=((2, "Bravo", 5.5), (1, "Alpha", 3.2)))
+    second.distance, second.start_time = "8f", first.start_time
+    second.runners[0].win_odds = 5.5
+    third = _race("C", runners=((3, "Charlie", 9.0), (2, "Bravo", 6.0)))
+    third.start_time = first.start_time
+    third.runners[1].win_odds = 6.0
+
+    def merged(order):
+        store = RaceMergeStore()
+        parts = [(i, race.model_copy(deep=True)) for i, race in enumerate((first, second, third))]
+        delivered = [p[1].model_dump() for p in parts]
+        for i in order:
+            store.ingest([parts[i][1]], source=parts[i][1].source, priority=parts[i][0])
+        # Only the first arrival is merged into; later copies stay as delivered
+        assert all(parts[i][1].model_dump() == delivered[i] for i in order[1:])
+        assert store.races()[0] is parts[order[0]][1]
+        return store.races()[0]
+
+    expected = merged([0, 1, 2])
+    assert expected.distance == "1m" and [r.number for r in expected.runners] == [1, 2, 3]
+    assert expected.runners[1].win_odds == 5.5 and set(expected.runners[0].odds) == {"A", "B"}
+    for order in ([2, 1, 0], [1, 2, 0], [0, 2, 1], [2, 0, 1]):
+        race = merged(order)
+        assert race.model_dump() == expected.model_dump(), order
@@ -0,0 +1,130 @@
+# tests/test_fortuna_monitor_events.py
+import asyncio
+import json
+import threading
+from datetime import timedelta
+
+import pytest
+
+import fortuna
+from fortuna import (
+    FavoriteToPlaceMonitor, MonitorEvent, MonitorEventBus, RaceSummary, VenueResolver, build_monitor_event_app,
+    now_eastern, serve_monitor_events,
+)
+
+
+@pytest.fixture(autouse=True)
+def resolver(monkeypatch):
+    monkeypatch.setattr(fortuna, "_venue_resolver", VenueResolver(path=None))
+
+
+def _summary(track, mtp, odds=5.0):
+    return RaceSummary(discipline="T", track=track, race_number=1, field_size=8, superfecta_offered=True, adapter="A",
+                       start_time=now_eastern() + timedelta(minutes=mtp), mtp=mtp, second_fav_odds=odds, gap12=1.0)
+
+
+def _monitor(tmp_path, monkeypatch, **races):
+    monkeypatch.chdir(tmp_path)
+    monitor = FavoriteToPlaceMonitor(events=MonitorEventBus())
+    monitor._set_race_map({monitor._summary_key(s): s for s in races.values()})
+    return monitor
+
+
+def test_bus_filters_kinds_replays_and_unsubscribes():
+    bus = MonitorEventBus(history=2)
+    got, offs = [], []
+    unsubscribe = bus.subscribe(got.append)
+    bus.subscribe(offs.append, kinds={"off"})
+    bus.subscribe(lambda e: 1 / 0)  # a failing subscriber does not stop delivery
+
+    bus.publish([MonitorEvent("qualified", "a", _summary("Ascot", 30)), MonitorEvent("off", "b", _summary("Ayr", 0))])
+    unsubscribe()
+    bus.publish([MonitorEvent("dropped", "a", _summary("Ascot", 30))])
+
+    assert [e.seq for e in got] == [1, 2] and [e.kind for e in offs] == ["off"]
+    assert [e.seq for e in bus.since(1)] == [2, 3]
+
+
+def test_monitor_publishes_only_deltas(tmp_path, monkeypatch):
+    ascot, ayr = _summary("Ascot", 30), _summary("Ayr", 60)
+    monitor = _monitor(tmp_path, monkeypatch, Ascot=ascot, Ayr=ayr)
+    kinds = lambda events: [(e.kind, e.summary.track) for e in events]  # noqa: E731
+
+    assert kinds(monitor.publish_changes()) == [("qualified", "Ascot"), ("qualified", "Ayr")]
+    assert monitor.publish_changes() == []
+
+    ascot.second_fav_odds = 5.3                     # below the 0.5 threshold
+    ayr.second_fav_odds = 3.5                       # falls out of BET NOW
+    assert kinds(monitor.publish_changes()) == [("dropped", "Ayr")]
+    ascot.second_fav_odds = 5.6
+    moved = monitor.publish_changes()
+    assert kinds(moved) == [("odds_moved", "Ascot")] and moved[0].previous_odds == 5.0
+
+    ascot.mtp = 0
+    assert kinds(monitor.publish_changes()) == [("off", "Ascot")]
+    ascot.mtp = -12
+    assert monitor.publish_changes() == []
+
+
+def test_saved_json_carries_events_since_last_save(tmp_path, monkeypatch):
+    ascot = _summary("Ascot", 30)
+    monitor = _monitor(tmp_path, monkeypatch, Ascot=ascot)
+    monitor.publish_changes()
+    monitor.save_to_json()
+    first = json.loads((tmp_path / "race_data.json").read_text())
+    ascot.second_fav_odds = 7.0
+    monitor.publish_changes()
+    monitor.save_to_json()
+    second = json.loads((tmp_path / "race_data.json").read_text())
+
+    assert [e["kind"] for e in first["events"]] == ["qualified"]
+    assert [e["kind"] for e in second["events"]] == ["odds_moved"] and second["events"][0]["race"]["second_fav_odds"] == 7.0
+
+
+class FakeWebSocket:
+    def __init__(self, since=None):
+        self.query_params = {"since": since} if since else {}
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+
+def test_websocket_replays_then_streams_events_from_other_threads():
+    bus = MonitorEventBus()
+    bus.publish([MonitorEvent("qualified", "a", _summary("Ascot", 30)), MonitorEvent("qualified", "b", _summary("Ayr", 40))])
+    ws = FakeWebSocket(since="1")
+
+    async def run():
+        task = asyncio.create_task(serve_monitor_events(ws, bus))
+        await asyncio.sleep(0.01)
+        publisher = threading.Thread(target=bus.publish, args=([MonitorEvent("off", "b", _summary("Ayr", 0))],))
+        publisher.start()
+        publisher.join()
+        for _ in range(100):
+            if len(ws.sent) == 2:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(run())
+    assert [(e["seq"], e["kind"]) for e in ws.sent] == [(2, "qualified"), (3, "off")]
+
+
+def test_monitor_app_streams_published_events_over_ws():
+    from fastapi.testclient import TestClient
+
+    bus = MonitorEventBus()
+    bus.publish([MonitorEvent("qualified", "a", _summary("Ascot", 30))])
+    monitor = FavoriteToPlaceMonitor(events=bus)
+    monitor._set_race_map({monitor._summary_key(s): s for s in [_summary("Ayr", 40)]})
+
+    with TestClient(build_monitor_event_app(bus)).websocket_connect("/ws/monitor?since=0") as ws:
+        assert ws.receive_json()["race"]["track"] == "Ascot"
+        monitor.publish_changes()
+        event = ws.receive_json()
+
+    assert (event["seq"], event["kind"], event["race"]["track"]) == (2, "qualified", "Ayr")
@@ -0,0 +1,87 @@
+# tests/test_fortuna_odds_refresh.py
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+import fortuna
+from fortuna import (
+    FavoriteToPlaceMonitor, OddsData, OddsRefreshScheduler, Race, RaceSummary, Runner, VenueResolver, now_eastern,
+)
+
+
+@pytest.fixture(autouse=True)
+def resolver(monkeypatch):
+    monkeypatch.setattr(fortuna, "_venue_resolver", VenueResolver(path=None))
+
+
+def _summary(venue, minutes, now):
+    return RaceSummary(discipline="T", track=venue, race_number=1, field_size=8, superfecta_offered=True,
+                       adapter="TwinSpiresAdapter", start_time=now + timedelta(minutes=minutes), mtp=minutes)
+
+
+def _race(venue, number, minutes, now, second=5.0):
+    prices = [2.0, second, 9.0, 12.0]
+    return Race(
+        id=f"{venue}_{number}", venue=venue, race_number=number, source="TwinSpires",
+        start_time=now + timedelta(minutes=minutes),
+        runners=[Runner(name=f"H{n}", number=n, odds={"TwinSpires": OddsData(win=p, source="TwinSpires")})
+                 for n, p in enumerate(prices, start=1)],
+    )
+
+
+class FakeAdapter:
+    def __init__(self, name, source, races):
+        self.SOURCE_NAME = source
+        self.__class__ = type(name, (FakeAdapter,), {})
+        self.races, self.calls = races, []
+
+    async def get_races(self, date):
+        self.calls.append(date)
+        return list(self.races)
+
+    async def shutdown(self):
+        pass
+
+
+def test_cadence_tightens_towards_post():
+    sched = OddsRefreshScheduler()
+    assert [sched.interval(m) for m in (-12, -3, 5, 10, 45, 120, 121, None)] == [None, 30, 30, 60, 300, 600, None, None]
+
+
+def test_plan_batches_pages_respects_budget_and_cadence():
+    now = now_eastern()
+    sched = OddsRefreshScheduler(budget_per_minute=1)
+    races = {f"k{i}": _summary(f"Track{i}", m, now) for i, m in enumerate([3, 4, 50, 200])}
+    for key in races:
+        sched.track(key, "TwinSpiresAdapter", now=0.0)
+    sched.track("k2", "NYRABetsAdapter", now=0.0)
+    races["k5"] = _summary("Untracked", 2, now)
+
+    first = sched.plan(races.items(), now=30.0)
+    assert [(b.adapter, b.keys, b.mtp) for b in first] == [("TwinSpiresAdapter", ["k0", "k1"], 3)]
+    assert sched.plan(races.items(), now=45.0) == []           # 5-minute races wait 30s
+    assert sched.plan(races.items(), now=60.0) == []           # due, but this minute's request is spent
+    assert sched.budget_left(now=90.0) == 1
+    later = sched.plan(races.items(), now=300.0)
+    assert [(b.adapter, b.keys) for b in later] == [("TwinSpiresAdapter", ["k0", "k1", "k2"])]
+    assert sched.requests == 2
+
+
+def test_monitor_refreshes_only_carrying_adapters():
+    now = now_eastern()
+    near, far = _race("Ascot", 1, 4, now), _race("Ayr", 2, 600, now)
+    ts = FakeAdapter("TwinSpiresAdapter", "TwinSpires", [near, far])
+    other = FakeAdapter("EquibaseAdapter", "Equibase", [_race("Bath", 1, 3, now)])
+    monitor = FavoriteToPlaceMonitor(target_dates=[now.strftime("%Y-%m-%d")])
+    monitor.adapters = [ts, other]
+    asyncio.run(monitor.build_race_summaries([(near, "TwinSpiresAdapter"), (far, "TwinSpiresAdapter"),
+                                              (other.races[0], "EquibaseAdapter")]))
+
+    ts.races = [_race("Ascot", 1, 4, now, second=7.5), far]
+    monitor.refresh_scheduler.clock = lambda: 1e9  # long after discovery
+
+    assert asyncio.run(monitor.refresh_due_odds()) == 2
+    assert ts.calls == [now.strftime("%Y-%m-%d")] and other.calls == []
+    ascot = next(r for r in monitor.get_bet_now_races() if r.track == "Ascot")
+    assert ascot.second_fav_odds == 7.5 and ascot in monitor.all_races
@@ -0,0 +1,50 @@
+# tests/test_fortuna_odds_values.py
+from decimal import Decimal
+
+from fortuna import (
+    OddsData, Race, Runner, SimplySuccessAnalyzer, _best_win_odds_value,
+    _get_best_win_odds, is_valid_odds, now_eastern, odds_value,
+)
+
+
+def _legacy_best(runner):
+    """The previous Decimal-per-access implementation, kept as the reference."""
+    if not runner.odds and runner.win_odds and is_valid_odds(runner.win_odds):
+        return Decimal(str(runner.win_odds))
+    valid = [Decimal(str(od.win)) for od in runner.odds.values() if is_valid_odds(od.win)]
+    if valid:
+        return min(valid)
+    if runner.win_odds and is_valid_odds(runner.win_odds):
+        return Decimal(str(runner.win_odds))
+    return None
+
+
+def test_float_values_match_decimal_path():
+    prices = [3.5, Decimal("4.50"), "6.25", 7, 2.75, 1000.0, 1.0, 1.333, Decimal("12.125"), None]
+    runners = [Runner(name="A", odds={f"S{i}": OddsData(win=p, source=f"S{i}")}) for i, p in enumerate(prices)]
+    runners += [Runner(name="B", win_odds=5.5), Runner(name="C", odds={"X": OddsData(win=3.1, source="X"), "Y": OddsData(win="2.9", source="Y")})]
+
+    for r in runners:
+        legacy = _legacy_best(r)
+        assert _best_win_odds_value(r) == (None if legacy is None else float(legacy))
+        assert _get_best_win_odds(r) == legacy
+
+    # Ordering is preserved, so sorting by floats gives the same runner order
+    values = [odds_value(p) for p in prices if p is not None]
+    decimals = [Decimal(str(p)) for p in prices if p is not None]
+    assert sorted(range(len(values)), key=values.__getitem__) == sorted(range(len(decimals)), key=decimals.__getitem__)
+
+
+def test_gap_keeps_exact_decimal_difference():
+    # 12.13 - 9.355 is 2.7750000000000004 in floats but exactly 2.775 in decimal
+    runners = [
+        Runner(name=f"R{n}", number=n, win_odds=w, metadata={"odds_source_trustworthy": True},
+               odds={"S": OddsData(win=w, source="S")})
+        for n, w in enumerate([9.355, 12.13, 20.0], 1)
+    ]
+    race = Race(id="x", venue="Ascot", race_number=1, start_time=now_eastern(), source="S", runners=runners)
+
+    qualified = SimplySuccessAnalyzer().qualify_races([race])["races"]
+
+    assert qualified[0].metadata["1Gap2"] == round(float(Decimal("12.13") - Decimal("9.355")), 2) == 2.77
+    assert qualified[0].metadata["predicted_2nd_fav_odds"] == 12.13
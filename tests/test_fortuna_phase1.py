@@ -0,0 +1,117 @@
+# tests/test_fortuna_phase1.py
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+fi = pytest.importorskip("fortuna_interactive")
+
+START = datetime(2026, 10, 18, 14, 0, tzinfo=fi.EASTERN)
+
+
+def test_gather_by_host_limits_and_isolates():
+    active = {"all": 0, "a": 0, "peak_all": 0, "peak_a": 0}
+    finished = []
+
+    async def fetch(item):
+        host, n = item
+        active["all"] += 1
+        active[host] = active.get(host, 0) + 1
+        active["peak_all"] = max(active["peak_all"], active["all"])
+        active["peak_a"] = max(active["peak_a"], active.get("a", 0))
+        await asyncio.sleep(0.01)
+        active["all"] -= 1
+        active[host] -= 1
+        if n == 3:
+            raise RuntimeError("boom")
+        return n
+
+    items = [("a", 0), ("a", 1), ("b", 2), ("c", 3), ("d", 4), ("e", 5)]
+    results = asyncio.run(fi.gather_by_host(items, fetch, lambda item: item[0], limit=3, per_host=1,
+                                            on_result=lambda i, r: finished.append(i)))
+
+    assert results[:3] == [0, 1, 2] and results[4:] == [4, 5] and isinstance(results[3], RuntimeError)
+    assert active["peak_all"] == 3 and active["peak_a"] == 1 and sorted(finished) == list(range(6))
+
+
+def make_adapter(name, delay, host, odds=True, missing_until_retry=False):
+    class Adapter:
+        SOURCE_NAME = name
+        BASE_URL = f"https://{host}"
+        PROVIDES_ODDS = odds
+        calls = 0
+
+        def __init__(self, config=None):
+            self.manual_fetch_misses = []
+
+        async def get_races(self, date_str):
+            type(self).calls += 1
+            await asyncio.sleep(delay)
+            if missing_until_retry and type(self).calls == 1:
+                self.manual_fetch_misses.append({"url": f"https://{host}/card", "file": f"manual_fetch/{name}.html"})
+                return []
+            return [fi.Race(id=f"{name}_r1", venue=f"Track {name}", race_number=1, source=name, start_time=START,
+                            runners=[fi.Runner(name=f"H{n}", number=n) for n in (1, 2)])]
+
+        async def close(self):
+            pass
+
+    return Adapter
+
+
+@pytest.fixture
+def quarter(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    merged = []
+    ingest = fi.RaceMergeStore.ingest
+
+    def recording_ingest(self, races, source=None):
+        merged.append(source)
+        return ingest(self, races, source=source)
+
+    monkeypatch.setattr(fi.RaceMergeStore, "ingest", recording_ingest)
+    db = fi.FortunaDB(str(tmp_path / "tips.db"))
+
+    def run(classes, **kwargs):
+        monkeypatch.setattr(fi, "get_discovery_adapter_classes", lambda: classes)
+        names = [c.SOURCE_NAME for c in classes]
+        return asyncio.run(fi.run_quarter_fetch({}, "Q3_261018", adapter_filter=names, force_fetch=True, db=db, **kwargs))
+
+    run.merged = merged
+    return run
+
+
+def test_phase1_runs_concurrently_but_merges_in_tier_order(quarter):
+    classes = [
+        make_adapter("Slow", 0.4, "slow.example"), make_adapter("Quick", 0.05, "quick.example"),
+        make_adapter("Mid", 0.2, "mid.example"), make_adapter("Discovery", 0.05, "disc.example", odds=False),
+        make_adapter("SameHost", 0.2, "slow.example", odds=False),
+    ]
+
+    t0 = time.perf_counter()
+    races = quarter(classes, prompt_missing=False)
+    elapsed = time.perf_counter() - t0
+
+    assert len(races) == 5
+    assert quarter.merged == ["Slow", "Quick", "Mid", "Discovery", "SameHost"]
+    # Slow and SameHost share a host so they run back to back; everything else overlaps
+    assert 0.6 <= elapsed < 0.6 + 0.5
+
+
+def test_missing_pages_are_prompted_once_and_retried(quarter, monkeypatch, tmp_path, capsys):
+    prompts = []
+    monkeypatch.setattr("builtins.input", lambda text: prompts.append(text) or "")
+    classes = [
+        make_adapter("First", 0.05, "first.example", missing_until_retry=True),
+        make_adapter("Second", 0.05, "second.example"),
+        make_adapter("Third", 0.05, "third.example", missing_until_retry=True),
+    ]
+
+    races = quarter(classes, prompt_missing=True)
+
+    assert len(prompts) == 1 and len(races) == 3
+    assert [c.calls for c in classes] == [2, 1, 2]
+    assert quarter.merged == ["First", "Second", "Third"]
+    assert "2 page(s) missing for 2 adapter(s)" in capsys.readouterr().out
+    assert (tmp_path / "manual_missing.txt").read_text().count("FILE: manual_fetch/") == 2
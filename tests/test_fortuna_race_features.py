@@ -0,0 +1,87 @@
+# tests/test_fortuna_race_features.py
+import gc
+from datetime import timedelta
+
+import fortuna
+from fortuna import (
+    FavoriteToPlaceMonitor, OddsData, Race, RaceMergeStore, Runner, SimplySuccessAnalyzer,
+    get_track_category, now_eastern, race_features,
+)
+
+
+def _race(prices=(9.355, 12.13, 20.0, 4.0), **kwargs):
+    runners = [
+        Runner(name=f"R{n}", number=n, metadata={"odds_source_trustworthy": True}, odds={"S": OddsData(win=w, source="S")})
+        for n, w in enumerate(prices, 1)
+    ]
+    kwargs.setdefault("start_time", now_eastern() + timedelta(minutes=30))
+    return Race(id="ascot_r1", venue="Ascot", race_number=1, source="S", runners=runners, **kwargs)
+
+
+def test_features_are_cached_until_the_race_changes():
+    race = _race()
+    feats = race_features(race)
+
+    assert race_features(race) is feats
+    assert (feats.field_size, feats.fav_odds, feats.sec_fav_odds, feats.gap12) == (4, 4.0, 9.355, 5.36)
+    assert feats.top_numbers(3) == "4, 1, 2"
+
+    race.runners[3].scratched = True
+    scratched = race_features(race)
+    assert scratched is not feats and race_features(race) is scratched
+    assert (scratched.field_size, scratched.fav_odds, scratched.gap12) == (3, 9.355, 2.77)
+
+    # Price updates in place, replaced odds records and new runners are all picked up
+    race.runners[0].odds["S"].win = 15.0
+    assert race_features(race).fav_odds == 12.13
+    race.runners[1].odds["S"] = OddsData(win=2.0, source="S")
+    assert race_features(race).favorite is race.runners[1]
+    race.runners.append(Runner(name="R5", number=5, odds={"S": OddsData(win=1.5, source="S")}))
+    assert race_features(race).favorite is race.runners[4] and race_features(race).field_size == 4
+
+    key = id(race)
+    del race, feats, scratched
+    gc.collect()
+    assert key not in fortuna._race_features
+
+
+def test_writing_back_derived_odds_does_not_go_stale():
+    race = _race()
+    monitor = FavoriteToPlaceMonitor()
+    assert [r.number for r in monitor._get_top_runners(race, 2)] == [4, 1]
+    race.runners[3].odds["S"].win = 30.0
+
+    assert [r.number for r in monitor._get_top_runners(race, 2)] == [1, 2]
+    assert race_features(race).gap12 == 2.77
+
+
+def test_merged_races_get_features_for_their_merged_runners():
+    store = RaceMergeStore(key_fn=lambda r: r.id)
+    race = _race(prices=(9.0, 12.0))
+    store.ingest([race], source="S")
+    before = race_features(race)
+
+    late = _race(prices=(9.0, 12.0, 3.0))
+    late.source = "T"
+    store.ingest([late], source="T")
+
+    feats = race_features(race)
+    assert feats is not before and feats.field_size == 3
+    assert feats.favorite is race.runners[2] and all(run in race.runners for run, _ in feats.ranked)
+
+
+def test_dict_races_are_supported():
+    race = _race().model_dump()
+    race["discipline"] = "Greyhound"
+    assert race_features(race).field_size == 4
+    assert get_track_category([race]) == "G"
+
+
+def test_monitor_and_analyzer_agree_on_gap():
+    race = _race()
+    qualified = SimplySuccessAnalyzer().qualify_races([race])["races"][0]
+    summary = FavoriteToPlaceMonitor()._create_race_summary(qualified, "S")
+
+    assert summary.gap12 == qualified.metadata["1Gap2"] == 5.36
+    assert summary.top_five_numbers == qualified.top_five_numbers == "4, 1, 2, 3"
+    assert summary.field_size == 4 and 29 <= summary.mtp <= 30
@@ -0,0 +1,41 @@
+# tests/test_fortuna_race_profile.py
+import random
+
+import pytest
+
+fi = pytest.importorskip("fortuna_interactive")
+
+
+@pytest.mark.parametrize("field, sec, distance, profile", [
+    (9, 5.0, "6f", "r9_6f_sweet_spot"),
+    (10, 4.6, "6 furlongs", "r10_6f_sweet_spot"),
+    (6, 6.5, "1m", "sup55_prime"),
+    (8, 4.5, "1 1/16m", "r8_route_sweet_spot"),
+    (8, 4.5, None, "r8_route_sweet_spot"),
+    (11, 7.0, "5f", "goldmine_high_fav2"),
+    (4, 9.0, "6f", "high_fav2"),
+    (7, 4.5, "7f", "goldmine_standard"),
+    (7, 4.4, "6f", "standard"),
+])
+def test_known_profiles(field, sec, distance, profile):
+    assert fi._classify_race_profile(field, sec, 2.0, distance, None)["profile"] == profile
+
+
+def test_distance_parsing_keeps_miles_reading_of_metres():
+    assert fi._classify_race_profile(8, 5.0, 2.0, "0.75m", None)["furlongs"] == 6.0
+    assert fi._classify_race_profile(8, 5.0, 2.0, "1200m", None)["furlongs"] == 9600.0
+    assert fi._classify_race_profile(8, 5.0, 2.0, "Sprint", None)["furlongs"] is None
+
+
+def test_batch_matches_per_race_classification():
+    rng = random.Random(3)
+    distances = ["6f", "5.5f", "7f", "1m", "0.75m", "1m 1f", "", None, "Sprint"]
+    tips = [(rng.randint(3, 14), round(rng.uniform(1.5, 12.0), 1), rng.choice(distances)) for _ in range(500)]
+
+    batch = fi.classify_race_profiles(*zip(*tips))
+
+    for i, (field, sec, distance) in enumerate(tips):
+        single = fi._classify_race_profile(field, sec, 2.0, distance, None)
+        assert batch["profile"][i] == single["profile"]
+        assert all(bool(batch[k][i]) == single[k] for k in fi._PROFILE_FLAG_KEYS)
+    assert len(set(batch["profile"])) == len(fi.RACE_PROFILE_RULES) + 1
@@ -0,0 +1,54 @@
+# tests/test_fortuna_race_table.py
+from datetime import timedelta
+from decimal import Decimal
+
+import numpy as np
+
+from fortuna import (
+    OddsData, Race, RaceTable, Runner, _get_best_win_odds,
+    generate_field_matrix, generate_summary_grid, now_eastern,
+)
+
+
+def _races():
+    now = now_eastern()
+    mk = lambda n, win, scratched=False, **kw: Runner(
+        name=f"Horse {n}", number=n, scratched=scratched,
+        odds={"A": OddsData(win=win, source="A")} if win is not None else {}, **kw)
+    return [
+        Race(id="r1", venue="Ascot (GB)", race_number=1, start_time=now + timedelta(minutes=30), source="A",
+             runners=[mk(1, 3.5), mk(2, Decimal("4.50")), mk(3, None, win_odds=6.0), mk(4, 9.0, scratched=True)],
+             available_bets=["Exacta"], metadata={"is_goldmine": True, "1Gap2": 1.0}),
+        Race(id="r2", venue="Ascot", race_number=2, start_time=now + timedelta(hours=30), source="B",
+             runners=[mk(1, 2.75), mk(2, 1000.0), mk(3, 5.0)], qualification_score=100.0, top_five_numbers="3, 1"),
+        Race(id="r3", venue="Flemington", race_number=3, start_time=now + timedelta(hours=1), source="A",
+             runners=[mk(n, 2.0 + n) for n in range(1, 7)], field_size=6, discipline="Thoroughbred"),
+    ]
+
+
+def test_round_trip_is_lossless():
+    races = _races()
+    table = RaceTable.from_races(races)
+
+    rebuilt = table.to_races()
+    assert rebuilt == races
+    assert isinstance(rebuilt[0].runners[1].odds["A"].win, Decimal)
+    assert table.strings.values.count("A") == 1  # interned once across races, runners and odds
+
+
+def test_vectorized_scans_match_models():
+    races = _races()
+    table = RaceTable.from_races(races)
+
+    assert table.active_field_sizes().tolist() == [3, 3, 6]
+    assert list(table.tracks()) == ["Ascot", "Ascot", "Flemington"]
+    best = [None if np.isnan(b) else b for b in table.best_win_odds()]
+    assert best == [None if (o := _get_best_win_odds(r)) is None else float(o) for race in races for r in race.runners]
+
+
+def test_reports_are_identical_with_table():
+    races = _races()
+    table = RaceTable.from_races(races)
+
+    assert generate_field_matrix(races, table=table) == generate_field_matrix(races)
+    assert generate_summary_grid(races, all_races=races, table=table) == generate_summary_grid(races, all_races=races)
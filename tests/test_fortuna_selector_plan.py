@@ -0,0 +1,86 @@
+# tests/test_fortuna_selector_plan.py
+import json
+
+import pytest
+from selectolax.parser import HTMLParser
+
+import fortuna
+from fortuna import AtTheRacesAdapter, SelectorPlanMixin, TwinSpiresAdapter
+
+
+@pytest.fixture
+def adapter(tmp_path, monkeypatch):
+    monkeypatch.setattr(SelectorPlanMixin, "SELECTOR_PLAN_PATH", str(tmp_path / "selector_plans.json"))
+    monkeypatch.setattr(SelectorPlanMixin, "_selector_plans", {})
+    monkeypatch.setattr(SelectorPlanMixin, "_selector_plans_loaded", False)
+    monkeypatch.setattr(SelectorPlanMixin, "_selector_plans_dirty", False)
+    return TwinSpiresAdapter()
+
+
+def test_winner_is_tried_first_within_its_tier_then_falls_back(adapter):
+    selectors = [".a", (".b", ".c")]
+    page = HTMLParser('<div class="c">one</div><div class="c">two</div>')
+
+    assert len(adapter._plan_css(page, "rows", selectors, "host/bet")) == 2
+    assert adapter._plan_selectors("rows", selectors, "host/bet") == [".a", ".c", ".b"]
+
+    # Redesign: the learned winner now misses, the full list is walked and the plan adapts
+    redesigned = HTMLParser('<div class="b">one</div>')
+    assert len(adapter._plan_css(redesigned, "rows", selectors, "host/bet")) == 1
+    assert adapter._plan_selectors("rows", selectors, "host/bet") == [".a", ".b", ".c"]
+
+    # Plans are scoped per template
+    assert adapter._plan_selectors("rows", selectors, "host/other") == [".a", ".b", ".c"]
+
+
+def test_winner_never_jumps_ahead_of_a_more_specific_selector(adapter):
+    selectors = [".specific", ".generic"]
+    assert adapter._plan_text(HTMLParser('<b class="generic">late</b>'), "time", selectors) == "late"
+
+    page = HTMLParser('<b class="generic">wrong</b><b class="specific">right</b>')
+    assert adapter._plan_text(page, "time", selectors) == "right"
+    assert adapter._plan_selectors("time", selectors) == selectors
+
+
+@pytest.mark.asyncio
+async def test_lists_without_tiers_keep_no_plan(adapter):
+    page = HTMLParser('<b class="generic">late</b>')
+    assert adapter._plan_text(page, "time", [".specific", ".generic"]) == "late"
+    await adapter.close()
+
+    assert SelectorPlanMixin._selector_plans == {} and not SelectorPlanMixin._selector_plans_loaded
+    assert not fortuna.Path(SelectorPlanMixin.SELECTOR_PLAN_PATH).exists()
+
+
+def test_learned_runner_rows_reorder_within_their_tier(adapter):
+    atr = AtTheRacesAdapter()
+    page = HTMLParser('<div class="horse-in-racecard">A</div><div class="horse-in-racecard">B</div>')
+    assert len(atr._plan_css(page, "runners", AtTheRacesAdapter.SELECTORS["runners"])) == 2
+    assert atr._plan_selectors("runners", AtTheRacesAdapter.SELECTORS["runners"]) == [
+        ".card-cell--horse", ".odds-grid-horse", ".horse-in-racecard", "atr-horse-in-racecard",
+    ]
+
+    rows = HTMLParser('<div class="runner-box">A</div>')
+    assert len(adapter._plan_css(rows, "runner_row", TwinSpiresAdapter.RUNNER_ROW_SELECTORS)) == 1
+    assert adapter._plan_selectors("runner_row", TwinSpiresAdapter.RUNNER_ROW_SELECTORS)[0] == 'div[class*="runner"]'
+
+
+@pytest.mark.asyncio
+async def test_plan_persists_on_close(adapter):
+    page = HTMLParser('<span class="trackName">Aqueduct</span>')
+    assert adapter._plan_text(page, "track_name", TwinSpiresAdapter.TRACK_NAME_SELECTORS) == "Aqueduct"
+    await adapter.close()
+
+    with open(SelectorPlanMixin.SELECTOR_PLAN_PATH) as f:
+        saved = json.load(f)
+    assert saved == {"TwinSpires|default|track_name": '[class*="trackName"]'}
+
+    SelectorPlanMixin._selector_plans.clear()
+    SelectorPlanMixin._selector_plans_loaded = False
+    assert adapter._plan_selectors("track_name", TwinSpiresAdapter.TRACK_NAME_SELECTORS)[0] == '[class*="trackName"]'
+
+
+def test_page_template(adapter):
+    assert adapter._page_template("https://www.twinspires.com/bet/todays-races/harness") == "www.twinspires.com/bet"
+    assert adapter._page_template("/racecard/Ascot/18-October-2026/1330") == "www.twinspires.com/racecard"
+    assert fortuna.SELECTOR_PLAN_FILE == "selector_plans.json"
@@ -0,0 +1,108 @@
+# tests/test_fortuna_tab_adapter.py
+import asyncio
+import gc
+import json
+import weakref
+
+import pytest
+from structlog.testing import capture_logs
+
+from fortuna import GlobalResourceManager, TabAdapter, UnifiedResponse
+
+
+def _meeting(name, mtype="R", runners=True):
+    race = {"raceNumber": 1, "raceStartTime": "2026-10-18T03:00:00.000Z"}
+    if runners:
+        race["runners"] = [{"runnerName": "Alpha", "runnerNumber": 1, "fixedOdds": {"returnWin": 3.4}}]
+    return {"meetingName": name, "meetingType": mtype, "races": [race]}
+
+
+class FakeTab:
+    def __init__(self, listings, fail=()):
+        self.listings, self.fail = listings, set(fail)
+        self.in_flight = self.peak = 0
+        self.urls = []
+
+    async def __call__(self, method, url, **kwargs):
+        self.urls.append(url)
+        if "/meetings?" in url:
+            j = url.rsplit("=", 1)[1]
+            return UnifiedResponse(text=json.dumps({"meetings": self.listings.get(j, [])}), status=200, status_code=200, url=url)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        name = url.split("/")[-1].split("?")[0]
+        if name in self.fail:
+            return UnifiedResponse(text="", status=500, status_code=500, url=url)
+        return UnifiedResponse(text=json.dumps(_meeting(name)), status=200, status_code=200, url=url)
+
+
+@pytest.mark.asyncio
+async def test_meeting_details_fetched_concurrently_under_host_cap():
+    names = [f"Track{i}" for i in range(10)]
+    fake = FakeTab({"VIC": [_meeting(n, runners=False) for n in names]})
+    adapter = TabAdapter(config={"host_concurrency": 3})
+    adapter.make_request = fake
+
+    data = await adapter._fetch_data("2026-10-18")
+
+    assert [m["meetingName"] for m in data["meetings"]] == names
+    assert all(m["races"][0].get("runners") for m in data["meetings"])
+    assert 1 < fake.peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_partial_results_and_multiple_jurisdictions():
+    fake = FakeTab(
+        {"VIC": [_meeting("Flemington", runners=False)], "NSW": [_meeting("Flemington", runners=False), _meeting("Randwick", runners=False)]},
+        fail={"Randwick"},
+    )
+    adapter = TabAdapter(config={"jurisdictions": ["VIC", "NSW"]})
+    adapter.make_request = fake
+
+    data = await adapter._fetch_data("2026-10-18")
+
+    # Flemington is fetched once (via VIC); Randwick falls back to its summary
+    assert [m["meetingName"] for m in data["meetings"]] == ["Flemington", "Randwick"]
+    assert data["meetings"][0]["races"][0]["runners"]
+    assert "runners" not in data["meetings"][1]["races"][0]
+    assert sum("Flemington?" in u for u in fake.urls) == 1
+    assert any(u.endswith("Randwick?jurisdiction=NSW") for u in fake.urls)
+    assert len(adapter._parse_races(data)) == 2
+
+
+def test_host_semaphore_is_per_loop_and_warns_on_a_different_limit():
+    async def get(limit):
+        return GlobalResourceManager.get_host_semaphore("API.Example", limit), GlobalResourceManager.get_host_semaphore("api.example", limit + 1)
+
+    loop = asyncio.new_event_loop()
+    with capture_logs() as logs:
+        first, again = loop.run_until_complete(get(2))
+    other, _ = asyncio.run(get(2))
+
+    assert first is again and first._value == 2 and other is not first
+    assert [e["event"] for e in logs] == ["host_semaphore_limit_mismatch"]
+    assert logs[0]["limit"] == 2 and logs[0]["requested"] == 3
+    loop.close()
+
+
+def test_cleanup_releases_a_loop_whose_host_semaphore_was_contended():
+    async def contend():
+        sem = GlobalResourceManager.get_host_semaphore("busy.example", 1)
+
+        async def hold():
+            async with sem:
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(hold(), hold())
+        assert sem._loop is asyncio.get_running_loop()
+        await GlobalResourceManager.cleanup()
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(contend())
+    ref = weakref.ref(loop)
+    loop.close()
+    del loop
+    gc.collect()
+    assert ref() is None
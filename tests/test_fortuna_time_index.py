@@ -0,0 +1,106 @@
+# tests/test_fortuna_time_index.py
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import fortuna
+from fortuna import (
+    EASTERN, FavoriteToPlaceMonitor, OddsData, Race, RaceMergeStore, RaceTimeIndex, Runner, VenueResolver,
+    now_eastern,
+)
+
+
+@pytest.fixture(autouse=True)
+def resolver(monkeypatch):
+    monkeypatch.setattr(fortuna, "_venue_resolver", VenueResolver(path=None))
+
+
+def _race(venue, number, minutes, now, source="A"):
+    return Race(
+        id=f"{venue}_{number}", venue=venue, race_number=number, source=source,
+        start_time=now + timedelta(minutes=minutes),
+        runners=[Runner(name="Alpha", number=1, odds={source: OddsData(win=3.0, source=source)})],
+    )
+
+
+def test_window_matches_linear_scan():
+    now = now_eastern()
+    rng = random.Random(3)
+    races = [_race(f"Track{i}", 1, rng.randint(-120, 1500), now) for i in range(300)]
+    index = RaceTimeIndex(races)
+
+    for lo, hi in [(-45, 1080), (0, 20), (-10, 120), (2000, 3000)]:
+        expected = [r for r in races if lo < (r.start_time - now).total_seconds() / 60 <= hi]
+        got = index.mtp_window(lo, hi, now=now)
+        assert sorted(map(id, got)) == sorted(map(id, expected))
+        assert [r.start_time for r in got] == sorted(r.start_time for r in expected)
+
+
+def test_ties_naive_and_unusable_times():
+    now = datetime(2026, 10, 18, 13, 0, tzinfo=EASTERN)
+    a, b = _race("Ascot", 1, 30, now), _race("Ayr", 1, 30, now)
+    naive = _race("Bath", 1, 60, now).model_copy(update={"start_time": datetime(2026, 10, 18, 14, 0)})
+    broken = _race("Chester", 1, 10, now)
+    object.__setattr__(broken, "start_time", "not a time")
+
+    index = RaceTimeIndex([a, b, naive, broken])
+
+    assert len(index) == 3
+    assert index.mtp_window(0, 60, now=now) == [a, b, naive]
+
+
+def test_upsert_moves_and_remove_drops():
+    now = now_eastern()
+    index = RaceTimeIndex(key_fn=lambda r: r.id)
+    race = _race("Ascot", 1, 30, now)
+    index.upsert(race)
+    index.upsert(_race("Ayr", 1, 45, now))
+
+    moved = race.model_copy(update={"start_time": now + timedelta(minutes=90)})
+    index.upsert(moved)
+
+    assert len(index) == 2
+    assert index.mtp_window(0, 60, now=now)[0].venue == "Ayr"
+    assert index.mtp_window(60, 120, now=now) == [moved]
+    assert index.remove("Ascot_1") is moved and index.remove("Ascot_1") is None
+    assert [r.venue for r in index] == ["Ayr"]
+
+
+def test_merge_store_keeps_shared_index_current():
+    now = now_eastern()
+    store, index = RaceMergeStore(), RaceTimeIndex()
+    store.subscribe(lambda event: index.upsert(event.race, key=event.key))
+
+    store.ingest([_race("Ascot", 1, 20, now), _race("Ayr", 2, 300, now)], source="A")
+    store.ingest([_race("Ascot", 1, 20, now, source="B")], source="B")
+
+    assert len(index) == 2
+    assert [r.source for r in index.mtp_window(0, 60, now=now)] == ["A, B"]
+
+
+@pytest.mark.asyncio
+async def test_monitor_windows_come_from_index():
+    now = now_eastern()
+    monitor = FavoriteToPlaceMonitor()
+    races = [_race("Ascot", n, m, now) for n, m in enumerate([-60, 5, 100, 200, 2000], start=1)]
+    await monitor.build_race_summaries([(r, "A") for r in races])
+    for s in monitor.golden_zone_races:
+        s.second_fav_odds, s.gap12 = 5.0, 1.0
+
+    assert [s.race_number for s in monitor.golden_zone_races] == [2, 3, 4]
+    assert [s.race_number for s in monitor.get_bet_now_races()] == [2, 3]
+    assert [s.race_number for s in monitor.get_you_might_like_races()] == [4]
+
+
+@pytest.mark.asyncio
+async def test_monitor_index_follows_refetches_by_key():
+    now = now_eastern()
+    monitor = FavoriteToPlaceMonitor()
+    await monitor.build_race_summaries([(_race("Ascot", n, 10 * n, now), "A") for n in (1, 2, 3)])
+    await monitor.build_race_summaries([(_race("Ascot", n, 10 * n, now), "A") for n in (2, 3)]
+                                       + [(_race("Ascot", 4, 15, now), "A")])
+
+    assert len(monitor.golden_zone_index) == 3
+    assert [s.race_number for s in monitor.all_races] == [4, 2, 3]
+    assert {id(s) for s in monitor.golden_zone_index} == {id(s) for s in monitor.race_map.values()}
@@ -0,0 +1,98 @@
+# tests/test_fortuna_universal_adapter.py
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from web_service.backend.adapters.universal_adapter import (
+    SelectorProbe, UniversalAdapter, _parse_odds, compile_definition, load_definition,
+)
+
+CARD = Path("tests/fixtures/twinspires_racecard.html").read_text()
+
+
+def test_definition_parses_recorded_racecard():
+    adapter = UniversalAdapter(definition_path="twinspires.json")
+    races = adapter._parse_races({"pages": [{"url": "fixture", "html": CARD}], "date": "2026-02-01"})
+
+    assert len(races) == 1
+    race = races[0]
+    assert (race.id, race.venue, race.race_number) == ("ts_churchilldowns_20260201_R5", "Churchill Downs", 5)
+    assert race.start_time.isoformat() == "2026-02-01T17:05:00+00:00"
+    assert [(r.number, r.name, r.scratched, r.win_odds) for r in race.runners] == [
+        (1, "Braveheart", False, 3.5), (2, "Fast Runner", False, 11.0),
+        (3, "Steady Eddy", True, None), (4, "Another Horse", False, 5.0),
+    ]
+
+
+def test_plan_is_compiled_once_per_definition():
+    definition = load_definition("twinspires.json")
+    a = UniversalAdapter(definition=definition)
+    b = UniversalAdapter(definition=dict(definition))
+    assert a.plan is b.plan is compile_definition(definition)
+
+
+def test_probe_promotes_only_within_an_equal_priority_group():
+    from selectolax.parser import HTMLParser
+    root = HTMLParser(CARD).root
+    text = lambda n: n.text(strip=True)
+
+    probe = SelectorProbe([[".missing", ".odds"]])
+    assert probe.first_value(root, text) == "5/2"
+    assert probe.selectors == [".odds", ".missing"]
+
+    # A generic fallback that matched once does not move ahead of the specific selector
+    fallback = SelectorProbe([".missing", "h2"])
+    assert fallback.first_value(root, text) and fallback.selectors == [".missing", "h2"]
+
+
+def test_definition_order_survives_a_page_only_the_fallback_matches():
+    plan = compile_definition(load_definition("twinspires.json"))
+    fallback_only = CARD.replace('<h2 class="track-name">', '<h2>')
+    with_header = CARD.replace('<div class="RaceCard">', '<div class="RaceCard">\n    <h2>Race Card</h2>')
+
+    assert plan.extract(fallback_only, date(2026, 2, 1), "TS")[0].venue == "Churchill Downs"
+    assert plan.extract(with_header, date(2026, 2, 1), "TS")[0].venue == "Churchill Downs"
+
+
+@pytest.mark.parametrize("text,fmt,expected", [
+    ("5/2", "auto", 3.5), ("EVS", "auto", 2.0), ("3,75", "decimal", 3.75),
+    ("+150", "american", 2.5), ("-200", "american", 1.5), ("SCR", "american", None),
+])
+def test_odds_formats(text, fmt, expected):
+    assert _parse_odds(text, fmt) == expected
+
+
+@pytest.mark.asyncio
+async def test_fetch_follows_link_step():
+    definition = load_definition("twinspires.json")
+    index = '<a href="/bet/program/cd/5">R5</a><a href="/bet/program/cd/5">dup</a>'
+    adapter = UniversalAdapter(definition=definition)
+    requested = []
+
+    async def fake_request(method, url, **kwargs):
+        requested.append(url)
+        return SimpleNamespace(text=index if "todays-races" in url else CARD)
+
+    adapter.make_request = fake_request
+    data = await adapter._fetch_data("2026-02-01")
+
+    assert requested == ["/bet/todays-races/time?date=2026-02-01", "/bet/program/cd/5"]
+    assert len(adapter._parse_races(data)) == 1
+
+
+@pytest.mark.parametrize("zone,expected", [
+    (None, "2026-02-01T17:05:00-05:00"), ("Europe/London", "2026-02-01T17:05:00+00:00"),
+])
+def test_naive_post_times_are_track_local(zone, expected):
+    definition = load_definition("twinspires.json")
+    definition.pop("timezone")
+    if zone:
+        definition["timezone"] = zone
+    definition["race"]["fields"]["start_time"] = {"selector": [".post-time-text"], "type": "time"}
+    html = CARD.replace('class="post-time"></time>', 'class="post-time"></time><span class="post-time-text">5:05 PM</span>')
+
+    race = compile_definition(definition).extract(html, date(2026, 2, 1), "TS")[0]
+
+    assert race.start_time.isoformat() == expected
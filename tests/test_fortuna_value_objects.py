@@ -0,0 +1,53 @@
+# tests/test_fortuna_value_objects.py
+from datetime import datetime
+
+import pytest
+
+import fortuna
+from fortuna import EASTERN, RaceSummary, VenueResolver
+
+fortuna_analytics = pytest.importorskip("fortuna_analytics")
+ResultRace = fortuna_analytics.ResultRace
+
+START = datetime(2026, 10, 18, 14, 30, tzinfo=EASTERN)
+
+
+@pytest.fixture(autouse=True)
+def resolver(monkeypatch):
+    monkeypatch.setattr(fortuna, "_venue_resolver", VenueResolver(path=None))
+
+
+def test_race_summary_is_slotted_but_keeps_its_attributes():
+    s = RaceSummary(discipline="T", track="Ascot", race_number=1, field_size=8, superfecta_offered=True, adapter="A", start_time=START)
+    s.mtp = 12
+
+    assert not hasattr(s, "__dict__")
+    assert s.to_dict()["mtp"] == 12 and s.to_dict()["start_time"] == START.isoformat()
+    with pytest.raises(AttributeError):
+        s.unknown = 1
+
+
+def test_result_keys_are_built_once_and_follow_changes():
+    race = ResultRace(id="r1", venue="Musselburgh", race_number=3, start_time=START, source="RP", discipline="Harness")
+
+    assert race.canonical_key == "musselburgh|3|20261018|1430|H"
+    assert race.relaxed_key == "musselburgh|3|20261018|H"
+    assert race.timed_key == "musselburgh|3|20261018|1430"
+    assert race.canonical_key is race.canonical_key
+
+    race.race_number = 4
+    assert race.canonical_key == "musselburgh|4|20261018|1430|H"
+    assert race.model_copy(update={"venue": "Ayr"}).relaxed_key == "ayr|4|20261018|H"
+
+
+def test_results_map_shares_keys_and_keeps_first_relaxed_match():
+    first = ResultRace(id="a", venue="Ayr", race_number=1, start_time=START, source="RP")
+    later = ResultRace(id="b", venue="Ayr", race_number=1, start_time=START.replace(hour=16), source="RP")
+
+    mapping = fortuna_analytics.AuditorEngine._build_results_map([first, later])
+
+    assert {k: v.id for k, v in mapping.items()} == {
+        "ayr|1|20261018|1430|T": "a", "ayr|1|20261018|1430": "a", "ayr|1|20261018|T": "a",
+        "ayr|1|20261018|1630|T": "b", "ayr|1|20261018|1630": "b",
+    }
+    assert next(k for k in mapping if k == first.canonical_key) is first.canonical_key
@@ -0,0 +1,83 @@
+# tests/test_fortuna_venue_resolver.py
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import fortuna
+from fortuna import VenueResolver
+
+
+@pytest.fixture
+def resolver(tmp_path, monkeypatch):
+    r = VenueResolver(path=str(tmp_path / "venue_aliases.json"))
+    monkeypatch.setattr(fortuna, "_venue_resolver", r)
+    return r
+
+
+def test_known_and_fuzzy_spellings_resolve_to_one_key(resolver):
+    assert resolver.resolve("Musselburgh") == "musselburgh"
+    assert resolver.resolve("Musselburg") == "musselburgh"
+    assert resolver.resolve("Doncastre") == "doncaster"
+    # Short or dissimilar names are never merged
+    assert resolver.resolve("Dove") == "dove"
+    assert resolver.resolve("Flemington") == "flemington"
+
+
+def test_observed_venues_join_the_index(resolver):
+    assert resolver.observe("Ludlow") == "ludlow"
+    assert resolver.resolve("Ludlw Racecourse") == "ludlow"
+
+
+def test_learned_aliases_persist(resolver):
+    resolver.learn("Gulfstrem", "gulfstreampark")
+    resolver.save()
+
+    assert json.load(open(resolver.path)) == {"gulfstrem": "gulfstreampark"}
+    assert VenueResolver(path=resolver.path).resolve("Gulfstrem") == "gulfstreampark"
+
+
+
+def test_fuzzy_evidence_persists_only_once_confirmed(resolver):
+    for n in (1, 2):
+        resolver.learn("Gulfstrem", "gulfstreampark", evidence=f"gulfstreampark|{n}|20261018")
+        resolver.learn("Gulfstrem", "gulfstreampark", evidence=f"gulfstreampark|{n}|20261018")
+    resolver.save()
+    assert resolver.resolve("Gulfstrem") == "gulfstreampark" and resolver.aliases == {}
+    assert not Path(resolver.path).exists()
+
+    resolver.learn("Gulfstrem", "gulfstreampark", evidence="gulfstreampark|3|20261018")
+    resolver.save()
+    assert json.load(open(resolver.path)) == {"gulfstrem": "gulfstreampark"} and resolver.provisional == {}
+
+
+def test_default_resolver_uses_the_writable_path(monkeypatch):
+    monkeypatch.setattr(fortuna, "_venue_resolver", None)
+    monkeypatch.setattr(fortuna, "get_writable_path", lambda name: Path("/appdata/Fortuna") / name)
+    assert fortuna.get_venue_resolver().path == str(Path("/appdata/Fortuna/venue_aliases.json"))
+
+
+def test_auditor_matches_noisy_tip_venue(resolver, tmp_path):
+    fortuna_analytics = pytest.importorskip("fortuna_analytics")
+    start = datetime(2026, 10, 18, 14, 30, tzinfo=fortuna.EASTERN)
+    result = fortuna_analytics.ResultRace(id="r1", venue="Musselburgh", race_number=3, start_time=start, source="RP", discipline="Thoroughbred")
+    results_map = fortuna_analytics.AuditorEngine._build_results_map([result])
+
+    tip = {"venue": "Musselburg", "race_number": 3, "start_time": start.isoformat(), "discipline": "Harness"}
+    tip_key = fortuna_analytics.AuditorEngine._tip_canonical_key(tip)
+
+    assert tip_key == "musselburgh|3|20261018|1430|H"
+    # Discipline differs, so this goes through the indexed time-keyed fallback
+    auditor = fortuna_analytics.AuditorEngine(db_path=str(tmp_path / "fortuna.db"))
+    assert auditor._match_tip_to_result(tip_key, results_map, "tip1") is result
+
+
+def test_result_keys_follow_resolver_changes(resolver):
+    fortuna_analytics = pytest.importorskip("fortuna_analytics")
+    start = datetime(2026, 10, 18, 14, 30, tzinfo=fortuna.EASTERN)
+    result = fortuna_analytics.ResultRace(id="r1", venue="Gulfstrem", race_number=3, start_time=start, source="RP")
+    assert result.canonical_key.startswith("gulfstrem|")
+
+    resolver.learn("Gulfstrem", "gulfstreampark")
+    assert result.canonical_key == "gulfstreampark|3|20261018|1430|T"
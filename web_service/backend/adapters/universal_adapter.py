@@ -1,24 +1,354 @@
 # python_service/adapters/universal_adapter.py
+"""
+Declarative adapter engine.
+
+A definition (JSON) describes the pages to fetch, where races and runners live on
+them and how each field is read. ``compile_definition`` turns it into an
+:class:`ExtractionPlan` once: selector lists become ordered probes, regexes
+are pre-compiled and converters are bound, so the per-page loop does no definition
+lookups. Plans are cached by definition content and shared by every adapter
+instance and page using the same definition.
+
+Minimal definition::
+
+    {
+      "adapter_name": "ExampleTrack",
+      "base_url": "https://example.com",
+      "start_url": "/entries/{date}",
+      "steps": [{"selector": "a.race-link", "attribute": "href"}],
+      "odds_format": "auto",
+      "timezone": "America/New_York",
+      "race": {
+        "container": ["div.race-card"],
+        "id_prefix": "ex",
+        "fields": {
+          "venue": {"selector": [".track-name"]},
+          "race_number": {"selector": [".race-number"], "type": "int"},
+          "start_time": {"selector": ["time[datetime]"], "attribute": "datetime", "type": "datetime"}
+        }
+      },
+      "runner": {
+        "container": ["tr.runner"],
+        "fields": {
+          "number": {"selector": [".program"], "type": "int"},
+          "name": {"selector": [".horse-name"], "remove": "\\\\([^)]*\\\\)"},
+          "odds": {"selector": [".odds"], "type": "odds"},
+          "scratched": {"contains": ["scratched"]}
+        }
+      }
+    }
+
+``timezone`` (IANA name, default America/New_York) is the track-local zone that naive
+post times on the page are read in.
+
+Selector lists are tried in order. A nested list groups equal-priority alternatives
+(``"container": [["div.RaceCard", "div.race-card"], "section.race"]``): only inside such
+a group does the selector that matched last get tried first next time.
+"""
+
+import hashlib
 import json
-from typing import Any, List
+import re
+from datetime import date, datetime, time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from zoneinfo import ZoneInfo
 
-from selectolax.parser import HTMLParser
+from selectolax.parser import HTMLParser, Node
 
-from ..models import Race
+from ..models import Race, Runner
+from ..utils.odds import parse_odds_to_decimal
+from ..utils.text import clean_text
 from .base_adapter_v3 import BaseAdapterV3
+from .mixins import RacePageFetcherMixin
+from .utils.odds_validator import create_odds_data
 from ..core.smart_fetcher import BrowserEngine, FetchStrategy
 
+DEFINITIONS_DIR = Path(__file__).parent / "definitions"
+DEFAULT_TIMEZONE = "America/New_York"
+BET_KEYWORDS = ("superfecta", "trifecta", "exacta", "quinella")
+TIME_FORMATS = ("%I:%M %p", "%I:%M%p", "%H:%M", "%I:%M:%S %p")
+_TZ_SUFFIX = re.compile(r"\s+(EST|EDT|CST|CDT|MST|MDT|PST|PDT|ET|PT|CT|MT|UTC|GMT)$", re.I)
+_AMERICAN = re.compile(r"^([+-])(\d+)$")
+
+
+# --- Converters (shared by every definition) ---
+
+@lru_cache(maxsize=4096)
+def _parse_odds(text: str, odds_format: str) -> Optional[float]:
+    """Odds text to decimal odds; results are memoised since prices repeat heavily."""
+    t = text.strip().upper()
+    try:
+        if odds_format == "decimal":
+            return round(float(t.replace(",", ".")), 2)
+        if odds_format == "american":
+            m = _AMERICAN.match(t)
+            if not m:
+                return None
+            v = int(m.group(2))
+            return round(v / 100 + 1.0, 2) if m.group(1) == "+" else round(100 / v + 1.0, 2)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return parse_odds_to_decimal(text)
+
+
+def _to_int(text: str) -> Optional[int]:
+    digits = "".join(filter(str.isdigit, text))
+    return int(digits) if digits else None
+
+
+def _to_datetime(text: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(text.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _to_time(text: str) -> Optional[time]:
+    cleaned = _TZ_SUFFIX.sub("", text).strip()
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.strptime(cleaned, fmt).time()
+        except ValueError:
+            continue
+    return None
+
+
+CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "str": clean_text,
+    "int": _to_int,
+    "datetime": _to_datetime,
+    "time": _to_time,
+}
 
-class UniversalAdapter(BaseAdapterV3):
+
+# --- Compiled plan ---
+
+class SelectorProbe:
+    """
+    A selector list tried in definition order.
+
+    An entry is a selector or a list of equal-priority alternatives; within such a group
+    whichever selector last matched moves to the front. Separate entries never trade
+    places, so a generic fallback cannot shadow a more specific selector listed before it.
+    """
+
+    __slots__ = ("groups",)
+
+    def __init__(self, selectors: Sequence[Any]):
+        self.groups = [_as_list(entry) for entry in selectors]
+
+    @property
+    def selectors(self) -> List[str]:
+        return [sel for group in self.groups for sel in group]
+
+    def _promote(self, group: List[str], i: int) -> None:
+        if i:
+            group.insert(0, group.pop(i))
+
+    def all(self, node: Node) -> List[Node]:
+        for group in self.groups:
+            for i, sel in enumerate(group):
+                found = node.css(sel)
+                if found:
+                    self._promote(group, i)
+                    return found
+        return []
+
+    def first_value(self, node: Node, read: Callable[[Node], Optional[str]]) -> Optional[str]:
+        for group in self.groups:
+            for i, sel in enumerate(group):
+                found = node.css_first(sel)
+                if found is not None:
+                    raw = read(found)
+                    if raw:
+                        self._promote(group, i)
+                        return raw
+        return None
+
+
+def _as_list(value: Any) -> List[str]:
+    if value is None:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _compile_field(spec: Any, odds_format: str) -> Callable[[Node], Any]:
+    """Binds one field spec into a single closure: probe -> read -> regex -> convert."""
+    if isinstance(spec, (str, list)):
+        spec = {"selector": spec}
+
+    if "contains" in spec:
+        keywords = tuple(k.lower() for k in _as_list(spec["contains"]))
+        return lambda node: any(k in (node.html or "").lower() for k in keywords)
+
+    attribute = spec.get("attribute")
+    if attribute:
+        read: Callable[[Node], Optional[str]] = lambda n: n.attributes.get(attribute)
+    else:
+        read = lambda n: n.text(strip=True)
+    probe = SelectorProbe(_as_list(spec.get("selector"))) if spec.get("selector") else None
+    pattern = re.compile(spec["regex"]) if spec.get("regex") else None
+    remove = re.compile(spec["remove"]) if spec.get("remove") else None
+    skip = frozenset(s.upper() for s in _as_list(spec.get("ignore")))
+    kind = spec.get("type", "str")
+    fmt = spec.get("format", odds_format)
+    convert = (lambda t: _parse_odds(t, fmt)) if kind == "odds" else CONVERTERS[kind]
+    default = spec.get("default")
+
+    def extract(node: Node) -> Any:
+        raw = probe.first_value(node, read) if probe else read(node)
+        if raw and pattern:
+            m = pattern.search(raw)
+            raw = (m.group(1) if m.groups() else m.group(0)) if m else None
+        if raw and remove:
+            raw = remove.sub("", raw)
+        if not raw or (skip and raw.strip().upper() in skip):
+            return default
+        value = convert(raw)
+        return default if value is None else value
+
+    return extract
+
+
+class ExtractionPlan:
+    """Executable form of a definition. Build via :func:`compile_definition`."""
+
+    def __init__(self, definition: Dict[str, Any]):
+        odds_format = definition.get("odds_format", "auto")
+        race, runner = definition.get("race", {}), definition.get("runner", {})
+        self.discipline = definition.get("discipline", "Thoroughbred")
+        self.timezone = ZoneInfo(definition.get("timezone", DEFAULT_TIMEZONE))
+        self.id_prefix = race.get("id_prefix") or re.sub(r"[^a-z0-9]", "", definition["adapter_name"].lower())
+        self.race_probe = SelectorProbe(_as_list(race.get("container")))
+        self.runner_probe = SelectorProbe(_as_list(runner.get("container")))
+        self.race_fields = {k: _compile_field(v, odds_format) for k, v in race.get("fields", {}).items()}
+        self.runner_fields = {k: _compile_field(v, odds_format) for k, v in runner.get("fields", {}).items()}
+        self.links = [
+            (SelectorProbe(_as_list(step["selector"])), step.get("attribute", "href"), step.get("limit"))
+            for step in definition.get("steps", [])
+        ]
+
+    def extract_links(self, html: str) -> List[str]:
+        if not self.links:
+            return []
+        tree = HTMLParser(html)
+        urls: List[str] = []
+        for probe, attribute, limit in self.links:
+            for node in probe.all(tree)[:limit]:
+                if url := node.attributes.get(attribute):
+                    urls.append(url)
+        return list(dict.fromkeys(urls))
+
+    def extract(self, html: str, race_date: date, source: str) -> List[Race]:
+        tree = HTMLParser(html)
+        root = tree.body or tree.root
+        containers = self.race_probe.all(root) if self.race_probe.selectors else [root]
+        races = []
+        for index, container in enumerate(containers, 1):
+            race = self._race(container, index, race_date, source)
+            if race:
+                races.append(race)
+        return races
+
+    def _race(self, node: Node, index: int, race_date: date, source: str) -> Optional[Race]:
+        f = self.race_fields
+        venue = f["venue"](node) if "venue" in f else None
+        if not venue:
+            return None
+        number = (f["race_number"](node) if "race_number" in f else None) or index
+        start = f["start_time"](node) if "start_time" in f else None
+        if isinstance(start, time):
+            start = datetime.combine(race_date, start)
+        if not isinstance(start, datetime):
+            return None
+        if start.tzinfo is None:
+            # Pages show track-local post times
+            start = start.replace(tzinfo=self.timezone)
+
+        runners = []
+        for i, row in enumerate(self.runner_probe.all(node), 1):
+            runner = self._runner(row, i, source)
+            if runner:
+                runners.append(runner)
+        if not runners:
+            return None
+
+        html_lower = (node.html or "").lower()
+        venue_id = re.sub(r"[^a-z0-9]", "", venue.lower())
+        return Race(
+            id=f"{self.id_prefix}_{venue_id}_{race_date:%Y%m%d}_R{number}",
+            venue=venue,
+            race_number=number,
+            start_time=start,
+            runners=runners,
+            source=source,
+            distance=f["distance"](node) if "distance" in f else None,
+            metadata={
+                "discipline": self.discipline,
+                "available_bets": [kw.capitalize() for kw in BET_KEYWORDS if kw in html_lower],
+            },
+        )
+
+    def _runner(self, node: Node, index: int, source: str) -> Optional[Runner]:
+        f = self.runner_fields
+        name = f["name"](node) if "name" in f else None
+        if not name:
+            return None
+        scratched = bool(f["scratched"](node)) if "scratched" in f else False
+        win_odds = None if scratched or "odds" not in f else f["odds"](node)
+        odds = {}
+        if od := create_odds_data(source, win_odds):
+            odds[source] = od
+        return Runner(
+            number=(f["number"](node) if "number" in f else None) or index,
+            name=clean_text(name),
+            scratched=scratched,
+            odds=odds,
+            win_odds=float(od.win) if od else None,
+        )
+
+
+_PLAN_CACHE: Dict[str, ExtractionPlan] = {}
+
+
+def definition_key(definition: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(definition, sort_keys=True).encode()).hexdigest()
+
+
+def compile_definition(definition: Dict[str, Any]) -> ExtractionPlan:
+    """Returns the cached plan for this definition, compiling it on first use."""
+    key = definition_key(definition)
+    plan = _PLAN_CACHE.get(key)
+    if plan is None:
+        plan = _PLAN_CACHE[key] = ExtractionPlan(definition)
+    return plan
+
+
+def load_definition(path: str) -> Dict[str, Any]:
+    p = Path(path)
+    if not p.is_absolute() and not p.exists():
+        p = DEFINITIONS_DIR / p
+    with open(p, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class UniversalAdapter(RacePageFetcherMixin, BaseAdapterV3):
     """
     An adapter that executes logic from a declarative JSON definition file.
-    NOTE: This is a simplified proof-of-concept implementation.
+    The definition is compiled into a cached ExtractionPlan; see the module docstring.
     Standardized on selectolax for performance.
     """
 
-    def __init__(self, config, definition_path: str):
-        with open(definition_path, "r") as f:
-            self.definition = json.load(f)
+    def __init__(self, config=None, definition_path: Optional[str] = None, definition: Optional[Dict[str, Any]] = None):
+        if definition is None:
+            if not definition_path:
+                raise ValueError("UniversalAdapter needs a definition or definition_path")
+            definition = load_definition(definition_path)
+        self.definition = definition
+        self.plan = compile_definition(definition)
 
         super().__init__(
             source_name=self.definition["adapter_name"],
@@ -30,21 +360,34 @@ class UniversalAdapter(BaseAdapterV3):
         return FetchStrategy(primary_engine=BrowserEngine.HTTPX)
 
     async def _fetch_data(self, date: str) -> Any:
-        """Executes the fetch steps defined in the JSON definition."""
-        self.logger.info(f"Executing Universal Adapter PoC for {self.source_name}")
-        response = await self.make_request("GET", self.definition["start_url"])
-        if not response:
+        """Fetches the start page and, when the definition has link steps, every linked race page."""
+        start_url = self.definition["start_url"].format(date=date)
+        response = await self.make_request("GET", start_url)
+        if not response or not response.text:
             return None
 
-        parser = HTMLParser(response.text)
-        # Assuming the first step is a simple CSS selector for track links
-        track_links = [self.base_url + a.attributes["href"] for a in parser.css(self.definition["steps"][0]["selector"]) if a.attributes.get("href")]
+        links = self.plan.extract_links(response.text)
+        if not links:
+            return {"pages": [{"url": start_url, "html": response.text}], "date": date}
 
-        # In a full implementation, we would fetch and return each track page's content.
-        # For this PoC, we are not fetching the individual track links.
-        self.logger.warning("UniversalAdapter is a proof-of-concept and does not fully fetch all data.")
-        return track_links
+        limit = int(self.definition.get("concurrency", 5))
+        pages = await self._fetch_race_pages_concurrent([{"url": u} for u in links], {}, semaphore_limit=limit)
+        return {"pages": pages, "date": date}
 
     def _parse_races(self, raw_data: Any) -> List[Race]:
-        """This is a proof-of-concept and does not parse any data."""
-        return []
+        if not raw_data or not raw_data.get("pages"):
+            return []
+        try:
+            race_date = datetime.strptime(raw_data["date"], "%Y-%m-%d").date()
+        except (KeyError, ValueError):
+            return []
+
+        races: List[Race] = []
+        for page in raw_data["pages"]:
+            if not page or not page.get("html"):
+                continue
+            try:
+                races.extend(self.plan.extract(page["html"], race_date, self.source_name))
+            except Exception as e:
+                self.logger.warning("Error parsing page", url=page.get("url"), error=str(e))
+        return races